@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.db import get_db_session
+from backend.app.core.artifacts.emission_factor_service import (
+    EmissionFactorArtifactError,
+    create_emission_factor_artifact,
+    load_emission_factor_artifact,
+)
+
+
+router = APIRouter(prefix="/api/v3/emission-factor-artifacts", tags=["emission-factor-artifacts"])
+
+
+@router.post("")
+async def create(payload: dict, db: AsyncSession = Depends(get_db_session)) -> dict:
+    dataset_version_id = payload.get("dataset_version_id")
+    created_at_str = payload.get("created_at")
+
+    if not isinstance(dataset_version_id, str) or not dataset_version_id.strip():
+        raise HTTPException(status_code=400, detail="DATASET_VERSION_ID_REQUIRED")
+
+    # created_at is required for determinism
+    if not created_at_str:
+        raise HTTPException(
+            status_code=400,
+            detail="CREATED_AT_REQUIRED: created_at is required for deterministic emission factor artifact creation",
+        )
+
+    try:
+        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        raise HTTPException(status_code=400, detail="CREATED_AT_INVALID_FORMAT: created_at must be ISO 8601 format with timezone")
+
+    try:
+        row = await create_emission_factor_artifact(
+            db,
+            dataset_version_id=dataset_version_id,
+            name=payload.get("name"),
+            factors=payload.get("factors"),
+            created_at=created_at,
+        )
+    except EmissionFactorArtifactError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {
+        "emission_factor_artifact_id": row.emission_factor_artifact_id,
+        "dataset_version_id": row.dataset_version_id,
+        "name": row.name,
+        "factor_count": row.factor_count,
+        "checksum": row.checksum,
+        "artifact_uri": row.artifact_uri,
+    }
+
+
+@router.get("/{emission_factor_artifact_id}")
+async def get(emission_factor_artifact_id: str, db: AsyncSession = Depends(get_db_session)) -> dict:
+    try:
+        row, payload = await load_emission_factor_artifact(db, emission_factor_artifact_id=emission_factor_artifact_id)
+    except EmissionFactorArtifactError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return {
+        "emission_factor_artifact_id": row.emission_factor_artifact_id,
+        "dataset_version_id": row.dataset_version_id,
+        "checksum": row.checksum,
+        "payload": payload,
+    }
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.models.base import Base
+
+
+class EmissionFactorArtifact(Base):
+    __tablename__ = "emission_factor_artifacts"
+    __table_args__ = (
+        UniqueConstraint("dataset_version_id", "checksum", name="uq_emission_factor_dataset_checksum"),
+    )
+
+    emission_factor_artifact_id: Mapped[str] = mapped_column(String, primary_key=True)
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), nullable=False, index=True
+    )
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    factor_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    checksum: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    artifact_uri: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
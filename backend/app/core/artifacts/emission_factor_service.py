@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.artifacts.checksums import sha256_hex, verify_sha256
+from backend.app.core.artifacts.emission_factor_models import EmissionFactorArtifact
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
+
+
+class EmissionFactorArtifactError(ValueError):
+    pass
+
+
+def _optional_text(value: object, code: str) -> str | None:
+    if value is None:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        raise EmissionFactorArtifactError(code)
+    return value.strip()
+
+
+def _canonical_factor_row(row: object) -> dict:
+    if not isinstance(row, dict):
+        raise EmissionFactorArtifactError("FACTOR_ROW_INVALID")
+
+    activity = _optional_text(row.get("activity"), "FACTOR_ACTIVITY_INVALID")
+    if activity is None:
+        raise EmissionFactorArtifactError("FACTOR_ACTIVITY_REQUIRED")
+    country = _optional_text(row.get("country"), "FACTOR_COUNTRY_INVALID")
+    if country is not None and (len(country) != 2 or not country.isalpha()):
+        raise EmissionFactorArtifactError("FACTOR_COUNTRY_INVALID")
+    region = _optional_text(row.get("region"), "FACTOR_REGION_INVALID")
+    if region is not None and country is None:
+        raise EmissionFactorArtifactError("FACTOR_REGION_REQUIRES_COUNTRY")
+    fuel_type = _optional_text(row.get("fuel_type"), "FACTOR_FUEL_TYPE_INVALID")
+
+    effective_date = row.get("effective_date")
+    if effective_date is None and isinstance(row.get("year"), int) and not isinstance(row.get("year"), bool):
+        effective_date = f"{row['year']:04d}-01-01"
+    if not isinstance(effective_date, str):
+        raise EmissionFactorArtifactError("FACTOR_EFFECTIVE_DATE_REQUIRED")
+    try:
+        effective = date.fromisoformat(effective_date.strip())
+    except ValueError as exc:
+        raise EmissionFactorArtifactError("FACTOR_EFFECTIVE_DATE_INVALID") from exc
+
+    value = row.get("kgco2e_per_unit")
+    if isinstance(value, bool):
+        raise EmissionFactorArtifactError("FACTOR_VALUE_DECIMAL_INVALID")
+    try:
+        dec = Decimal(str(value))
+    except Exception as exc:
+        raise EmissionFactorArtifactError("FACTOR_VALUE_DECIMAL_INVALID") from exc
+    if not dec.is_finite():
+        raise EmissionFactorArtifactError("FACTOR_VALUE_DECIMAL_INVALID")
+    if dec < 0:
+        raise EmissionFactorArtifactError("FACTOR_VALUE_NEGATIVE")
+
+    return {
+        "activity": activity.lower(),
+        "country": country.upper() if country is not None else None,
+        "region": region.upper() if region is not None else None,
+        "fuel_type": fuel_type.lower() if fuel_type is not None else None,
+        "effective_date": effective.isoformat(),
+        "kgco2e_per_unit": format(dec, "f"),
+    }
+
+
+def _factor_sort_key(row: dict) -> tuple[str, str, str, str, str]:
+    return (
+        row["activity"],
+        row["country"] or "",
+        row["region"] or "",
+        row["fuel_type"] or "",
+        row["effective_date"],
+    )
+
+
+def _canonical_emission_factor_payload_bytes(*, name: str, factors: list) -> tuple[bytes, int]:
+    """
+    Canonical JSON for a factor table, plus its row count.
+
+    Rows are keyed by (activity, country, region, fuel_type, effective_date); an
+    unset country, region or fuel type marks a fallback row. Rows are sorted by key,
+    so the checksum does not depend on input order.
+    """
+    if not isinstance(name, str) or not name.strip():
+        raise EmissionFactorArtifactError("NAME_REQUIRED")
+    if not isinstance(factors, list) or not factors:
+        raise EmissionFactorArtifactError("FACTORS_REQUIRED")
+
+    rows = sorted((_canonical_factor_row(row) for row in factors), key=_factor_sort_key)
+    for previous, current in zip(rows, rows[1:]):
+        if _factor_sort_key(previous) == _factor_sort_key(current):
+            raise EmissionFactorArtifactError("FACTOR_KEY_DUPLICATE")
+
+    payload = {"name": name.strip(), "factors": rows}
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8"), len(rows)
+
+
+async def create_emission_factor_artifact(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    name: str,
+    factors: list,
+    created_at: datetime,
+) -> EmissionFactorArtifact:
+    """
+    Create an emission factor artifact with a deterministic timestamp.
+
+    The table is stored content-addressed; creating the same table twice for a
+    dataset version returns the existing artifact.
+    """
+    if created_at.tzinfo is None:
+        raise EmissionFactorArtifactError("CREATED_AT_TIMEZONE_REQUIRED: created_at must be timezone-aware")
+
+    payload_bytes, factor_count = _canonical_emission_factor_payload_bytes(name=name, factors=factors)
+    checksum = sha256_hex(payload_bytes)
+
+    existing = await db.scalar(
+        select(EmissionFactorArtifact).where(
+            EmissionFactorArtifact.dataset_version_id == dataset_version_id,
+            EmissionFactorArtifact.checksum == checksum,
+        )
+    )
+    if existing is not None:
+        return existing
+
+    store = get_artifact_store()
+    stored = await store.put_bytes(
+        key=f"core/emission-factors/{dataset_version_id}/{checksum}.json",
+        data=payload_bytes,
+        content_type="application/json",
+    )
+
+    row = EmissionFactorArtifact(
+        emission_factor_artifact_id=str(uuid.uuid4()),
+        dataset_version_id=dataset_version_id,
+        name=name.strip(),
+        factor_count=factor_count,
+        checksum=checksum,
+        artifact_uri=stored.uri,
+        created_at=created_at,
+    )
+    db.add(row)
+    await db.commit()
+    await db.refresh(row)
+    return row
+
+
+async def load_emission_factor_artifact(
+    db: AsyncSession, *, emission_factor_artifact_id: str
+) -> tuple[EmissionFactorArtifact, dict]:
+    row = await db.scalar(
+        select(EmissionFactorArtifact).where(
+            EmissionFactorArtifact.emission_factor_artifact_id == emission_factor_artifact_id
+        )
+    )
+    if row is None:
+        raise EmissionFactorArtifactError("EMISSION_FACTOR_ARTIFACT_NOT_FOUND")
+
+    store = get_artifact_store()
+    try:
+        key = artifact_key_from_uri(row.artifact_uri)
+    except ValueError as exc:
+        raise EmissionFactorArtifactError("EMISSION_FACTOR_ARTIFACT_URI_INVALID") from exc
+    raw = await store.get_bytes(key=key)
+    verify_sha256(raw, row.checksum)
+    payload = json.loads(raw.decode("utf-8"))
+    return row, payload
+
+
+async def load_emission_factor_artifact_for_dataset(
+    db: AsyncSession, *, emission_factor_artifact_id: str, dataset_version_id: str
+) -> tuple[EmissionFactorArtifact, dict]:
+    row, payload = await load_emission_factor_artifact(db, emission_factor_artifact_id=emission_factor_artifact_id)
+    if row.dataset_version_id != dataset_version_id:
+        raise EmissionFactorArtifactError("EMISSION_FACTOR_ARTIFACT_DATASET_MISMATCH")
+    return row, payload
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from typing import BinaryIO
 
 from backend.app.core.artifacts.interface import StoredArtifact
 from backend.app.core.artifacts.store import get_artifact_store
@@ -67,3 +68,31 @@ async def put_bytes_immutable(*, key: str, data: bytes, content_type: str) -> St
 
     return await store.put_bytes(key=key, data=data, content_type=content_type)
 
+
+async def put_file_immutable(
+    *, key: str, fileobj: BinaryIO, sha256: str, size_bytes: int, content_type: str
+) -> StoredArtifact:
+    """
+    Streaming variant of `put_bytes_immutable` for content already written to a file.
+
+    `sha256` and `size_bytes` describe the file contents (computed while writing it),
+    so an existing object can be checked without re-reading the file; the existing
+    object is hashed as it streams from the store.
+    """
+    store = get_artifact_store()
+    try:
+        digest = hashlib.sha256()
+        async for chunk in store.iter_bytes(key=key):
+            digest.update(chunk)
+        existing_sha256: str | None = digest.hexdigest()
+    except Exception:
+        existing_sha256 = None
+
+    if existing_sha256 is not None:
+        if existing_sha256 != sha256:
+            raise ArtifactImmutableWriteError(
+                f"ARTIFACT_OVERWRITE_FORBIDDEN: key={key} already exists with different bytes"
+            )
+        return StoredArtifact(uri=_uri_for_key(key), sha256=sha256, size_bytes=size_bytes, content_type=content_type)
+
+    return await store.put_file(key=key, fileobj=fileobj, content_type=content_type)
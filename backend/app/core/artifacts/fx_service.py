@@ -4,14 +4,13 @@ import json
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from urllib.parse import urlparse
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.artifacts.checksums import sha256_hex, verify_sha256
 from backend.app.core.artifacts.fx_models import FxArtifact
-from backend.app.core.artifacts.store import get_artifact_store
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
 
 
 class FxArtifactError(ValueError):
@@ -114,16 +113,10 @@ async def load_fx_artifact(db: AsyncSession, *, fx_artifact_id: str) -> tuple[Fx
         raise FxArtifactError("FX_ARTIFACT_NOT_FOUND")
 
     store = get_artifact_store()
-    parsed = urlparse(row.artifact_uri)
-    if parsed.scheme == "memory":
-        key = parsed.netloc + parsed.path
-        if key.startswith("/"):
-            key = key[1:]
-    elif parsed.scheme == "s3":
-        # s3://bucket/key -> path is /key
-        key = parsed.path[1:] if parsed.path.startswith("/") else parsed.path
-    else:
-        raise FxArtifactError("FX_ARTIFACT_URI_INVALID")
+    try:
+        key = artifact_key_from_uri(row.artifact_uri)
+    except ValueError as exc:
+        raise FxArtifactError("FX_ARTIFACT_URI_INVALID") from exc
     raw = await store.get_bytes(key=key)
     verify_sha256(raw, row.checksum)
     payload = json.loads(raw.decode("utf-8"))
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import hashlib
+from typing import AsyncIterator, BinaryIO
+
+
+ARTIFACT_CHUNK_BYTES = 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -17,3 +22,38 @@ class ArtifactStore:
 
     async def get_bytes(self, *, key: str) -> bytes:
         raise NotImplementedError
+
+    async def iter_bytes(self, *, key: str, chunk_size: int = ARTIFACT_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """Yield the object in chunks; stores should override to avoid loading it whole."""
+        data = await self.get_bytes(key=key)
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    async def put_file(self, *, key: str, fileobj: BinaryIO, content_type: str) -> StoredArtifact:
+        """
+        Store the contents of a seekable binary file.
+
+        The file is read in chunks. This fallback still hands `put_bytes` one buffer;
+        stores that can upload in parts or keep a buffer of their own override it.
+        """
+        buffer = bytearray()
+        for chunk in iter_file_chunks(fileobj):
+            buffer += chunk
+        return await self.put_bytes(key=key, data=bytes(buffer), content_type=content_type)
+
+
+def iter_file_chunks(fileobj: BinaryIO, chunk_size: int = ARTIFACT_CHUNK_BYTES):
+    """Rewind `fileobj` and yield its contents in chunks of at most `chunk_size` bytes."""
+    fileobj.seek(0)
+    return iter(lambda: fileobj.read(chunk_size), b"")
+
+
+def file_sha256(fileobj: BinaryIO) -> tuple[str, int]:
+    """SHA-256 hex digest and size of a seekable file, read in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter_file_chunks(fileobj):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
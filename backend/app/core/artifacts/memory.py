@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+from typing import BinaryIO
 
-from backend.app.core.artifacts.interface import ArtifactStore, StoredArtifact
+from backend.app.core.artifacts.interface import ArtifactStore, StoredArtifact, iter_file_chunks
 
 
 class MemoryArtifactStore(ArtifactStore):
@@ -14,6 +15,18 @@ class MemoryArtifactStore(ArtifactStore):
         self._data[key] = (data, content_type)
         return StoredArtifact(uri=f"memory://{key}", sha256=sha, size_bytes=len(data), content_type=content_type)
 
+    async def put_file(self, *, key: str, fileobj: BinaryIO, content_type: str) -> StoredArtifact:
+        # Hash and copy in one chunked pass; the store's own buffer is the only full copy.
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        for chunk in iter_file_chunks(fileobj):
+            digest.update(chunk)
+            buffer += chunk
+        self._data[key] = (bytes(buffer), content_type)
+        return StoredArtifact(
+            uri=f"memory://{key}", sha256=digest.hexdigest(), size_bytes=len(buffer), content_type=content_type
+        )
+
     async def get_bytes(self, *, key: str) -> bytes:
         if key not in self._data:
             raise KeyError(key)
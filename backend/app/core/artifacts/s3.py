@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import hashlib
+from typing import AsyncIterator, BinaryIO
 from urllib.parse import urlparse
 
 import boto3
 
-from backend.app.core.artifacts.interface import ArtifactStore, StoredArtifact
+from backend.app.core.artifacts.interface import ARTIFACT_CHUNK_BYTES, ArtifactStore, StoredArtifact, file_sha256
 from backend.app.core.config import get_settings
 
 
@@ -33,7 +34,24 @@ class S3ArtifactStore(ArtifactStore):
             content_type=content_type,
         )
 
+    async def put_file(self, *, key: str, fileobj: BinaryIO, content_type: str) -> StoredArtifact:
+        # Hash in a streaming pass, then let boto3 upload in multipart chunks so the
+        # file is never held in memory as a whole.
+        sha, size = file_sha256(fileobj)
+        self._client.upload_fileobj(fileobj, self._bucket, key, ExtraArgs={"ContentType": content_type})
+        return StoredArtifact(
+            uri=f"s3://{self._bucket}/{key}",
+            sha256=sha,
+            size_bytes=size,
+            content_type=content_type,
+        )
+
     async def get_bytes(self, *, key: str) -> bytes:
         obj = self._client.get_object(Bucket=self._bucket, Key=key)
         return obj["Body"].read()
 
+    async def iter_bytes(self, *, key: str, chunk_size: int = ARTIFACT_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        obj = self._client.get_object(Bucket=self._bucket, Key=key)
+        for chunk in obj["Body"].iter_chunks(chunk_size):
+            yield chunk
+
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from urllib.parse import urlparse
+
 from backend.app.core.artifacts.interface import ArtifactStore
 from backend.app.core.config import get_settings
 
@@ -25,6 +27,18 @@ def get_artifact_store() -> ArtifactStore:
     return _STORE
 
 
+def artifact_key_from_uri(uri: str) -> str:
+    """Resolve the store key for a URI returned by `ArtifactStore.put_bytes`."""
+    parsed = urlparse(uri)
+    if parsed.scheme == "memory":
+        key = parsed.netloc + parsed.path
+        return key[1:] if key.startswith("/") else key
+    if parsed.scheme == "s3":
+        # s3://bucket/key -> path is /key
+        return parsed.path[1:] if parsed.path.startswith("/") else parsed.path
+    raise ValueError("ARTIFACT_URI_INVALID")
+
+
 def reset_artifact_store_for_tests() -> None:
     global _STORE
     _STORE = None
@@ -2,28 +2,152 @@
 API endpoints for audit log querying and export.
 
 Provides endpoints for external audit tools to access and query audit logs.
+
+Listing uses keyset pagination on (created_at, audit_log_id) so deep pages cost the
+same as the first one; exports stream rows from a server-side cursor straight into
+the response without materializing the result set.
 """
 
 from __future__ import annotations
 
+import base64
+import csv
 from datetime import datetime
-from typing import Any
+import io
+import json
+from typing import Any, AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse, StreamingResponse
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, and_, func, or_, select, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import CompileError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.auth.dependencies import require_principal
 from backend.app.core.audit.models import AuditLog
-from backend.app.core.db import get_db_session
+from backend.app.core.db import get_db_session, get_sessionmaker
 from backend.app.core.rbac.roles import Role
-import csv
-import io
 
 router = APIRouter(prefix="/api/v3/audit", tags=["audit"])
 
 
+EXPORT_BATCH_SIZE = 1000
+
+_CSV_FIELDS = [
+    "audit_log_id",
+    "dataset_version_id",
+    "calculation_run_id",
+    "artifact_id",
+    "actor_id",
+    "actor_type",
+    "action_type",
+    "action_label",
+    "created_at",
+    "reason",
+    "status",
+    "error_message",
+]
+
+
+def _filters(
+    *,
+    dataset_version_id: str | None = None,
+    calculation_run_id: str | None = None,
+    action_type: str | None = None,
+    actor_id: str | None = None,
+    status: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> list[Any]:
+    clauses: list[Any] = []
+    if dataset_version_id:
+        clauses.append(AuditLog.dataset_version_id == dataset_version_id)
+    if calculation_run_id:
+        clauses.append(AuditLog.calculation_run_id == calculation_run_id)
+    if action_type:
+        clauses.append(AuditLog.action_type == action_type)
+    if actor_id:
+        clauses.append(AuditLog.actor_id == actor_id)
+    if status:
+        clauses.append(AuditLog.status == status)
+    if start_date:
+        clauses.append(AuditLog.created_at >= start_date)
+    if end_date:
+        clauses.append(AuditLog.created_at <= end_date)
+    return clauses
+
+
+def _encode_cursor(created_at: datetime, audit_log_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), audit_log_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, audit_log_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at_raw), str(audit_log_id)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail="CURSOR_INVALID") from exc
+
+
+def _serialize_log(log: AuditLog) -> dict[str, Any]:
+    return {
+        "audit_log_id": log.audit_log_id,
+        "dataset_version_id": log.dataset_version_id,
+        "calculation_run_id": log.calculation_run_id,
+        "artifact_id": log.artifact_id,
+        "actor_id": log.actor_id,
+        "actor_type": log.actor_type,
+        "action_type": log.action_type,
+        "action_label": log.action_label,
+        "created_at": log.created_at.isoformat(),
+        "reason": log.reason,
+        "context": log.context,
+        "metadata": log.event_metadata,
+        "status": log.status,
+        "error_message": log.error_message,
+    }
+
+
+def _explain_sql(stmt: Select, dialect: Dialect) -> str | None:
+    """`EXPLAIN` for `stmt` with its binds rendered by `dialect`, or None when a bind cannot be rendered."""
+    try:
+        compiled = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    except (CompileError, NotImplementedError):
+        return None
+    return "EXPLAIN (FORMAT JSON) " + compiled.string
+
+
+async def _count(db: AsyncSession, clauses: list[Any], *, estimated: bool) -> int:
+    """
+    Count matching rows.
+
+    With `estimated=True` on PostgreSQL the planner's row estimate is used instead of
+    a full count; other dialects, and filters whose values cannot be rendered into
+    the `EXPLAIN` statement, fall back to an exact COUNT(*).
+    """
+    if estimated and db.bind.dialect.name == "postgresql":
+        if not clauses:
+            reltuples = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+                {"name": AuditLog.__tablename__},
+            )
+            if reltuples is not None and int(reltuples) >= 0:
+                return int(reltuples)
+        explain = _explain_sql(select(AuditLog.audit_log_id).where(*clauses), db.bind.dialect)
+        if explain is not None:
+            # Driver-level execution: rendered literals (e.g. '... 00:00:00') must not be re-parsed as binds.
+            connection = await db.connection()
+            plan = (await connection.exec_driver_sql(explain)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+    total = await db.scalar(select(func.count()).select_from(AuditLog).where(*clauses))
+    return int(total or 0)
+
+
 @router.get("/logs")
 async def query_audit_logs(
     dataset_version_id: str | None = Query(None, description="Filter by DatasetVersion ID"),
@@ -34,90 +158,133 @@ async def query_audit_logs(
     start_date: datetime | None = Query(None, description="Start date for filtering"),
     end_date: datetime | None = Query(None, description="End date for filtering"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (prefer cursor)"),
+    cursor: str | None = Query(None, description="Opaque keyset cursor from a previous page's next_cursor"),
+    count: str = Query("exact", description="Total count mode: exact, estimated, or none"),
     db: AsyncSession = Depends(get_db_session),
     _: object = Depends(require_principal(Role.INGEST)),
 ) -> dict[str, Any]:
     """
     Query audit logs with filtering and pagination.
-    
+
+    Results are ordered newest first by (created_at, audit_log_id). Pass the returned
+    `next_cursor` as `cursor` to fetch the following page; `offset` is still accepted
+    for backward compatibility but cannot be combined with `cursor`.
+
     Returns:
         Dictionary with audit logs and pagination metadata
     """
-    # Build query
-    query = select(AuditLog)
-    
-    if dataset_version_id:
-        query = query.where(AuditLog.dataset_version_id == dataset_version_id)
-    if calculation_run_id:
-        query = query.where(AuditLog.calculation_run_id == calculation_run_id)
-    if action_type:
-        query = query.where(AuditLog.action_type == action_type)
-    if actor_id:
-        query = query.where(AuditLog.actor_id == actor_id)
-    if status:
-        query = query.where(AuditLog.status == status)
-    if start_date:
-        query = query.where(AuditLog.created_at >= start_date)
-    if end_date:
-        query = query.where(AuditLog.created_at <= end_date)
-    
-    # Order by created_at descending
-    query = query.order_by(AuditLog.created_at.desc())
-    
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-    
-    # Execute query
+    if count not in ("exact", "estimated", "none"):
+        raise HTTPException(status_code=400, detail="COUNT_MODE_INVALID")
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="CURSOR_AND_OFFSET_EXCLUSIVE")
+
+    clauses = _filters(
+        dataset_version_id=dataset_version_id,
+        calculation_run_id=calculation_run_id,
+        action_type=action_type,
+        actor_id=actor_id,
+        status=status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    query = select(AuditLog).where(*clauses)
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(
+                AuditLog.created_at < cursor_created_at,
+                and_(AuditLog.created_at == cursor_created_at, AuditLog.audit_log_id < cursor_id),
+            )
+        )
+    query = query.order_by(AuditLog.created_at.desc(), AuditLog.audit_log_id.desc())
+    query = query.limit(limit + 1)
+    if offset:
+        query = query.offset(offset)
+
     result = await db.execute(query)
-    logs = result.scalars().all()
-    
-    # Count total (for pagination)
-    count_query = select(AuditLog)
-    if dataset_version_id:
-        count_query = count_query.where(AuditLog.dataset_version_id == dataset_version_id)
-    if calculation_run_id:
-        count_query = count_query.where(AuditLog.calculation_run_id == calculation_run_id)
-    if action_type:
-        count_query = count_query.where(AuditLog.action_type == action_type)
-    if actor_id:
-        count_query = count_query.where(AuditLog.actor_id == actor_id)
-    if status:
-        count_query = count_query.where(AuditLog.status == status)
-    if start_date:
-        count_query = count_query.where(AuditLog.created_at >= start_date)
-    if end_date:
-        count_query = count_query.where(AuditLog.created_at <= end_date)
-    
-    count_result = await db.execute(count_query)
-    total_count = len(count_result.scalars().all())
-    
-    # Serialize logs
-    logs_data = []
-    for log in logs:
-        logs_data.append({
+    logs = list(result.scalars().all())
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+
+    total_count = None if count == "none" else await _count(db, clauses, estimated=count == "estimated")
+
+    return {
+        "logs": [_serialize_log(log) for log in logs],
+        "total": total_count,
+        "total_is_estimate": count == "estimated",
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": _encode_cursor(logs[-1].created_at, logs[-1].audit_log_id) if has_more else None,
+    }
+
+
+async def _stream_logs(query: Select) -> AsyncIterator[AuditLog]:
+    # The export outlives the request-scoped session, so it owns its own session and
+    # reads through a server-side cursor in fixed-size partitions.
+    async with get_sessionmaker()() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for partition in result.scalars().partitions(EXPORT_BATCH_SIZE):
+            for log in partition:
+                yield log
+            session.expunge_all()
+
+
+async def _csv_chunks(query: Select) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_CSV_FIELDS)
+    writer.writeheader()
+    pending = 0
+    async for log in _stream_logs(query):
+        writer.writerow({
             "audit_log_id": log.audit_log_id,
-            "dataset_version_id": log.dataset_version_id,
-            "calculation_run_id": log.calculation_run_id,
-            "artifact_id": log.artifact_id,
+            "dataset_version_id": log.dataset_version_id or "",
+            "calculation_run_id": log.calculation_run_id or "",
+            "artifact_id": log.artifact_id or "",
             "actor_id": log.actor_id,
             "actor_type": log.actor_type,
             "action_type": log.action_type,
-            "action_label": log.action_label,
+            "action_label": log.action_label or "",
             "created_at": log.created_at.isoformat(),
-            "reason": log.reason,
-            "context": log.context,
-            "metadata": log.event_metadata,
+            "reason": log.reason or "",
             "status": log.status,
-            "error_message": log.error_message,
+            "error_message": log.error_message or "",
         })
-    
-    return {
-        "logs": logs_data,
-        "total": total_count,
-        "limit": limit,
-        "offset": offset,
-    }
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue()
+
+
+async def _ndjson_chunks(query: Select) -> AsyncIterator[str]:
+    lines: list[str] = []
+    async for log in _stream_logs(query):
+        lines.append(json.dumps(_serialize_log(log), separators=(",", ":")))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def _json_chunks(query: Select) -> AsyncIterator[str]:
+    # Same document shape as before ({"logs": [...], "total": N}), emitted incrementally.
+    yield '{"logs":['
+    total = 0
+    parts: list[str] = []
+    async for log in _stream_logs(query):
+        parts.append(("," if total else "") + json.dumps(_serialize_log(log), separators=(",", ":")))
+        total += 1
+        if len(parts) >= EXPORT_BATCH_SIZE:
+            yield "".join(parts)
+            parts = []
+    if parts:
+        yield "".join(parts)
+    yield f'],"total":{total}}}'
 
 
 @router.get("/logs/export")
@@ -125,102 +292,50 @@ async def export_audit_logs(
     dataset_version_id: str | None = Query(None, description="Filter by DatasetVersion ID"),
     calculation_run_id: str | None = Query(None, description="Filter by CalculationRun ID"),
     action_type: str | None = Query(None, description="Filter by action type"),
+    actor_id: str | None = Query(None, description="Filter by actor ID"),
+    status: str | None = Query(None, description="Filter by status"),
     start_date: datetime | None = Query(None, description="Start date for filtering"),
     end_date: datetime | None = Query(None, description="End date for filtering"),
-    format: str = Query("csv", description="Export format: csv or json"),
-    db: AsyncSession = Depends(get_db_session),
+    format: str = Query("csv", description="Export format: csv, ndjson or json"),
     _: object = Depends(require_principal(Role.INGEST)),
-):
+) -> StreamingResponse:
     """
-    Export audit logs in CSV or JSON format.
-    
+    Export audit logs in CSV, NDJSON or JSON format.
+
+    Rows are streamed from a server-side cursor; memory use is bounded by
+    `EXPORT_BATCH_SIZE` regardless of the number of matching logs.
+
     Returns:
-        StreamingResponse with CSV or JSON data
+        StreamingResponse with CSV, NDJSON or JSON data
     """
-    # Build query (same as query_audit_logs but without pagination)
-    query = select(AuditLog)
-    
-    if dataset_version_id:
-        query = query.where(AuditLog.dataset_version_id == dataset_version_id)
-    if calculation_run_id:
-        query = query.where(AuditLog.calculation_run_id == calculation_run_id)
-    if action_type:
-        query = query.where(AuditLog.action_type == action_type)
-    if start_date:
-        query = query.where(AuditLog.created_at >= start_date)
-    if end_date:
-        query = query.where(AuditLog.created_at <= end_date)
-    
-    query = query.order_by(AuditLog.created_at.desc())
-    
-    # Execute query
-    result = await db.execute(query)
-    logs = result.scalars().all()
-    
+    if format not in ("csv", "ndjson", "json"):
+        raise HTTPException(status_code=400, detail="EXPORT_FORMAT_INVALID")
+
+    clauses = _filters(
+        dataset_version_id=dataset_version_id,
+        calculation_run_id=calculation_run_id,
+        action_type=action_type,
+        actor_id=actor_id,
+        status=status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    query = (
+        select(AuditLog)
+        .where(*clauses)
+        .order_by(AuditLog.created_at.desc(), AuditLog.audit_log_id.desc())
+    )
+
     if format == "csv":
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=[
-                "audit_log_id",
-                "dataset_version_id",
-                "calculation_run_id",
-                "artifact_id",
-                "actor_id",
-                "actor_type",
-                "action_type",
-                "action_label",
-                "created_at",
-                "reason",
-                "status",
-                "error_message",
-            ],
-        )
-        writer.writeheader()
-        for log in logs:
-            writer.writerow({
-                "audit_log_id": log.audit_log_id,
-                "dataset_version_id": log.dataset_version_id or "",
-                "calculation_run_id": log.calculation_run_id or "",
-                "artifact_id": log.artifact_id or "",
-                "actor_id": log.actor_id,
-                "actor_type": log.actor_type,
-                "action_type": log.action_type,
-                "action_label": log.action_label or "",
-                "created_at": log.created_at.isoformat(),
-                "reason": log.reason or "",
-                "status": log.status,
-                "error_message": log.error_message or "",
-            })
-        
-        output.seek(0)
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _csv_chunks(query),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=audit_logs.csv"},
         )
-    else:
-        # Generate JSON
-        logs_data = []
-        for log in logs:
-            logs_data.append({
-                "audit_log_id": log.audit_log_id,
-                "dataset_version_id": log.dataset_version_id,
-                "calculation_run_id": log.calculation_run_id,
-                "artifact_id": log.artifact_id,
-                "actor_id": log.actor_id,
-                "actor_type": log.actor_type,
-                "action_type": log.action_type,
-                "action_label": log.action_label,
-                "created_at": log.created_at.isoformat(),
-                "reason": log.reason,
-                "context": log.context,
-                "metadata": log.event_metadata,
-                "status": log.status,
-                "error_message": log.error_message,
-            })
-        
-        return JSONResponse(content={"logs": logs_data, "total": len(logs_data)})
-
-
+    if format == "ndjson":
+        return StreamingResponse(
+            _ndjson_chunks(query),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": "attachment; filename=audit_logs.ndjson"},
+        )
+    return StreamingResponse(_json_chunks(query), media_type="application/json")
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, JSON, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.models.base import Base
@@ -23,6 +23,18 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_log"
+    __table_args__ = (
+        # Keyset pagination order (created_at DESC, audit_log_id DESC)
+        Index("ix_audit_log_created_at_id", "created_at", "audit_log_id"),
+        # Common filtered listings: per dataset version, optionally per action type
+        Index(
+            "ix_audit_log_dataset_action_created",
+            "dataset_version_id",
+            "action_type",
+            "created_at",
+            "audit_log_id",
+        ),
+    )
 
     audit_log_id: Mapped[str] = mapped_column(String, primary_key=True)
     dataset_version_id: Mapped[str] = mapped_column(
@@ -10,11 +10,11 @@ from datetime import datetime, timezone
 from typing import Any
 import uuid
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.audit.models import AuditLog
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.audit.sink import DURABLE_ACTION_TYPES, get_audit_sink
+from backend.app.core.dataset.existence import dataset_version_exists
 
 
 async def log_action(
@@ -33,9 +33,17 @@ async def log_action(
     status: str = "success",
     error_message: str | None = None,
     timestamp: datetime | None = None,
+    durable: bool = False,
 ) -> AuditLog:
     """
     Log a platform action to the audit log.
+
+    The dataset-version reference is always checked first, so an unknown ID raises
+    ``ValueError``. When write-behind is enabled (``TODISCOPE_AUDIT_WRITE_BEHIND``,
+    off by default), non-durable entries are then only enqueued and the sink inserts
+    them in batches outside the caller's transaction; they are kept even if that
+    transaction rolls back. Durable entries (``durable=True`` or an action type in
+    ``DURABLE_ACTION_TYPES``) are added to ``db`` and commit with it.
     
     Args:
         db: Database session
@@ -52,9 +60,10 @@ async def log_action(
         status: Action status ("success", "failure", "warning")
         error_message: Optional error message if status is "failure"
         timestamp: Optional timestamp (defaults to now)
+        durable: Write synchronously in the caller's transaction
     
     Returns:
-        Created AuditLog instance
+        Created AuditLog instance (transient when the entry was enqueued)
     """
     # Validate required fields
     if not actor_id or not isinstance(actor_id, str):
@@ -86,30 +95,36 @@ async def log_action(
     if status not in ("success", "failure", "warning"):
         raise ValueError("status must be one of: success, failure, warning")
     
-    # Verify DatasetVersion exists if provided
+    row = {
+        "audit_log_id": uuid.uuid4().hex,
+        "dataset_version_id": dataset_version_id,
+        "calculation_run_id": calculation_run_id,
+        "artifact_id": artifact_id,
+        "actor_id": actor_id.strip(),
+        "actor_type": actor_type.strip(),
+        "action_type": action_type.strip(),
+        "action_label": action_label.strip() if action_label else None,
+        "created_at": timestamp if timestamp else datetime.now(timezone.utc),
+        "reason": reason,
+        "context": context or {},
+        "event_metadata": metadata or {},
+        "status": status,
+        "error_message": error_message,
+    }
+
+    # Verify DatasetVersion exists if provided (cached, so cheap on the write-behind path too)
     if dataset_version_id:
-        exists = await db.scalar(select(1).where(DatasetVersion.id == dataset_version_id))
-        if exists is None:
+        if not await dataset_version_exists(db, dataset_version_id):
             raise ValueError(f"DatasetVersion '{dataset_version_id}' not found")
-    
+
+    # Write-behind: hot path cost is an enqueue.
+    sink = get_audit_sink()
+    if not durable and row["action_type"] not in DURABLE_ACTION_TYPES and sink is not None:
+        if sink.try_enqueue(row):
+            return AuditLog(**row)
+
     # Create audit log entry
-    audit_log = AuditLog(
-        audit_log_id=uuid.uuid4().hex,
-        dataset_version_id=dataset_version_id,
-        calculation_run_id=calculation_run_id,
-        artifact_id=artifact_id,
-        actor_id=actor_id.strip(),
-        actor_type=actor_type.strip(),
-        action_type=action_type.strip(),
-        action_label=action_label.strip() if action_label else None,
-        created_at=timestamp if timestamp else datetime.now(timezone.utc),
-        reason=reason,
-        context=context or {},
-        event_metadata=metadata or {},
-        status=status,
-        error_message=error_message,
-    )
-    
+    audit_log = AuditLog(**row)
     db.add(audit_log)
     return audit_log
 
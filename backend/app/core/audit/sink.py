@@ -0,0 +1,207 @@
+"""
+Write-behind sink for audit log entries.
+
+Write-behind is opt-in (`TODISCOPE_AUDIT_WRITE_BEHIND=1`): entries written by the
+sink commit independently of the caller's transaction. When the sink is running,
+`log_action` checks the dataset-version reference and then enqueues non-durable
+entries instead of adding an `AuditLog` row to the caller's session. A background task drains the bounded
+queue and writes entries in multi-row INSERTs, triggered when `batch_size` entries
+are pending or every `flush_interval` seconds, whichever comes first.
+
+References are re-validated per batch through the existence cache, with a single
+IN query for any IDs not cached yet, because the sink's session may not see a dataset
+version that was only visible to the caller's uncommitted transaction. Such entries
+are retried for a few flush cycles; after that the reference is moved into the entry
+context so the row still satisfies the foreign key and nothing is lost. A batch
+whose INSERT or commit fails is requeued the same way, with the same attempt limit;
+entries are only dropped, with an error log per entry, once that limit is spent.
+
+Durable entries (see `DURABLE_ACTION_TYPES`) and any entry logged while the sink is
+stopped or its queue is full bypass the queue and are written synchronously in the
+caller's transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import insert
+
+from backend.app.core.audit.models import AuditLog
+from backend.app.core.dataset.existence import existing_dataset_versions
+from backend.app.core.db import get_sessionmaker
+
+
+logger = logging.getLogger(__name__)
+
+# Actions whose audit rows must commit atomically with the action they describe.
+DURABLE_ACTION_TYPES = frozenset({"integrity"})
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+MAX_RETRIES = 3
+
+
+class AuditSink:
+    """Bounded in-process queue of pending audit rows with a background flusher."""
+
+    def __init__(
+        self,
+        *,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        if batch_size < 1 or max_queue_size < batch_size:
+            raise ValueError("AUDIT_SINK_SIZES_INVALID")
+        self._queue: asyncio.Queue[tuple[dict[str, Any], int]] = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def try_enqueue(self, row: dict[str, Any]) -> bool:
+        """Queue an AuditLog row (attribute-keyed dict); False when stopped or full."""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((row, 0))
+        except asyncio.QueueFull:
+            return False
+        if self._queue.qsize() >= self._batch_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self) -> int:
+        """
+        Write the entries queued when the flush starts; returns the number of rows inserted.
+
+        Entries requeued for an unresolved dataset version or a failed write wait for
+        the next flush; a failed write is re-raised after its batch is requeued.
+        """
+        written = 0
+        async with self._flush_lock:
+            remaining = self._queue.qsize()
+            while remaining > 0:
+                batch: list[tuple[dict[str, Any], int]] = []
+                while len(batch) < self._batch_size and remaining > 0:
+                    batch.append(self._queue.get_nowait())
+                    remaining -= 1
+                written += await self._write_batch(batch)
+        return written
+
+    async def _write_batch(self, batch: list[tuple[dict[str, Any], int]]) -> int:
+        async with get_sessionmaker()() as session:
+            referenced = {row["dataset_version_id"] for row, _ in batch if row.get("dataset_version_id")}
+            known = await existing_dataset_versions(session, referenced) if referenced else set()
+
+            rows: list[tuple[dict[str, Any], int]] = []
+            for row, attempts in batch:
+                dv_id = row.get("dataset_version_id")
+                if dv_id and dv_id not in known:
+                    if attempts < MAX_RETRIES:
+                        self._requeue(row, attempts + 1)
+                        continue
+                    logger.warning("Audit entry %s references unknown dataset version %s", row["audit_log_id"], dv_id)
+                    row = {
+                        **row,
+                        "dataset_version_id": None,
+                        "context": {**row["context"], "unresolved_dataset_version_id": dv_id},
+                    }
+                rows.append((row, attempts))
+
+            if rows:
+                try:
+                    await session.execute(insert(AuditLog), [row for row, _ in rows])
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    for row, attempts in rows:
+                        if attempts < MAX_RETRIES:
+                            self._requeue(row, attempts + 1)
+                        else:
+                            logger.error(
+                                "Audit write failed %d times; dropping entry %s", attempts + 1, row["audit_log_id"]
+                            )
+                    raise
+            return len(rows)
+
+    def _requeue(self, row: dict[str, Any], attempts: int) -> None:
+        try:
+            self._queue.put_nowait((row, attempts))
+        except asyncio.QueueFull:
+            logger.error("Audit queue full; dropping requeued entry %s", row["audit_log_id"])
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Audit sink flush failed")
+
+    def start(self) -> None:
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write any remaining entries."""
+        # Signal rather than cancel so an in-flight batch is never abandoned mid-write.
+        self._stopping = True
+        self._wakeup.set()
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+        # Requeued entries exhaust their retries within MAX_RETRIES + 1 passes.
+        for _ in range(MAX_RETRIES + 1):
+            if self._queue.empty():
+                break
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Audit sink flush failed")
+
+
+_SINK: AuditSink | None = None
+
+
+def get_audit_sink() -> AuditSink | None:
+    return _SINK
+
+
+async def start_audit_sink(**kwargs: Any) -> AuditSink:
+    global _SINK
+    if _SINK is None or not _SINK.running:
+        _SINK = AuditSink(**kwargs)
+        _SINK.start()
+    return _SINK
+
+
+async def stop_audit_sink() -> None:
+    global _SINK
+    sink, _SINK = _SINK, None
+    if sink is not None:
+        await sink.stop()
+
+
+def reset_audit_sink_for_tests() -> None:
+    global _SINK
+    _SINK = None
@@ -12,6 +12,11 @@ class Settings:
     s3_secret_access_key: str | None
     s3_bucket: str | None
     api_keys: dict[str, tuple[str, ...]]
+    audit_write_behind: bool = False
+    slow_query_threshold_ms: float = 250.0
+    slow_query_explain: bool = False
+    slow_query_log_size: int = 200
+    engine_parallel_workers: int = 0
 
 
 def _parse_api_keys(raw: str) -> dict[str, tuple[str, ...]]:
@@ -36,6 +41,19 @@ def _parse_api_keys(raw: str) -> dict[str, tuple[str, ...]]:
     return out
 
 
+def _parse_parallel_workers(raw: str) -> int:
+    """Worker processes for parallel engine stages: 0 runs serially, "auto" uses every CPU."""
+    raw = raw.strip().lower()
+    if not raw:
+        return 0
+    if raw == "auto":
+        return os.cpu_count() or 1
+    workers = int(raw)
+    if workers < 0:
+        raise ValueError("Invalid TODISCOPE_ENGINE_PARALLEL_WORKERS (expected a non-negative integer or 'auto')")
+    return workers
+
+
 def get_settings() -> Settings:
     enabled = os.getenv("TODISCOPE_ENABLED_ENGINES", "")
     enabled_engines = tuple([e.strip() for e in enabled.split(",") if e.strip()])
@@ -48,4 +66,9 @@ def get_settings() -> Settings:
         s3_secret_access_key=os.getenv("TODISCOPE_S3_SECRET_ACCESS_KEY"),
         s3_bucket=os.getenv("TODISCOPE_S3_BUCKET"),
         api_keys=_parse_api_keys(os.getenv("TODISCOPE_API_KEYS", "")),
+        audit_write_behind=os.getenv("TODISCOPE_AUDIT_WRITE_BEHIND", "0").strip().lower() in ("1", "true", "yes"),
+        slow_query_threshold_ms=float(os.getenv("TODISCOPE_SLOW_QUERY_THRESHOLD_MS", "250")),
+        slow_query_explain=os.getenv("TODISCOPE_SLOW_QUERY_EXPLAIN", "0").strip().lower() in ("1", "true", "yes"),
+        slow_query_log_size=int(os.getenv("TODISCOPE_SLOW_QUERY_LOG_SIZE", "200")),
+        engine_parallel_workers=_parse_parallel_workers(os.getenv("TODISCOPE_ENGINE_PARALLEL_WORKERS", "")),
     )
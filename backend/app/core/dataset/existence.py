@@ -0,0 +1,84 @@
+"""
+Process-wide DatasetVersion existence cache.
+
+DatasetVersions are immutable and can never be deleted (see `install_immutability_guards`),
+so a positive existence result never goes stale and is cached without expiry. Negative
+results are cached only briefly (`NEGATIVE_TTL_SECONDS`) so a just-created version is
+visible to other processes almost immediately, while repeated lookups of a bogus ID
+(e.g. a retried request) still avoid the database.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.dataset.models import DatasetVersion
+
+
+NEGATIVE_TTL_SECONDS = 5.0
+MAX_POSITIVE_ENTRIES = 200_000
+MAX_NEGATIVE_ENTRIES = 10_000
+
+# dict used as an insertion-ordered set; the oldest entries are evicted past the cap.
+_KNOWN: dict[str, None] = {}
+_MISSING: dict[str, float] = {}
+
+
+def remember_dataset_version(dataset_version_id: str) -> None:
+    """Record a committed DatasetVersion as existing."""
+    _MISSING.pop(dataset_version_id, None)
+    if dataset_version_id in _KNOWN:
+        return
+    if len(_KNOWN) >= MAX_POSITIVE_ENTRIES:
+        _KNOWN.pop(next(iter(_KNOWN)))
+    _KNOWN[dataset_version_id] = None
+
+
+def _remember_missing(dataset_version_id: str) -> None:
+    if len(_MISSING) >= MAX_NEGATIVE_ENTRIES:
+        now = time.monotonic()
+        for key in [k for k, expires_at in _MISSING.items() if expires_at <= now]:
+            _MISSING.pop(key, None)
+        if len(_MISSING) >= MAX_NEGATIVE_ENTRIES:
+            _MISSING.clear()
+    _MISSING[dataset_version_id] = time.monotonic() + NEGATIVE_TTL_SECONDS
+
+
+async def dataset_version_exists(db: AsyncSession, dataset_version_id: str) -> bool:
+    """Return whether `dataset_version_id` exists, consulting the cache first."""
+    if not dataset_version_id:
+        return False
+    if dataset_version_id in _KNOWN:
+        return True
+    expires_at = _MISSING.get(dataset_version_id)
+    if expires_at is not None:
+        if expires_at > time.monotonic():
+            return False
+        _MISSING.pop(dataset_version_id, None)
+
+    found = await db.scalar(select(1).where(DatasetVersion.id == dataset_version_id))
+    if found is None:
+        _remember_missing(dataset_version_id)
+        return False
+    remember_dataset_version(dataset_version_id)
+    return True
+
+
+async def existing_dataset_versions(db: AsyncSession, dataset_version_ids: set[str]) -> set[str]:
+    """Return the subset of `dataset_version_ids` that exist, querying only uncached IDs."""
+    existing = {dv_id for dv_id in dataset_version_ids if dv_id in _KNOWN}
+    unknown = dataset_version_ids - existing
+    if unknown:
+        found = set((await db.execute(select(DatasetVersion.id).where(DatasetVersion.id.in_(unknown)))).scalars())
+        for dv_id in found:
+            remember_dataset_version(dv_id)
+        existing |= found
+    return existing
+
+
+def reset_dataset_version_cache_for_tests() -> None:
+    _KNOWN.clear()
+    _MISSING.clear()
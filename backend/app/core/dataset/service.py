@@ -4,6 +4,7 @@ from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.dataset.checksums import verify_raw_record_checksum
+from backend.app.core.dataset.existence import remember_dataset_version
 from backend.app.core.dataset.models import DatasetVersion
 from backend.app.core.dataset.raw_models import RawRecord
 from backend.app.core.dataset.uuidv7 import uuid7
@@ -14,6 +15,7 @@ async def create_dataset_version_via_ingestion(db: AsyncSession) -> DatasetVersi
     db.add(dv)
     await db.commit()
     await db.refresh(dv)
+    remember_dataset_version(dv.id)
     return dv
 
 
@@ -22,6 +24,7 @@ async def create_dataset_version_for_normalization(db: AsyncSession) -> DatasetV
     db.add(dv)
     await db.commit()
     await db.refresh(dv)
+    remember_dataset_version(dv.id)
     return dv
 
 
@@ -3,6 +3,7 @@ from collections.abc import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.app.core.config import get_settings
+from backend.app.core.query_metrics import install_query_instrumentation
 
 
 _ENGINE: AsyncEngine | None = None
@@ -19,6 +20,7 @@ def get_engine() -> AsyncEngine:
         raise RuntimeError("Database not configured (TODISCOPE_DATABASE_URL missing)")
 
     _ENGINE = create_async_engine(settings.database_url, pool_pre_ping=True)
+    install_query_instrumentation(_ENGINE.sync_engine)
     _SESSIONMAKER = async_sessionmaker(_ENGINE, expire_on_commit=False)
     return _ENGINE
 
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled
 from backend.app.core.engine_registry.registry import REGISTRY
+from backend.app.core.metrics import register_engine_routes
 
 
 def mount_enabled_engine_routers(app: FastAPI) -> None:
@@ -9,4 +10,5 @@ def mount_enabled_engine_routers(app: FastAPI) -> None:
         if is_engine_enabled(spec.engine_id):
             for r in spec.routers:
                 app.include_router(r)
+                register_engine_routes(spec.engine_id, r)
 
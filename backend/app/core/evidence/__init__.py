@@ -4,6 +4,8 @@ from backend.app.core.evidence.aggregation import (
     MissingEvidenceError,
     aggregate_evidence_by_engine,
     aggregate_evidence_by_kind,
+    count_evidence_by_engine,
+    count_evidence_by_kind,
     get_evidence_by_dataset_version,
     get_evidence_by_ids,
     get_evidence_for_findings,
@@ -11,22 +13,65 @@ from backend.app.core.evidence.aggregation import (
     get_findings_by_dataset_version,
     verify_evidence_traceability,
 )
-from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
+from backend.app.core.evidence.models import EvidenceRecord, EvidenceReference, FindingEvidenceLink, FindingRecord
+from backend.app.core.evidence.reader import EvidenceReader, EvidenceRef, FindingRef
+from backend.app.core.evidence.references import (
+    REF_CONTROL,
+    REF_RULE,
+    REF_SOURCE_RECORD,
+    SUBJECT_EVIDENCE,
+    SUBJECT_FINDING,
+    backfill_references,
+    extract_references,
+)
 from backend.app.core.evidence.service import (
+    EvidenceBatch,
+    as_stored_payload,
+    bulk_create_evidence,
+    bulk_create_findings,
+    bulk_link_findings_to_evidence,
     create_evidence,
     create_finding,
     deterministic_evidence_id,
+    existing_ids,
+    existing_rows,
     link_finding_to_evidence,
+    persist_evidence_batch,
+    verify_existing_evidence,
+    verify_existing_finding,
+    verify_existing_link,
 )
 
 __all__ = [
     "EvidenceRecord",
+    "EvidenceReference",
     "FindingEvidenceLink",
     "FindingRecord",
+    "EvidenceReader",
+    "EvidenceRef",
+    "FindingRef",
+    "REF_CONTROL",
+    "REF_RULE",
+    "REF_SOURCE_RECORD",
+    "SUBJECT_EVIDENCE",
+    "SUBJECT_FINDING",
+    "backfill_references",
+    "extract_references",
+    "EvidenceBatch",
+    "as_stored_payload",
+    "bulk_create_evidence",
+    "bulk_create_findings",
+    "bulk_link_findings_to_evidence",
     "create_evidence",
     "create_finding",
     "deterministic_evidence_id",
+    "existing_ids",
+    "existing_rows",
     "link_finding_to_evidence",
+    "persist_evidence_batch",
+    "verify_existing_evidence",
+    "verify_existing_finding",
+    "verify_existing_link",
     "EvidenceAggregationError",
     "DatasetVersionMismatchError",
     "MissingEvidenceError",
@@ -36,6 +81,8 @@ __all__ = [
     "get_evidence_for_findings",
     "aggregate_evidence_by_kind",
     "aggregate_evidence_by_engine",
+    "count_evidence_by_kind",
+    "count_evidence_by_engine",
     "verify_evidence_traceability",
     "get_evidence_summary",
 ]
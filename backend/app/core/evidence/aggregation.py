@@ -11,8 +11,9 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, defer
 
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 
@@ -173,23 +174,26 @@ async def get_evidence_for_findings(
         return {}
     
     # First, verify all findings belong to the correct dataset version
+    # (IDs only; finding payloads are not needed here)
     findings_result = await db.execute(
-        select(FindingRecord).where(FindingRecord.finding_id.in_(finding_ids))
+        select(FindingRecord.finding_id, FindingRecord.dataset_version_id).where(
+            FindingRecord.finding_id.in_(finding_ids)
+        )
     )
-    findings = findings_result.scalars().all()
-    
-    for finding in findings:
-        if finding.dataset_version_id != dataset_version_id:
+    for finding_id, finding_dv_id in findings_result.all():
+        if finding_dv_id != dataset_version_id:
             raise DatasetVersionMismatchError(
-                f"Finding {finding.finding_id} belongs to dataset_version_id {finding.dataset_version_id}, "
+                f"Finding {finding_id} belongs to dataset_version_id {finding_dv_id}, "
                 f"expected {dataset_version_id}"
             )
     
     # Get all links for these findings
     links_result = await db.execute(
-        select(FindingEvidenceLink).where(FindingEvidenceLink.finding_id.in_(finding_ids))
+        select(FindingEvidenceLink.finding_id, FindingEvidenceLink.evidence_id).where(
+            FindingEvidenceLink.finding_id.in_(finding_ids)
+        )
     )
-    links = links_result.scalars().all()
+    links = links_result.all()
     
     # Collect evidence IDs
     evidence_ids = {link.evidence_id for link in links}
@@ -227,58 +231,142 @@ async def get_evidence_for_findings(
     return dict(result)
 
 
+EVIDENCE_STREAM_BATCH_SIZE = 1000
+
+
+async def count_evidence_by_kind(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    engine_id: str | None = None,
+) -> dict[str, int]:
+    """
+    Count evidence records per kind with a single GROUP BY query.
+    
+    Args:
+        db: Database session
+        dataset_version_id: The dataset version ID
+        engine_id: Optional filter by engine ID
+        
+    Returns:
+        Dictionary mapping evidence kind to record count
+    """
+    query = (
+        select(EvidenceRecord.kind, func.count())
+        .where(EvidenceRecord.dataset_version_id == dataset_version_id)
+        .group_by(EvidenceRecord.kind)
+    )
+    if engine_id is not None:
+        query = query.where(EvidenceRecord.engine_id == engine_id)
+    return {kind: int(count) for kind, count in (await db.execute(query)).all()}
+
+
+async def count_evidence_by_engine(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+) -> dict[str, int]:
+    """
+    Count evidence records per engine with a single GROUP BY query.
+    
+    Args:
+        db: Database session
+        dataset_version_id: The dataset version ID
+        
+    Returns:
+        Dictionary mapping engine_id to record count
+    """
+    query = (
+        select(EvidenceRecord.engine_id, func.count())
+        .where(EvidenceRecord.dataset_version_id == dataset_version_id)
+        .group_by(EvidenceRecord.engine_id)
+    )
+    return {engine_id: int(count) for engine_id, count in (await db.execute(query)).all()}
+
+
+async def _group_evidence(
+    db: AsyncSession,
+    *,
+    group_by: InstrumentedAttribute[str],
+    dataset_version_id: str,
+    engine_id: str | None,
+    include_payload: bool,
+) -> dict[str, list[EvidenceRecord]]:
+    query = select(EvidenceRecord).where(EvidenceRecord.dataset_version_id == dataset_version_id)
+    if engine_id is not None:
+        query = query.where(EvidenceRecord.engine_id == engine_id)
+    if not include_payload:
+        # Raise instead of lazy-loading so a caller touching payload fails loudly
+        # rather than issuing one query per record.
+        query = query.options(defer(EvidenceRecord.payload, raiseload=True))
+    query = query.order_by(EvidenceRecord.created_at.asc(), EvidenceRecord.evidence_id.asc())
+
+    grouped: dict[str, list[EvidenceRecord]] = defaultdict(list)
+    result = await db.stream(query.execution_options(yield_per=EVIDENCE_STREAM_BATCH_SIZE))
+    async for partition in result.scalars().partitions():
+        for record in partition:
+            grouped[getattr(record, group_by.key)].append(record)
+    return dict(grouped)
+
+
 async def aggregate_evidence_by_kind(
     db: AsyncSession,
     *,
     dataset_version_id: str,
     engine_id: str | None = None,
+    include_payload: bool = True,
 ) -> dict[str, list[EvidenceRecord]]:
     """
     Aggregate evidence records grouped by kind.
     
+    Rows are streamed in batches of `EVIDENCE_STREAM_BATCH_SIZE`. Use
+    `count_evidence_by_kind` when only the counts are needed.
+    
     Args:
         db: Database session
         dataset_version_id: The dataset version ID
         engine_id: Optional filter by engine ID
+        include_payload: If False, the payload column is not loaded; accessing it raises
         
     Returns:
         Dictionary mapping evidence kind to list of EvidenceRecord instances
     """
-    evidence_records = await get_evidence_by_dataset_version(
-        db, dataset_version_id=dataset_version_id, engine_id=engine_id
+    return await _group_evidence(
+        db,
+        group_by=EvidenceRecord.kind,
+        dataset_version_id=dataset_version_id,
+        engine_id=engine_id,
+        include_payload=include_payload,
     )
-    
-    grouped: dict[str, list[EvidenceRecord]] = defaultdict(list)
-    for record in evidence_records:
-        grouped[record.kind].append(record)
-    
-    return dict(grouped)
 
 
 async def aggregate_evidence_by_engine(
     db: AsyncSession,
     *,
     dataset_version_id: str,
+    include_payload: bool = True,
 ) -> dict[str, list[EvidenceRecord]]:
     """
     Aggregate evidence records grouped by engine ID.
     
+    Rows are streamed in batches of `EVIDENCE_STREAM_BATCH_SIZE`. Use
+    `count_evidence_by_engine` when only the counts are needed.
+    
     Args:
         db: Database session
         dataset_version_id: The dataset version ID
+        include_payload: If False, the payload column is not loaded; accessing it raises
         
     Returns:
         Dictionary mapping engine_id to list of EvidenceRecord instances
     """
-    evidence_records = await get_evidence_by_dataset_version(
-        db, dataset_version_id=dataset_version_id
+    return await _group_evidence(
+        db,
+        group_by=EvidenceRecord.engine_id,
+        dataset_version_id=dataset_version_id,
+        engine_id=None,
+        include_payload=include_payload,
     )
-    
-    grouped: dict[str, list[EvidenceRecord]] = defaultdict(list)
-    for record in evidence_records:
-        grouped[record.engine_id].append(record)
-    
-    return dict(grouped)
 
 
 async def verify_evidence_traceability(
@@ -290,6 +378,8 @@ async def verify_evidence_traceability(
     """
     Verify that all evidence is properly traceable to the dataset version.
     
+    Only evidence IDs and dataset version IDs are read; payloads are never loaded.
+    
     Args:
         db: Database session
         dataset_version_id: The dataset version ID to verify against
@@ -307,43 +397,45 @@ async def verify_evidence_traceability(
         MissingEvidenceError: If any evidence ID is not found (when evidence_ids is provided)
     """
     if evidence_ids is None:
-        # Verify all evidence for this dataset version
-        evidence_records = await get_evidence_by_dataset_version(
-            db, dataset_version_id=dataset_version_id
+        # Every row selected by dataset_version_id trivially traces back to it.
+        total = await db.scalar(
+            select(func.count())
+            .select_from(EvidenceRecord)
+            .where(EvidenceRecord.dataset_version_id == dataset_version_id)
         )
-        evidence_ids_to_check = [record.evidence_id for record in evidence_records]
-    else:
-        # Verify specific evidence IDs
-        evidence_ids_to_check = evidence_ids
-        result = await db.execute(
-            select(EvidenceRecord).where(EvidenceRecord.evidence_id.in_(evidence_ids_to_check))
-        )
-        found_records = result.scalars().all()
-        found_ids = {record.evidence_id for record in found_records}
-        missing_ids = set(evidence_ids_to_check) - found_ids
-        
-        if missing_ids:
-            raise MissingEvidenceError(f"Missing evidence IDs: {sorted(missing_ids)}")
-    
-    mismatches: list[dict[str, str]] = []
-    
-    if evidence_ids_to_check:
+        return {
+            "valid": True,
+            "total_checked": int(total or 0),
+            "mismatches": [],
+            "missing": [],
+        }
+
+    found: dict[str, str] = {}
+    if evidence_ids:
         result = await db.execute(
-            select(EvidenceRecord).where(EvidenceRecord.evidence_id.in_(evidence_ids_to_check))
+            select(EvidenceRecord.evidence_id, EvidenceRecord.dataset_version_id).where(
+                EvidenceRecord.evidence_id.in_(evidence_ids)
+            )
         )
-        records = result.scalars().all()
-        
-        for record in records:
-            if record.dataset_version_id != dataset_version_id:
-                mismatches.append({
-                    "evidence_id": record.evidence_id,
-                    "expected_dataset_version_id": dataset_version_id,
-                    "actual_dataset_version_id": record.dataset_version_id,
-                })
-    
+        found = {evidence_id: dv_id for evidence_id, dv_id in result.all()}
+
+    missing_ids = set(evidence_ids) - found.keys()
+    if missing_ids:
+        raise MissingEvidenceError(f"Missing evidence IDs: {sorted(missing_ids)}")
+
+    mismatches: list[dict[str, str]] = [
+        {
+            "evidence_id": evidence_id,
+            "expected_dataset_version_id": dataset_version_id,
+            "actual_dataset_version_id": actual,
+        }
+        for evidence_id, actual in found.items()
+        if actual != dataset_version_id
+    ]
+
     return {
         "valid": len(mismatches) == 0,
-        "total_checked": len(evidence_ids_to_check),
+        "total_checked": len(evidence_ids),
         "mismatches": mismatches,
         "missing": [],
     }
@@ -357,6 +449,8 @@ async def get_evidence_summary(
     """
     Get a summary of all evidence for a dataset version.
     
+    Computed with one GROUP BY (kind, engine_id) query; no evidence rows are loaded.
+    
     Args:
         db: Database session
         dataset_version_id: The dataset version ID
@@ -370,41 +464,38 @@ async def get_evidence_summary(
         - earliest_evidence: ISO datetime string or None
         - latest_evidence: ISO datetime string or None
     """
-    evidence_records = await get_evidence_by_dataset_version(
-        db, dataset_version_id=dataset_version_id
+    result = await db.execute(
+        select(
+            EvidenceRecord.kind,
+            EvidenceRecord.engine_id,
+            func.count(),
+            func.min(EvidenceRecord.created_at),
+            func.max(EvidenceRecord.created_at),
+        )
+        .where(EvidenceRecord.dataset_version_id == dataset_version_id)
+        .group_by(EvidenceRecord.kind, EvidenceRecord.engine_id)
     )
-    
-    if not evidence_records:
-        return {
-            "dataset_version_id": dataset_version_id,
-            "total_evidence_count": 0,
-            "evidence_by_kind": {},
-            "evidence_by_engine": {},
-            "earliest_evidence": None,
-            "latest_evidence": None,
-        }
-    
+
+    total = 0
     by_kind: dict[str, int] = defaultdict(int)
     by_engine: dict[str, int] = defaultdict(int)
-    
-    timestamps: list[datetime] = []
-    
-    for record in evidence_records:
-        by_kind[record.kind] += 1
-        by_engine[record.engine_id] += 1
-        timestamps.append(record.created_at)
-    
+    earliest: datetime | None = None
+    latest: datetime | None = None
+
+    for kind, engine_id, count, group_earliest, group_latest in result.all():
+        total += count
+        by_kind[kind] += count
+        by_engine[engine_id] += count
+        if earliest is None or group_earliest < earliest:
+            earliest = group_earliest
+        if latest is None or group_latest > latest:
+            latest = group_latest
+
     return {
         "dataset_version_id": dataset_version_id,
-        "total_evidence_count": len(evidence_records),
+        "total_evidence_count": total,
         "evidence_by_kind": dict(by_kind),
         "evidence_by_engine": dict(by_engine),
-        "earliest_evidence": min(timestamps).isoformat() if timestamps else None,
-        "latest_evidence": max(timestamps).isoformat() if timestamps else None,
+        "earliest_evidence": earliest.isoformat() if earliest else None,
+        "latest_evidence": latest.isoformat() if latest else None,
     }
-
-
-
-
-
-
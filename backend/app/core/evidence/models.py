@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, JSON, String
+from sqlalchemy import DateTime, ForeignKey, Index, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.models.base import Base
@@ -46,3 +46,27 @@ class FindingEvidenceLink(Base):
     evidence_id: Mapped[str] = mapped_column(
         String, ForeignKey("evidence_records.evidence_id"), nullable=False, index=True
     )
+
+
+class EvidenceReference(Base):
+    """
+    Identifier pulled out of an evidence or finding payload at write time.
+
+    Payloads are opaque JSON; this side table makes "which evidence references
+    control X" or "which findings came from rule Y" an index lookup. Rows are written
+    by `create_evidence`/`create_finding` and never change (payloads are immutable).
+    """
+
+    __tablename__ = "evidence_reference"
+    __table_args__ = (
+        # Lookup by reference within a dataset version
+        Index("ix_evidence_reference_lookup", "dataset_version_id", "ref_type", "ref_value", "subject_type"),
+    )
+
+    subject_type: Mapped[str] = mapped_column(String, primary_key=True)
+    subject_id: Mapped[str] = mapped_column(String, primary_key=True)
+    ref_type: Mapped[str] = mapped_column(String, primary_key=True)
+    ref_value: Mapped[str] = mapped_column(String, primary_key=True)
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), nullable=False
+    )
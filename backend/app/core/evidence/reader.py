@@ -0,0 +1,265 @@
+"""
+Projection-first read API for evidence and findings.
+
+Evidence and finding rows carry arbitrary JSON payloads, but most readers (report
+indexes, traceability checks, link walks) only need identifiers and kinds. An
+`EvidenceReader` selects the metadata columns only and returns lightweight refs;
+payloads are fetched separately, on first request, in batches that also cover the
+other refs the reader has handed out but not yet loaded.
+
+Refs and payloads are kept in a per-reader identity map. `EvidenceReader.for_session`
+returns one reader per session, so a request-scoped session gets a request-scoped
+cache: assembling a report that touches the same evidence from several sections
+reads each row (and parses each payload) at most once. Evidence and findings are
+immutable once written, so cached entries never go stale within a session.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
+
+
+DEFAULT_PAYLOAD_BATCH_SIZE = 500
+_SESSION_INFO_KEY = "evidence_reader"
+
+
+@dataclass(frozen=True)
+class EvidenceRef:
+    evidence_id: str
+    dataset_version_id: str
+    engine_id: str
+    kind: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class FindingRef:
+    finding_id: str
+    dataset_version_id: str
+    raw_record_id: str
+    kind: str
+    created_at: datetime
+
+
+_EVIDENCE_COLUMNS = (
+    EvidenceRecord.evidence_id,
+    EvidenceRecord.dataset_version_id,
+    EvidenceRecord.engine_id,
+    EvidenceRecord.kind,
+    EvidenceRecord.created_at,
+)
+_FINDING_COLUMNS = (
+    FindingRecord.finding_id,
+    FindingRecord.dataset_version_id,
+    FindingRecord.raw_record_id,
+    FindingRecord.kind,
+    FindingRecord.created_at,
+)
+
+
+class EvidenceReader:
+    """Session-bound identity map over evidence/finding metadata with lazy batched payloads."""
+
+    def __init__(self, db: AsyncSession, *, payload_batch_size: int = DEFAULT_PAYLOAD_BATCH_SIZE) -> None:
+        if payload_batch_size < 1:
+            raise ValueError("PAYLOAD_BATCH_SIZE_INVALID")
+        self._db = db
+        self._payload_batch_size = payload_batch_size
+        self._evidence: dict[str, EvidenceRef] = {}
+        self._findings: dict[str, FindingRef] = {}
+        self._links: dict[str, tuple[str, ...]] = {}
+        self._evidence_payloads: dict[str, dict] = {}
+        self._finding_payloads: dict[str, dict] = {}
+        # Refs handed out whose payload has not been loaded yet, in issue order.
+        self._pending_evidence: dict[str, None] = {}
+        self._pending_findings: dict[str, None] = {}
+
+    @classmethod
+    def for_session(cls, db: AsyncSession) -> "EvidenceReader":
+        """Return the reader cached on `db`, creating it on first use."""
+        reader = db.info.get(_SESSION_INFO_KEY)
+        if reader is None:
+            reader = cls(db)
+            db.info[_SESSION_INFO_KEY] = reader
+        return reader
+
+    # Metadata (projection-only)
+
+    async def evidence(self, evidence_ids: Iterable[str]) -> dict[str, EvidenceRef]:
+        """Return refs for the given IDs; IDs that do not exist are absent from the result."""
+        ids = _unique(evidence_ids)
+        unknown = [i for i in ids if i not in self._evidence]
+        if unknown:
+            rows = await self._db.execute(select(*_EVIDENCE_COLUMNS).where(EvidenceRecord.evidence_id.in_(unknown)))
+            for row in rows.all():
+                self._remember_evidence(EvidenceRef(*row))
+        return {i: self._evidence[i] for i in ids if i in self._evidence}
+
+    async def evidence_for_dataset_version(
+        self,
+        dataset_version_id: str,
+        *,
+        engine_id: str | None = None,
+        kind: str | None = None,
+    ) -> list[EvidenceRef]:
+        """Return refs for a dataset version ordered by (created_at, evidence_id)."""
+        query = select(*_EVIDENCE_COLUMNS).where(EvidenceRecord.dataset_version_id == dataset_version_id)
+        if engine_id is not None:
+            query = query.where(EvidenceRecord.engine_id == engine_id)
+        if kind is not None:
+            query = query.where(EvidenceRecord.kind == kind)
+        query = query.order_by(EvidenceRecord.created_at.asc(), EvidenceRecord.evidence_id.asc())
+        refs: list[EvidenceRef] = []
+        for row in (await self._db.execute(query)).all():
+            ref = self._evidence.get(row[0]) or self._remember_evidence(EvidenceRef(*row))
+            refs.append(ref)
+        return refs
+
+    async def findings(self, finding_ids: Iterable[str]) -> dict[str, FindingRef]:
+        """Return refs for the given IDs; IDs that do not exist are absent from the result."""
+        ids = _unique(finding_ids)
+        unknown = [i for i in ids if i not in self._findings]
+        if unknown:
+            rows = await self._db.execute(select(*_FINDING_COLUMNS).where(FindingRecord.finding_id.in_(unknown)))
+            for row in rows.all():
+                self._remember_finding(FindingRef(*row))
+        return {i: self._findings[i] for i in ids if i in self._findings}
+
+    async def findings_for_dataset_version(
+        self,
+        dataset_version_id: str,
+        *,
+        kind: str | None = None,
+    ) -> list[FindingRef]:
+        """Return refs for a dataset version ordered by (created_at, finding_id)."""
+        query = select(*_FINDING_COLUMNS).where(FindingRecord.dataset_version_id == dataset_version_id)
+        if kind is not None:
+            query = query.where(FindingRecord.kind == kind)
+        query = query.order_by(FindingRecord.created_at.asc(), FindingRecord.finding_id.asc())
+        refs: list[FindingRef] = []
+        for row in (await self._db.execute(query)).all():
+            ref = self._findings.get(row[0]) or self._remember_finding(FindingRef(*row))
+            refs.append(ref)
+        return refs
+
+    async def evidence_ids_by_finding(self, finding_ids: Iterable[str]) -> dict[str, list[str]]:
+        """Return linked evidence IDs (sorted) per finding; every requested finding is a key."""
+        ids = _unique(finding_ids)
+        unknown = [i for i in ids if i not in self._links]
+        if unknown:
+            rows = await self._db.execute(
+                select(FindingEvidenceLink.finding_id, FindingEvidenceLink.evidence_id).where(
+                    FindingEvidenceLink.finding_id.in_(unknown)
+                )
+            )
+            linked: dict[str, set[str]] = {i: set() for i in unknown}
+            for finding_id, evidence_id in rows.all():
+                linked[finding_id].add(evidence_id)
+            for finding_id, evidence_ids in linked.items():
+                self._links[finding_id] = tuple(sorted(evidence_ids))
+        return {i: list(self._links[i]) for i in ids}
+
+    # Payloads (lazy, batched)
+
+    async def evidence_payload(self, evidence_id: str) -> dict:
+        """
+        Return the payload of one evidence record.
+
+        The first call loads this payload together with up to `payload_batch_size - 1`
+        other pending ones, so iterating over refs and awaiting each payload costs one
+        query per batch rather than one per record.
+
+        Raises:
+            KeyError: If the evidence record does not exist
+        """
+        if evidence_id not in self._evidence_payloads:
+            await self._load_payloads(
+                EvidenceRecord.evidence_id,
+                EvidenceRecord.payload,
+                evidence_id,
+                self._pending_evidence,
+                self._evidence_payloads,
+            )
+        return self._evidence_payloads[evidence_id]
+
+    async def evidence_payloads(self, evidence_ids: Iterable[str]) -> dict[str, dict]:
+        """Return payloads for the given IDs; IDs that do not exist are absent from the result."""
+        ids = _unique(evidence_ids)
+        for evidence_id in ids:
+            self._pending_evidence.setdefault(evidence_id, None)
+        for evidence_id in ids:
+            if evidence_id not in self._evidence_payloads and evidence_id in self._pending_evidence:
+                await self._load_payloads(
+                    EvidenceRecord.evidence_id,
+                    EvidenceRecord.payload,
+                    evidence_id,
+                    self._pending_evidence,
+                    self._evidence_payloads,
+                    missing_ok=True,
+                )
+        return {i: self._evidence_payloads[i] for i in ids if i in self._evidence_payloads}
+
+    async def finding_payload(self, finding_id: str) -> dict:
+        """
+        Return the payload of one finding, batched like `evidence_payload`.
+
+        Raises:
+            KeyError: If the finding does not exist
+        """
+        if finding_id not in self._finding_payloads:
+            await self._load_payloads(
+                FindingRecord.finding_id,
+                FindingRecord.payload,
+                finding_id,
+                self._pending_findings,
+                self._finding_payloads,
+            )
+        return self._finding_payloads[finding_id]
+
+    async def _load_payloads(
+        self,
+        id_column: Any,
+        payload_column: Any,
+        wanted: str,
+        pending: dict[str, None],
+        loaded: dict[str, dict],
+        *,
+        missing_ok: bool = False,
+    ) -> None:
+        pending.pop(wanted, None)
+        batch = [wanted]
+        for key in pending:
+            if len(batch) >= self._payload_batch_size:
+                break
+            batch.append(key)
+        for key in batch[1:]:
+            pending.pop(key, None)
+
+        rows = await self._db.execute(select(id_column, payload_column).where(id_column.in_(batch)))
+        for key, payload in rows.all():
+            loaded[key] = payload
+        if wanted not in loaded and not missing_ok:
+            raise KeyError(wanted)
+
+    def _remember_evidence(self, ref: EvidenceRef) -> EvidenceRef:
+        self._evidence[ref.evidence_id] = ref
+        if ref.evidence_id not in self._evidence_payloads:
+            self._pending_evidence.setdefault(ref.evidence_id, None)
+        return ref
+
+    def _remember_finding(self, ref: FindingRef) -> FindingRef:
+        self._findings[ref.finding_id] = ref
+        if ref.finding_id not in self._finding_payloads:
+            self._pending_findings.setdefault(ref.finding_id, None)
+        return ref
+
+
+def _unique(ids: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(ids))
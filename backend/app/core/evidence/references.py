@@ -0,0 +1,164 @@
+"""
+Indexed references extracted from evidence and finding payloads.
+
+`EvidenceRecord.payload` and `FindingRecord.payload` are opaque JSON, so questions
+like "which evidence references control X" or "which findings came from rule Y"
+used to mean loading and scanning every payload of a dataset version. The service
+layer now pulls a fixed set of identifier keys out of each payload when the row is
+written (`create_evidence`, `create_finding`) and stores them in the
+`evidence_reference` side table, indexed by (dataset_version_id, ref_type, ref_value).
+
+Reference types and the payload paths they are read from are declared in
+`REFERENCE_PATHS`. A path is a dotted key into nested objects; the value at a path
+may be a string or a list of strings (other values are ignored).
+
+Rows written before the side table existed (or directly, bypassing the service) are
+indexed on demand with `backfill_references`, which readers call for the evidence
+they are about to use; it only adds missing rows, so it is safe to re-run. The audit
+readiness control index is such a reader.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.models import EvidenceRecord, EvidenceReference
+
+
+SUBJECT_EVIDENCE = "evidence"
+SUBJECT_FINDING = "finding"
+
+REF_CONTROL = "control"
+REF_SOURCE_RECORD = "source_record"
+REF_RULE = "rule"
+
+REFERENCE_PATHS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        REF_CONTROL: ("control_id", "control_ids", "controls", "control.control_id"),
+        REF_SOURCE_RECORD: (
+            "source_record_id",
+            "source_record_ids",
+            "raw_record_id",
+            "raw_record_ids",
+            "source_raw_record_id",
+        ),
+        REF_RULE: ("rule_id", "rule_ids", "rule_identity.rule_id"),
+    }
+)
+
+DEFAULT_BACKFILL_BATCH_SIZE = 500
+
+
+def _values_at(payload: Mapping[str, Any], path: str) -> list[str]:
+    node: Any = payload
+    for part in path.split("."):
+        if not isinstance(node, Mapping):
+            return []
+        node = node.get(part)
+    if isinstance(node, str):
+        return [node] if node else []
+    if isinstance(node, (list, tuple)):
+        return [item for item in node if isinstance(item, str) and item]
+    return []
+
+
+def extract_references(
+    payload: Any, *, paths: Mapping[str, tuple[str, ...]] = REFERENCE_PATHS
+) -> list[tuple[str, str]]:
+    """Sorted, de-duplicated (ref_type, ref_value) pairs found in a payload."""
+    if not isinstance(payload, Mapping):
+        return []
+    found = {
+        (ref_type, value)
+        for ref_type, ref_paths in paths.items()
+        for path in ref_paths
+        for value in _values_at(payload, path)
+    }
+    return sorted(found)
+
+
+def reference_values(
+    *, subject_type: str, subject_id: str, dataset_version_id: str, payload: Any
+) -> list[dict[str, str]]:
+    """Reference rows for one subject as column dicts, for multi-row inserts."""
+    return [
+        {
+            "subject_type": subject_type,
+            "subject_id": subject_id,
+            "ref_type": ref_type,
+            "ref_value": ref_value,
+            "dataset_version_id": dataset_version_id,
+        }
+        for ref_type, ref_value in extract_references(payload)
+    ]
+
+
+def reference_rows(
+    *, subject_type: str, subject_id: str, dataset_version_id: str, payload: Any
+) -> list[EvidenceReference]:
+    return [
+        EvidenceReference(**values)
+        for values in reference_values(
+            subject_type=subject_type,
+            subject_id=subject_id,
+            dataset_version_id=dataset_version_id,
+            payload=payload,
+        )
+    ]
+
+
+async def backfill_references(
+    db: AsyncSession,
+    *,
+    evidence_ids: Sequence[str],
+    batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+) -> int:
+    """
+    Index those of `evidence_ids` that have no reference rows yet.
+
+    Works in chunks of `batch_size` IDs: one query for already indexed IDs, one for
+    the remaining payloads, then multi-row inserts. Returns the number of rows
+    inserted; rows are flushed, not committed.
+    """
+    if batch_size < 1:
+        raise ValueError("BACKFILL_BATCH_SIZE_INVALID")
+    inserted = 0
+    ids = sorted(set(evidence_ids))
+    for start in range(0, len(ids), batch_size):
+        chunk = ids[start : start + batch_size]
+        indexed = set(
+            (
+                await db.scalars(
+                    select(EvidenceReference.subject_id)
+                    .where(EvidenceReference.subject_type == SUBJECT_EVIDENCE)
+                    .where(EvidenceReference.subject_id.in_(chunk))
+                    .distinct()
+                )
+            ).all()
+        )
+        missing = [evidence_id for evidence_id in chunk if evidence_id not in indexed]
+        if not missing:
+            continue
+        pending: list[dict[str, str]] = []
+        rows = await db.execute(
+            select(EvidenceRecord.evidence_id, EvidenceRecord.dataset_version_id, EvidenceRecord.payload).where(
+                EvidenceRecord.evidence_id.in_(missing)
+            )
+        )
+        for evidence_id, dataset_version_id, payload in rows.all():
+            pending.extend(
+                reference_values(
+                    subject_type=SUBJECT_EVIDENCE,
+                    subject_id=evidence_id,
+                    dataset_version_id=dataset_version_id,
+                    payload=payload,
+                )
+            )
+        if pending:
+            await db.execute(insert(EvidenceReference), pending)
+        inserted += len(pending)
+    return inserted
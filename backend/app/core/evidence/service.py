@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import logging
 import uuid
-from datetime import datetime
+from typing import Any, Iterable, Mapping, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
+from backend.app.core.evidence.models import EvidenceRecord, EvidenceReference, FindingEvidenceLink, FindingRecord
+from backend.app.core.evidence.references import (
+    SUBJECT_EVIDENCE,
+    SUBJECT_FINDING,
+    reference_rows,
+    reference_values,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_INSERT_BATCH_SIZE = 500
 
 
 def deterministic_evidence_id(*, dataset_version_id: str, engine_id: str, kind: str, stable_key: str) -> str:
@@ -37,6 +52,14 @@ async def create_evidence(
         created_at=created_at,
     )
     db.add(rec)
+    db.add_all(
+        reference_rows(
+            subject_type=SUBJECT_EVIDENCE,
+            subject_id=evidence_id,
+            dataset_version_id=dataset_version_id,
+            payload=payload,
+        )
+    )
     await db.flush()
     return rec
 
@@ -63,6 +86,14 @@ async def create_finding(
         created_at=created_at,
     )
     db.add(rec)
+    db.add_all(
+        reference_rows(
+            subject_type=SUBJECT_FINDING,
+            subject_id=finding_id,
+            dataset_version_id=dataset_version_id,
+            payload=payload,
+        )
+    )
     await db.flush()
     return rec
 
@@ -77,3 +108,287 @@ async def link_finding_to_evidence(
     db.add(rec)
     await db.flush()
     return rec
+
+
+async def _insert_in_batches(db: AsyncSession, model: type, rows: Sequence[dict], batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("BULK_INSERT_BATCH_SIZE_INVALID")
+    for start in range(0, len(rows), batch_size):
+        await db.execute(insert(model), rows[start : start + batch_size])
+
+
+async def bulk_create_evidence(
+    db: AsyncSession,
+    rows: Sequence[dict],
+    *,
+    batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """
+    Insert new evidence records, with their references, in multi-row statements.
+
+    Each row holds the `create_evidence` keyword arguments. Unlike `create_evidence`
+    there is no per-row existence check: callers prefetch existing IDs and pass only
+    new records (a duplicate ID fails the insert).
+    """
+    references = [
+        values
+        for row in rows
+        for values in reference_values(
+            subject_type=SUBJECT_EVIDENCE,
+            subject_id=row["evidence_id"],
+            dataset_version_id=row["dataset_version_id"],
+            payload=row["payload"],
+        )
+    ]
+    await _insert_in_batches(db, EvidenceRecord, rows, batch_size)
+    await _insert_in_batches(db, EvidenceReference, references, batch_size)
+
+
+async def bulk_create_findings(
+    db: AsyncSession,
+    rows: Sequence[dict],
+    *,
+    batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """Insert new finding records, with their references; see `bulk_create_evidence`."""
+    references = [
+        values
+        for row in rows
+        for values in reference_values(
+            subject_type=SUBJECT_FINDING,
+            subject_id=row["finding_id"],
+            dataset_version_id=row["dataset_version_id"],
+            payload=row["payload"],
+        )
+    ]
+    await _insert_in_batches(db, FindingRecord, rows, batch_size)
+    await _insert_in_batches(db, EvidenceReference, references, batch_size)
+
+
+async def bulk_link_findings_to_evidence(
+    db: AsyncSession,
+    rows: Sequence[dict],
+    *,
+    batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """Insert new finding -> evidence links (`link_id`, `finding_id`, `evidence_id`)."""
+    await _insert_in_batches(db, FindingEvidenceLink, rows, batch_size)
+
+
+def as_stored_payload(payload: Any) -> Any:
+    """`payload` in the form a JSON column returns it (tuples become lists)."""
+    return json.loads(json.dumps(payload))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _field(record: Any, name: str) -> Any:
+    return record[name] if isinstance(record, Mapping) else getattr(record, name)
+
+
+def _payloads_differ(existing: Any, payload: Any) -> bool:
+    return existing != payload and as_stored_payload(existing) != as_stored_payload(payload)
+
+
+def _conflict(
+    log_prefix: str, conflict_error: type[Exception], problem: str, subject: str, row: Mapping[str, Any], code: str
+) -> Exception:
+    logger.warning(
+        "%s_IMMUTABLE_CONFLICT %s %s=%s dataset_version_id=%s",
+        log_prefix,
+        problem,
+        subject,
+        row[subject],
+        row.get("dataset_version_id"),
+    )
+    return conflict_error(code)
+
+
+def verify_existing_evidence(
+    existing: EvidenceRecord | Mapping[str, Any],
+    row: Mapping[str, Any],
+    *,
+    log_prefix: str,
+    conflict_error: type[Exception],
+) -> None:
+    """
+    Raise `conflict_error` if evidence `row` differs from the `existing` record or row.
+
+    Payloads are compared in their stored form. Each conflict is logged as
+    `<log_prefix>_IMMUTABLE_CONFLICT` before raising.
+    """
+    if (
+        _field(existing, "dataset_version_id") != row["dataset_version_id"]
+        or _field(existing, "engine_id") != row["engine_id"]
+        or _field(existing, "kind") != row["kind"]
+    ):
+        raise _conflict(
+            log_prefix, conflict_error, "evidence_id_collision", "evidence_id", row, "EVIDENCE_ID_COLLISION"
+        )
+    if _as_utc(_field(existing, "created_at")) != _as_utc(row["created_at"]):
+        raise _conflict(
+            log_prefix,
+            conflict_error,
+            "evidence_created_at_mismatch",
+            "evidence_id",
+            row,
+            "IMMUTABLE_EVIDENCE_CREATED_AT_MISMATCH",
+        )
+    if _payloads_differ(_field(existing, "payload"), row["payload"]):
+        raise _conflict(
+            log_prefix, conflict_error, "evidence_payload_mismatch", "evidence_id", row, "IMMUTABLE_EVIDENCE_MISMATCH"
+        )
+
+
+def verify_existing_finding(
+    existing: FindingRecord | Mapping[str, Any],
+    row: Mapping[str, Any],
+    *,
+    log_prefix: str,
+    conflict_error: type[Exception],
+) -> None:
+    """Raise `conflict_error` if finding `row` differs from `existing`; see `verify_existing_evidence`."""
+    if (
+        _field(existing, "dataset_version_id") != row["dataset_version_id"]
+        or _field(existing, "raw_record_id") != row["raw_record_id"]
+        or _field(existing, "kind") != row["kind"]
+    ):
+        raise _conflict(
+            log_prefix, conflict_error, "finding_id_collision", "finding_id", row, "FINDING_ID_COLLISION"
+        )
+    if _payloads_differ(_field(existing, "payload"), row["payload"]):
+        raise _conflict(
+            log_prefix, conflict_error, "finding_payload_mismatch", "finding_id", row, "IMMUTABLE_FINDING_MISMATCH"
+        )
+
+
+def verify_existing_link(
+    existing: FindingEvidenceLink | Mapping[str, Any],
+    row: Mapping[str, Any],
+    *,
+    log_prefix: str,
+    conflict_error: type[Exception],
+) -> None:
+    """Raise `conflict_error` if link `row` points elsewhere than `existing`."""
+    if _field(existing, "finding_id") != row["finding_id"] or _field(existing, "evidence_id") != row["evidence_id"]:
+        raise _conflict(log_prefix, conflict_error, "link_mismatch", "link_id", row, "IMMUTABLE_LINK_MISMATCH")
+
+
+@dataclass
+class EvidenceBatch:
+    """
+    Evidence, findings and links of one run keyed by ID, in insertion order.
+
+    Engines with deterministic IDs collect every row up front and write the batch
+    with `persist_evidence_batch`. Adding the same row twice is a no-op; a
+    different row under an ID already in the batch is verified like an existing
+    record and raises `conflict_error`. Conflicts are logged with `log_prefix`.
+    """
+    dataset_version_id: str
+    log_prefix: str
+    conflict_error: type[Exception]
+    evidence: dict[str, dict] = field(default_factory=dict)
+    findings: dict[str, dict] = field(default_factory=dict)
+    links: dict[str, dict] = field(default_factory=dict)
+
+    def add_evidence(self, row: dict) -> None:
+        existing = self.evidence.setdefault(row["evidence_id"], row)
+        if existing is not row:
+            verify_existing_evidence(existing, row, log_prefix=self.log_prefix, conflict_error=self.conflict_error)
+
+    def add_finding(self, row: dict) -> None:
+        existing = self.findings.setdefault(row["finding_id"], row)
+        if existing is not row:
+            verify_existing_finding(existing, row, log_prefix=self.log_prefix, conflict_error=self.conflict_error)
+
+    def add_link(self, row: dict) -> None:
+        existing = self.links.setdefault(row["link_id"], row)
+        if existing is not row:
+            verify_existing_link(existing, row, log_prefix=self.log_prefix, conflict_error=self.conflict_error)
+
+    def add_row(self, rows: dict[str, dict], row_id: str, row: dict, code: str) -> None:
+        """Add an engine table row to `rows`; a different row under `row_id` raises `conflict_error(code)`."""
+        existing = rows.setdefault(row_id, row)
+        if existing is not row and existing != row:
+            logger.warning(
+                "%s_IMMUTABLE_CONFLICT duplicate_row_mismatch row_id=%s dataset_version_id=%s",
+                self.log_prefix,
+                row_id,
+                self.dataset_version_id,
+            )
+            raise self.conflict_error(code)
+
+
+def _chunks(ids: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    if size < 1:
+        raise ValueError("BULK_INSERT_BATCH_SIZE_INVALID")
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+async def existing_ids(
+    db: AsyncSession, column: Any, ids: Sequence[str], *, batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE
+) -> set[str]:
+    """The `ids` present in `column`, with one `IN (...)` query per `batch_size` IDs."""
+    found: set[str] = set()
+    for chunk in _chunks(ids, batch_size):
+        found.update((await db.scalars(select(column).where(column.in_(chunk)))).all())
+    return found
+
+
+async def existing_rows(
+    db: AsyncSession, model: type, column: Any, ids: Sequence[str], *, batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE
+) -> dict[str, Any]:
+    """Records of `model` whose `column` is in `ids`, keyed by that column."""
+    found: dict[str, Any] = {}
+    for chunk in _chunks(ids, batch_size):
+        for record in (await db.scalars(select(model).where(column.in_(chunk)))).all():
+            found[getattr(record, column.key)] = record
+    return found
+
+
+async def persist_evidence_batch(
+    db: AsyncSession,
+    batch: EvidenceBatch,
+    *,
+    batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """
+    Write the evidence, findings and links of `batch` that do not exist yet.
+
+    Existing records are prefetched with one `IN (...)` query per table and
+    `batch_size` IDs and verified in memory; nothing is inserted if one conflicts.
+    Missing rows are inserted with multi-row statements. Rows are flushed, not
+    committed; the caller owns the transaction.
+    """
+    if batch_size < 1:
+        raise ValueError("BULK_INSERT_BATCH_SIZE_INVALID")
+    found_evidence = await existing_rows(
+        db, EvidenceRecord, EvidenceRecord.evidence_id, list(batch.evidence), batch_size=batch_size
+    )
+    found_findings = await existing_rows(
+        db, FindingRecord, FindingRecord.finding_id, list(batch.findings), batch_size=batch_size
+    )
+    found_links = await existing_rows(
+        db, FindingEvidenceLink, FindingEvidenceLink.link_id, list(batch.links), batch_size=batch_size
+    )
+    conflicts = {"log_prefix": batch.log_prefix, "conflict_error": batch.conflict_error}
+    for evidence_id, record in found_evidence.items():
+        verify_existing_evidence(record, batch.evidence[evidence_id], **conflicts)
+    for finding_id, record in found_findings.items():
+        verify_existing_finding(record, batch.findings[finding_id], **conflicts)
+    for link_id, record in found_links.items():
+        verify_existing_link(record, batch.links[link_id], **conflicts)
+
+    # Links reference findings and evidence.
+    await bulk_create_evidence(
+        db, [row for row_id, row in batch.evidence.items() if row_id not in found_evidence], batch_size=batch_size
+    )
+    await bulk_create_findings(
+        db, [row for row_id, row in batch.findings.items() if row_id not in found_findings], batch_size=batch_size
+    )
+    await bulk_link_findings_to_evidence(
+        db, [row for row_id, row in batch.links.items() if row_id not in found_links], batch_size=batch_size
+    )
@@ -4,10 +4,9 @@ from datetime import datetime, timezone
 import uuid
 from typing import Any, Mapping
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.governance.models import AiEventLog
 
 
@@ -52,9 +51,7 @@ def _normalize_governance_metadata(payload: Mapping[str, Any]) -> dict:
 async def _ensure_dataset_version_exists(db: AsyncSession, dataset_version_id: str) -> None:
     if not dataset_version_id or not isinstance(dataset_version_id, str):
         raise DatasetVersionLoggingError("DatasetVersion identifier is required for AI event logging.")
-    # Optimized: select only constant 1 instead of entire DatasetVersion object
-    exists = await db.scalar(select(1).where(DatasetVersion.id == dataset_version_id))
-    if exists is None:
+    if not await dataset_version_exists(db, dataset_version_id):
         raise DatasetVersionLoggingError(f"DatasetVersion '{dataset_version_id}' not found.")
 
 
@@ -14,9 +14,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.audit.service import log_action
 from backend.app.core.calculation.service import create_calculation_run, get_calculation_run
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.raw_models import RawRecord
 from backend.app.core.ingestion.models import Import
+from backend.app.core.lifecycle.status import get_lifecycle_status, set_lifecycle_stage
 from backend.app.core.normalization.models import NormalizedRecord
 from backend.app.core.workflows.state_machine import (
     WorkflowStateEnum,
@@ -73,13 +74,16 @@ async def _log_violation(
 
 
 async def _dataset_exists(db: AsyncSession, dataset_version_id: str) -> bool:
-    stmt = select(DatasetVersion.id).where(DatasetVersion.id == dataset_version_id).limit(1)
-    result = await db.scalar(stmt)
-    return result is not None
+    return await dataset_version_exists(db, dataset_version_id)
 
 
 async def _import_completed(db: AsyncSession, dataset_version_id: str) -> bool:
-    # Check workflow state first (authoritative source)
+    # Materialized status (single PK lookup, maintained with the workflow transition)
+    status = await get_lifecycle_status(db, dataset_version_id=dataset_version_id)
+    if status is not None and status.import_completed:
+        return True
+
+    # Check workflow state (authoritative source)
     workflow_state = await get_workflow_state(
         db,
         dataset_version_id=dataset_version_id,
@@ -102,7 +106,12 @@ async def _import_completed(db: AsyncSession, dataset_version_id: str) -> bool:
 
 
 async def _normalize_completed(db: AsyncSession, dataset_version_id: str) -> bool:
-    # Check workflow state first (authoritative source)
+    # Materialized status (single PK lookup, maintained with the workflow transition)
+    status = await get_lifecycle_status(db, dataset_version_id=dataset_version_id)
+    if status is not None and status.normalize_completed:
+        return True
+
+    # Check workflow state (authoritative source)
     workflow_state = await get_workflow_state(
         db,
         dataset_version_id=dataset_version_id,
@@ -130,6 +139,10 @@ async def _normalize_completed(db: AsyncSession, dataset_version_id: str) -> boo
 
 async def _calculate_completed(db: AsyncSession, dataset_version_id: str, engine_id: str) -> bool:
     """Check if calculation stage is completed for the given engine and dataset version."""
+    status = await get_lifecycle_status(db, dataset_version_id=dataset_version_id, engine_id=engine_id)
+    if status is not None and status.calculate_completed:
+        return True
+
     # Check workflow state (authoritative source)
     workflow_state = await get_workflow_state(
         db,
@@ -167,6 +180,11 @@ async def verify_import_complete(
         )
         raise LifecycleViolationError("DATASET_VERSION_ID_REQUIRED", LifecycleStage.IMPORT)
 
+    # A materialized status row implies the dataset version exists (foreign key).
+    status = await get_lifecycle_status(db, dataset_version_id=dataset_version_id)
+    if status is not None and status.import_completed:
+        return
+
     if not await _dataset_exists(db, dataset_version_id):
         await _log_violation(
             db,
@@ -430,7 +448,9 @@ async def record_import_completion(
             created_at=now,
         )
         db.add(transition)
-        await db.commit()
+
+    await set_lifecycle_stage(db, dataset_version_id=dataset_version_id, stage="import", completed=True)
+    await db.commit()
 
 
 async def record_normalize_completion(
@@ -485,7 +505,9 @@ async def record_normalize_completion(
             created_at=now,
         )
         db.add(transition)
-        await db.commit()
+
+    await set_lifecycle_stage(db, dataset_version_id=dataset_version_id, stage="normalize", completed=True)
+    await db.commit()
 
 
 async def record_calculation_completion(
@@ -561,6 +583,14 @@ async def record_calculation_completion(
             created_at=now,
         )
         db.add(transition)
-    
+
+    await set_lifecycle_stage(
+        db,
+        dataset_version_id=dataset_version_id,
+        stage="calculate",
+        completed=True,
+        engine_id=engine_id,
+        run_id=run.run_id,
+    )
     await db.commit()
     return run.run_id
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.models.base import Base
+
+
+class LifecycleStatus(Base):
+    """
+    Materialized lifecycle status per (dataset_version_id, engine_id).
+
+    Maintained transactionally by the lifecycle `record_*_completion` helpers so
+    prerequisite checks are a single primary-key lookup instead of a chain of
+    workflow-state and record-count queries. Dataset-wide stages (import, normalize)
+    live on the row whose engine_id is `DATASET_SCOPE`; calculate is tracked per engine.
+
+    Attributes:
+        dataset_version_id: Link to DatasetVersion
+        engine_id: Engine ID, or `DATASET_SCOPE` for dataset-wide stages
+        import_completed: Import workflow state is approved
+        normalize_completed: Normalize workflow state is approved
+        calculate_completed: Calculate workflow state is approved for engine_id
+        last_run_id: Most recent CalculationRun recorded for engine_id
+        updated_at: Timestamp of the last materialization
+    """
+
+    __tablename__ = "lifecycle_status"
+
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), primary_key=True
+    )
+    engine_id: Mapped[str] = mapped_column(String, primary_key=True)
+    import_completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    normalize_completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    calculate_completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    last_run_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
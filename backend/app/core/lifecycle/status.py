@@ -0,0 +1,146 @@
+"""
+Materialized lifecycle status.
+
+`LifecycleStatus` rows are written in the same transaction as the lifecycle workflow
+transitions (see `record_*_completion` in `enforcement`) and read by prerequisite
+checks with a single primary-key lookup. Positive snapshots are additionally cached
+in-process; every write through this module invalidates the affected entry, and
+entries expire after `_CACHE_TTL_SECONDS` to bound staleness across processes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.lifecycle.models import LifecycleStatus
+
+
+DATASET_SCOPE = "*"
+
+_STAGE_COLUMNS = {
+    "import": "import_completed",
+    "normalize": "normalize_completed",
+    "calculate": "calculate_completed",
+}
+
+_CACHE_TTL_SECONDS = 30.0
+_CACHE_MAX_ENTRIES = 10_000
+_CACHE: dict[tuple[str, str], tuple[float, LifecycleSnapshot]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class LifecycleSnapshot:
+    """Immutable view of a `LifecycleStatus` row."""
+
+    dataset_version_id: str
+    engine_id: str
+    import_completed: bool
+    normalize_completed: bool
+    calculate_completed: bool
+    last_run_id: str | None
+
+    @classmethod
+    def from_row(cls, row: LifecycleStatus) -> LifecycleSnapshot:
+        return cls(
+            dataset_version_id=row.dataset_version_id,
+            engine_id=row.engine_id,
+            import_completed=bool(row.import_completed),
+            normalize_completed=bool(row.normalize_completed),
+            calculate_completed=bool(row.calculate_completed),
+            last_run_id=row.last_run_id,
+        )
+
+
+def stage_for_subject_id(subject_id: str) -> tuple[str, str] | None:
+    """Map a lifecycle workflow subject_id to (stage, engine_id)."""
+    if subject_id in ("import", "normalize"):
+        return subject_id, DATASET_SCOPE
+    if subject_id.startswith("calculate:"):
+        return "calculate", subject_id.split(":", 1)[1]
+    return None
+
+
+def invalidate_lifecycle_status(dataset_version_id: str, engine_id: str | None = None) -> None:
+    """Drop cached snapshots for a dataset version (optionally a single engine scope)."""
+    if engine_id is not None:
+        _CACHE.pop((dataset_version_id, engine_id), None)
+        return
+    for key in [k for k in _CACHE if k[0] == dataset_version_id]:
+        _CACHE.pop(key, None)
+
+
+def reset_lifecycle_status_cache_for_tests() -> None:
+    _CACHE.clear()
+
+
+async def get_lifecycle_status(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    engine_id: str = DATASET_SCOPE,
+) -> LifecycleSnapshot | None:
+    """Return the materialized status for (dataset_version_id, engine_id), or None if absent."""
+    key = (dataset_version_id, engine_id)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        expires_at, snapshot = cached
+        if expires_at > time.monotonic():
+            return snapshot
+        _CACHE.pop(key, None)
+
+    row = await db.get(LifecycleStatus, key)
+    if row is None:
+        return None
+    snapshot = LifecycleSnapshot.from_row(row)
+    if snapshot.import_completed or snapshot.normalize_completed or snapshot.calculate_completed:
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            _CACHE.clear()
+        _CACHE[key] = (time.monotonic() + _CACHE_TTL_SECONDS, snapshot)
+    return snapshot
+
+
+async def set_lifecycle_stage(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    stage: str,
+    completed: bool,
+    engine_id: str = DATASET_SCOPE,
+    run_id: str | None = None,
+) -> LifecycleStatus:
+    """
+    Materialize the completion flag of one lifecycle stage.
+
+    The row is added to the session but not committed; callers commit together with
+    the workflow transition so the materialized status never diverges from it.
+    """
+    column = _STAGE_COLUMNS.get(stage)
+    if column is None:
+        raise ValueError(f"Unknown lifecycle stage: {stage}")
+    if stage == "calculate" and engine_id == DATASET_SCOPE:
+        raise ValueError("engine_id is required for the calculate stage")
+    if stage != "calculate" and engine_id != DATASET_SCOPE:
+        raise ValueError(f"Lifecycle stage '{stage}' is dataset-scoped")
+
+    invalidate_lifecycle_status(dataset_version_id, engine_id)
+    row = await db.get(LifecycleStatus, (dataset_version_id, engine_id))
+    if row is None:
+        row = LifecycleStatus(
+            dataset_version_id=dataset_version_id,
+            engine_id=engine_id,
+            import_completed=False,
+            normalize_completed=False,
+            calculate_completed=False,
+            last_run_id=None,
+            updated_at=datetime.now(timezone.utc),
+        )
+        db.add(row)
+    setattr(row, column, completed)
+    if run_id is not None:
+        row.last_run_id = run_id
+    row.updated_at = datetime.now(timezone.utc)
+    return row
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import time
-from typing import Callable
+from typing import AsyncIterator, Callable
 
 from fastapi import APIRouter, Request, Response
 
 try:
-    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest  # type: ignore
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest  # type: ignore
 
     _PROM_AVAILABLE = True
 except Exception:  # pragma: no cover
@@ -24,12 +24,18 @@ except Exception:  # pragma: no cover
         def observe(self, _value: float) -> None:
             return None
 
+        def dec(self, _amount: float = 1.0) -> None:
+            return None
+
     def Counter(*_args, **_kwargs):  # noqa: N802, ANN001, ANN002
         return _NoopMetric()
 
     def Histogram(*_args, **_kwargs):  # noqa: N802, ANN001, ANN002
         return _NoopMetric()
 
+    def Gauge(*_args, **_kwargs):  # noqa: N802, ANN001, ANN002
+        return _NoopMetric()
+
     def generate_latest() -> bytes:  # noqa: ANN001
         return b""
 
@@ -37,19 +43,48 @@ except Exception:  # pragma: no cover
 router = APIRouter(tags=["metrics"])
 
 
+# HTTP series are labelled with the matched route template (never the raw path) and
+# the owning engine, if any. Both label sets are bounded: unmatched requests share
+# one label value and distinct values past a cap collapse into an overflow value.
+UNMATCHED_ROUTE = "__unmatched__"
+OVERFLOW_LABEL = "__other__"
+MAX_ROUTE_LABELS = 500
+
 http_requests_total = Counter(
     "todiscope_http_requests_total",
     "Total HTTP requests.",
-    labelnames=("method", "path", "status"),
+    labelnames=("method", "path", "status", "engine_id"),
 )
 
 http_request_duration_seconds = Histogram(
     "todiscope_http_request_duration_seconds",
     "HTTP request duration seconds.",
-    labelnames=("method", "path"),
+    labelnames=("method", "path", "engine_id"),
     buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
 )
 
+_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+http_request_size_bytes = Histogram(
+    "todiscope_http_request_size_bytes",
+    "HTTP request body size (Content-Length) in bytes.",
+    labelnames=("method", "path", "engine_id"),
+    buckets=_SIZE_BUCKETS,
+)
+
+http_response_size_bytes = Histogram(
+    "todiscope_http_response_size_bytes",
+    "HTTP response body size in bytes (counted as streamed).",
+    labelnames=("method", "path", "engine_id"),
+    buckets=_SIZE_BUCKETS,
+)
+
+http_requests_in_flight = Gauge(
+    "todiscope_http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    labelnames=("method",),
+)
+
 engine_exports_total = Counter(
     "todiscope_engine_exports_total",
     "Engine export attempts and outcomes.",
@@ -83,6 +118,34 @@ engine_persistence_duration_seconds = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
 )
 
+db_queries_per_scope = Histogram(
+    "todiscope_db_queries_per_scope",
+    "SQL statements executed per request or engine stage.",
+    labelnames=("scope", "name"),
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+db_time_seconds_per_scope = Histogram(
+    "todiscope_db_time_seconds_per_scope",
+    "Total SQL execution time per request or engine stage.",
+    labelnames=("scope", "name"),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+db_rows_per_scope = Histogram(
+    "todiscope_db_rows_per_scope",
+    "Rows reported by the driver (affected rows) per request or engine stage.",
+    labelnames=("scope", "name"),
+    buckets=(0, 1, 10, 100, 1000, 10000, 100000),
+)
+
+engine_stage_duration_seconds = Histogram(
+    "todiscope_engine_stage_duration_seconds",
+    "Engine run stage duration seconds (load, normalize, model, persist, report).",
+    labelnames=("engine_id", "stage"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
 engine_errors_total = Counter(
     "todiscope_engine_errors_total",
     "Engine run errors by type.",
@@ -95,18 +158,105 @@ async def metrics() -> Response:
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
+class _BoundedLabelValues:
+    """Admits at most `limit` distinct label values; later newcomers map to OVERFLOW_LABEL."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._seen: set[str] = set()
+
+    def __call__(self, value: str) -> str:
+        if value in self._seen:
+            return value
+        if len(self._seen) >= self._limit:
+            return OVERFLOW_LABEL
+        self._seen.add(value)
+        return value
+
+
+_route_label = _BoundedLabelValues(MAX_ROUTE_LABELS)
+_ENGINE_ENDPOINTS: dict[Callable, str] = {}
+
+
+def register_engine_routes(engine_id: str, router: APIRouter) -> None:
+    """Label requests served by `router`'s endpoints with `engine_id`."""
+    for route in router.routes:
+        endpoint = getattr(route, "endpoint", None)
+        if endpoint is not None:
+            _ENGINE_ENDPOINTS[endpoint] = engine_id
+
+
+def route_labels(scope: dict) -> tuple[str, str]:
+    """(route template, engine_id) for a request scope that has been through routing."""
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_ROUTE, ""
+    return _route_label(template), _ENGINE_ENDPOINTS.get(scope.get("endpoint"), "")
+
+
+def _content_length(headers) -> int | None:  # noqa: ANN001
+    raw = headers.get("content-length")
+    if raw is None or not raw.isdigit():
+        return None
+    return int(raw)
+
+
 def metrics_middleware() -> Callable:
+    # Imported here: query_metrics defines its histograms in this module.
+    from backend.app.core.query_metrics import track_queries
+
+    async def _stream_body(
+        body: AsyncIterator[bytes], histogram, finish: Callable[[], None]  # noqa: ANN001
+    ) -> AsyncIterator[bytes]:
+        size = 0
+        try:
+            async for chunk in body:
+                size += len(chunk)
+                yield chunk
+        finally:
+            histogram.observe(size)
+            finish()
+
     async def _middleware(request: Request, call_next: Callable) -> Response:
         method = request.method
-        path = request.url.path
         start = time.perf_counter()
         status = "500"
+        path, engine_id = UNMATCHED_ROUTE, ""
+        in_flight = http_requests_in_flight.labels(method=method)
+        in_flight.inc()
+
+        def _finish() -> None:
+            in_flight.dec()
+            http_requests_total.labels(method=method, path=path, status=status, engine_id=engine_id).inc()
+            http_request_duration_seconds.labels(method=method, path=path, engine_id=engine_id).observe(
+                time.perf_counter() - start
+            )
+            request_size = _content_length(request.headers)
+            if request_size is not None:
+                http_request_size_bytes.labels(method=method, path=path, engine_id=engine_id).observe(request_size)
+
+        # A streamed body is still being sent when call_next returns; the request
+        # ends (and is counted) when its body iterator is exhausted or closed.
+        streaming = False
         try:
-            resp = await call_next(request)
+            with track_queries("http", UNMATCHED_ROUTE) as db_stats:
+                try:
+                    resp = await call_next(request)
+                finally:
+                    # Routing has filled in the shared scope by now.
+                    path, engine_id = route_labels(request.scope)
+                    db_stats.name = path
             status = str(resp.status_code)
+            response_size = http_response_size_bytes.labels(method=method, path=path, engine_id=engine_id)
+            if hasattr(resp, "body_iterator"):
+                resp.body_iterator = _stream_body(resp.body_iterator, response_size, _finish)
+                streaming = True
+            else:
+                response_size.observe(len(resp.body))
             return resp
         finally:
-            http_requests_total.labels(method=method, path=path, status=status).inc()
-            http_request_duration_seconds.labels(method=method, path=path).observe(time.perf_counter() - start)
+            if not streaming:
+                _finish()
 
     return _middleware
@@ -5,6 +5,12 @@ from backend.app.core.normalization.workflow import (
     preview_normalization,
     validate_normalization,
 )
+from backend.app.core.normalization.warning_store import (
+    WarningAggregator,
+    WarningSummary,
+    load_warning_page,
+    persist_warning_artifact,
+)
 from backend.app.core.normalization.warnings import (
     NormalizationWarning,
     WarningSeverity,
@@ -24,4 +30,8 @@ __all__ = [
     "create_fuzzy_match_warning",
     "create_conversion_issue_warning",
     "create_unit_discrepancy_warning",
+    "WarningAggregator",
+    "WarningSummary",
+    "persist_warning_artifact",
+    "load_warning_page",
 ]
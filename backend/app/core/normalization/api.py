@@ -6,6 +6,8 @@ Provides endpoints for preview, validation, and commit of normalization operatio
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,12 @@ from backend.app.core.audit.service import log_normalization_action
 from backend.app.core.auth.models import Principal
 from backend.app.core.db import get_db_session
 from backend.app.core.rbac.roles import Role
+from backend.app.core.normalization.warning_store import (
+    WarningAggregator,
+    WarningStoreError,
+    load_warning_page,
+    persist_warning_artifact,
+)
 from backend.app.core.normalization.workflow import (
     commit_normalization,
     preview_normalization,
@@ -23,6 +31,21 @@ from backend.app.core.normalization.workflow import (
 router = APIRouter(prefix="/api/v3/normalize", tags=["normalization"])
 
 
+async def _store_warnings(
+    db: AsyncSession, *, dataset_version_id: str, aggregator: WarningAggregator
+) -> str | None:
+    """Persist the full warning stream; returns its artifact ID (None when there are no warnings)."""
+    if aggregator.total == 0:
+        return None
+    row = await persist_warning_artifact(
+        db,
+        dataset_version_id=dataset_version_id,
+        aggregator=aggregator,
+        created_at=datetime.now(timezone.utc),
+    )
+    return row.warning_artifact_id
+
+
 @router.post("/preview")
 async def preview_normalization_endpoint(
     payload: dict,
@@ -39,7 +62,8 @@ async def preview_normalization_endpoint(
         - strict_mode: bool (optional, default: true)
     
     Returns:
-        NormalizationPreview with preview records and warnings
+        NormalizationPreview with preview records, a capped warning sample, and a
+        warning summary referencing the full warning artifact
     """
     dataset_version_id = payload.get("dataset_version_id")
     if not isinstance(dataset_version_id, str) or not dataset_version_id.strip():
@@ -60,6 +84,9 @@ async def preview_normalization_endpoint(
             verify_checksums=bool(verify_checksums),
             strict_mode=bool(strict_mode),
         )
+        warning_artifact_id = await _store_warnings(
+            db, dataset_version_id=dataset_version_id.strip(), aggregator=preview.warnings
+        )
         await log_normalization_action(
             db,
             actor_id=getattr(principal, "subject", "system"),
@@ -70,13 +97,15 @@ async def preview_normalization_endpoint(
             reason="Preview normalization output",
             context={
                 "preview_limit": preview_limit,
-                "warning_count": len(preview.warnings),
+                "warning_count": preview.warnings.total,
             },
             metadata={
-                "warnings": [w.to_dict() for w in preview.warnings],
+                "warning_summary": preview.warnings.summary(
+                    warning_artifact_id=warning_artifact_id
+                ).to_dict(include_sample=False),
             },
         )
-        return preview.to_dict()
+        return preview.to_dict(warning_artifact_id=warning_artifact_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"NORMALIZATION_PREVIEW_FAILED: {str(e)}") from e
 
@@ -96,7 +125,8 @@ async def validate_normalization_endpoint(
         - strict_mode: bool (optional, default: true)
     
     Returns:
-        Validation result with is_valid flag and warnings
+        Validation result with is_valid flag, a capped warning sample, and a
+        warning summary referencing the full warning artifact
     """
     dataset_version_id = payload.get("dataset_version_id")
     if not isinstance(dataset_version_id, str) or not dataset_version_id.strip():
@@ -112,6 +142,10 @@ async def validate_normalization_endpoint(
             verify_checksums=bool(verify_checksums),
             strict_mode=bool(strict_mode),
         )
+        warning_artifact_id = await _store_warnings(
+            db, dataset_version_id=dataset_version_id.strip(), aggregator=warnings
+        )
+        summary = warnings.summary(warning_artifact_id=warning_artifact_id)
         await log_normalization_action(
             db,
             actor_id=getattr(principal, "subject", "system"),
@@ -122,17 +156,18 @@ async def validate_normalization_endpoint(
             reason="Validated normalization output",
             context={
                 "is_valid": is_valid,
-                "warning_count": len(warnings),
+                "warning_count": summary.total,
             },
             metadata={
-                "warnings": [w.to_dict() for w in warnings],
+                "warning_summary": summary.to_dict(include_sample=False),
             },
         )
         return {
             "dataset_version_id": dataset_version_id.strip(),
             "is_valid": is_valid,
-            "warnings": [w.to_dict() for w in warnings],
-            "warning_count": len(warnings),
+            "warnings": summary.sample,
+            "warning_count": summary.total,
+            "warning_summary": summary.to_dict(include_sample=False),
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"NORMALIZATION_VALIDATION_FAILED: {str(e)}") from e
@@ -172,6 +207,9 @@ async def commit_normalization_endpoint(
             strict_mode=bool(strict_mode),
             skip_on_error=bool(skip_on_error),
         )
+        warning_artifact_id = await _store_warnings(
+            db, dataset_version_id=result.normalized_dataset_version_id, aggregator=result.warnings
+        )
         await log_normalization_action(
             db,
             actor_id=getattr(principal, "subject", "system"),
@@ -181,8 +219,47 @@ async def commit_normalization_endpoint(
             metadata={
                 "source_dataset_version_id": result.source_dataset_version_id,
                 "normalized_dataset_version_id": result.normalized_dataset_version_id,
+                "warning_summary": result.warnings.summary(
+                    warning_artifact_id=warning_artifact_id
+                ).to_dict(include_sample=False),
             },
         )
-        return result.to_dict()
+        return result.to_dict(warning_artifact_id=warning_artifact_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"NORMALIZATION_COMMIT_FAILED: {str(e)}") from e
+
+
+@router.get("/warnings/{warning_artifact_id}")
+async def list_normalization_warnings_endpoint(
+    warning_artifact_id: str,
+    offset: int = 0,
+    limit: int = 100,
+    code: str | None = None,
+    severity: str | None = None,
+    db: AsyncSession = Depends(get_db_session),
+    principal: Principal = Depends(require_principal(Role.READ)),
+) -> dict:
+    """
+    Browse a persisted normalization warning stream page by page.
+
+    Query parameters:
+        - offset: int (optional, default: 0)
+        - limit: int (optional, default: 100, max: 1000)
+        - code: str (optional) - filter by warning code
+        - severity: str (optional) - filter by warning severity
+
+    Returns:
+        Page of warnings with aggregated counts and `next_offset` (null on the last page)
+    """
+    try:
+        return await load_warning_page(
+            db,
+            warning_artifact_id=warning_artifact_id,
+            offset=offset,
+            limit=limit,
+            code=code,
+            severity=severity,
+        )
+    except WarningStoreError as exc:
+        status_code = 404 if str(exc) == "WARNING_ARTIFACT_NOT_FOUND" else 400
+        raise HTTPException(status_code=status_code, detail=str(exc)) from exc
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, JSON, String
+from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.models.base import Base
@@ -21,3 +21,27 @@ class NormalizedRecord(Base):
     payload: Mapped[dict] = mapped_column(JSON, nullable=False)
     normalized_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+
+
+class NormalizationWarningArtifact(Base):
+    """
+    Content-addressed reference to the full warning stream of a normalization pass.
+
+    The stream itself lives in the artifact store as gzip-compressed NDJSON; this row
+    carries the aggregated counts so summaries never need to decompress the artifact.
+    """
+
+    __tablename__ = "normalization_warning_artifact"
+    __table_args__ = (
+        UniqueConstraint("dataset_version_id", "checksum", name="uq_normalization_warning_dataset_checksum"),
+    )
+
+    warning_artifact_id: Mapped[str] = mapped_column(String, primary_key=True)
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), nullable=False, index=True
+    )
+    checksum: Mapped[str] = mapped_column(String, nullable=False)
+    artifact_uri: Mapped[str] = mapped_column(String, nullable=False)
+    warning_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    counts: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,270 @@
+"""
+Warning aggregation and storage for the normalization workflow.
+
+Normalization passes can emit hundreds of thousands of warnings. Embedding them in
+audit metadata or HTTP responses produces multi-MB rows and payloads, so warnings are
+instead streamed through a `WarningAggregator` which keeps:
+
+- counts aggregated by code and severity,
+- a capped sample of the first warnings seen,
+- the full warning stream as gzip-compressed NDJSON (compressed incrementally).
+
+The compressed stream is persisted content-addressed through the artifact store and
+referenced by `NormalizationWarningArtifact.warning_artifact_id`; callers browse it
+page by page via `load_warning_page`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from typing import Any, Iterable, Iterator
+import uuid
+import zlib
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.artifacts.checksums import sha256_hex, verify_sha256
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
+from backend.app.core.normalization.models import NormalizationWarningArtifact
+from backend.app.core.normalization.warnings import NormalizationWarning, WarningSeverity
+
+
+DEFAULT_WARNING_SAMPLE_LIMIT = 100
+MAX_WARNING_PAGE_LIMIT = 1000
+
+# wbits=31 selects the gzip container; zlib writes a zero mtime so output is deterministic.
+_GZIP_WBITS = 31
+
+
+class WarningStoreError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class WarningSummary:
+    """
+    Bounded summary of a warning stream.
+
+    Attributes:
+        total: Total number of warnings in the stream
+        counts: Warning counts keyed by code, then by severity
+        by_severity: Warning counts keyed by severity
+        sample: First `sample_limit` warnings (serialized)
+        sample_limit: Maximum sample size
+        warning_artifact_id: ID of the persisted full warning stream, if stored
+    """
+
+    total: int
+    counts: dict[str, dict[str, int]]
+    by_severity: dict[str, int]
+    sample: list[dict[str, Any]]
+    sample_limit: int
+    warning_artifact_id: str | None = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self.sample)
+
+    def to_dict(self, *, include_sample: bool = True) -> dict[str, Any]:
+        """Convert summary to dictionary for serialization."""
+        out: dict[str, Any] = {
+            "total": self.total,
+            "counts": self.counts,
+            "by_severity": self.by_severity,
+            "sample_limit": self.sample_limit,
+            "truncated": self.truncated,
+            "warning_artifact_id": self.warning_artifact_id,
+        }
+        if include_sample:
+            out["sample"] = self.sample
+        return out
+
+
+class WarningAggregator:
+    """
+    Streaming sink for normalization warnings.
+
+    Memory use is bounded by the sample size plus the compressed stream; individual
+    `NormalizationWarning` objects are not retained after `add`.
+    """
+
+    def __init__(self, *, sample_limit: int = DEFAULT_WARNING_SAMPLE_LIMIT) -> None:
+        if sample_limit < 0:
+            raise WarningStoreError("SAMPLE_LIMIT_INVALID")
+        self._sample_limit = sample_limit
+        self._total = 0
+        self._counts: dict[str, dict[str, int]] = {}
+        self._sample: list[dict[str, Any]] = []
+        self._compressor = zlib.compressobj(9, zlib.DEFLATED, _GZIP_WBITS)
+        self._chunks: list[bytes] = []
+        self._finished: bytes | None = None
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def add(self, warning: NormalizationWarning) -> None:
+        if self._finished is not None:
+            raise WarningStoreError("WARNING_AGGREGATOR_FINALIZED")
+        data = warning.to_dict()
+        by_sev = self._counts.setdefault(warning.code, {})
+        by_sev[warning.severity.value] = by_sev.get(warning.severity.value, 0) + 1
+        if len(self._sample) < self._sample_limit:
+            self._sample.append(data)
+        line = json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n"
+        chunk = self._compressor.compress(line.encode("utf-8"))
+        if chunk:
+            self._chunks.append(chunk)
+        self._total += 1
+
+    def extend(self, warnings: Iterable[NormalizationWarning]) -> None:
+        for warning in warnings:
+            self.add(warning)
+
+    def by_severity(self) -> dict[str, int]:
+        out: dict[str, int] = {}
+        for severity in WarningSeverity:
+            count = sum(by_sev.get(severity.value, 0) for by_sev in self._counts.values())
+            if count > 0:
+                out[severity.value] = count
+        return out
+
+    def summary(self, *, warning_artifact_id: str | None = None) -> WarningSummary:
+        return WarningSummary(
+            total=self._total,
+            counts={code: dict(sorted(self._counts[code].items())) for code in sorted(self._counts)},
+            by_severity=self.by_severity(),
+            sample=list(self._sample),
+            sample_limit=self._sample_limit,
+            warning_artifact_id=warning_artifact_id,
+        )
+
+    def compressed_ndjson(self) -> bytes:
+        """Finalize and return the full warning stream as gzip-compressed NDJSON."""
+        if self._finished is None:
+            self._chunks.append(self._compressor.flush())
+            self._finished = b"".join(self._chunks)
+            self._chunks = []
+        return self._finished
+
+
+async def persist_warning_artifact(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    aggregator: WarningAggregator,
+    created_at: datetime,
+) -> NormalizationWarningArtifact:
+    """
+    Persist the full warning stream of `aggregator` to the artifact store.
+
+    Storage is content-addressed per dataset version: identical warning streams
+    resolve to the same artifact row. The row is added to the session but not
+    committed; the caller owns the transaction.
+    """
+    if created_at.tzinfo is None:
+        raise WarningStoreError("CREATED_AT_TIMEZONE_REQUIRED: created_at must be timezone-aware")
+
+    data = aggregator.compressed_ndjson()
+    checksum = sha256_hex(data)
+    existing = await db.scalar(
+        select(NormalizationWarningArtifact).where(
+            NormalizationWarningArtifact.dataset_version_id == dataset_version_id,
+            NormalizationWarningArtifact.checksum == checksum,
+        )
+    )
+    if existing is not None:
+        return existing
+
+    stored = await get_artifact_store().put_bytes(
+        key=f"core/normalization/warnings/{dataset_version_id}/{checksum}.ndjson.gz",
+        data=data,
+        content_type="application/x-ndjson+gzip",
+    )
+    row = NormalizationWarningArtifact(
+        warning_artifact_id=str(uuid.uuid4()),
+        dataset_version_id=dataset_version_id,
+        checksum=checksum,
+        artifact_uri=stored.uri,
+        warning_count=aggregator.total,
+        counts=aggregator.summary().counts,
+        created_at=created_at,
+    )
+    db.add(row)
+    await db.flush()
+    return row
+
+
+def _iter_ndjson_gzip(data: bytes, *, chunk_size: int = 64 * 1024) -> Iterator[dict[str, Any]]:
+    decompressor = zlib.decompressobj(_GZIP_WBITS)
+    pending = b""
+    for start in range(0, len(data), chunk_size):
+        pending += decompressor.decompress(data[start : start + chunk_size])
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line:
+                yield json.loads(line)
+    pending += decompressor.flush()
+    if pending.strip():
+        yield json.loads(pending)
+
+
+async def load_warning_page(
+    db: AsyncSession,
+    *,
+    warning_artifact_id: str,
+    offset: int = 0,
+    limit: int = 100,
+    code: str | None = None,
+    severity: str | None = None,
+) -> dict[str, Any]:
+    """
+    Load one page of a persisted warning stream.
+
+    Filters are applied before pagination; `offset` counts matching warnings only.
+    The stream is decompressed incrementally and iteration stops once the page is full.
+    """
+    if offset < 0:
+        raise WarningStoreError("OFFSET_INVALID")
+    if limit < 1 or limit > MAX_WARNING_PAGE_LIMIT:
+        raise WarningStoreError("LIMIT_INVALID")
+
+    row = await db.scalar(
+        select(NormalizationWarningArtifact).where(
+            NormalizationWarningArtifact.warning_artifact_id == warning_artifact_id
+        )
+    )
+    if row is None:
+        raise WarningStoreError("WARNING_ARTIFACT_NOT_FOUND")
+
+    raw = await get_artifact_store().get_bytes(key=artifact_key_from_uri(row.artifact_uri))
+    verify_sha256(raw, row.checksum)
+
+    items: list[dict[str, Any]] = []
+    matched = 0
+    has_more = False
+    for warning in _iter_ndjson_gzip(raw):
+        if code is not None and warning.get("code") != code:
+            continue
+        if severity is not None and warning.get("severity") != severity:
+            continue
+        if matched >= offset + limit:
+            has_more = True
+            break
+        if matched >= offset:
+            items.append(warning)
+        matched += 1
+
+    return {
+        "warning_artifact_id": row.warning_artifact_id,
+        "dataset_version_id": row.dataset_version_id,
+        "total": row.warning_count,
+        "counts": row.counts,
+        "offset": offset,
+        "limit": limit,
+        "items": items,
+        "next_offset": offset + len(items) if has_more else None,
+    }
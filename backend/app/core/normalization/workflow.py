@@ -18,6 +18,7 @@ from backend.app.core.dataset.raw_models import RawRecord
 from backend.app.core.dataset.service import load_raw_records
 from backend.app.core.normalization.models import NormalizedRecord
 from backend.app.core.normalization.pipeline import normalize_payload
+from backend.app.core.normalization.warning_store import WarningAggregator
 from backend.app.core.normalization.warnings import (
     NormalizationWarning,
     WarningSeverity,
@@ -41,23 +42,30 @@ class NormalizationPreview:
         dataset_version_id: DatasetVersion ID
         total_records: Total number of records to normalize
         preview_records: List of preview records (first N records)
-        warnings: List of warnings generated during normalization
+        warnings: Aggregated warnings generated during normalization
         warnings_by_severity: Count of warnings by severity
     """
 
     dataset_version_id: str
     total_records: int
     preview_records: list[dict[str, Any]]
-    warnings: list[NormalizationWarning]
+    warnings: WarningAggregator
     warnings_by_severity: dict[str, int]
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert preview to dictionary for serialization."""
+    def to_dict(self, *, warning_artifact_id: str | None = None) -> dict[str, Any]:
+        """
+        Convert preview to dictionary for serialization.
+
+        Only a capped sample of warnings is included; the full stream is referenced
+        by `warning_artifact_id` once persisted.
+        """
+        summary = self.warnings.summary(warning_artifact_id=warning_artifact_id)
         return {
             "dataset_version_id": self.dataset_version_id,
             "total_records": self.total_records,
             "preview_records": self.preview_records,
-            "warnings": [w.to_dict() for w in self.warnings],
+            "warnings": summary.sample,
+            "warning_summary": summary.to_dict(include_sample=False),
             "warnings_by_severity": self.warnings_by_severity,
         }
 
@@ -71,7 +79,7 @@ class NormalizationResult:
         dataset_version_id: DatasetVersion ID
         records_normalized: Number of records normalized
         records_skipped: Number of records skipped (due to errors)
-        warnings: List of warnings generated
+        warnings: Aggregated warnings generated
         normalized_record_ids: List of normalized record IDs created
     """
 
@@ -79,17 +87,19 @@ class NormalizationResult:
     normalized_dataset_version_id: str
     records_normalized: int
     records_skipped: int
-    warnings: list[NormalizationWarning]
+    warnings: WarningAggregator
     normalized_record_ids: list[str]
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert result to dictionary for serialization."""
+    def to_dict(self, *, warning_artifact_id: str | None = None) -> dict[str, Any]:
+        """Convert result to dictionary for serialization (warnings are sampled)."""
+        summary = self.warnings.summary(warning_artifact_id=warning_artifact_id)
         return {
             "source_dataset_version_id": self.source_dataset_version_id,
             "normalized_dataset_version_id": self.normalized_dataset_version_id,
             "records_normalized": self.records_normalized,
             "records_skipped": self.records_skipped,
-            "warnings": [w.to_dict() for w in self.warnings],
+            "warnings": summary.sample,
+            "warning_summary": summary.to_dict(include_sample=False),
             "normalized_record_ids": self.normalized_record_ids,
         }
 
@@ -102,6 +112,7 @@ async def preview_normalization(
     preview_limit: int = 10,
     verify_checksums: bool = True,
     strict_mode: bool = True,
+    warning_sink: WarningAggregator | None = None,
 ) -> NormalizationPreview:
     """
     Preview normalization results without committing.
@@ -116,10 +127,13 @@ async def preview_normalization(
         preview_limit: Maximum number of records to include in preview
         verify_checksums: Whether to verify checksums on read
         strict_mode: Whether to use strict mode for checksum verification
+        warning_sink: Optional aggregator receiving warnings (created if omitted)
     
     Returns:
         NormalizationPreview with preview records and warnings
     """
+    all_warnings = warning_sink if warning_sink is not None else WarningAggregator()
+
     # Load raw records
     raw_records = await load_raw_records(
         db,
@@ -134,13 +148,12 @@ async def preview_normalization(
             dataset_version_id=dataset_version_id,
             total_records=0,
             preview_records=[],
-            warnings=[],
+            warnings=all_warnings,
             warnings_by_severity={},
         )
 
     # Apply normalization and collect warnings
     preview_records: list[dict[str, Any]] = []
-    all_warnings: list[NormalizationWarning] = []
 
     for raw_record in raw_records[:preview_limit]:
         try:
@@ -165,7 +178,7 @@ async def preview_normalization(
             all_warnings.extend(warnings)
         except Exception as e:
             # Generate error warning for failed normalization
-            all_warnings.append(
+            all_warnings.add(
                 create_data_quality_warning(
                     raw_record_id=raw_record.raw_record_id,
                     code="NORMALIZATION_ERROR",
@@ -177,19 +190,12 @@ async def preview_normalization(
                 )
             )
 
-    # Count warnings by severity
-    warnings_by_severity: dict[str, int] = {}
-    for severity in WarningSeverity:
-        count = sum(1 for w in all_warnings if w.severity == severity)
-        if count > 0:
-            warnings_by_severity[severity.value] = count
-
     return NormalizationPreview(
         dataset_version_id=dataset_version_id,
         total_records=len(raw_records),
         preview_records=preview_records,
         warnings=all_warnings,
-        warnings_by_severity=warnings_by_severity,
+        warnings_by_severity=all_warnings.by_severity(),
     )
 
 
@@ -200,7 +206,8 @@ async def validate_normalization(
     normalization_rule: NormalizationRule | None = None,
     verify_checksums: bool = True,
     strict_mode: bool = True,
-) -> tuple[bool, list[NormalizationWarning]]:
+    warning_sink: WarningAggregator | None = None,
+) -> tuple[bool, WarningAggregator]:
     """
     Validate normalization rules without committing.
     
@@ -213,10 +220,13 @@ async def validate_normalization(
         normalization_rule: Optional engine-specific normalization rule
         verify_checksums: Whether to verify checksums on read
         strict_mode: Whether to use strict mode for checksum verification
+        warning_sink: Optional aggregator receiving warnings (created if omitted)
     
     Returns:
         Tuple of (is_valid, warnings) where is_valid is True if no critical errors
     """
+    all_warnings = warning_sink if warning_sink is not None else WarningAggregator()
+
     # Load all raw records
     raw_records = await load_raw_records(
         db,
@@ -226,7 +236,6 @@ async def validate_normalization(
         order_by=(RawRecord.ingested_at.asc(), RawRecord.raw_record_id.asc()),
     )
 
-    all_warnings: list[NormalizationWarning] = []
     has_critical_errors = False
 
     for raw_record in raw_records:
@@ -245,7 +254,7 @@ async def validate_normalization(
                 has_critical_errors = True
         except Exception:
             has_critical_errors = True
-            all_warnings.append(
+            all_warnings.add(
                 create_data_quality_warning(
                     raw_record_id=raw_record.raw_record_id,
                     code="NORMALIZATION_ERROR",
@@ -268,6 +277,7 @@ async def commit_normalization(
     verify_checksums: bool = True,
     strict_mode: bool = True,
     skip_on_error: bool = False,
+    warning_sink: WarningAggregator | None = None,
 ) -> NormalizationResult:
     """
     Commit normalization to database.
@@ -283,10 +293,13 @@ async def commit_normalization(
         verify_checksums: Whether to verify checksums on read
         strict_mode: Whether to use strict mode for checksum verification
         skip_on_error: Whether to skip records with errors (True) or fail (False)
+        warning_sink: Optional aggregator receiving warnings (created if omitted)
     
     Returns:
         NormalizationResult with normalization statistics
     """
+    all_warnings = warning_sink if warning_sink is not None else WarningAggregator()
+
     # Load raw records
     raw_records = await load_raw_records(
         db,
@@ -302,7 +315,7 @@ async def commit_normalization(
             normalized_dataset_version_id=dataset_version_id,
             records_normalized=0,
             records_skipped=0,
-            warnings=[],
+            warnings=all_warnings,
             normalized_record_ids=[],
         )
 
@@ -314,7 +327,6 @@ async def commit_normalization(
     now = datetime.now(timezone.utc)
     normalized_count = 0
     skipped_count = 0
-    all_warnings: list[NormalizationWarning] = []
     normalized_record_ids: list[str] = []
 
     for raw_record in raw_records:
@@ -355,7 +367,7 @@ async def commit_normalization(
         except Exception as e:
             if skip_on_error:
                 skipped_count += 1
-                all_warnings.append(
+                all_warnings.add(
                     create_data_quality_warning(
                         raw_record_id=raw_record.raw_record_id,
                         code="NORMALIZATION_ERROR",
@@ -18,7 +18,7 @@ from backend.app.core.auth.dependencies import require_principal
 from backend.app.core.dataset.models import DatasetVersion
 from backend.app.core.dataset.uuidv7 import uuid7
 from backend.app.core.db import get_db_session
-from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.core.evidence.service import create_evidence
 from backend.app.core.rbac.roles import Role
 from backend.app.core.ocr.service import extract_text_from_file
 
@@ -105,7 +105,9 @@ async def upload_ocr_file(
     # Create evidence record
     evidence_id = f"ocr-{uuid4().hex[:16]}"
     
-    evidence_record = EvidenceRecord(
+    # Through the service, so the record's references are indexed with it.
+    await create_evidence(
+        db,
         evidence_id=evidence_id,
         dataset_version_id=dataset_version.id,
         engine_id="ocr",
@@ -122,10 +124,7 @@ async def upload_ocr_file(
         },
         created_at=created_at,
     )
-    
-    db.add(evidence_record)
     await db.commit()
-    await db.refresh(evidence_record)
     
     # Return response matching frontend expectations
     return {
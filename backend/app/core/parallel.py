@@ -0,0 +1,93 @@
+"""
+Chunked process-pool execution for CPU-bound engine stages.
+
+Engines hand over a list of picklable chunks and a top-level function; `map_chunks`
+returns the per-chunk results in input order, so merging them in sequence is as
+deterministic as the serial loop it replaces. It is a coroutine: pool results are
+awaited through the running event loop, so other requests keep being served while
+the workers compute.
+
+The pool is shared by the process and created lazily with the "spawn" start
+method (forking an event loop with live DB connections is unsafe). It is sized
+once from `Settings.engine_parallel_workers` (or the caller's `workers` when no
+pool size is configured) and never resized, so concurrent runs share it without
+cancelling each other's work; the app shutdown handler calls `shutdown_pool`.
+With fewer than two workers or a single chunk the function runs inline. If the
+pool cannot be started or breaks, the broken pool is dropped and the chunks run
+in a worker thread with a warning instead of failing the run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+import threading
+from typing import Callable, Sequence, TypeVar
+
+from backend.app.core.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def configured_workers() -> int:
+    return get_settings().engine_parallel_workers
+
+
+def chunked(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    if size < 1:
+        raise ValueError("CHUNK_SIZE_INVALID")
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            size = configured_workers()
+            _POOL = ProcessPoolExecutor(
+                max_workers=size if size > 1 else workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def map_chunks(fn: Callable[[T], R], chunks: Sequence[T], *, workers: int | None = None) -> list[R]:
+    """Apply `fn` to every chunk, in a process pool when configured; results keep chunk order."""
+    workers = configured_workers() if workers is None else workers
+    if workers < 2 or len(chunks) < 2:
+        return [fn(chunk) for chunk in chunks]
+    loop = asyncio.get_running_loop()
+    pool: ProcessPoolExecutor | None = None
+    try:
+        pool = _pool(workers)
+        return list(await asyncio.gather(*(loop.run_in_executor(pool, fn, chunk) for chunk in chunks)))
+    except (BrokenProcessPool, OSError) as exc:
+        logger.warning("PARALLEL_POOL_UNAVAILABLE falling back to a worker thread: %s", exc)
+        if pool is not None:
+            _discard_pool(pool)
+        return await asyncio.to_thread(lambda: [fn(chunk) for chunk in chunks])
@@ -0,0 +1,16 @@
+from backend.app.core.profiling.capture import (
+    PROFILE_CAPTURE_HEADER,
+    PROFILE_REQUEST_HEADER,
+    profiling_middleware,
+)
+from backend.app.core.profiling.stages import STAGES, engine_stage, mark_stage, profiled_run
+
+__all__ = [
+    "PROFILE_CAPTURE_HEADER",
+    "PROFILE_REQUEST_HEADER",
+    "STAGES",
+    "engine_stage",
+    "mark_stage",
+    "profiled_run",
+    "profiling_middleware",
+]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
+from backend.app.core.auth.dependencies import require_principal
+from backend.app.core.db import get_db_session
+from backend.app.core.profiling.capture import CAPTURE_ARTIFACTS
+from backend.app.core.profiling.models import ProfileCapture
+from backend.app.core.rbac.roles import Role
+
+
+router = APIRouter(prefix="/api/v3/admin/profiles", tags=["admin"])
+
+
+def _capture_payload(row: ProfileCapture) -> dict:
+    return {
+        "capture_id": row.capture_id,
+        "engine_id": row.engine_id,
+        "run_id": row.run_id,
+        "dataset_version_id": row.dataset_version_id,
+        "status": row.status,
+        "artifacts": sorted(row.artifacts),
+        "summary": row.summary,
+        "created_at": row.created_at.isoformat(),
+    }
+
+
+@router.get("")
+async def list_profile_captures(
+    run_id: str | None = Query(None),
+    dataset_version_id: str | None = Query(None),
+    engine_id: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db_session),
+    _: object = Depends(require_principal(Role.ADMIN)),
+) -> dict:
+    stmt = select(ProfileCapture)
+    if run_id is not None:
+        stmt = stmt.where(ProfileCapture.run_id == run_id)
+    if dataset_version_id is not None:
+        stmt = stmt.where(ProfileCapture.dataset_version_id == dataset_version_id)
+    if engine_id is not None:
+        stmt = stmt.where(ProfileCapture.engine_id == engine_id)
+    stmt = stmt.order_by(ProfileCapture.created_at.desc(), ProfileCapture.capture_id).limit(limit)
+    rows = (await db.scalars(stmt)).all()
+    return {"items": [_capture_payload(row) for row in rows]}
+
+
+@router.get("/{capture_id}/{artifact_name}")
+async def get_profile_capture_artifact(
+    capture_id: str,
+    artifact_name: str,
+    db: AsyncSession = Depends(get_db_session),
+    _: object = Depends(require_principal(Role.ADMIN)),
+) -> Response:
+    row = await db.get(ProfileCapture, capture_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="PROFILE_CAPTURE_NOT_FOUND")
+    uri = row.artifacts.get(artifact_name)
+    if uri is None:
+        raise HTTPException(status_code=404, detail="PROFILE_ARTIFACT_NOT_FOUND")
+    data = await get_artifact_store().get_bytes(key=artifact_key_from_uri(uri))
+    return Response(content=data, media_type=CAPTURE_ARTIFACTS.get(artifact_name, "application/octet-stream"))
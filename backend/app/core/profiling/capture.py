@@ -0,0 +1,219 @@
+"""
+On-demand cProfile/tracemalloc captures of engine runs.
+
+An admin request carrying `X-Todiscope-Profile: 1` arms a capture for that request
+(`profiling_middleware`). The next `profiled_run` entered in the request profiles
+the run with cProfile and tracemalloc, stores the results as artifacts under
+`core/profiles/{engine_id}/{capture_id}/` and indexes them in `profile_capture` by
+run ID and dataset version. The response carries the capture IDs in
+`X-Todiscope-Profile-Capture`.
+
+cProfile observes the whole event-loop thread, so a capture also includes any
+other work interleaved with the run; only one capture runs at a time per process,
+and a request arriving while another capture is active is simply not profiled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import io
+import json
+import logging
+import marshal
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable
+import uuid
+
+from fastapi import HTTPException, Request, Response
+
+from backend.app.core.artifacts.store import get_artifact_store
+from backend.app.core.auth.dependencies import get_principal
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.profiling.models import ProfileCapture
+from backend.app.core.rbac.roles import Role
+from backend.app.core.rbac.service import has_roles
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_REQUEST_HEADER = "X-Todiscope-Profile"
+PROFILE_CAPTURE_HEADER = "X-Todiscope-Profile-Capture"
+TRACEMALLOC_FRAMES = 25
+TOP_FUNCTIONS = 60
+TOP_ALLOCATIONS = 50
+
+# artifact name -> content type
+CAPTURE_ARTIFACTS = {
+    "cprofile.pstats": "application/octet-stream",
+    "cprofile.txt": "text/plain; charset=utf-8",
+    "tracemalloc.txt": "text/plain; charset=utf-8",
+    "summary.json": "application/json",
+}
+
+
+@dataclass
+class _ProfileRequest:
+    capture_ids: list[str] = field(default_factory=list)
+    consumed: bool = False
+
+
+_REQUESTED: ContextVar[_ProfileRequest | None] = ContextVar("todiscope_profile_request", default=None)
+_CAPTURE_SLOT = threading.Lock()
+
+
+class RunCapture:
+    """cProfile + tracemalloc capture of one engine run."""
+
+    def __init__(self, engine_id: str, request: _ProfileRequest) -> None:
+        self.capture_id = uuid.uuid4().hex
+        self.engine_id = engine_id
+        self._request = request
+        self._profiler = cProfile.Profile()
+        self._owns_tracemalloc = False
+        self._started = 0.0
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        self._profiler.enable()
+
+    async def finish(
+        self,
+        *,
+        result: Any,
+        failed: bool,
+        dataset_version_id: Any,
+        timings: list[dict[str, Any]],
+    ) -> None:
+        """Stop profiling and store the capture; storage errors are logged, never raised."""
+        try:
+            self._profiler.disable()
+            wall_seconds = time.perf_counter() - self._started
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+        finally:
+            _CAPTURE_SLOT.release()
+
+        run_id = result.get("run_id") if isinstance(result, dict) else None
+        summary = {
+            "capture_id": self.capture_id,
+            "engine_id": self.engine_id,
+            "run_id": run_id if isinstance(run_id, str) else None,
+            "dataset_version_id": dataset_version_id if isinstance(dataset_version_id, str) else None,
+            "status": "failed" if failed else "completed",
+            "wall_seconds": round(wall_seconds, 6),
+            "traced_memory_bytes": {"current": current, "peak": peak},
+            "stages": timings,
+        }
+        try:
+            await _store_capture(self, summary=summary, snapshot=snapshot)
+            self._request.capture_ids.append(self.capture_id)
+        except Exception:  # noqa: BLE001 - diagnostics must not fail the run
+            logger.exception("PROFILE_CAPTURE_STORE_FAILED capture_id=%s", self.capture_id)
+
+    def render(self, snapshot: tracemalloc.Snapshot, summary: dict[str, Any]) -> dict[str, bytes]:
+        self._profiler.create_stats()
+        text = io.StringIO()
+        # Stats takes over the profiler's data; dump from it below.
+        stats = pstats.Stats(self._profiler, stream=text)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+        lines = [
+            f"traced memory: current={summary['traced_memory_bytes']['current']} "
+            f"peak={summary['traced_memory_bytes']['peak']} bytes",
+            f"top {TOP_ALLOCATIONS} allocation sites by size:",
+        ]
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+        return {
+            # Same format as cProfile.Profile.dump_stats; load with pstats.Stats(path).
+            "cprofile.pstats": marshal.dumps(stats.stats),
+            "cprofile.txt": text.getvalue().encode("utf-8"),
+            "tracemalloc.txt": ("\n".join(lines) + "\n").encode("utf-8"),
+            "summary.json": json.dumps(summary, sort_keys=True, indent=2).encode("utf-8"),
+        }
+
+
+async def _store_capture(capture: RunCapture, *, summary: dict[str, Any], snapshot: tracemalloc.Snapshot) -> None:
+    store = get_artifact_store()
+    uris: dict[str, str] = {}
+    for name, data in capture.render(snapshot, summary).items():
+        stored = await store.put_bytes(
+            key=f"core/profiles/{capture.engine_id}/{capture.capture_id}/{name}",
+            data=data,
+            content_type=CAPTURE_ARTIFACTS[name],
+        )
+        uris[name] = stored.uri
+    async with get_sessionmaker()() as db:
+        db.add(
+            ProfileCapture(
+                capture_id=capture.capture_id,
+                engine_id=capture.engine_id,
+                run_id=summary["run_id"],
+                dataset_version_id=summary["dataset_version_id"],
+                status=summary["status"],
+                artifacts=uris,
+                summary=summary,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+
+
+def start_requested_capture(engine_id: str) -> RunCapture | None:
+    """Start a capture if the current request asked for one and none is running."""
+    request = _REQUESTED.get()
+    if request is None or request.consumed:
+        return None
+    # One capture per request: nested runs are not profiled separately.
+    request.consumed = True
+    if not _CAPTURE_SLOT.acquire(blocking=False):
+        logger.warning("PROFILE_CAPTURE_SKIPPED_BUSY engine_id=%s", engine_id)
+        return None
+    capture = RunCapture(engine_id, request)
+    try:
+        capture.start()
+    except BaseException:
+        _CAPTURE_SLOT.release()
+        raise
+    return capture
+
+
+def _flag_set(value: str | None) -> bool:
+    return value is not None and value.strip().lower() in ("1", "true", "yes")
+
+
+async def _is_admin(request: Request) -> bool:
+    try:
+        principal = await get_principal(request.headers.get("X-API-Key"))
+    except HTTPException:
+        return False
+    return has_roles(principal.roles, (Role.ADMIN,))
+
+
+def profiling_middleware() -> Callable:
+    async def _middleware(request: Request, call_next: Callable) -> Response:
+        if not _flag_set(request.headers.get(PROFILE_REQUEST_HEADER)) or not await _is_admin(request):
+            return await call_next(request)
+        profile_request = _ProfileRequest()
+        token = _REQUESTED.set(profile_request)
+        try:
+            resp = await call_next(request)
+        finally:
+            _REQUESTED.reset(token)
+        if profile_request.capture_ids:
+            resp.headers[PROFILE_CAPTURE_HEADER] = ",".join(profile_request.capture_ids)
+        return resp
+
+    return _middleware
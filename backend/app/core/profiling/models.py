@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.models.base import Base
+
+
+class ProfileCapture(Base):
+    """Index row for one on-demand cProfile/tracemalloc capture of an engine run."""
+
+    __tablename__ = "profile_capture"
+
+    capture_id: Mapped[str] = mapped_column(String, primary_key=True)
+    engine_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Not foreign keys: a capture is kept even when the run failed validation.
+    run_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    dataset_version_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    # artifact name -> artifact URI
+    artifacts: Mapped[dict] = mapped_column(JSON, nullable=False)
+    summary: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,152 @@
+"""
+Named stages for engine runs.
+
+`profiled_run` wraps an engine's `run_engine`. Inside it, `mark_stage("model")`
+ends the current stage and starts the next one without re-indenting the run body,
+and `engine_stage("report")` times an enclosed block. Each stage observes
+`engine_stage_duration_seconds` and is a query scope, so per-stage SQL counts and
+DB time show up next to its wall time. Any stage still open when the run returns
+or raises is closed by `profiled_run`.
+
+When the current request asked for a profile (see `capture.py`), `profiled_run`
+also records a cProfile/tracemalloc capture of the whole run and stores it.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import functools
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from backend.app.core.metrics import engine_stage_duration_seconds
+from backend.app.core.profiling.capture import start_requested_capture
+from backend.app.core.query_metrics import QueryStats, close_query_scope, open_query_scope
+
+
+STAGES = ("load", "normalize", "model", "persist", "report")
+
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: str
+    seconds: float
+    query_count: int
+    db_seconds: float
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "seconds": round(self.seconds, 6),
+            "query_count": self.query_count,
+            "db_seconds": round(self.db_seconds, 6),
+        }
+
+
+@dataclass
+class _RunStages:
+    engine_id: str
+    timings: list[StageTiming] = field(default_factory=list)
+    _stage: str | None = None
+    _started: float = 0.0
+    _stats: QueryStats | None = None
+    _token: Token | None = None
+
+    def open(self, stage: str) -> None:
+        self.close()
+        self._stage = stage
+        self._stats, self._token = open_query_scope("stage", f"{self.engine_id}:{stage}")
+        self._started = time.perf_counter()
+
+    def close(self) -> None:
+        if self._stage is None:
+            return
+        assert self._stats is not None and self._token is not None
+        close_query_scope(self._stats, self._token)
+        self.record(self._stage, time.perf_counter() - self._started, self._stats)
+        self._stage = self._stats = self._token = None
+
+    def record(self, stage: str, seconds: float, stats: QueryStats) -> None:
+        engine_stage_duration_seconds.labels(engine_id=self.engine_id, stage=stage).observe(seconds)
+        self.timings.append(
+            StageTiming(stage=stage, seconds=seconds, query_count=stats.query_count, db_seconds=stats.db_seconds)
+        )
+
+
+_CURRENT_RUN: ContextVar[_RunStages | None] = ContextVar("todiscope_engine_run_stages", default=None)
+
+
+def mark_stage(stage: str) -> None:
+    """End the current stage of the enclosing `profiled_run` (if any) and start `stage`."""
+    run = _CURRENT_RUN.get()
+    if run is not None:
+        run.open(stage)
+
+
+@contextmanager
+def engine_stage(stage: str, *, engine_id: str | None = None) -> Iterator[None]:
+    """
+    Time the enclosed block as `stage`.
+
+    `engine_id` defaults to the enclosing `profiled_run`'s engine. Do not call
+    `mark_stage` inside the block.
+    """
+    run = _CURRENT_RUN.get()
+    owner = engine_id or (run.engine_id if run is not None else None)
+    if owner is None:
+        raise ValueError("ENGINE_STAGE_ENGINE_ID_REQUIRED")
+    stats, token = open_query_scope("stage", f"{owner}:{stage}")
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        close_query_scope(stats, token)
+        seconds = time.perf_counter() - started
+        if run is not None and run.engine_id == owner:
+            run.record(stage, seconds, stats)
+        else:
+            engine_stage_duration_seconds.labels(engine_id=owner, stage=stage).observe(seconds)
+
+
+def profiled_run(engine_id: str) -> Callable[[_F], _F]:
+    """Decorate an engine's async `run_engine` with stage tracking and on-demand profiling."""
+
+    def decorator(fn: _F) -> _F:
+        signature = inspect.signature(fn)
+
+        def dataset_version_id(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            try:
+                return signature.bind_partial(*args, **kwargs).arguments.get("dataset_version_id")
+            except TypeError:
+                return None
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            run = _RunStages(engine_id=engine_id)
+            token = _CURRENT_RUN.set(run)
+            capture = start_requested_capture(engine_id)
+            result: Any = None
+            failed = True
+            try:
+                result = await fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                run.close()
+                _CURRENT_RUN.reset(token)
+                if capture is not None:
+                    await capture.finish(
+                        result=result,
+                        failed=failed,
+                        dataset_version_id=dataset_version_id(args, kwargs),
+                        timings=[t.to_payload() for t in run.timings],
+                    )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
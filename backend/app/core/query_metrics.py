@@ -0,0 +1,295 @@
+"""
+SQL query instrumentation.
+
+Cursor-level SQLAlchemy event hooks attribute every statement to the scopes active
+in the current context (an HTTP request, an engine stage, ...). Each scope counts
+queries, DB time and rows reported by the driver, and observes them as histograms
+when it closes, so an N+1 regression shows up as a jump in queries per request
+long before a run times out.
+
+Statements slower than the configured threshold are also recorded in a bounded
+in-memory ring buffer as a fingerprint (literals and IN-lists collapsed), the shape
+of the parameters (never their values) and, optionally, the query plan.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import logging
+import re
+import threading
+import time
+from typing import Any, Iterator
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.app.core.auth.dependencies import require_principal
+from backend.app.core.config import get_settings
+from backend.app.core.metrics import (
+    db_queries_per_scope,
+    db_rows_per_scope,
+    db_time_seconds_per_scope,
+)
+from backend.app.core.rbac.roles import Role
+
+
+logger = logging.getLogger(__name__)
+
+_EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+_START_KEY = "todiscope_query_start"
+_EXPLAIN_SAVEPOINT = "todiscope_explain"
+
+
+@dataclass(slots=True)
+class QueryStats:
+    scope: str
+    name: str
+    query_count: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    fingerprint: str
+    parameters_shape: Any
+    duration_ms: float
+    rowcount: int
+    scopes: tuple[str, ...]
+    recorded_at: str
+    explain: list[str] | None = None
+    explain_error: str | None = None
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "parameters_shape": self.parameters_shape,
+            "duration_ms": round(self.duration_ms, 3),
+            "rowcount": self.rowcount,
+            "scopes": list(self.scopes),
+            "recorded_at": self.recorded_at,
+            "explain": self.explain,
+            "explain_error": self.explain_error,
+        }
+
+
+@dataclass
+class _SlowQueryLog:
+    threshold_seconds: float
+    explain: bool
+    entries: deque[SlowQuery] = field(default_factory=lambda: deque(maxlen=200))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_ACTIVE_SCOPES: ContextVar[tuple[QueryStats, ...]] = ContextVar("todiscope_query_scopes", default=())
+_SLOW_LOG: _SlowQueryLog | None = None
+
+
+def _slow_log() -> _SlowQueryLog:
+    global _SLOW_LOG
+    if _SLOW_LOG is None:
+        settings = get_settings()
+        _SLOW_LOG = _SlowQueryLog(
+            threshold_seconds=settings.slow_query_threshold_ms / 1000.0,
+            explain=settings.slow_query_explain,
+            entries=deque(maxlen=max(1, settings.slow_query_log_size)),
+        )
+    return _SLOW_LOG
+
+
+@contextmanager
+def track_queries(scope: str, name: str) -> Iterator[QueryStats]:
+    """
+    Attribute queries issued inside the block to (scope, name).
+
+    Scopes nest: a query inside an engine stage inside a request counts towards both.
+    Histograms are observed when the block exits, including on error, under the
+    stats' name at that point (callers may set it once it is known, e.g. the route).
+    """
+    stats, token = open_query_scope(scope, name)
+    try:
+        yield stats
+    finally:
+        close_query_scope(stats, token)
+
+
+def open_query_scope(scope: str, name: str) -> tuple[QueryStats, Token]:
+    """Start attributing queries to (scope, name); pair with `close_query_scope` in the same task."""
+    stats = QueryStats(scope=scope, name=name)
+    return stats, _ACTIVE_SCOPES.set(_ACTIVE_SCOPES.get() + (stats,))
+
+
+def close_query_scope(stats: QueryStats, token: Token) -> None:
+    _ACTIVE_SCOPES.reset(token)
+    db_queries_per_scope.labels(scope=stats.scope, name=stats.name).observe(stats.query_count)
+    db_time_seconds_per_scope.labels(scope=stats.scope, name=stats.name).observe(stats.db_seconds)
+    db_rows_per_scope.labels(scope=stats.scope, name=stats.name).observe(stats.rows)
+
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|(?<!:):\w+|\$\d+|%s|\?")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a statement so that executions differing only in literals or IN-list length match."""
+    fp = _STRING_LITERAL_RE.sub("?", statement)
+    fp = _PLACEHOLDER_RE.sub("?", fp)
+    fp = _NUMBER_RE.sub("?", fp)
+    fp = _IN_LIST_RE.sub("(?...)", fp)
+    return _WHITESPACE_RE.sub(" ", fp).strip()
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Describe parameters by type (and batch size) without exposing values."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {"batch": len(parameters), "row": parameters_shape(parameters[0]) if parameters else None}
+    if isinstance(parameters, dict):
+        return {str(k): type(v).__name__ for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(v).__name__ for v in parameters]
+    return type(parameters).__name__
+
+
+def recent_slow_queries(limit: int | None = None) -> list[SlowQuery]:
+    """Slow queries currently held in the ring buffer, newest first."""
+    log = _slow_log()
+    with log.lock:
+        entries = list(log.entries)
+    entries.reverse()
+    return entries[:limit] if limit is not None else entries
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    rowcount = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else 0
+
+    scopes = _ACTIVE_SCOPES.get()
+    for stats in scopes:
+        stats.query_count += 1
+        stats.db_seconds += elapsed
+        stats.rows += rowcount
+
+    log = _slow_log()
+    if elapsed >= log.threshold_seconds:
+        _record_slow_query(
+            log,
+            conn,
+            statement=statement,
+            parameters=parameters,
+            executemany=executemany,
+            elapsed=elapsed,
+            rowcount=rowcount,
+            scopes=tuple(f"{s.scope}:{s.name}" for s in scopes),
+        )
+
+
+def _record_slow_query(
+    log: _SlowQueryLog,
+    conn: Any,
+    *,
+    statement: str,
+    parameters: Any,
+    executemany: bool,
+    elapsed: float,
+    rowcount: int,
+    scopes: tuple[str, ...],
+) -> None:
+    explain: list[str] | None = None
+    explain_error: str | None = None
+    if log.explain and not executemany and statement.lstrip()[:6].upper() == "SELECT":
+        try:
+            explain = _explain(conn, statement, parameters)
+        except Exception as exc:  # noqa: BLE001 - plans are best-effort diagnostics
+            explain_error = f"{type(exc).__name__}: {exc}"
+    entry = SlowQuery(
+        fingerprint=fingerprint_statement(statement),
+        parameters_shape=parameters_shape(parameters, executemany),
+        duration_ms=elapsed * 1000.0,
+        rowcount=rowcount,
+        scopes=scopes,
+        recorded_at=datetime.now(timezone.utc).isoformat(),
+        explain=explain,
+        explain_error=explain_error,
+    )
+    with log.lock:
+        log.entries.append(entry)
+    logger.warning("SLOW_QUERY duration_ms=%.1f fingerprint=%s", entry.duration_ms, entry.fingerprint)
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> list[str] | None:
+    prefix = _EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None:
+        return None
+    # Use a raw DBAPI cursor so the plan query is not itself instrumented. It shares the
+    # caller's connection, so it runs in a savepoint: a failing EXPLAIN is rolled back
+    # to it instead of aborting the caller's transaction (Postgres).
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = [" | ".join(str(col) for col in row) for row in cursor.fetchall()]
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        finally:
+            cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        return plan
+    finally:
+        cursor.close()
+
+
+def _handle_error(exception_context) -> None:  # noqa: ANN001
+    # after_cursor_execute does not fire for failed statements; drop their start time.
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get(_START_KEY)
+        if starts:
+            starts.pop()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Attach the cursor hooks to a (sync) engine; safe to call more than once."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def reset_query_metrics_for_tests() -> None:
+    global _SLOW_LOG
+    _SLOW_LOG = None
+
+
+router = APIRouter(prefix="/api/v3/admin", tags=["admin"])
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    _: object = Depends(require_principal(Role.ADMIN)),
+) -> dict:
+    log = _slow_log()
+    return {
+        "threshold_ms": log.threshold_seconds * 1000.0,
+        "explain_enabled": log.explain,
+        "capacity": log.entries.maxlen,
+        "items": [entry.to_payload() for entry in recent_slow_queries(limit)],
+    }
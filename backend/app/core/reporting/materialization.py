@@ -0,0 +1,135 @@
+"""
+Report materialization.
+
+A report assembled from an engine run reads only immutable inputs (the run, its
+findings and evidence), so its output for a given (run_id, report_kind) never
+changes. The first request renders the report, serializes it canonically and stores
+the bytes as an artifact indexed by `deterministic_report_id`; later requests are
+served from that artifact without re-assembling anything.
+
+The artifact's SHA-256 doubles as a strong ETag, so a client revalidating with
+`If-None-Match` is answered from the index row alone without reading the artifact.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+from typing import Any, Awaitable, Callable
+
+from fastapi import Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
+from backend.app.core.reporting.models import MaterializedReport
+from backend.app.core.reporting.service import deterministic_report_id
+
+
+REPORT_CONTENT_TYPE = "application/json"
+# Content at a given report_id never changes, but clients must still revalidate so
+# that access control is re-checked on every request.
+REPORT_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class MaterializedReportContent:
+    report_id: str
+    etag: str
+    # None when the caller's If-None-Match already matched and the body was not read.
+    content: bytes | None
+    rendered: bool
+
+    @property
+    def not_modified(self) -> bool:
+        return self.content is None
+
+
+def canonical_report_bytes(report: Any) -> bytes:
+    """Serialize a report deterministically (sorted keys, compact separators, UTF-8)."""
+    return json.dumps(report, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def report_kind_with_parameters(report_kind: str, parameters: dict | None) -> str:
+    """Qualify `report_kind` with a digest of any parameters that shape the output."""
+    if not parameters:
+        return report_kind
+    digest = hashlib.sha256(canonical_report_bytes(parameters)).hexdigest()[:16]
+    return f"{report_kind}:{digest}"
+
+
+def _etag(sha256: str) -> str:
+    return f'"{sha256}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # Weak comparison is what If-None-Match specifies.
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+async def materialize_report(
+    db: AsyncSession,
+    *,
+    run_id: str,
+    report_kind: str,
+    dataset_version_id: str,
+    engine_id: str,
+    render: Callable[[], Awaitable[Any]],
+    if_none_match: str | None = None,
+) -> MaterializedReportContent:
+    """
+    Return the stored report for (run_id, report_kind), rendering and storing it first if needed.
+
+    `render` is only awaited when no materialized copy exists; exceptions it raises
+    propagate and nothing is stored. The index row is committed on `db`.
+    """
+    report_id = deterministic_report_id(calculation_run_id=run_id, report_kind=report_kind)
+    store = get_artifact_store()
+
+    row = await db.get(MaterializedReport, report_id)
+    if row is not None:
+        etag = _etag(row.sha256)
+        if etag_matches(if_none_match, etag):
+            return MaterializedReportContent(report_id=report_id, etag=etag, content=None, rendered=False)
+        data = await store.get_bytes(key=artifact_key_from_uri(row.artifact_uri))
+        return MaterializedReportContent(report_id=report_id, etag=etag, content=data, rendered=False)
+
+    data = canonical_report_bytes(await render())
+    stored = await store.put_bytes(
+        key=f"core/reports/{engine_id}/{report_id}.json",
+        data=data,
+        content_type=REPORT_CONTENT_TYPE,
+    )
+    db.add(
+        MaterializedReport(
+            report_id=report_id,
+            dataset_version_id=dataset_version_id,
+            run_id=run_id,
+            engine_id=engine_id,
+            report_kind=report_kind,
+            artifact_uri=stored.uri,
+            sha256=stored.sha256,
+            size_bytes=stored.size_bytes,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request materialized the same report first; rendering is
+        # deterministic, so its bytes (and stored artifact key) are identical.
+        await db.rollback()
+    return MaterializedReportContent(report_id=report_id, etag=_etag(stored.sha256), content=data, rendered=True)
+
+
+def report_response(report: MaterializedReportContent) -> Response:
+    """Build a 200 (body) or 304 (revalidated) response carrying the report's ETag."""
+    headers = {"ETag": report.etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    if report.not_modified:
+        return Response(status_code=304, headers=headers)
+    return Response(content=report.content, media_type=REPORT_CONTENT_TYPE, headers=headers)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, JSON, String
+from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.db.models.base import Base
@@ -22,3 +22,21 @@ class ReportArtifact(Base):
     report_kind: Mapped[str] = mapped_column(String, nullable=False, index=True)
     payload: Mapped[dict] = mapped_column(JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class MaterializedReport(Base):
+    """Index row for a rendered report whose canonical bytes live in the artifact store."""
+
+    __tablename__ = "materialized_report"
+
+    report_id: Mapped[str] = mapped_column(String, primary_key=True)
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), nullable=False, index=True
+    )
+    run_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    engine_id: Mapped[str] = mapped_column(String, nullable=False)
+    report_kind: Mapped[str] = mapped_column(String, nullable=False)
+    artifact_uri: Mapped[str] = mapped_column(String, nullable=False)
+    sha256: Mapped[str] = mapped_column(String, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
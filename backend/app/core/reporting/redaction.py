@@ -0,0 +1,122 @@
+"""
+Single-pass field redaction for externally shared report views.
+
+Engines describe what may leave the platform as a policy (fields to drop, fields whose
+identifier values are replaced by opaque references). `CompiledFieldPolicy` turns such
+a policy into one field -> action lookup, built once per policy. A `Redactor` bound to
+it copies a report in a single traversal: redacted fields are dropped, anonymized
+values are replaced (each distinct identifier is hashed once per redactor), optional
+text sanitization is applied to strings, and anything the policy forbids that cannot
+be stripped is rejected with `ValueError` on the spot, so the output needs no
+separate validation walk.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+
+REDACT = "redact"
+ANONYMIZE = "anonymize"
+
+
+class CompiledFieldPolicy:
+    """Field -> action lookup compiled from redacted/anonymized field sets."""
+
+    __slots__ = ("_actions",)
+
+    def __init__(self, *, redacted_fields: Iterable[str], anonymized_fields: Iterable[str]) -> None:
+        actions = {field: ANONYMIZE for field in anonymized_fields}
+        # Redaction wins if a field appears in both sets.
+        actions.update({field: REDACT for field in redacted_fields})
+        self._actions: dict[str, str] = actions
+
+    def action(self, field: str) -> str | None:
+        return self._actions.get(field)
+
+    def redactor(
+        self,
+        *,
+        anonymize: Callable[[str], str],
+        sanitize_text: Callable[[str], str] | None = None,
+    ) -> "Redactor":
+        return Redactor(self, anonymize=anonymize, sanitize_text=sanitize_text)
+
+
+class Redactor:
+    """
+    One external-view pass over a report.
+
+    A redactor memoizes anonymized identifiers, so it should live for one request
+    (one salt); create a new one per view.
+    """
+
+    def __init__(
+        self,
+        policy: CompiledFieldPolicy,
+        *,
+        anonymize: Callable[[str], str],
+        sanitize_text: Callable[[str], str] | None = None,
+    ) -> None:
+        self._actions = policy._actions
+        self._anonymize = anonymize
+        self._sanitize_text = sanitize_text
+        self._anonymized: dict[str, str] = {}
+
+    def anonymize(self, identifier: str) -> str:
+        ref = self._anonymized.get(identifier)
+        if ref is None:
+            ref = self._anonymize(identifier)
+            self._anonymized[identifier] = ref
+        return ref
+
+    def redact(self, value: Any) -> Any:
+        """Return a redacted copy of `value`; raises ValueError if forbidden data cannot be removed."""
+        if isinstance(value, dict):
+            actions = self._actions
+            out = {}
+            for key, item in value.items():
+                action = actions.get(key)
+                if action is None:
+                    out[key] = self.redact(item)
+                elif action == ANONYMIZE:
+                    anonymized = self._anonymize_value(key, item)
+                    if anonymized is not _OMIT:
+                        out[key] = anonymized
+            return out
+        if isinstance(value, list):
+            return [self.redact(item) for item in value]
+        if isinstance(value, str) and self._sanitize_text is not None:
+            return self._sanitize_text(value)
+        # Numbers and other primitives pass through untouched.
+        return value
+
+    def _anonymize_value(self, key: str, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.anonymize(value)
+        if isinstance(value, list):
+            out = []
+            for i, item in enumerate(value):
+                if isinstance(item, str):
+                    out.append(self.anonymize(item))
+                else:
+                    # Non-identifier items are kept as-is, so they must not carry redacted fields.
+                    self._check_no_redacted(item, f"{key}[{i}]")
+                    out.append(item)
+            return out
+        # Non-string anonymizable value - omit to be safe.
+        return _OMIT
+
+    def _check_no_redacted(self, value: Any, path: str) -> None:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                current = f"{path}.{key}"
+                if self._actions.get(key) == REDACT:
+                    raise ValueError(f"External view contains redacted field: {current}")
+                self._check_no_redacted(item, current)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                self._check_no_redacted(item, f"{path}[{i}]")
+
+
+_OMIT = object()
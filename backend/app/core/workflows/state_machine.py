@@ -16,8 +16,9 @@ import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.audit.service import log_workflow_action
+from backend.app.core.lifecycle.status import set_lifecycle_stage, stage_for_subject_id
 from backend.app.core.rbac.roles import Role
 from backend.app.core.workflows.models import WorkflowState, WorkflowTransition
 from backend.app.core.calculation.models import CalculationEvidenceLink
@@ -169,8 +170,7 @@ async def create_workflow_state(
         Created WorkflowState instance
     """
     # Verify DatasetVersion exists
-    dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dataset_version_id))
-    if dv is None:
+    if not await dataset_version_exists(db, dataset_version_id):
         raise ValueError(f"DatasetVersion '{dataset_version_id}' not found")
     
     # Validate initial state
@@ -382,6 +382,17 @@ async def transition_workflow_state(
         reason=reason,
         metadata={"has_evidence": has_evidence, "has_approval": has_approval},
     )
+    if subject_type == "lifecycle":
+        # Keep the materialized lifecycle status in step with the workflow state.
+        stage = stage_for_subject_id(subject_id)
+        if stage is not None:
+            await set_lifecycle_stage(
+                db,
+                dataset_version_id=dataset_version_id,
+                stage=stage[0],
+                engine_id=stage[1],
+                completed=to_state == WorkflowStateEnum.APPROVED.value,
+            )
     await db.commit()
     await db.refresh(workflow_state)
     
@@ -139,6 +139,7 @@ def register_engine() -> None:
             enabled_by_default=False,
             owned_tables=(
                 "audit_readiness_runs",
+                "audit_readiness_evidence_index",
             ),
             report_sections=(),
             routers=(router,),
@@ -0,0 +1,214 @@
+"""
+Control-to-Evidence Index for Audit Readiness Engine
+
+Control references in evidence payloads are extracted by core when evidence is
+written (`evidence_reference`, ref_type "control"). The index adds this engine's
+`control_*` kind convention and records each evidence record once in
+`audit_readiness_evidence_index`: a refresh is a single streaming pass over the
+evidence that has not been indexed yet, joined with its control references.
+Evidence without reference rows (stored before core extracted references, or
+written around the service) is first indexed with core's `backfill_references`,
+so it is recorded with its controls rather than with none. The inverted
+control -> evidence map is built from those
+rows. A run builds the map once and shares it across all frameworks; later runs and
+reports on the same dataset version only scan evidence written since.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from sqlalchemy import and_, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.models import EvidenceRecord, EvidenceReference
+from backend.app.core.evidence.references import REF_CONTROL, SUBJECT_EVIDENCE, backfill_references
+from backend.app.engines.audit_readiness.errors import ImmutableConflictError
+from backend.app.engines.audit_readiness.models.evidence_index import AuditReadinessEvidenceIndexEntry
+
+
+DEFAULT_INDEX_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ControlEvidenceIndex:
+    """Inverted control -> evidence map for one dataset version."""
+    dataset_version_id: str
+    controls: Mapping[str, tuple[str, ...]]
+
+    def evidence_for(self, control_id: str) -> tuple[str, ...]:
+        return self.controls.get(control_id, ())
+
+    def as_evidence_map(self) -> dict[str, list[str]]:
+        """Mutable `control_id -> [evidence_id]` copy in the shape `assess_regulatory_readiness` expects."""
+        return {control_id: list(evidence_ids) for control_id, evidence_ids in self.controls.items()}
+
+
+def extract_control_ids(kind: str, control_refs: Iterable[str]) -> list[str]:
+    """
+    Control IDs an evidence record refers to.
+
+    `control_refs` are the core control references of the payload (`control_ids`,
+    `controls`, `control_id`, `control.control_id`); `control_*` kinds
+    (e.g. "control_access_001") additionally refer to the control in their name.
+    """
+    extracted = sorted({control_id for control_id in control_refs if control_id})
+    if kind.startswith("control_"):
+        parts = kind.split("_")
+        if len(parts) >= 3:
+            derived = "_".join(parts[1:])
+            if derived not in extracted:
+                extracted.append(derived)
+    return extracted
+
+
+async def refresh_control_evidence_index(
+    db: AsyncSession,
+    dataset_version_id: str,
+    *,
+    batch_size: int = DEFAULT_INDEX_BATCH_SIZE,
+) -> int:
+    """
+    Index evidence for the dataset version that has no index entry yet.
+
+    Streams (evidence_id, kind, control reference) rows for unindexed evidence only
+    and inserts one entry per record. Records without control reference rows may
+    predate the reference table; they are backfilled and their references re-read.
+    Returns the number of newly indexed evidence records. Entries are flushed, not
+    committed; the caller owns the transaction.
+    """
+    if batch_size < 1:
+        raise ValueError("INDEX_BATCH_SIZE_INVALID")
+
+    entry = AuditReadinessEvidenceIndexEntry
+    reference = EvidenceReference
+    query = (
+        select(EvidenceRecord.evidence_id, EvidenceRecord.kind, reference.ref_value)
+        .outerjoin(
+            entry,
+            and_(
+                entry.dataset_version_id == EvidenceRecord.dataset_version_id,
+                entry.evidence_id == EvidenceRecord.evidence_id,
+            ),
+        )
+        .outerjoin(
+            reference,
+            and_(
+                reference.subject_type == SUBJECT_EVIDENCE,
+                reference.subject_id == EvidenceRecord.evidence_id,
+                reference.ref_type == REF_CONTROL,
+            ),
+        )
+        .where(EvidenceRecord.dataset_version_id == dataset_version_id)
+        .where(entry.evidence_id.is_(None))
+        .order_by(EvidenceRecord.evidence_id, reference.ref_value)
+        .execution_options(yield_per=batch_size)
+    )
+
+    # One row per (evidence, control reference); rows of one evidence record are adjacent.
+    collected: dict[str, tuple[str, list[str]]] = {}
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        for evidence_id, kind, control_ref in partition:
+            _, control_refs = collected.setdefault(evidence_id, (kind, []))
+            if control_ref is not None:
+                control_refs.append(control_ref)
+    if not collected:
+        return 0
+    unreferenced = [evidence_id for evidence_id, (_, control_refs) in collected.items() if not control_refs]
+    if await backfill_references(db, evidence_ids=unreferenced, batch_size=batch_size):
+        for start in range(0, len(unreferenced), batch_size):
+            backfilled = await db.execute(
+                select(reference.subject_id, reference.ref_value)
+                .where(reference.subject_type == SUBJECT_EVIDENCE)
+                .where(reference.ref_type == REF_CONTROL)
+                .where(reference.subject_id.in_(unreferenced[start : start + batch_size]))
+                .order_by(reference.subject_id, reference.ref_value)
+            )
+            for evidence_id, control_ref in backfilled.all():
+                collected[evidence_id][1].append(control_ref)
+    rows = [
+        {
+            "dataset_version_id": dataset_version_id,
+            "evidence_id": evidence_id,
+            "control_ids": extract_control_ids(kind, control_refs),
+        }
+        for evidence_id, (kind, control_refs) in collected.items()
+    ]
+
+    try:
+        async with db.begin_nested():
+            for start in range(0, len(rows), batch_size):
+                await db.execute(insert(entry), rows[start : start + batch_size])
+    except IntegrityError:
+        # A concurrent run indexed some of the same evidence first: verify its entries
+        # and insert only the ones still missing.
+        rows = await _verify_existing_entries(db, dataset_version_id, rows, batch_size=batch_size)
+        for start in range(0, len(rows), batch_size):
+            await db.execute(insert(entry), rows[start : start + batch_size])
+    return len(rows)
+
+
+async def _verify_existing_entries(
+    db: AsyncSession,
+    dataset_version_id: str,
+    rows: list[dict[str, object]],
+    *,
+    batch_size: int,
+) -> list[dict[str, object]]:
+    """
+    Return the rows that have no index entry yet.
+
+    Entries are a pure function of immutable evidence, so an existing entry must match
+    the row computed here; a different one raises ImmutableConflictError.
+    """
+    entry = AuditReadinessEvidenceIndexEntry
+    existing: dict[str, list[str]] = {}
+    for start in range(0, len(rows), batch_size):
+        found = await db.execute(
+            select(entry.evidence_id, entry.control_ids)
+            .where(entry.dataset_version_id == dataset_version_id)
+            .where(entry.evidence_id.in_([row["evidence_id"] for row in rows[start : start + batch_size]]))
+        )
+        existing.update({evidence_id: list(control_ids or []) for evidence_id, control_ids in found.all()})
+    missing = []
+    for row in rows:
+        if row["evidence_id"] not in existing:
+            missing.append(row)
+        elif existing[row["evidence_id"]] != row["control_ids"]:
+            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_INDEX_MISMATCH")
+    return missing
+
+
+async def load_control_evidence_index(
+    db: AsyncSession,
+    dataset_version_id: str,
+    *,
+    refresh: bool = True,
+    batch_size: int = DEFAULT_INDEX_BATCH_SIZE,
+) -> ControlEvidenceIndex:
+    """
+    Return the control -> evidence index for a dataset version.
+
+    With `refresh` (the default) evidence written since the last build is indexed
+    first. Evidence IDs per control are in evidence_id order.
+    """
+    if refresh:
+        await refresh_control_evidence_index(db, dataset_version_id, batch_size=batch_size)
+
+    entry = AuditReadinessEvidenceIndexEntry
+    result = await db.execute(
+        select(entry.evidence_id, entry.control_ids)
+        .where(entry.dataset_version_id == dataset_version_id)
+        .order_by(entry.evidence_id)
+    )
+    controls: dict[str, list[str]] = {}
+    for evidence_id, control_ids in result.all():
+        for control_id in control_ids or ():
+            controls.setdefault(control_id, []).append(evidence_id)
+    return ControlEvidenceIndex(
+        dataset_version_id=dataset_version_id,
+        controls=MappingProxyType({control_id: tuple(ids) for control_id, ids in controls.items()}),
+    )
@@ -20,6 +20,7 @@ from backend.app.core.evidence.service import (
     link_finding_to_evidence,
 )
 from backend.app.engines.audit_readiness.errors import EvidenceStorageError, ImmutableConflictError
+from backend.app.engines.audit_readiness.evidence_index import load_control_evidence_index
 from backend.app.engines.audit_readiness.ids import deterministic_id
 
 
@@ -61,8 +62,11 @@ async def map_evidence_to_controls(
     """
     Map available evidence to controls based on evidence metadata.
     
-    This function examines evidence records and maps them to control IDs
-    based on evidence kind and payload metadata.
+    Evidence is mapped through `control_ids`/`controls`/`control_id` payload keys
+    and `control_*` kinds (see `evidence_index.extract_control_ids`). The mapping is
+    served from the persisted control-evidence index, which is brought up to date
+    first. Callers evaluating several frameworks should load the index once with
+    `load_control_evidence_index` instead.
     
     Args:
         db: Database session
@@ -72,39 +76,8 @@ async def map_evidence_to_controls(
     Returns:
         Map of control_id to list of evidence_ids
     """
-    evidence_records = await get_evidence_for_dataset_version(db, dataset_version_id)
-    
-    evidence_map: dict[str, list[str]] = {}
-    
-    # Extract control-to-evidence mappings from evidence payloads
-    for evidence in evidence_records:
-        payload = evidence.payload or {}
-        
-        # Check for control_id references in payload
-        control_ids = payload.get("control_ids", [])
-        if not control_ids:
-            # Try alternative field names
-            control_ids = payload.get("controls", [])
-        if not control_ids and isinstance(payload.get("control_id"), str):
-            control_ids = [payload["control_id"]]
-        
-        # Map evidence to controls
-        for control_id in control_ids:
-            if control_id not in evidence_map:
-                evidence_map[control_id] = []
-            evidence_map[control_id].append(evidence.evidence_id)
-        
-        # Also check evidence kind for control mapping
-        if evidence.kind.startswith("control_"):
-            # Extract control ID from kind (e.g., "control_access_control_001")
-            parts = evidence.kind.split("_")
-            if len(parts) >= 3:
-                potential_control_id = "_".join(parts[1:])
-                if potential_control_id not in evidence_map:
-                    evidence_map[potential_control_id] = []
-                evidence_map[potential_control_id].append(evidence.evidence_id)
-    
-    return evidence_map
+    index = await load_control_evidence_index(db, dataset_version_id)
+    return index.as_evidence_map()
 
 
 async def _strict_create_evidence(
@@ -356,11 +329,14 @@ async def create_audit_trail_entry(
     Returns:
         Evidence ID of audit trail entry
     """
+    # One run logs many actions at the same timestamp; the framework and control
+    # they concern keep their entries apart.
+    subject = "_".join(str(action_details[key]) for key in ("framework_id", "control_id") if key in action_details)
     evidence_id = deterministic_evidence_id(
         dataset_version_id=dataset_version_id,
         engine_id="engine_audit_readiness",
         kind="audit_trail",
-        stable_key=f"{action_type}_{created_at.isoformat()}",
+        stable_key=f"{action_type}_{subject}_{created_at.isoformat()}",
     )
     
     payload = {
@@ -3,8 +3,9 @@ Models for Audit Readiness Engine
 """
 from __future__ import annotations
 
+from backend.app.engines.audit_readiness.models.evidence_index import AuditReadinessEvidenceIndexEntry
 from backend.app.engines.audit_readiness.models.runs import AuditReadinessRun
 from backend.app.engines.audit_readiness.models.regulatory_checks import RegulatoryCheckResult
 
-__all__ = ["AuditReadinessRun", "RegulatoryCheckResult"]
+__all__ = ["AuditReadinessEvidenceIndexEntry", "AuditReadinessRun", "RegulatoryCheckResult"]
 
@@ -0,0 +1,27 @@
+"""
+Control-evidence index model for Audit Readiness Engine
+"""
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.models.base import Base
+
+
+class AuditReadinessEvidenceIndexEntry(Base):
+    """
+    Control references extracted from one evidence record.
+
+    One row per evidence record that has been scanned for a dataset version, including
+    records that reference no control (empty `control_ids`), so a later refresh only
+    has to read evidence that has no row yet. Evidence is immutable, so entries never
+    need to be rewritten.
+    """
+    __tablename__ = "audit_readiness_evidence_index"
+
+    dataset_version_id: Mapped[str] = mapped_column(
+        String, ForeignKey("dataset_version.id"), primary_key=True
+    )
+    evidence_id: Mapped[str] = mapped_column(String, primary_key=True)
+    control_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
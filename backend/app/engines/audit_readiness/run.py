@@ -8,12 +8,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import logging
 
-from sqlalchemy import select
-
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.service import load_raw_records
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled
 from backend.app.engines.audit_readiness.audit_trail import AuditTrail
@@ -26,8 +25,8 @@ from backend.app.engines.audit_readiness.errors import (
     StartedAtInvalidError,
     StartedAtMissingError,
 )
+from backend.app.engines.audit_readiness.evidence_index import load_control_evidence_index
 from backend.app.engines.audit_readiness.evidence_integration import (
-    map_evidence_to_controls,
     store_control_gap_finding,
     store_regulatory_check_evidence,
 )
@@ -65,6 +64,7 @@ def _validate_dataset_version_id(value: object) -> str:
     return value.strip()
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: object,
@@ -103,11 +103,11 @@ async def run_engine(
     scope = evaluation_scope or {}
     params = parameters or {}
     
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
         # Validate DatasetVersion exists
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
         
         # Phase 2: Acquire inputs
@@ -130,6 +130,10 @@ async def run_engine(
         # Initialize audit trail
         audit_trail = AuditTrail(db, dv_id)
         
+        # Index control references once; every framework reads the same map
+        evidence_index = await load_control_evidence_index(db, dv_id)
+        
+        mark_stage("model")
         # Phase 3 & 4: Evaluate regulatory frameworks
         regulatory_results = []
         all_findings = []
@@ -143,7 +147,7 @@ async def run_engine(
                 framework_version = framework_catalog.get("metadata", {}).get("version", "v1")
                 
                 # Map evidence to controls
-                evidence_map = await map_evidence_to_controls(db, dv_id, framework_catalog)
+                evidence_map = evidence_index.as_evidence_map()
                 
                 # Assess regulatory readiness
                 check_result = assess_regulatory_readiness(
@@ -242,6 +246,7 @@ async def run_engine(
                     "error": str(e),
                 })
         
+        mark_stage("persist")
         # Phase 7: Persist run record
         # Generate deterministic run_id from stable inputs (not timestamp)
         import hashlib
@@ -15,6 +15,7 @@ from backend.app.core.dataset.errors import ChecksumMismatchError, ChecksumMissi
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled, log_disabled_engine_attempt
 from backend.app.core.engine_registry.registry import REGISTRY
 from backend.app.core.engine_registry.spec import EngineSpec
+from backend.app.core.json_stream import StreamingJSONResponse
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.lifecycle.enforcement import (
     LifecycleViolationError,
@@ -210,7 +211,7 @@ async def report_endpoint(payload: dict) -> dict:
                 engine_id=ENGINE_ID,
                 actor_id=f"engine:{ENGINE_ID}",
             )
-            return await assemble_report(
+            report = await assemble_report(
                 db,
                 dataset_version_id=dataset_version_id.strip(),
                 run_id=run_id.strip(),
@@ -218,6 +219,7 @@ async def report_endpoint(payload: dict) -> dict:
                 parameters=parameters,
                 emit_evidence=bool(payload.get("emit_evidence", True)),
             )
+            return StreamingJSONResponse(report)
         except HTTPException:
             raise
         except LifecycleViolationError as exc:
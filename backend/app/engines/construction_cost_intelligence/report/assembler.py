@@ -9,10 +9,9 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
+from backend.app.core.evidence.reader import EvidenceReader
 from backend.app.engines.construction_cost_intelligence.assumptions import (
     AssumptionRegistry,
     ValidityScope,
@@ -215,53 +214,52 @@ async def _load_core_traceability_bundle(
     if not isinstance(finding_ids, list) or any(not isinstance(x, str) or not x.strip() for x in finding_ids):
         raise MissingArtifactError("CORE_FINDING_IDS_REQUIRED")
 
-    assumptions_ev = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == assumptions_evidence_id))
+    reader = EvidenceReader.for_session(db)
+    evidence_refs = await reader.evidence([assumptions_evidence_id, *inputs_evidence_ids])
+
+    assumptions_ev = evidence_refs.get(assumptions_evidence_id)
     if assumptions_ev is None:
         raise MissingArtifactError("CORE_ASSUMPTIONS_EVIDENCE_NOT_FOUND")
     if assumptions_ev.dataset_version_id != dataset_version_id:
         raise DatasetVersionMismatchError("CORE_ASSUMPTIONS_EVIDENCE_DATASET_MISMATCH")
 
     core_assumptions: list[dict] = []
-    if isinstance(assumptions_ev.payload, dict):
-        ass = assumptions_ev.payload.get("assumptions")
+    assumptions_payload = await reader.evidence_payload(assumptions_evidence_id)
+    if isinstance(assumptions_payload, dict):
+        ass = assumptions_payload.get("assumptions")
         if isinstance(ass, list) and all(isinstance(a, dict) for a in ass):
             core_assumptions = list(ass)
 
     evidence_ids_set: set[str] = {assumptions_evidence_id}
     for ev_id in inputs_evidence_ids:
-        ev = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == ev_id))
+        ev = evidence_refs.get(ev_id)
         if ev is None:
             raise MissingArtifactError("CORE_INPUT_EVIDENCE_NOT_FOUND")
         if ev.dataset_version_id != dataset_version_id:
             raise DatasetVersionMismatchError("CORE_INPUT_EVIDENCE_DATASET_MISMATCH")
         evidence_ids_set.add(ev_id)
 
-    findings_rows = (
-        await db.execute(select(FindingRecord).where(FindingRecord.finding_id.in_(finding_ids)))
-    ).scalars().all()
-    if len(findings_rows) != len(set(finding_ids)):
+    findings_by_id = await reader.findings(finding_ids)
+    if len(findings_by_id) != len(set(finding_ids)):
         raise MissingArtifactError("CORE_FINDING_NOT_FOUND")
-    for fr in findings_rows:
+    for fr in findings_by_id.values():
         if fr.dataset_version_id != dataset_version_id:
             raise DatasetVersionMismatchError("CORE_FINDING_DATASET_MISMATCH")
 
-    link_rows = (
-        await db.execute(select(FindingEvidenceLink).where(FindingEvidenceLink.finding_id.in_(finding_ids)))
-    ).scalars().all()
-    evidence_by_finding: dict[str, set[str]] = {}
-    for link in link_rows:
-        evidence_by_finding.setdefault(link.finding_id, set()).add(link.evidence_id)
-        evidence_ids_set.add(link.evidence_id)
+    evidence_by_finding = await reader.evidence_ids_by_finding(finding_ids)
+    for linked in evidence_by_finding.values():
+        evidence_ids_set.update(linked)
 
     core_findings: list[dict] = []
-    for fr in sorted(findings_rows, key=lambda f: f.finding_id):
+    for finding_id in sorted(findings_by_id):
+        fr = findings_by_id[finding_id]
         core_findings.append(
             {
                 "finding_id": fr.finding_id,
                 "kind": fr.kind,
                 "raw_record_id": fr.raw_record_id,
-                "payload": fr.payload,
-                "evidence_ids": sorted(evidence_by_finding.get(fr.finding_id, set())),
+                "payload": await reader.finding_payload(fr.finding_id),
+                "evidence_ids": evidence_by_finding.get(fr.finding_id, []),
             }
         )
 
@@ -466,14 +464,12 @@ async def assemble_cost_variance_report(
 
     all_evidence_ids = sorted(set([e for e in all_evidence_ids if isinstance(e, str) and e.strip()]))
     if all_evidence_ids:
-        evidences = (
-            await db.execute(
-                select(EvidenceRecord)
-                .where(EvidenceRecord.evidence_id.in_(all_evidence_ids))
-                .where(EvidenceRecord.dataset_version_id == dataset_version_id)
-                .order_by(EvidenceRecord.evidence_id.asc())
-            )
-        ).scalars().all()
+        evidence_refs = await EvidenceReader.for_session(db).evidence(all_evidence_ids)
+        evidences = [
+            evidence_refs[e]
+            for e in all_evidence_ids
+            if e in evidence_refs and evidence_refs[e].dataset_version_id == dataset_version_id
+        ]
         
         evidence_index = [
             {
@@ -689,14 +685,12 @@ async def assemble_time_phased_report(
 
     all_evidence_ids = sorted(set([e for e in all_evidence_ids if isinstance(e, str) and e.strip()]))
     if all_evidence_ids:
-        evidences = (
-            await db.execute(
-                select(EvidenceRecord)
-                .where(EvidenceRecord.evidence_id.in_(all_evidence_ids))
-                .where(EvidenceRecord.dataset_version_id == dataset_version_id)
-                .order_by(EvidenceRecord.evidence_id.asc())
-            )
-        ).scalars().all()
+        evidence_refs = await EvidenceReader.for_session(db).evidence(all_evidence_ids)
+        evidences = [
+            evidence_refs[e]
+            for e in all_evidence_ids
+            if e in evidence_refs and evidence_refs[e].dataset_version_id == dataset_version_id
+        ]
         
         evidence_index = [
             {
@@ -3,12 +3,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Mapping
 
-from sqlalchemy import select
-
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.raw_models import RawRecord
 from backend.app.core.dataset.service import load_raw_record_by_id
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
 from backend.app.core.db import get_sessionmaker
 from backend.app.engines.construction_cost_intelligence.compare import compare_boq_to_actuals
@@ -102,6 +101,7 @@ def _parse_comparison_config(value: object) -> ComparisonConfig:
     )
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: object,
@@ -127,10 +127,10 @@ async def run_engine(
     mapping = _parse_normalization_mapping(normalization_mapping)
     cfg = _parse_comparison_config(comparison_config)
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionMismatchError("DATASET_VERSION_NOT_FOUND")
 
         strict_mode = await resolve_strict_mode(db, workflow_id=ENGINE_ID, override=None)
@@ -157,12 +157,15 @@ async def run_engine(
         boq_lines_raw = _require_lines_payload(boq_raw.payload, code="BOQ_LINES_REQUIRED")
         actual_lines_raw = _require_lines_payload(actual_raw.payload, code="ACTUAL_LINES_REQUIRED")
 
+        mark_stage("normalize")
         boq_lines = normalize_cost_lines(dataset_version_id=dv_id, kind="boq", raw_lines=boq_lines_raw, mapping=mapping)
         actual_lines = normalize_cost_lines(
             dataset_version_id=dv_id, kind="actual", raw_lines=actual_lines_raw, mapping=mapping
         )
+        mark_stage("model")
         comparison = compare_boq_to_actuals(dataset_version_id=dv_id, boq_lines=boq_lines, actual_lines=actual_lines, config=cfg)
 
+        mark_stage("persist")
         materialization = await materialize_core_traceability(
             db,
             dataset_version_id=dv_id,
@@ -174,6 +177,7 @@ async def run_engine(
         )
         await db.commit()
 
+    mark_stage("report")
     assumptions = build_core_assumptions(dataset_version_id=dv_id, config=cfg)
 
     return {
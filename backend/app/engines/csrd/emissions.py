@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from backend.app.engines.csrd.factor_library import FactorResolver, site_location
+
 
 @dataclass(frozen=True)
 class EmissionFactor:
@@ -19,58 +21,35 @@ class EmissionsResult:
     assumptions: list[dict]
 
 
-def _f(value: object, default: float = 0.0) -> float:
-    if isinstance(value, (int, float)):
-        return float(value)
-    return default
-
-
-def calculate_emissions(*, dataset_version_id: str, esg: dict, parameters: dict) -> EmissionsResult:
-    emissions = esg.get("emissions") if isinstance(esg.get("emissions"), dict) else {}
-    activity = esg.get("activity") if isinstance(esg.get("activity"), dict) else {}
-
-    totals = {
-        "scope1": _f(emissions.get("scope1")),
-        "scope2": _f(emissions.get("scope2")),
-        "scope3": _f(emissions.get("scope3")),
-    }
+DEFAULT_FUEL_KGCO2E_PER_LITER = 2.68
+DEFAULT_ELECTRICITY_KGCO2E_PER_KWH = 0.25
 
-    assumptions: list[dict] = [
-        {
-            "id": "assumption_units",
-            "description": "Emissions are expressed as metric tons CO2e (tCO2e).",
-            "source": "Engine convention",
-            "impact": "Ensures consistent aggregation across scopes.",
-            "sensitivity": "Low - unit conversion is deterministic.",
-        }
-    ]
+UNITS_ASSUMPTION = {
+    "id": "assumption_units",
+    "description": "Emissions are expressed as metric tons CO2e (tCO2e).",
+    "source": "Engine convention",
+    "impact": "Ensures consistent aggregation across scopes.",
+    "sensitivity": "Low - unit conversion is deterministic.",
+}
 
-    if all(v == 0.0 for v in totals.values()) and activity:
-        scope1 = activity.get("scope1") if isinstance(activity.get("scope1"), dict) else {}
-        fuel_liters = _f(scope1.get("fuel_liters"))
-        ef_kg_per_liter = _f(scope1.get("emission_factor_kgco2e_per_liter"), 2.68)
-        totals["scope1"] = (fuel_liters * ef_kg_per_liter) / 1000.0
+DEFAULT_FACTORS_ASSUMPTION = {
+    "id": "assumption_default_factors",
+    "description": "Default emission factors used when not provided.",
+    "source": "Config defaults (2.68 kgCO2e/L fuel; 0.25 kgCO2e/kWh electricity)",
+    "impact": "Affects calculated emissions when activity data is used.",
+    "sensitivity": "High - linear with factor selection.",
+}
 
-        scope2 = activity.get("scope2") if isinstance(activity.get("scope2"), dict) else {}
-        electricity_kwh = _f(scope2.get("electricity_kwh"))
-        ef_kg_per_kwh = _f(scope2.get("emission_factor_kgco2e_per_kwh"), 0.25)
-        totals["scope2"] = (electricity_kwh * ef_kg_per_kwh) / 1000.0
 
-        scope3 = activity.get("scope3") if isinstance(activity.get("scope3"), dict) else {}
-        totals["scope3"] = _f(scope3.get("total_tco2e"))
+def _f(value: object, default: float = 0.0) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return default
 
-        assumptions.append(
-            {
-                "id": "assumption_default_factors",
-                "description": "Default emission factors used when not provided.",
-                "source": "Config defaults (2.68 kgCO2e/L fuel; 0.25 kgCO2e/kWh electricity)",
-                "impact": "Affects calculated emissions when activity data is used.",
-                "sensitivity": "High - linear with factor selection.",
-            }
-        )
 
+def scope_factors(totals: dict[str, float], parameters: dict) -> dict[str, EmissionFactor]:
     scope2_method = str(parameters.get("scope2_method", "market-based"))
-    factors: dict[str, EmissionFactor] = {
+    return {
         "scope1": EmissionFactor(
             scope="scope1",
             value=totals["scope1"],
@@ -94,4 +73,85 @@ def calculate_emissions(*, dataset_version_id: str, esg: dict, parameters: dict)
         ),
     }
 
+
+def _library_factor(
+    factor_resolver: FactorResolver | None,
+    activity: str,
+    esg: dict,
+    *,
+    explicit: object,
+    fuel_type: object,
+    default: float,
+) -> tuple[float, bool]:
+    """Fallback factor for an activity: from the library when it has one, else `default`."""
+    if factor_resolver is None or isinstance(explicit, (int, float)):
+        return default, False
+    country, region, on = site_location(esg)
+    resolved = factor_resolver.resolve(
+        activity,
+        country=country,
+        region=region,
+        fuel_type=fuel_type if isinstance(fuel_type, str) else None,
+        on=on,
+    )
+    if resolved is None:
+        return default, False
+    return resolved.kgco2e_per_unit, True
+
+
+def calculate_emissions(
+    *,
+    dataset_version_id: str,
+    esg: dict,
+    parameters: dict,
+    factor_resolver: FactorResolver | None = None,
+) -> EmissionsResult:
+    emissions = esg.get("emissions") if isinstance(esg.get("emissions"), dict) else {}
+    activity = esg.get("activity") if isinstance(esg.get("activity"), dict) else {}
+
+    totals = {
+        "scope1": _f(emissions.get("scope1")),
+        "scope2": _f(emissions.get("scope2")),
+        "scope3": _f(emissions.get("scope3")),
+    }
+
+    assumptions: list[dict] = [dict(UNITS_ASSUMPTION)]
+
+    if all(v == 0.0 for v in totals.values()) and activity:
+        scope1 = activity.get("scope1") if isinstance(activity.get("scope1"), dict) else {}
+        fuel_liters = _f(scope1.get("fuel_liters"))
+        fuel_default, fuel_from_library = _library_factor(
+            factor_resolver,
+            "fuel_liters",
+            esg,
+            explicit=scope1.get("emission_factor_kgco2e_per_liter"),
+            fuel_type=scope1.get("fuel_type"),
+            default=DEFAULT_FUEL_KGCO2E_PER_LITER,
+        )
+        ef_kg_per_liter = _f(scope1.get("emission_factor_kgco2e_per_liter"), fuel_default)
+        totals["scope1"] = (fuel_liters * ef_kg_per_liter) / 1000.0
+
+        scope2 = activity.get("scope2") if isinstance(activity.get("scope2"), dict) else {}
+        electricity_kwh = _f(scope2.get("electricity_kwh"))
+        electricity_default, electricity_from_library = _library_factor(
+            factor_resolver,
+            "electricity_kwh",
+            esg,
+            explicit=scope2.get("emission_factor_kgco2e_per_kwh"),
+            fuel_type=None,
+            default=DEFAULT_ELECTRICITY_KGCO2E_PER_KWH,
+        )
+        ef_kg_per_kwh = _f(scope2.get("emission_factor_kgco2e_per_kwh"), electricity_default)
+        totals["scope2"] = (electricity_kwh * ef_kg_per_kwh) / 1000.0
+
+        scope3 = activity.get("scope3") if isinstance(activity.get("scope3"), dict) else {}
+        totals["scope3"] = _f(scope3.get("total_tco2e"))
+
+        if factor_resolver is not None and (fuel_from_library or electricity_from_library):
+            assumptions.append(factor_resolver.assumption())
+        if not (fuel_from_library and electricity_from_library):
+            assumptions.append(dict(DEFAULT_FACTORS_ASSUMPTION))
+
+    factors = scope_factors(totals, parameters)
+
     return EmissionsResult(totals_tco2e=totals, factors=factors, assumptions=assumptions)
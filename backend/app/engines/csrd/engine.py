@@ -47,6 +47,7 @@ async def run_endpoint(payload: dict) -> dict:
         DatasetVersionInvalidError,
         DatasetVersionMissingError,
         DatasetVersionNotFoundError,
+        EmissionFactorArtifactInvalidError,
         ImmutableConflictError,
         RawRecordsMissingError,
         StartedAtInvalidError,
@@ -119,6 +120,8 @@ async def run_endpoint(payload: dict) -> dict:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except StartedAtInvalidError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except EmissionFactorArtifactInvalidError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except LifecycleViolationError as exc:
         raise HTTPException(status_code=409, detail=exc.detail) from exc
     except Exception as exc:
@@ -31,3 +31,7 @@ class RawRecordsMissingError(ValueError):
 
 class ImmutableConflictError(RuntimeError):
     pass
+
+
+class EmissionFactorArtifactInvalidError(ValueError):
+    pass
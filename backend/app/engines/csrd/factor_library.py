@@ -0,0 +1,222 @@
+"""
+Emission factor library: indexed lookup over a core emission factor artifact.
+
+A factor table (see `core.artifacts.emission_factor_service`) holds kgCO2e per
+activity unit keyed by activity, country, grid region, fuel type and effective
+date. `build_factor_index` groups the rows into one date-sorted series per key
+and caches the index per artifact checksum, so repeated runs against the same
+table skip parsing. A lookup bisects the series for the factor in effect on the
+requested date.
+
+`FactorResolver` is created once per run. It applies the fallback chain
+(region -> country -> global, fuel-specific before generic rows) and memoizes
+every resolution on the normalized key, so a group report with many rows per site
+resolves each distinct (activity, location, fuel, date) once. Records without a
+reporting date are not resolved: the factor in effect would depend on when the
+run happens, which evidence IDs do not capture, so they keep the factor set.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+import threading
+from typing import Any
+
+
+FACTOR_INDEX_CACHE_SIZE = 8
+
+_Key = tuple[str, str | None, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class ResolvedFactor:
+    """A factor table row, identified by its key and effective date."""
+    activity: str
+    country: str | None
+    region: str | None
+    fuel_type: str | None
+    effective_date: str
+    kgco2e_per_unit: float
+
+    def as_dict(self) -> dict[str, Any]:
+        # Called once per activity row; a flat literal avoids `asdict`'s recursive copying.
+        return {
+            "activity": self.activity,
+            "country": self.country,
+            "region": self.region,
+            "fuel_type": self.fuel_type,
+            "effective_date": self.effective_date,
+            "kgco2e_per_unit": self.kgco2e_per_unit,
+        }
+
+
+class FactorIndex:
+    """Date-sorted factor series per (activity, country, region, fuel_type)."""
+
+    def __init__(self, *, name: str, checksum: str, rows: list[dict]) -> None:
+        self.name = name
+        self.checksum = checksum
+        self.factor_count = len(rows)
+        series: dict[_Key, list[tuple[int, ResolvedFactor]]] = {}
+        for row in rows:
+            factor = ResolvedFactor(
+                activity=row["activity"],
+                country=row["country"],
+                region=row["region"],
+                fuel_type=row["fuel_type"],
+                effective_date=row["effective_date"],
+                kgco2e_per_unit=float(row["kgco2e_per_unit"]),
+            )
+            key = (factor.activity, factor.country, factor.region, factor.fuel_type)
+            series.setdefault(key, []).append((date.fromisoformat(factor.effective_date).toordinal(), factor))
+        self._dates: dict[_Key, list[int]] = {}
+        self._factors: dict[_Key, list[ResolvedFactor]] = {}
+        for key, entries in series.items():
+            entries.sort(key=lambda entry: entry[0])
+            self._dates[key] = [ordinal for ordinal, _ in entries]
+            self._factors[key] = [factor for _, factor in entries]
+
+    def lookup(
+        self,
+        activity: str,
+        *,
+        country: str | None,
+        region: str | None,
+        fuel_type: str | None,
+        on: date,
+    ) -> ResolvedFactor | None:
+        """The row for exactly this key that is in effect on `on`, if any."""
+        key = (activity, country, region, fuel_type)
+        dates = self._dates.get(key)
+        if dates is None:
+            return None
+        position = bisect_right(dates, on.toordinal()) - 1
+        return self._factors[key][position] if position >= 0 else None
+
+
+_INDEXES: OrderedDict[str, FactorIndex] = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+
+
+def build_factor_index(*, checksum: str, payload: dict) -> FactorIndex:
+    """Return the index for a loaded artifact payload, reusing a cached one with the same checksum."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(checksum)
+        if index is None:
+            index = _INDEXES[checksum] = FactorIndex(
+                name=str(payload.get("name", "")), checksum=checksum, rows=list(payload.get("factors") or [])
+            )
+        _INDEXES.move_to_end(checksum)
+        while len(_INDEXES) > FACTOR_INDEX_CACHE_SIZE:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def clear_factor_index_cache() -> None:
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+def _text(value: object) -> str | None:
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def site_location(esg: dict) -> tuple[str | None, str | None, date | None]:
+    """(country, grid region, reporting date) of a record; the date is `period_end` or the end of `reporting_year`."""
+    country = _text(esg.get("country"))
+    region = _text(esg.get("grid_region"))
+    on: date | None = None
+    period_end = _text(esg.get("period_end"))
+    if period_end is not None:
+        try:
+            on = date.fromisoformat(period_end)
+        except ValueError:
+            on = None
+    year = esg.get("reporting_year")
+    if on is None and isinstance(year, int) and not isinstance(year, bool) and 1 <= year <= 9999:
+        on = date(year, 12, 31)
+    return country, region, on
+
+
+class FactorResolver:
+    """Memoized factor resolution for one run."""
+
+    def __init__(self, index: FactorIndex) -> None:
+        self.index = index
+        self._memo: dict[tuple, ResolvedFactor | None] = {}
+        self.lookups = 0
+
+    def resolve(
+        self,
+        activity: str,
+        *,
+        country: str | None = None,
+        region: str | None = None,
+        fuel_type: str | None = None,
+        on: date | None = None,
+    ) -> ResolvedFactor | None:
+        """The library factor for a record, or None (also when `on` is unknown)."""
+        if on is None:
+            return None
+        self.lookups += 1
+        activity_key = activity.lower()
+        country_key = country.upper() if country else None
+        region_key = region.upper() if region and country_key else None
+        fuel_key = fuel_type.lower() if fuel_type else None
+        memo_key = (activity_key, country_key, region_key, fuel_key, on)
+        try:
+            return self._memo[memo_key]
+        except KeyError:
+            pass
+        locations = list(dict.fromkeys([(country_key, region_key), (country_key, None), (None, None)]))
+        fuels = [fuel_key, None] if fuel_key is not None else [None]
+        resolved = None
+        for fuel in fuels:
+            for location_country, location_region in locations:
+                resolved = self.index.lookup(
+                    activity_key,
+                    country=location_country,
+                    region=location_region,
+                    fuel_type=fuel,
+                    on=on,
+                )
+                if resolved is not None:
+                    break
+            if resolved is not None:
+                break
+        self._memo[memo_key] = resolved
+        return resolved
+
+    def describe(self) -> dict[str, Any]:
+        return {"name": self.index.name, "checksum": self.index.checksum, "factor_count": self.index.factor_count}
+
+    def summary(self) -> dict[str, Any]:
+        """Library identity, the distinct factors this run resolved and lookup counts."""
+        used = {factor for factor in self._memo.values() if factor is not None}
+        return {
+            **self.describe(),
+            "resolved_factors": [
+                factor.as_dict()
+                for factor in sorted(
+                    used,
+                    key=lambda f: (f.activity, f.country or "", f.region or "", f.fuel_type or "", f.effective_date),
+                )
+            ],
+            "lookups": self.lookups,
+            "distinct_lookups": len(self._memo),
+        }
+
+    def assumption(self) -> dict[str, str]:
+        return {
+            "id": "assumption_factor_library",
+            "description": (
+                "Emission factors resolved from the factor library by activity, country, grid region, "
+                "fuel type and reporting date when not provided; records without a reporting date "
+                "use the default factor set."
+            ),
+            "source": f"Emission factor artifact '{self.index.name}' (checksum {self.index.checksum[:12]})",
+            "impact": "Affects calculated emissions when activity data is used.",
+            "sensitivity": "High - linear with factor selection.",
+        }
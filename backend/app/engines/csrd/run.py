@@ -6,12 +6,25 @@ import logging
 
 from sqlalchemy import select
 
+from backend.app.core.artifacts.emission_factor_service import (
+    EmissionFactorArtifactError,
+    load_emission_factor_artifact_for_dataset,
+)
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.service import load_raw_records
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
-from backend.app.core.evidence.service import create_evidence, create_finding, deterministic_evidence_id, link_finding_to_evidence
+from backend.app.core.evidence.service import (
+    EvidenceBatch,
+    create_evidence,
+    create_finding,
+    deterministic_evidence_id,
+    link_finding_to_evidence,
+    persist_evidence_batch,
+    verify_existing_evidence,
+)
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.engines.csrd.emissions import calculate_emissions
 from backend.app.core.governance import log_model_call, log_rag_event, log_tool_call
@@ -20,11 +33,19 @@ from backend.app.engines.csrd.errors import (
     DatasetVersionInvalidError,
     DatasetVersionMissingError,
     DatasetVersionNotFoundError,
+    EmissionFactorArtifactInvalidError,
     ImmutableConflictError,
     RawRecordsMissingError,
     StartedAtInvalidError,
     StartedAtMissingError,
 )
+from backend.app.engines.csrd.factor_library import FactorResolver, build_factor_index
+from backend.app.engines.csrd.group_emissions import (
+    GroupEmissionsResult,
+    GroupEntity,
+    calculate_group_emissions,
+    group_computation_key,
+)
 from backend.app.engines.csrd.ids import deterministic_id
 from backend.app.engines.csrd.materiality import assess_double_materiality
 from backend.app.engines.csrd.reporting import generate_esrs_report
@@ -62,6 +83,34 @@ def _extract_inputs(raw_payload: dict) -> tuple[dict, dict]:
     return esg, financial
 
 
+def _entity_id(raw_payload: dict, default: str) -> str:
+    if isinstance(raw_payload.get("data"), dict):
+        raw_payload = raw_payload["data"]
+    esg = raw_payload.get("esg") if isinstance(raw_payload.get("esg"), dict) else {}
+    for candidate in (raw_payload.get("entity_id"), esg.get("entity_id")):
+        if isinstance(candidate, str) and candidate.strip():
+            return candidate.strip()
+    return default
+
+
+async def _load_factor_resolver(db, *, dataset_version_id: str, parameters: dict) -> FactorResolver | None:
+    """Per-run resolver over `parameters.emission_factor_artifact_id`, or None when no library is configured."""
+    if "emission_factor_artifact_id" not in parameters:
+        return None
+    artifact_id = parameters["emission_factor_artifact_id"]
+    if not isinstance(artifact_id, str) or not artifact_id.strip():
+        raise EmissionFactorArtifactInvalidError("EMISSION_FACTOR_ARTIFACT_ID_INVALID")
+    try:
+        row, payload = await load_emission_factor_artifact_for_dataset(
+            db, emission_factor_artifact_id=artifact_id.strip(), dataset_version_id=dataset_version_id
+        )
+    except EmissionFactorArtifactError as exc:
+        raise EmissionFactorArtifactInvalidError(str(exc)) from exc
+    except ValueError as exc:
+        raise EmissionFactorArtifactInvalidError("EMISSION_FACTOR_ARTIFACT_CHECKSUM_MISMATCH") from exc
+    return FactorResolver(build_factor_index(checksum=row.checksum, payload=payload))
+
+
 async def _strict_create_evidence(
     db,
     *,
@@ -74,31 +123,19 @@ async def _strict_create_evidence(
 ) -> EvidenceRecord:
     existing = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == evidence_id))
     if existing is not None:
-        if existing.dataset_version_id != dataset_version_id or existing.engine_id != engine_id or existing.kind != kind:
-            logger.warning(
-                "CSRD_IMMUTABLE_CONFLICT evidence_id_collision evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("EVIDENCE_ID_COLLISION")
-        existing_created_at = existing.created_at
-        if existing_created_at.tzinfo is None:
-            existing_created_at = existing_created_at.replace(tzinfo=timezone.utc)
-        created_at_norm = created_at if created_at.tzinfo is not None else created_at.replace(tzinfo=timezone.utc)
-        if existing_created_at != created_at_norm:
-            logger.warning(
-                "CSRD_IMMUTABLE_CONFLICT evidence_created_at_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_CREATED_AT_MISMATCH")
-        if existing.payload != payload:
-            logger.warning(
-                "CSRD_IMMUTABLE_CONFLICT evidence_payload_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_MISMATCH")
+        verify_existing_evidence(
+            existing,
+            {
+                "evidence_id": evidence_id,
+                "dataset_version_id": dataset_version_id,
+                "engine_id": engine_id,
+                "kind": kind,
+                "payload": payload,
+                "created_at": created_at,
+            },
+            log_prefix="CSRD",
+            conflict_error=ImmutableConflictError,
+        )
         return existing
     return await create_evidence(
         db,
@@ -169,16 +206,82 @@ async def _strict_link(
     return await link_finding_to_evidence(db, link_id=link_id, finding_id=finding_id, evidence_id=evidence_id)
 
 
+def _group_evidence_rows(
+    *,
+    dataset_version_id: str,
+    group: GroupEmissionsResult,
+    parameters: dict,
+    created_at: datetime,
+) -> tuple[list[dict], dict[str, str], str]:
+    """Entity and group evidence rows; every entity total traces back to its raw records and rows."""
+    key = group_computation_key(group, parameters)
+    rows_by_entity: dict[str, list[dict]] = {}
+    for row in group.rows:
+        rows_by_entity.setdefault(row["entity_id"], []).append(row)
+    factor_set = {"version": group.factor_set.version, "factors": group.factor_set.as_dict()}
+
+    evidence_rows: list[dict] = []
+    entity_evidence_ids: dict[str, str] = {}
+    for entity in group.entities:
+        evidence_id = deterministic_evidence_id(
+            dataset_version_id=dataset_version_id,
+            engine_id="engine_csrd",
+            kind="entity_emissions",
+            stable_key=f"{key}:{entity['entity_id']}",
+        )
+        entity_evidence_ids[entity["entity_id"]] = evidence_id
+        evidence_rows.append(
+            {
+                "evidence_id": evidence_id,
+                "dataset_version_id": dataset_version_id,
+                "engine_id": "engine_csrd",
+                "kind": "entity_emissions",
+                "payload": {
+                    "entity": entity,
+                    "activity_rows": rows_by_entity.get(entity["entity_id"], []),
+                    "factor_set": factor_set,
+                    "source_raw_record_ids": entity["source_raw_record_ids"],
+                },
+                "created_at": created_at,
+            }
+        )
+
+    group_evidence_id = deterministic_evidence_id(
+        dataset_version_id=dataset_version_id, engine_id="engine_csrd", kind="group_emissions", stable_key=key
+    )
+    evidence_rows.append(
+        {
+            "evidence_id": group_evidence_id,
+            "dataset_version_id": dataset_version_id,
+            "engine_id": "engine_csrd",
+            "kind": "group_emissions",
+            "payload": {
+                "totals_tco2e": group.consolidated.totals_tco2e,
+                "total_emissions_tco2e": sum(group.consolidated.totals_tco2e.values()),
+                "entity_count": len(group.entities),
+                "material_entities": [e["entity_id"] for e in group.entities if e["materiality"]["is_material"]],
+                "factor_set": factor_set,
+                "entity_evidence_ids": entity_evidence_ids,
+                "source_raw_record_ids": [raw_id for e in group.entities for raw_id in e["source_raw_record_ids"]],
+                **({"factor_library": group.factor_library} if group.factor_library is not None else {}),
+            },
+            "created_at": created_at,
+        }
+    )
+    return evidence_rows, entity_evidence_ids, group_evidence_id
+
+
+@profiled_run(ENGINE_ID)
 async def run_engine(*, dataset_version_id: object, started_at: object, parameters: dict | None = None) -> dict:
     install_immutability_guards()
     dv_id = _validate_dataset_version_id(dataset_version_id)
     started = _parse_started_at(started_at)
     params = parameters or {}
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         strict_mode_override = params.get("strict_mode") if isinstance(params.get("strict_mode"), bool) else None
@@ -191,6 +294,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         )
         if not raw_records:
             raise RawRecordsMissingError("RAW_RECORDS_REQUIRED")
+        factor_resolver = await _load_factor_resolver(db, dataset_version_id=dv_id, parameters=params)
         esg, financial = _extract_inputs(raw_records[0].payload)
         source_raw_id = raw_records[0].raw_record_id
         rag_sources = [
@@ -215,6 +319,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             timestamp=started,
         )
 
+        mark_stage("model")
         warnings: list[str] = []
         emissions_dict = esg.get("emissions") if isinstance(esg.get("emissions"), dict) else None
         if not emissions_dict:
@@ -224,7 +329,34 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         if warnings:
             logger.warning("CSRD_DATA_INTEGRITY_WARNINGS dataset_version_id=%s warnings=%s", dv_id, warnings)
 
-        emissions_res = calculate_emissions(dataset_version_id=dv_id, esg=esg, parameters=params)
+        group_reporting = params.get("group_reporting") is True
+        group: GroupEmissionsResult | None = None
+        if group_reporting:
+            entities: list[GroupEntity] = []
+            for r in raw_records:
+                entity_esg, entity_financial = _extract_inputs(r.payload)
+                entities.append(
+                    GroupEntity(
+                        raw_record_id=r.raw_record_id,
+                        entity_id=_entity_id(r.payload, r.raw_record_id),
+                        esg=entity_esg,
+                        financial=entity_financial,
+                    )
+                )
+            group = calculate_group_emissions(records=entities, parameters=params, factor_resolver=factor_resolver)
+            emissions_res = group.consolidated
+            model_inputs = {
+                "raw_record_ids": [r.raw_record_id for r in raw_records],
+                "factor_set": {"version": group.factor_set.version, "factors": group.factor_set.as_dict()},
+                "parameters": params,
+            }
+        else:
+            emissions_res = calculate_emissions(
+                dataset_version_id=dv_id, esg=esg, parameters=params, factor_resolver=factor_resolver
+            )
+            model_inputs = {"esg": esg, "parameters": params}
+        if factor_resolver is not None:
+            model_inputs["factor_library"] = factor_resolver.describe()
         total_emissions = sum(emissions_res.totals_tco2e.values())
         emissions_event_outputs = {
             "dataset_version_id": dv_id,
@@ -236,9 +368,9 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             db,
             engine_id=ENGINE_ID,
             dataset_version_id=dv_id,
-            model_identifier="csrd.calculate_emissions",
+            model_identifier="csrd.calculate_group_emissions" if group_reporting else "csrd.calculate_emissions",
             model_version=ENGINE_VERSION,
-            inputs={"esg": esg, "parameters": params},
+            inputs=model_inputs,
             outputs=emissions_event_outputs,
             context_id=source_raw_id,
             governance_metadata={
@@ -253,7 +385,8 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         findings_dc, assumptions_dc = assess_double_materiality(
             dataset_version_id=dv_id,
             esg=esg,
-            financial=financial,
+            # Group materiality weighs consolidated emissions against consolidated revenue.
+            financial={**financial, "revenue": group.consolidated_revenue} if group is not None else financial,
             total_emissions_tco2e=total_emissions,
             parameters=params,
         )
@@ -322,9 +455,45 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             },
             "total_emissions_tco2e": total_emissions,
         }
-
+        if factor_resolver is not None:
+            emissions_payload["factor_library"] = factor_resolver.summary()
+
+        mark_stage("persist")
+        group_summary: dict | None = None
+        if group is not None:
+            group_rows, entity_evidence_ids, group_evidence_id = _group_evidence_rows(
+                dataset_version_id=dv_id, group=group, parameters=params, created_at=started
+            )
+            evidence_batch = EvidenceBatch(
+                dataset_version_id=dv_id, log_prefix="CSRD", conflict_error=ImmutableConflictError
+            )
+            for row in group_rows:
+                evidence_batch.add_evidence(row)
+            await persist_evidence_batch(db, evidence_batch)
+            group_summary = {
+                "group_emissions_evidence_id": group_evidence_id,
+                "factor_set_version": group.factor_set.version,
+                "entity_count": len(group.entities),
+                "entities": [
+                    {
+                        "entity_id": entity["entity_id"],
+                        "totals_tco2e": entity["totals_tco2e"],
+                        "total_emissions_tco2e": entity["total_emissions_tco2e"],
+                        "is_material": entity["materiality"]["is_material"],
+                        "source_raw_record_ids": entity["source_raw_record_ids"],
+                        "evidence_id": entity_evidence_ids[entity["entity_id"]],
+                    }
+                    for entity in group.entities
+                ],
+            }
+            emissions_payload["group"] = {
+                key: value for key, value in group_summary.items() if key != "entities"
+            }
         emissions_evidence_id = deterministic_evidence_id(
-            dataset_version_id=dv_id, engine_id="engine_csrd", kind="emissions", stable_key="scopes_v1"
+            dataset_version_id=dv_id,
+            engine_id="engine_csrd",
+            kind="emissions",
+            stable_key="group_scopes_v1" if group is not None else "scopes_v1",
         )
         await _strict_create_evidence(
             db,
@@ -336,6 +505,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             created_at=started,
         )
 
+        mark_stage("report")
         report_id = deterministic_id(dv_id, "report", "v1")
         report = generate_esrs_report(
             report_id=report_id,
@@ -372,6 +542,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             timestamp=started,
         )
 
+        mark_stage("persist")
         # Persist traceability in core evidence + finding tables (append-only).
         report_evidence_id = deterministic_evidence_id(
             dataset_version_id=dv_id, engine_id="engine_csrd", kind="report", stable_key="report"
@@ -431,4 +602,5 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         "report": report,
         "emissions_evidence_id": emissions_evidence_id,
         "report_evidence_id": report_evidence_id,
+        **({"group_emissions": group_summary} if group_summary is not None else {}),
     }
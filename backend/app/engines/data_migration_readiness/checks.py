@@ -342,7 +342,7 @@ def assess_risks(
             "mapping",
             "high",
             "Field mapping coverage is incomplete for one or more collections.",
-            {"missing_mappings": mapping.missing_mappings},
+            {"missing_mappings": {k: list(v) for k, v in mapping.missing_mappings.items()}},
         )
     if not integrity.compliant:
         _make_risk(
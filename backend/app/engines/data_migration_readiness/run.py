@@ -13,8 +13,9 @@ from sqlalchemy import select
 
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset import immutability as dataset_immutability
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.service import load_raw_records
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.core.evidence.service import (
@@ -249,7 +250,7 @@ def _build_remediation_tasks(
                 "category": "mapping",
                 "severity": "medium",
                 "description": "Add missing field mappings so the target schema can be satisfied.",
-                "details": {"missing_mappings": mapping.missing_mappings},
+                "details": {"missing_mappings": {k: list(v) for k, v in mapping.missing_mappings.items()}},
                 "status": "pending",
             }
         )
@@ -281,6 +282,7 @@ def _build_remediation_tasks(
     return tasks
 
 
+@profiled_run(ENGINE_ID)
 async def run_readiness_check(
     *,
     dataset_version_id: object,
@@ -298,14 +300,14 @@ async def run_readiness_check(
         mutable.update(overrides)
         config = MappingProxyType(mutable)
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     session_candidate = sessionmaker()
     if inspect.isawaitable(session_candidate):
         session_candidate = await session_candidate  # type: ignore[assignment]
     session_context = _ensure_async_context(session_candidate)
     async with session_context as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         strict_mode_override = params.get("strict_mode") if isinstance(params.get("strict_mode"), bool) else None
@@ -320,8 +322,10 @@ async def run_readiness_check(
             raise RawRecordsMissingError("RAW_RECORDS_REQUIRED")
 
         source_raw_id = raw_records[0].raw_record_id
+        mark_stage("normalize")
         snapshots = snapshot_raw_records(dv_id, raw_records)
         collections = build_collection_index(snapshots)
+        mark_stage("model")
         structure_result = evaluate_structure(dv_id, snapshots, collections, config)
         integrity_result = verify_integrity(dv_id, snapshots)
         quality_result = evaluate_quality(dv_id, collections, config, integrity_result.duplicate_ratio)
@@ -354,6 +358,7 @@ async def run_readiness_check(
             config=config,
         )
 
+        mark_stage("persist")
         # Calculate deterministic run_id from stable inputs (not timestamp)
         # Same inputs → same run_id, enabling deterministic replay
         import hashlib
@@ -120,7 +120,7 @@ def generate_executive_report(
 
     component_scores = readiness_result.get("component_scores", {})
     risk_assessment = {
-        "readiness_score": readiness_score,
+        "readiness_score": _decimal_to_float(readiness_score),
         "readiness_level": readiness_level,
         "component_scores": component_scores,
         "capital_adequacy_flags": capital_adequacy.get("flags", []),
@@ -7,14 +7,16 @@ from sqlalchemy import select
 
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.service import load_raw_records
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.core.evidence.service import create_evidence, create_finding, deterministic_evidence_id, link_finding_to_evidence
 from backend.app.engines.enterprise_capital_debt_readiness.assumptions import resolved_assumptions
 from backend.app.engines.enterprise_capital_debt_readiness.capital_adequacy import assess_capital_adequacy, capital_adequacy_payload
 from backend.app.engines.enterprise_capital_debt_readiness.debt_service import assess_debt_service_ability, debt_service_payload
+from backend.app.engines.enterprise_capital_debt_readiness.engine import ENGINE_ID
 from backend.app.engines.enterprise_capital_debt_readiness.reporting import generate_executive_report
 from backend.app.engines.enterprise_capital_debt_readiness.readiness_scores import (
     calculate_composite_readiness_score,
@@ -144,16 +146,17 @@ async def _strict_link(
     return await link_finding_to_evidence(db, link_id=link_id, finding_id=finding_id, evidence_id=evidence_id)
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(*, dataset_version_id: object, started_at: object, parameters: dict | None = None) -> dict:
     install_immutability_guards()
     dv_id = _validate_dataset_version_id(dataset_version_id)
     started = _parse_started_at(started_at)
     params = parameters or {}
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         strict_mode_override = params.get("strict_mode") if isinstance(params.get("strict_mode"), bool) else None
@@ -177,6 +180,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             except ValueError:
                 logger.warning("CAPDEBT_ANALYSIS_DATE_INVALID dataset_version_id=%s value=%s", dv_id, analysis_date_str)
 
+        mark_stage("model")
         assumptions = resolved_assumptions(params)
         cap = assess_capital_adequacy(
             dataset_version_id=dv_id,
@@ -257,6 +261,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             }
         )
 
+        mark_stage("persist")
         capital_evidence_id = deterministic_evidence_id(
             dataset_version_id=dv_id,
             engine_id="engine_enterprise_capital_debt_readiness",
@@ -411,6 +416,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             created_at=started,
         )
 
+        mark_stage("report")
         report_evidence_ids = [
             capital_evidence_id,
             debt_evidence_id,
@@ -453,6 +459,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         summary["executive_report"] = executive_report
         summary["evidence"]["executive_report"] = executive_report_evidence_id
 
+        mark_stage("persist")
         for f in findings:
             finding_id = f["id"]
             await _strict_create_finding(
@@ -9,12 +9,15 @@ Build Task 1 scope:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import json
+
+from fastapi import APIRouter, Header, HTTPException, Response
 
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled, log_disabled_engine_attempt
 from backend.app.core.engine_registry.registry import REGISTRY
 from backend.app.core.engine_registry.spec import EngineSpec
+from backend.app.core.json_stream import StreamingJSONResponse
 from backend.app.core.lifecycle.enforcement import (
     LifecycleViolationError,
     record_calculation_completion,
@@ -22,6 +25,7 @@ from backend.app.core.lifecycle.enforcement import (
     verify_import_complete,
     verify_normalize_complete,
 )
+from backend.app.core.reporting.materialization import materialize_report, report_response
 
 
 ENGINE_ID = "engine_enterprise_deal_transaction_readiness"
@@ -138,8 +142,14 @@ async def run_engine_endpoint(payload: dict) -> dict:
         raise HTTPException(status_code=500, detail=f"ENGINE_RUN_FAILED: {type(exc).__name__}: {exc}")
 
 
-@router.post("/report")
-async def report_endpoint(payload: dict) -> dict:
+async def _materialized_report(
+    *,
+    dataset_version_id: object,
+    run_id: object,
+    view_type: object,
+    anonymization_salt: str,
+    if_none_match: str | None,
+) -> Response:
     """
     Generate transaction readiness report.
     
@@ -152,7 +162,6 @@ async def report_endpoint(payload: dict) -> dict:
     """
     # Kill-switch revalidation (hardening)
     if not is_engine_enabled(ENGINE_ID):
-        dataset_version_id = payload.get("dataset_version_id")
         await log_disabled_engine_attempt(
             engine_id=ENGINE_ID,
             actor_id="system",
@@ -175,11 +184,6 @@ async def report_endpoint(payload: dict) -> dict:
     )
     from backend.app.engines.enterprise_deal_transaction_readiness.run import _validate_dataset_version_id
     
-    dataset_version_id = payload.get("dataset_version_id")
-    run_id = payload.get("run_id")
-    view_type = payload.get("view_type", "internal")  # "internal" or "external"
-    anonymization_salt = payload.get("anonymization_salt", "")
-    
     # Validate inputs
     try:
         validated_dv_id = _validate_dataset_version_id(dataset_version_id)
@@ -200,21 +204,36 @@ async def report_endpoint(payload: dict) -> dict:
                 engine_id=ENGINE_ID,
                 actor_id=f"engine:{ENGINE_ID}",
             )
-            report = await assemble_report(
+
+            async def _render() -> dict:
+                return await assemble_report(
+                    db,
+                    dataset_version_id=validated_dv_id,
+                    run_id=run_id,
+                )
+
+            materialized = await materialize_report(
                 db,
-                dataset_version_id=validated_dv_id,
                 run_id=run_id,
+                report_kind=f"{ENGINE_ID}:report",
+                dataset_version_id=validated_dv_id,
+                engine_id=ENGINE_ID,
+                render=_render,
+                # The ETag is that of the internal report, so only that view revalidates.
+                if_none_match=if_none_match if view_type == "internal" else None,
             )
             if view_type == "external":
                 from backend.app.engines.enterprise_deal_transaction_readiness.externalization.views import (
                     create_external_view,
-                    validate_external_view,
                 )
 
-                external_view = create_external_view(report, anonymization_salt=anonymization_salt)
-                validate_external_view(external_view)
-                return external_view
-            return report
+                # The salt varies per caller, so only the internal report is materialized.
+                # Redaction validates as it goes, so an unsafe report fails before any bytes are sent.
+                external_view = create_external_view(
+                    json.loads(materialized.content), anonymization_salt=anonymization_salt
+                )
+                return StreamingJSONResponse(external_view)
+            return report_response(materialized)
         except RunNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc))
         except DatasetVersionMismatchError as exc:
@@ -228,6 +247,33 @@ async def report_endpoint(payload: dict) -> dict:
             )
 
 
+@router.post("/report")
+async def report_endpoint(payload: dict) -> Response:
+    return await _materialized_report(
+        dataset_version_id=payload.get("dataset_version_id"),
+        run_id=payload.get("run_id"),
+        view_type=payload.get("view_type", "internal"),  # "internal" or "external"
+        anonymization_salt=payload.get("anonymization_salt", ""),
+        if_none_match=None,
+    )
+
+
+@router.get("/report")
+async def get_report_endpoint(
+    dataset_version_id: str,
+    run_id: str,
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Cacheable form of POST /report (internal view); honours If-None-Match."""
+    return await _materialized_report(
+        dataset_version_id=dataset_version_id,
+        run_id=run_id,
+        view_type="internal",
+        anonymization_salt="",
+        if_none_match=if_none_match,
+    )
+
+
 @router.post("/export")
 async def export_endpoint(payload: dict) -> dict:
     """
@@ -272,7 +318,6 @@ async def export_endpoint(payload: dict) -> dict:
     from backend.app.engines.enterprise_deal_transaction_readiness.externalization.views import (
         create_external_view,
         create_internal_view,
-        validate_external_view,
     )
     from backend.app.engines.enterprise_deal_transaction_readiness.run import _validate_dataset_version_id
     
@@ -318,8 +363,8 @@ async def export_endpoint(payload: dict) -> dict:
             
             # Create view based on type (externalization)
             if view_type == "external":
+                # Single pass: redaction rejects anything the policy forbids.
                 report_view = create_external_view(full_report, anonymization_salt=anonymization_salt)
-                validate_external_view(report_view)
             else:
                 report_view = create_internal_view(full_report)
 
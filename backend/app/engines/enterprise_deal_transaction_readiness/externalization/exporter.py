@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+import tempfile
+from typing import Any, BinaryIO, Iterator
 
-from backend.app.core.artifacts.externalization_service import put_bytes_immutable
+from backend.app.core.artifacts.externalization_service import put_bytes_immutable, put_file_immutable
 from backend.app.core.metrics import engine_exports_total
 from backend.app.engines.enterprise_deal_transaction_readiness.engine import ENGINE_ID
-from backend.app.engines.enterprise_deal_transaction_readiness.pdf import render_simple_text_pdf
+from backend.app.engines.enterprise_deal_transaction_readiness.pdf import write_text_pdf
+
+
+PDF_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
 
 def _canonical_json_bytes(obj: Any) -> bytes:
@@ -53,6 +57,53 @@ async def export_report_json(
     return {"format": "json", "uri": stored.uri, "sha256": stored.sha256, "size_bytes": stored.size_bytes}
 
 
+class _HashingWriter:
+    """Binary sink that hashes everything written through it."""
+
+    def __init__(self, out: BinaryIO) -> None:
+        self._out = out
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._out.write(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _report_pdf_lines(report_view: dict[str, Any]) -> Iterator[str]:
+    yield f"engine_id={report_view.get('engine_id')}"
+    yield f"dataset_version_id={report_view.get('dataset_version_id')}"
+    yield f"result_set_id={report_view.get('result_set_id')}"
+
+    sections = report_view.get("sections", [])
+    if not isinstance(sections, list):
+        return
+    for section in sections:
+        if not isinstance(section, dict):
+            continue
+        section_id = section.get("section_id")
+        if isinstance(section_id, str) and section_id:
+            yield f"[{section_id}]"
+        if section.get("section_id") == "readiness_findings":
+            finding_count = section.get("finding_count")
+            if isinstance(finding_count, int):
+                yield f"finding_count={finding_count}"
+            findings = section.get("findings")
+            if isinstance(findings, list):
+                for finding in findings:
+                    if not isinstance(finding, dict):
+                        continue
+                    yield (
+                        f"- {finding.get('finding_id')} severity={finding.get('severity')} "
+                        f"kind={finding.get('kind')} evidence_id={finding.get('evidence_id')}"
+                    )
+                    title = finding.get("title")
+                    if isinstance(title, str) and title:
+                        yield f"  {title}"
+
+
 async def export_report_pdf(
     *,
     dataset_version_id: str,
@@ -60,36 +111,23 @@ async def export_report_pdf(
     view_type: str,
     report_view: dict[str, Any],
 ) -> dict:
-    title = "Transaction Readiness Report"
-    lines: list[str] = []
-    lines.append(f"engine_id={report_view.get('engine_id')}")
-    lines.append(f"dataset_version_id={report_view.get('dataset_version_id')}")
-    lines.append(f"result_set_id={report_view.get('result_set_id')}")
-
-    sections = report_view.get("sections", [])
-    if isinstance(sections, list):
-        for section in sections:
-            if not isinstance(section, dict):
-                continue
-            section_id = section.get("section_id")
-            if isinstance(section_id, str) and section_id:
-                lines.append(f"[{section_id}]")
-            if section.get("section_id") == "readiness_findings":
-                finding_count = section.get("finding_count")
-                if isinstance(finding_count, int):
-                    lines.append(f"finding_count={finding_count}")
-
-    pdf_bytes = render_simple_text_pdf(title=title, lines=lines)
-    sha = _sha256(pdf_bytes)
-    key = _export_key(
-        dataset_version_id=dataset_version_id,
-        result_set_id=result_set_id,
-        view_type=view_type,
-        kind="report",
-        sha256_hex=sha,
-        ext="pdf",
-    )
-    engine_exports_total.labels(engine_id=ENGINE_ID, format="pdf", view_type=view_type, status="attempt").inc()
-    stored = await put_bytes_immutable(key=key, data=pdf_bytes, content_type="application/pdf")
+    # Pages are written as they are laid out into a spooled file (spilling to disk
+    # for large reports) and hashed on the way, since the artifact key embeds the sha.
+    with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES) as spool:
+        sink = _HashingWriter(spool)
+        size_bytes = write_text_pdf(sink, title="Transaction Readiness Report", lines=_report_pdf_lines(report_view))
+        sha = sink.hexdigest()
+        key = _export_key(
+            dataset_version_id=dataset_version_id,
+            result_set_id=result_set_id,
+            view_type=view_type,
+            kind="report",
+            sha256_hex=sha,
+            ext="pdf",
+        )
+        engine_exports_total.labels(engine_id=ENGINE_ID, format="pdf", view_type=view_type, status="attempt").inc()
+        stored = await put_file_immutable(
+            key=key, fileobj=spool, sha256=sha, size_bytes=size_bytes, content_type="application/pdf"
+        )
     engine_exports_total.labels(engine_id=ENGINE_ID, format="pdf", view_type=view_type, status="success").inc()
     return {"format": "pdf", "uri": stored.uri, "sha256": stored.sha256, "size_bytes": stored.size_bytes}
@@ -13,8 +13,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+from backend.app.core.reporting.redaction import CompiledFieldPolicy
+
 
 class ReportSection(str, Enum):
     """Report section identifiers for Engine #5."""
@@ -158,6 +161,19 @@ def validate_externalization_policy(policy: ExternalizationPolicy) -> None:
         raise ValueError(f"Policy has overlapping redacted/anonymized fields: {field_overlap}")
 
 
+@lru_cache(maxsize=None)
+def compile_policy(policy: ExternalizationPolicy) -> CompiledFieldPolicy:
+    """
+    Compile a policy into the field matcher used for single-pass redaction.
+
+    Compiled once per policy instance (policies are frozen and hashable).
+    """
+    return CompiledFieldPolicy(
+        redacted_fields=policy.redacted_fields,
+        anonymized_fields=policy.anonymized_fields,
+    )
+
+
 # Default policy instance
 DEFAULT_POLICY = ExternalizationPolicy()
 
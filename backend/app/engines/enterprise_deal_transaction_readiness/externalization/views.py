@@ -12,13 +12,15 @@ Platform Law Compliance:
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+from typing import Any, Iterator
 
+from backend.app.core.reporting.redaction import Redactor
 from backend.app.engines.enterprise_deal_transaction_readiness.externalization.policy import (
     DEFAULT_POLICY,
     ExternalizationPolicy,
     ReportSection,
     SharingLevel,
+    compile_policy,
     get_sharing_level,
     should_anonymize_field,
     should_redact_field,
@@ -56,6 +58,19 @@ def create_internal_view(report: dict[str, Any]) -> dict[str, Any]:
     return report.copy()
 
 
+def external_view_redactor(
+    policy: ExternalizationPolicy = DEFAULT_POLICY,
+    anonymization_salt: str = "",
+) -> Redactor:
+    """
+    Build a single-use redactor for one external view.
+
+    Anonymized references are memoized on the redactor, so each distinct identifier
+    is hashed once per view regardless of how often it appears in the report.
+    """
+    return compile_policy(policy).redactor(anonymize=lambda value: anonymize_id(value, salt=anonymization_salt))
+
+
 def create_external_view(
     report: dict[str, Any],
     policy: ExternalizationPolicy = DEFAULT_POLICY,
@@ -64,7 +79,9 @@ def create_external_view(
     """
     Create external view of report (policy-filtered, redacted).
     
-    No transformation of numbers, only omission/redaction.
+    No transformation of numbers, only omission/redaction. Redaction, anonymization
+    and validation happen in one traversal; data the policy forbids that cannot be
+    omitted raises ValueError.
     
     Args:
         report: Full report data
@@ -74,7 +91,24 @@ def create_external_view(
     Returns:
         External view (filtered, redacted, anonymized)
     """
-    external_view = {}
+    redactor = external_view_redactor(policy, anonymization_salt)
+    return {
+        key: redactor.redact(value) if needs_redaction else value
+        for key, value, needs_redaction in _external_entries(report, policy=policy, redactor=redactor)
+    }
+
+
+def _external_entries(
+    report: dict[str, Any],
+    *,
+    policy: ExternalizationPolicy,
+    redactor: Redactor,
+) -> Iterator[tuple[str, Any, bool]]:
+    """
+    Yield the top-level (key, value, needs_redaction) entries of the external view.
+
+    Section filtering happens here; section bodies are left for the redactor.
+    """
     omitted_internal_sections: list[str] = []
     
     # Handle sections array if present
@@ -88,30 +122,21 @@ def create_external_view(
                 # Unknown section - exclude from external view (conservative)
                 continue
             
-            sharing_level = get_sharing_level(section_enum, policy)
-            
-            if sharing_level == SharingLevel.EXTERNAL:
-                # Include section, but redact/anonymize fields
-                external_sections.append(
-                    _redact_section(
-                        section,
-                        policy=policy,
-                        anonymization_salt=anonymization_salt,
-                    )
-                )
+            if get_sharing_level(section_enum, policy) == SharingLevel.EXTERNAL:
+                external_sections.append(section)
             else:
                 omitted_internal_sections.append(section_id)
         
-        external_view["sections"] = external_sections
+        yield "sections", external_sections, True
         # Copy top-level metadata (redacted)
         for key in ["engine_id", "engine_version", "dataset_version_id", "run_id"]:
             if key in report:
                 if should_redact_field(key, policy):
                     continue
                 elif should_anonymize_field(key, policy):
-                    external_view[key] = anonymize_id(str(report[key]), salt=anonymization_salt)
+                    yield key, redactor.anonymize(str(report[key])), False
                 else:
-                    external_view[key] = report[key]
+                    yield key, report[key], False
     else:
         # Handle flat report structure
         for section_key, section_data in report.items():
@@ -121,21 +146,16 @@ def create_external_view(
                 # Unknown section - exclude from external view (conservative)
                 continue
             
-            sharing_level = get_sharing_level(section_enum, policy)
-            
-            if sharing_level == SharingLevel.EXTERNAL:
-                external_view[section_key] = _redact_section(
-                    section_data,
-                    policy=policy,
-                    anonymization_salt=anonymization_salt,
-                )
+            if get_sharing_level(section_enum, policy) == SharingLevel.EXTERNAL:
+                yield section_key, section_data, True
             else:
                 omitted_internal_sections.append(section_key)
     
     if omitted_internal_sections:
-        external_view["__omitted_internal_sections__"] = sorted(omitted_internal_sections)
-    
-    return external_view
+        yield "__omitted_internal_sections__", sorted(omitted_internal_sections), False
+
+
+_SECTION_MAP = {section.value: section for section in ReportSection}
 
 
 def _identify_section(section_key: str) -> ReportSection | None:
@@ -148,72 +168,7 @@ def _identify_section(section_key: str) -> ReportSection | None:
     Returns:
         ReportSection if identified, None otherwise
     """
-    section_key_lower = section_key.lower()
-    
-    section_map = {
-        "executive_overview": ReportSection.EXECUTIVE_OVERVIEW,
-        "transaction_scope_validation": ReportSection.TRANSACTION_SCOPE_VALIDATION,
-        "execution_summary": ReportSection.EXECUTION_SUMMARY,
-        "readiness_findings": ReportSection.READINESS_FINDINGS,
-        "checklist_status": ReportSection.CHECKLIST_STATUS,
-        "evidence_index": ReportSection.EVIDENCE_INDEX,
-        "limitations_uncertainty": ReportSection.LIMITATIONS_UNCERTAINTY,
-        "explicit_non_claims": ReportSection.EXPLICIT_NON_CLAIMS,
-        "internal_notes": ReportSection.INTERNAL_NOTES,
-        "transaction_scope_details": ReportSection.TRANSACTION_SCOPE_DETAILS,
-        "run_parameters": ReportSection.RUN_PARAMETERS,
-        "dataset_version_details": ReportSection.DATASET_VERSION_DETAILS,
-    }
-    
-    return section_map.get(section_key_lower)
-
-
-def _redact_section(
-    section_data: Any,
-    policy: ExternalizationPolicy,
-    anonymization_salt: str,
-) -> Any:
-    """
-    Redact and anonymize section data for external view.
-    
-    Args:
-        section_data: Section data (dict, list, or primitive)
-        policy: Externalization policy
-        anonymization_salt: Salt for anonymization
-    
-    Returns:
-        Redacted/anonymized section data
-    """
-    if isinstance(section_data, dict):
-        redacted = {}
-        for key, value in section_data.items():
-            if should_redact_field(key, policy):
-                # Omit redacted fields
-                continue
-            elif should_anonymize_field(key, policy):
-                # Anonymize field value
-                if isinstance(value, str):
-                    redacted[key] = anonymize_id(value, salt=anonymization_salt)
-                elif isinstance(value, list):
-                    redacted[key] = [
-                        anonymize_id(item, salt=anonymization_salt) if isinstance(item, str) else item
-                        for item in value
-                    ]
-                else:
-                    # Non-string anonymizable field - omit to be safe
-                    continue
-            else:
-                # Recursively redact nested structures
-                redacted[key] = _redact_section(value, policy=policy, anonymization_salt=anonymization_salt)
-        return redacted
-    elif isinstance(section_data, list):
-        return [
-            _redact_section(item, policy=policy, anonymization_salt=anonymization_salt)
-            for item in section_data
-        ]
-    else:
-        # Primitive value - return as-is (no transformation of numbers)
-        return section_data
+    return _SECTION_MAP.get(section_key.lower())
 
 
 def validate_external_view(external_view: dict[str, Any], policy: ExternalizationPolicy = DEFAULT_POLICY) -> None:
@@ -1,6 +1,26 @@
 from __future__ import annotations
 
+import io
 import re
+import textwrap
+from typing import BinaryIO, Iterable
+
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+TOP_MARGIN = 36
+TOP_Y = PAGE_HEIGHT - TOP_MARGIN
+BOTTOM_MARGIN = 72
+LINE_HEIGHT = 14
+# Helvetica 12pt averages ~6pt per glyph; 72pt side margins leave room for ~80.
+MAX_LINE_CHARS = 80
+_LINES_PER_PAGE = (TOP_Y - BOTTOM_MARGIN) // LINE_HEIGHT + 1
+
+_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+# Fixed object numbers; page content/page object pairs are numbered from 4 upward.
+_PAGES_OBJ = 1
+_FONT_OBJ = 2
+_CATALOG_OBJ = 3
 
 
 def _pdf_escape_text(s: str) -> str:
@@ -8,67 +28,128 @@ def _pdf_escape_text(s: str) -> str:
     return re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", s)
 
 
+class StreamingTextPdfWriter:
+    """
+    Incremental deterministic text PDF writer (Helvetica, text only).
+
+    Lines are buffered one page at a time; each full page is written to `out` as
+    soon as it is complete, and byte offsets for the cross-reference table are
+    tracked while writing. Memory use is bounded by one page plus one offset per
+    object. No timestamps or metadata are written, so identical inputs produce
+    identical bytes.
+    """
+
+    def __init__(self, out: BinaryIO, *, title: str) -> None:
+        self._out = out
+        self._offset = 0
+        self._offsets: dict[int, int] = {}
+        self._next_obj = _CATALOG_OBJ + 1
+        self._page_objs: list[int] = []
+        self._page_lines: list[str] = [title]
+        self._closed = False
+        self._write(_HEADER)
+        self._write_obj(_FONT_OBJ, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    @property
+    def bytes_written(self) -> int:
+        return self._offset
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_objs) + (1 if self._page_lines else 0)
+
+    def add_line(self, line: str) -> None:
+        if self._closed:
+            raise ValueError("PDF_WRITER_CLOSED")
+        for wrapped in textwrap.wrap(line, MAX_LINE_CHARS) or [""]:
+            if len(self._page_lines) >= _LINES_PER_PAGE:
+                self._flush_page()
+            self._page_lines.append(wrapped)
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.add_line(line)
+
+    def close(self) -> int:
+        """Write the remaining page, page tree, catalog, xref and trailer; returns total bytes."""
+        if self._closed:
+            return self._offset
+        if self._page_lines or not self._page_objs:
+            self._flush_page()
+        kids = " ".join(f"{n} 0 R" for n in self._page_objs)
+        self._write_obj(_PAGES_OBJ, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_objs)} >>".encode("utf-8"))
+        self._write_obj(_CATALOG_OBJ, f"<< /Type /Catalog /Pages {_PAGES_OBJ} 0 R >>".encode("utf-8"))
+
+        xref_offset = self._offset
+        size = self._next_obj
+        xref = ["xref", f"0 {size}", "0000000000 65535 f "]
+        for n in range(1, size):
+            xref.append(f"{self._offsets[n]:010d} 00000 n ")
+        self._write(("\n".join(xref) + "\n").encode("utf-8"))
+        self._write(
+            (
+                "trailer\n"
+                f"<< /Size {size} /Root {_CATALOG_OBJ} 0 R >>\n"
+                "startxref\n"
+                f"{xref_offset}\n"
+                "%%EOF\n"
+            ).encode("utf-8")
+        )
+        self._closed = True
+        return self._offset
+
+    def _flush_page(self) -> None:
+        content_lines = ["BT", "/F1 12 Tf", f"72 {TOP_Y} Td"]
+        for i, line in enumerate(self._page_lines):
+            if i:
+                content_lines.append(f"0 -{LINE_HEIGHT} Td")
+            content_lines.append(f"({_pdf_escape_text(line)}) Tj")
+        content_lines.append("ET")
+        stream = "\n".join(content_lines).encode("utf-8")
+
+        content_obj = self._allocate()
+        page_obj = self._allocate()
+        self._write_obj(
+            content_obj,
+            f"<< /Length {len(stream)} >>\nstream\n".encode("utf-8") + stream + b"\nendstream",
+        )
+        self._write_obj(
+            page_obj,
+            (
+                f"<< /Type /Page /Parent {_PAGES_OBJ} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                f"/Resources << /Font << /F1 {_FONT_OBJ} 0 R >> >> "
+                f"/Contents {content_obj} 0 R >>"
+            ).encode("utf-8"),
+        )
+        self._page_objs.append(page_obj)
+        self._page_lines = []
+
+    def _allocate(self) -> int:
+        n = self._next_obj
+        self._next_obj += 1
+        return n
+
+    def _write_obj(self, number: int, body: bytes) -> None:
+        self._offsets[number] = self._offset
+        self._write(f"{number} 0 obj\n".encode("utf-8") + body + b"\nendobj\n")
+
+    def _write(self, data: bytes) -> None:
+        self._out.write(data)
+        self._offset += len(data)
+
+
+def write_text_pdf(out: BinaryIO, *, title: str, lines: Iterable[str]) -> int:
+    """Stream a paginated text PDF to `out`; returns the number of bytes written."""
+    writer = StreamingTextPdfWriter(out, title=title)
+    writer.add_lines(lines)
+    return writer.close()
+
+
 def render_simple_text_pdf(*, title: str, lines: list[str]) -> bytes:
     """
-    Minimal deterministic single-page PDF generator (Helvetica, text only).
+    Deterministic paginated text PDF (Helvetica, text only) rendered into memory.
     No timestamps, no metadata, stable bytes for identical inputs.
     """
-    font_obj = "2 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
-
-    # Content stream
-    y = 760
-    content_lines = ["BT", "/F1 12 Tf", "72 800 Td", f"({ _pdf_escape_text(title) }) Tj"]
-    for line in lines:
-        y -= 14
-        content_lines.append("0 -14 Td")
-        content_lines.append(f"({ _pdf_escape_text(line) }) Tj")
-        if y < 72:
-            break
-    content_lines.append("ET")
-    content_stream = "\n".join(content_lines).encode("utf-8")
-    content_obj = (
-        f"4 0 obj\n<< /Length {len(content_stream)} >>\nstream\n".encode("utf-8")
-        + content_stream
-        + b"\nendstream\nendobj\n"
-    )
-
-    page_obj = (
-        "3 0 obj\n"
-        "<< /Type /Page /Parent 1 0 R /MediaBox [0 0 612 792] "
-        "/Resources << /Font << /F1 2 0 R >> >> "
-        "/Contents 4 0 R >>\n"
-        "endobj\n"
-    )
-    pages_obj = "1 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
-    catalog_obj = "5 0 obj\n<< /Type /Catalog /Pages 1 0 R >>\nendobj\n"
-
-    parts: list[bytes] = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
-    offsets: list[int] = []
-
-    def add_obj(obj_bytes: bytes) -> None:
-        offsets.append(sum(len(p) for p in parts))
-        parts.append(obj_bytes)
-
-    add_obj(pages_obj.encode("utf-8"))  # 1
-    add_obj(font_obj.encode("utf-8"))  # 2
-    add_obj(page_obj.encode("utf-8"))  # 3
-    add_obj(content_obj)  # 4
-    add_obj(catalog_obj.encode("utf-8"))  # 5
-
-    xref_offset = sum(len(p) for p in parts)
-    xref = ["xref", "0 6", "0000000000 65535 f "]
-    for off in offsets:
-        xref.append(f"{off:010d} 00000 n ")
-    xref_bytes = ("\n".join(xref) + "\n").encode("utf-8")
-    trailer = (
-        "trailer\n"
-        "<< /Size 6 /Root 5 0 R >>\n"
-        "startxref\n"
-        f"{xref_offset}\n"
-        "%%EOF\n"
-    ).encode("utf-8")
-
-    parts.append(xref_bytes)
-    parts.append(trailer)
-    return b"".join(parts)
-
+    buffer = io.BytesIO()
+    write_text_pdf(buffer, title=title, lines=lines)
+    return buffer.getvalue()
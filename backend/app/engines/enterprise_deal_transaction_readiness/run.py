@@ -3,12 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import select
-
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.uuidv7 import uuid7
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.engines.enterprise_deal_transaction_readiness.engine import ENGINE_ID, ENGINE_VERSION
 from backend.app.engines.enterprise_deal_transaction_readiness.errors import (
     DatasetVersionInvalidError,
@@ -131,6 +130,7 @@ def _parse_started_at(started_at: object) -> datetime:
     return parsed
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: str | None,
@@ -156,10 +156,10 @@ async def run_engine(
         optional_inputs=validated_optional_inputs,
     )
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == validated_dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, validated_dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         run_id = str(uuid7())
@@ -176,6 +176,7 @@ async def run_engine(
         )
         db.add(run)
 
+        mark_stage("model")
         await evaluate_optional_inputs_and_persist_findings(
             db,
             dataset_version_id=validated_dv_id,
@@ -184,6 +185,7 @@ async def run_engine(
             deterministic_finding_id_fn=deterministic_readiness_finding_id,
         )
 
+        mark_stage("persist")
         await db.commit()
 
     return {
@@ -16,7 +16,7 @@ from backend.app.core.metrics import (
     engine_runs_total,
 )
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.core.evidence.service import (
     create_evidence,
@@ -25,6 +25,7 @@ from backend.app.core.evidence.service import (
     link_finding_to_evidence,
 )
 from backend.app.core.normalization.models import NormalizedRecord
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.engines.enterprise_distressed_asset_debt_stress.constants import ENGINE_ID
 from backend.app.engines.enterprise_distressed_asset_debt_stress.errors import (
     DatasetVersionInvalidError,
@@ -334,6 +335,7 @@ def _classify_error(exc: Exception) -> str:
     return "unknown"
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: object,
@@ -350,10 +352,10 @@ async def run_engine(
     params = dict(parameters) if isinstance(parameters, dict) else {}
 
     try:
+        mark_stage("load")
         sessionmaker = get_sessionmaker()
         async with sessionmaker() as db:
-            dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-            if dv is None:
+            if not await dataset_version_exists(db, dv_id):
                 raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
             normalized_records = (
@@ -368,6 +370,7 @@ async def run_engine(
             normalized_record = normalized_records[0]
             raw_id = normalized_record.raw_record_id
 
+            mark_stage("model")
             model_start = time.perf_counter()
             exposure = calculate_debt_exposure(normalized_payload=normalized_record.payload)
             warnings: list[str] = []
@@ -387,6 +390,7 @@ async def run_engine(
             ]
             engine_model_duration_seconds.labels(engine_id=ENGINE_ID).observe(time.perf_counter() - model_start)
 
+            mark_stage("report")
             assumptions = _build_assumptions(parameters=params, normalized_record_id=normalized_record.normalized_record_id)
             exposure_payload = exposure.to_payload()
             stress_payloads = [result.to_payload() for result in stress_results]
@@ -414,6 +418,7 @@ async def run_engine(
                 scenario_threshold_pct=scenario_threshold_pct,
             )
 
+            mark_stage("persist")
             persist_start = time.perf_counter()
             exposure_evidence_id = deterministic_evidence_id(
                 dataset_version_id=dv_id, engine_id=ENGINE_ID, kind="debt_exposure", stable_key="base"
@@ -5,18 +5,22 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Any, Sequence
 
+from backend.app.core.parallel import chunked, configured_workers, map_chunks
+
+from . import columnar
 from .claims_management import (
     ClaimRecord,
     ClaimTransaction,
     extract_transactions_from_claim_payload,
     parse_claim_from_payload,
 )
-from .validation import validate_claim
+from .validation import validate_claims
 
 PAYMENT_INDICATORS = {"payment", "payout", "settlement", "reimbursement", "refund", "compensation"}
 HIGH_SEVERITY_STATUSES = {"open", "pending", "escalated", "under_review"}
 LOW_SEVERITY_STATUSES = {"closed", "settled", "paid", "approved"}
 SEVERITY_FACTORS = {"high": 0.85, "medium": 0.55, "low": 0.35}
+PARALLEL_CHUNK_SIZE = 5000
 
 
 def extract_claims_and_transactions(
@@ -132,6 +136,44 @@ def summarize_claim_portfolio(exposures: Sequence[dict[str, Any]]) -> dict[str,
     }
 
 
+def model_portfolio_exposures(
+    claims: Sequence[ClaimRecord],
+    grouped: dict[str, list[ClaimTransaction]],
+    *,
+    layout: columnar.ClaimLayout | None = None,
+) -> list[dict[str, Any]]:
+    """Exposure details for every claim, vectorized when NumPy is available."""
+    if columnar.numpy_available():
+        return columnar.model_exposures_columnar(
+            claims,
+            grouped,
+            layout=layout,
+            payment_indicators=PAYMENT_INDICATORS,
+            high_statuses=HIGH_SEVERITY_STATUSES,
+            low_statuses=LOW_SEVERITY_STATUSES,
+            severity_factors=SEVERITY_FACTORS,
+        )
+    return [model_loss_exposure(claim, grouped.get(claim.claim_id, [])) for claim in claims]
+
+
+def _model_and_validate(
+    claims: Sequence[ClaimRecord], grouped: dict[str, list[ClaimTransaction]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Exposures and validations for `claims`, sharing one columnar layout when NumPy is available."""
+    layout = columnar.ClaimLayout.build(claims, grouped) if columnar.numpy_available() else None
+    return model_portfolio_exposures(claims, grouped, layout=layout), validate_claims(claims, grouped, layout=layout)
+
+
+def summarize_portfolio_exposures(exposures: list[dict[str, Any]]) -> dict[str, Any]:
+    """`summarize_claim_portfolio` plus exposure percentiles and histograms."""
+    if columnar.numpy_available():
+        summary = columnar.summarize_exposure_columns(columnar.exposure_columns_from_details(exposures), exposures)
+    else:
+        summary = summarize_claim_portfolio(exposures)
+    summary["exposure_distribution"] = columnar.exposure_distribution(exposures)
+    return summary
+
+
 def summarize_validation_results(validation_results: dict[str, dict[str, Any]]) -> dict[str, Any]:
     """Aggregate validation results across claims."""
     failed_claims = [cid for cid, payload in validation_results.items() if not payload.get("is_valid", False)]
@@ -146,17 +188,111 @@ def summarize_validation_results(validation_results: dict[str, dict[str, Any]])
     }
 
 
-def analyze_claim_portfolio(
-    claims: Sequence[ClaimRecord], transactions: Sequence[ClaimTransaction]
+# Compact claim/transaction encoding for process-pool chunks: positional tuples
+# pickle far smaller and faster than the slotted dataclasses they stand for.
+_ClaimRow = tuple
+_TransactionRow = tuple
+
+
+def _encode_claim(claim: ClaimRecord, transactions: Sequence[ClaimTransaction]) -> tuple[_ClaimRow, list[_TransactionRow]]:
+    return (
+        (
+            claim.claim_id,
+            claim.dataset_version_id,
+            claim.policy_number,
+            claim.claim_number,
+            claim.claim_type,
+            claim.claim_status,
+            claim.reported_date,
+            claim.incident_date,
+            claim.claim_amount,
+            claim.currency,
+            claim.claimant_name,
+            claim.claimant_type,
+            claim.description,
+            claim.metadata or None,
+        ),
+        [
+            (
+                tx.transaction_id,
+                tx.transaction_type,
+                tx.transaction_date,
+                tx.amount,
+                tx.currency,
+                tx.description,
+                tx.metadata or None,
+            )
+            for tx in transactions
+        ],
+    )
+
+
+def _decode_claim(row: _ClaimRow, tx_rows: Sequence[_TransactionRow]) -> tuple[ClaimRecord, list[ClaimTransaction]]:
+    claim = ClaimRecord(*row[:13], metadata=row[13] or {})
+    transactions = [
+        ClaimTransaction(
+            transaction_id=tx_row[0],
+            claim_id=claim.claim_id,
+            dataset_version_id=claim.dataset_version_id,
+            transaction_type=tx_row[1],
+            transaction_date=tx_row[2],
+            amount=tx_row[3],
+            currency=tx_row[4],
+            description=tx_row[5],
+            metadata=tx_row[6] or {},
+        )
+        for tx_row in tx_rows
+    ]
+    return claim, transactions
+
+
+def _analyze_chunk(
+    chunk: Sequence[tuple[_ClaimRow, list[_TransactionRow]]]
+) -> tuple[list[dict[str, Any]], list[tuple[str, dict[str, Any]]]]:
+    """Exposure and validation for one encoded chunk; runs in a pool worker."""
+    claims: list[ClaimRecord] = []
+    grouped: dict[str, list[ClaimTransaction]] = {}
+    for row, tx_rows in chunk:
+        claim, transactions = _decode_claim(row, tx_rows)
+        claims.append(claim)
+        grouped[claim.claim_id] = transactions
+    exposures, results = _model_and_validate(claims, grouped)
+    return exposures, [(claim.claim_id, result) for claim, result in zip(claims, results)]
+
+
+async def analyze_claim_portfolio(
+    claims: Sequence[ClaimRecord],
+    transactions: Sequence[ClaimTransaction],
+    *,
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
 ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, dict[str, Any]], dict[str, Any]]:
-    """Build exposures, summary, validations, and validation summary for parsed claims."""
+    """
+    Build exposures, summary, validations, and validation summary for parsed claims.
+
+    Exposure modeling and validation are per-claim and pure, so portfolios larger
+    than `chunk_size` are split into encoded chunks and run on the shared process
+    pool when `workers` (default: `TODISCOPE_ENGINE_PARALLEL_WORKERS`) is above one,
+    without blocking the event loop. Chunk results are merged in claim order, so the
+    output matches a serial run.
+    Exposures and the portfolio summary use the columnar path when NumPy is
+    installed; the summary also carries `exposure_distribution`.
+    """
     grouped = group_transactions_by_claim(transactions)
-    exposures = [
-        model_loss_exposure(claim, grouped.get(claim.claim_id, [])) for claim in claims
-    ]
+    workers = configured_workers() if workers is None else workers
+    exposures: list[dict[str, Any]] = []
     validations: dict[str, dict[str, Any]] = {}
-    for claim in claims:
-        validations[claim.claim_id] = validate_claim(claim, grouped.get(claim.claim_id, []))
-    portfolio_summary = summarize_claim_portfolio(exposures)
+    if workers > 1 and len(claims) > chunk_size:
+        encoded = [_encode_claim(claim, grouped.get(claim.claim_id, [])) for claim in claims]
+        for chunk_exposures, chunk_validations in await map_chunks(
+            _analyze_chunk, chunked(encoded, chunk_size), workers=workers
+        ):
+            exposures.extend(chunk_exposures)
+            validations.update(chunk_validations)
+    else:
+        exposures, results = _model_and_validate(claims, grouped)
+        for claim, result in zip(claims, results):
+            validations[claim.claim_id] = result
+    portfolio_summary = summarize_portfolio_exposures(exposures)
     validation_summary = summarize_validation_results(validations)
     return exposures, portfolio_summary, validations, validation_summary
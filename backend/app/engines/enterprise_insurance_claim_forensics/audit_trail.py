@@ -1,18 +1,28 @@
-"""Audit trail functionality for forensic analysis of claim transactions."""
+"""
+Audit trail functionality for forensic analysis of claim transactions.
+
+Entries are buffered: each `log_*` call computes its deterministic evidence ID
+and returns it immediately, and `AuditTrail.flush` writes the whole buffer at
+once. The flush prefetches existing evidence with `IN (...)` queries, verifies
+immutability in memory and inserts the missing records with multi-row
+statements, so a run costs a handful of round-trips instead of two per claim
+and per transaction. Each flush also writes an `audit_trail_batch` evidence
+record listing the batch's evidence IDs in log order.
+"""
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
+import hashlib
 from typing import Any
-import logging
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.evidence.models import EvidenceRecord
 from backend.app.core.evidence.service import (
-    create_evidence,
+    DEFAULT_BULK_INSERT_BATCH_SIZE,
+    EvidenceBatch,
     deterministic_evidence_id,
+    persist_evidence_batch,
 )
 from backend.app.engines.enterprise_insurance_claim_forensics.constants import ENGINE_ID
 from backend.app.engines.enterprise_insurance_claim_forensics.claims_management import (
@@ -21,62 +31,6 @@ from backend.app.engines.enterprise_insurance_claim_forensics.claims_management
 )
 from backend.app.engines.enterprise_insurance_claim_forensics.errors import ImmutableConflictError
 
-logger = logging.getLogger(__name__)
-
-
-async def _strict_create_evidence(
-    db: AsyncSession,
-    *,
-    evidence_id: str,
-    dataset_version_id: str,
-    engine_id: str,
-    kind: str,
-    payload: dict[str, Any],
-    created_at: datetime,
-) -> EvidenceRecord:
-    """
-    Create evidence with immutability conflict detection.
-
-    Follows the pattern from other engines for consistency.
-    """
-    existing = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == evidence_id))
-    if existing is not None:
-        if existing.dataset_version_id != dataset_version_id or existing.engine_id != engine_id or existing.kind != kind:
-            logger.warning(
-                "INSURANCE_CLAIM_IMMUTABLE_CONFLICT evidence_id_collision evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("EVIDENCE_ID_COLLISION")
-        existing_created_at = existing.created_at
-        if existing_created_at.tzinfo is None:
-            existing_created_at = existing_created_at.replace(tzinfo=timezone.utc)
-        normalized_created_at = created_at if created_at.tzinfo is not None else created_at.replace(tzinfo=timezone.utc)
-        if existing_created_at != normalized_created_at:
-            logger.warning(
-                "INSURANCE_CLAIM_IMMUTABLE_CONFLICT evidence_created_at_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_CREATED_AT_MISMATCH")
-        if existing.payload != payload:
-            logger.warning(
-                "INSURANCE_CLAIM_IMMUTABLE_CONFLICT evidence_payload_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_MISMATCH")
-        return existing
-    return await create_evidence(
-        db,
-        evidence_id=evidence_id,
-        dataset_version_id=dataset_version_id,
-        engine_id=engine_id,
-        kind=kind,
-        payload=payload,
-        created_at=created_at,
-    )
-
 
 class AuditTrail:
     """Audit trail manager for claim transactions and interactions."""
@@ -92,6 +46,92 @@ class AuditTrail:
         self.db = db
         self.dataset_version_id = dataset_version_id
         self._entries: list[dict[str, Any]] = []
+        self._pending = self._new_batch()
+        self._batch_evidence_ids: list[str] = []
+
+    def _new_batch(self) -> EvidenceBatch:
+        return EvidenceBatch(
+            dataset_version_id=self.dataset_version_id,
+            log_prefix="INSURANCE_CLAIM",
+            conflict_error=ImmutableConflictError,
+        )
+
+    def _buffer(self, *, evidence_id: str, payload: dict[str, Any], created_at: datetime) -> None:
+        # Logging the same entry twice is idempotent; different data under one ID is a conflict.
+        self._pending.add_evidence(
+            {
+                "evidence_id": evidence_id,
+                "dataset_version_id": self.dataset_version_id,
+                "engine_id": ENGINE_ID,
+                "kind": "audit_trail",
+                "payload": payload,
+                "created_at": created_at,
+            }
+        )
+
+    async def flush(
+        self,
+        *,
+        created_at: datetime,
+        batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+    ) -> str | None:
+        """
+        Persist buffered entries and a batch summary record.
+
+        Args:
+            created_at: Timestamp of the batch summary record
+            batch_size: Maximum IDs per prefetch query and rows per insert
+
+        Returns:
+            Evidence ID of the batch summary, or None if nothing was buffered
+
+        Existing records are verified, not rewritten; nothing is inserted if one
+        conflicts. Rows are flushed, not committed; the caller owns the transaction.
+        """
+        if batch_size < 1:
+            raise ValueError("AUDIT_TRAIL_BATCH_SIZE_INVALID")
+        if not self._pending.evidence:
+            return None
+
+        evidence_ids = list(self._pending.evidence)
+        action_counts: dict[str, int] = {}
+        for row in self._pending.evidence.values():
+            action = row["payload"]["action"]
+            action_counts[action] = action_counts.get(action, 0) + 1
+        batch_digest = hashlib.sha256("\n".join(evidence_ids).encode("utf-8")).hexdigest()
+        batch_evidence_id = deterministic_evidence_id(
+            dataset_version_id=self.dataset_version_id,
+            engine_id=ENGINE_ID,
+            kind="audit_trail_batch",
+            stable_key=f"audit_trail_batch_{batch_digest}",
+        )
+        # A failed flush leaves the buffer as it was.
+        flushed = self._new_batch()
+        flushed.evidence.update(self._pending.evidence)
+        flushed.add_evidence(
+            {
+                "evidence_id": batch_evidence_id,
+                "dataset_version_id": self.dataset_version_id,
+                "engine_id": ENGINE_ID,
+                "kind": "audit_trail_batch",
+                "payload": {
+                    "action": "batch",
+                    "timestamp": created_at.isoformat(),
+                    "details": {
+                        "entry_count": len(evidence_ids),
+                        "action_counts": action_counts,
+                        "batch_digest": batch_digest,
+                        "evidence_ids": evidence_ids,
+                    },
+                },
+                "created_at": created_at,
+            }
+        )
+
+        await persist_evidence_batch(self.db, flushed, batch_size=batch_size)
+        self._pending = self._new_batch()
+        self._batch_evidence_ids.append(batch_evidence_id)
+        return batch_evidence_id
 
     async def log_claim_creation(
         self,
@@ -132,12 +172,8 @@ class AuditTrail:
             stable_key=f"claim_creation_{claim.claim_id}",
         )
 
-        evidence = await _strict_create_evidence(
-            self.db,
+        self._buffer(
             evidence_id=evidence_id,
-            dataset_version_id=self.dataset_version_id,
-            engine_id=ENGINE_ID,
-            kind="audit_trail",
             payload={
                 "action": "claim_creation",
                 "timestamp": created_at.isoformat(),
@@ -185,12 +221,8 @@ class AuditTrail:
             stable_key=f"claim_update_{claim_id}_{updated_at.isoformat()}",
         )
 
-        evidence = await _strict_create_evidence(
-            self.db,
+        self._buffer(
             evidence_id=evidence_id,
-            dataset_version_id=self.dataset_version_id,
-            engine_id=ENGINE_ID,
-            kind="audit_trail",
             payload={
                 "action": "claim_update",
                 "timestamp": updated_at.isoformat(),
@@ -242,12 +274,8 @@ class AuditTrail:
             stable_key=f"transaction_{transaction.transaction_id}",
         )
 
-        evidence = await _strict_create_evidence(
-            self.db,
+        self._buffer(
             evidence_id=evidence_id,
-            dataset_version_id=self.dataset_version_id,
-            engine_id=ENGINE_ID,
-            kind="audit_trail",
             payload={
                 "action": "transaction",
                 "timestamp": created_at.isoformat(),
@@ -296,12 +324,8 @@ class AuditTrail:
             stable_key=f"validation_{claim_id}_{validated_at.isoformat()}",
         )
 
-        evidence = await _strict_create_evidence(
-            self.db,
+        self._buffer(
             evidence_id=evidence_id,
-            dataset_version_id=self.dataset_version_id,
-            engine_id=ENGINE_ID,
-            kind="audit_trail",
             payload={
                 "action": "validation",
                 "timestamp": validated_at.isoformat(),
@@ -352,12 +376,8 @@ class AuditTrail:
             stable_key=f"forensic_analysis_{claim_id}_{analysis_type}_{analyzed_at.isoformat()}",
         )
 
-        evidence = await _strict_create_evidence(
-            self.db,
+        self._buffer(
             evidence_id=evidence_id,
-            dataset_version_id=self.dataset_version_id,
-            engine_id=ENGINE_ID,
-            kind="audit_trail",
             payload={
                 "action": "forensic_analysis",
                 "timestamp": analyzed_at.isoformat(),
@@ -391,5 +411,6 @@ class AuditTrail:
             "total_entries": len(self._entries),
             "action_counts": action_counts,
             "dataset_version_id": self.dataset_version_id,
+            "batch_evidence_ids": list(self._batch_evidence_ids),
         }
 
@@ -0,0 +1,327 @@
+"""
+Columnar exposure modeling and portfolio aggregation.
+
+Claims and transactions are laid out as NumPy arrays, with every transaction
+tagged by the index of its claim group (claims sharing a claim_id share their
+transactions, as in `group_transactions_by_claim`). Same-currency and paid totals
+then come from `bincount` over (claim group, currency) keys instead of
+re-filtering each claim's transactions, and severity, expected loss and evidence
+ranges are computed as array expressions.
+
+Totals accumulate left to right (`bincount`, `cumsum`), while `model_loss_exposure`
+and `summarize_claim_portfolio` use `sum`. Up to Python 3.11 that is the same
+order, so results are bit-identical. From 3.12 `sum` compensates float rounding,
+so the two paths can disagree in the last bits of a total. After rounding to
+cents that shows only when a total lands on a half cent, or when magnitudes make
+cents unrepresentable, so values may differ by one cent. Rounding stays with
+Python's `round` (NumPy rounds some halves differently). A `ClaimLayout` built
+once can be shared by exposure modeling and `currency_mismatches`, which applies it
+to the currency consistency rule. NumPy is optional; without it callers keep the
+per-claim path, and `exposure_distribution` uses a pure-Python fallback with the
+same percentile and histogram definitions.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+import math
+from typing import Any, Mapping, Sequence
+
+from .claims_management import ClaimRecord, ClaimTransaction
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+SEVERITY_LEVELS = ("low", "medium", "high")
+DISTRIBUTION_PERCENTILES = (50, 75, 90, 95, 99)
+DISTRIBUTION_BINS = 10
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+@dataclass(frozen=True)
+class ExposureColumns:
+    """Per-claim exposure values as arrays, rounded exactly as in the exposure details."""
+    claim_amount: Any
+    outstanding_exposure: Any
+    expected_loss: Any
+    severity: Any
+    severity_levels: tuple[str, ...]
+
+
+def round2(values: Any) -> list[float]:
+    """
+    `[round(v, 2) for v in values]` for a float array, exactly.
+
+    `rint(v * 100) / 100` picks the same integer k as Python's correctly rounded
+    `round` unless `v * 100` lies within its own rounding error of a half (or the
+    value is huge or not finite); those entries are rounded by Python. k / 100 is
+    then the same nearest double in both.
+    """
+    scaled = values * 100.0
+    rounded = np.rint(scaled) / 100.0
+    with np.errstate(invalid="ignore"):
+        distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    suspect = ~np.isfinite(scaled) | (np.abs(scaled) >= 2.0**50) | (distance <= np.abs(scaled) * 2.0**-50 + 2.0**-60)
+    result = rounded.tolist()
+    for index in np.flatnonzero(suspect).tolist():
+        result[index] = round(float(values[index]), 2)
+    return result
+
+
+@dataclass(frozen=True)
+class ClaimLayout:
+    """Claims grouped by claim_id, with their transactions flattened in group order."""
+    group_transactions: list[Sequence[ClaimTransaction]]
+    transactions: list[ClaimTransaction]
+    claim_group: Any
+    claim_currency: Any
+    tx_group: Any
+    tx_currency: Any
+    currency_count: int
+
+    @classmethod
+    def build(cls, claims: Sequence[ClaimRecord], grouped: Mapping[str, Sequence[ClaimTransaction]]) -> ClaimLayout:
+        if np is None:
+            raise RuntimeError("NUMPY_UNAVAILABLE")
+        group_of: dict[str, int] = {}
+        currency_of: dict[str, int] = {}
+        group_transactions: list[Sequence[ClaimTransaction]] = []
+        claim_groups: list[int] = []
+        for claim in claims:
+            group = group_of.get(claim.claim_id)
+            if group is None:
+                group = group_of[claim.claim_id] = len(group_transactions)
+                group_transactions.append(grouped.get(claim.claim_id, ()))
+            claim_groups.append(group)
+        claim_currency = [currency_of.setdefault(claim.currency, len(currency_of)) for claim in claims]
+        transactions = [tx for items in group_transactions for tx in items]
+        tx_currency = [currency_of.setdefault(tx.currency, len(currency_of)) for tx in transactions]
+        group_sizes = np.fromiter((len(items) for items in group_transactions), np.int64, len(group_transactions))
+        return cls(
+            group_transactions=group_transactions,
+            transactions=transactions,
+            claim_group=np.array(claim_groups, dtype=np.int64),
+            claim_currency=np.array(claim_currency, dtype=np.int64),
+            tx_group=np.repeat(np.arange(len(group_transactions), dtype=np.int64), group_sizes),
+            tx_currency=np.array(tx_currency, dtype=np.int64),
+            currency_count=len(currency_of),
+        )
+
+
+def model_exposures_columnar(
+    claims: Sequence[ClaimRecord],
+    grouped: Mapping[str, Sequence[ClaimTransaction]],
+    *,
+    payment_indicators: frozenset[str] | set[str],
+    high_statuses: frozenset[str] | set[str],
+    low_statuses: frozenset[str] | set[str],
+    severity_factors: Mapping[str, float],
+    layout: ClaimLayout | None = None,
+) -> list[dict[str, Any]]:
+    """Vectorized `model_loss_exposure` for a whole portfolio; requires NumPy."""
+    layout = ClaimLayout.build(claims, grouped) if layout is None else layout
+    group_transactions, claim_group, flat = layout.group_transactions, layout.claim_group, layout.transactions
+    statuses = [claim.claim_status.lower() for claim in claims]
+    claim_amount = np.array([claim.claim_amount for claim in claims], dtype=np.float64)
+    status_high = np.array([status in high_statuses for status in statuses], dtype=bool)
+    status_low = np.array([status in low_statuses for status in statuses], dtype=bool)
+    tx_amount = np.array([tx.amount for tx in flat], dtype=np.float64)
+    tx_payment = np.array([tx.transaction_type.lower() in payment_indicators for tx in flat], dtype=bool)
+
+    # One bucket per (claim group, currency); each claim reads the bucket of its own currency.
+    currencies = max(layout.currency_count, 1)
+    buckets = len(group_transactions) * currencies
+    tx_key = layout.tx_group * currencies + layout.tx_currency
+    claim_key = claim_group * currencies + layout.claim_currency
+    same_total = np.bincount(tx_key, weights=tx_amount, minlength=buckets)[claim_key]
+    same_count = np.bincount(tx_key, minlength=buckets)[claim_key]
+    paid_total = np.bincount(tx_key[tx_payment], weights=tx_amount[tx_payment], minlength=buckets)[claim_key]
+    paid_count = np.bincount(tx_key[tx_payment], minlength=buckets)[claim_key]
+
+    exposure = np.maximum(claim_amount - paid_total, 0.0)
+    high = status_high | ((claim_amount > 0) & (exposure >= claim_amount * 0.4))
+    severity = np.where(exposure == 0, 0, np.where(high, 2, np.where(status_low, 0, 1)))
+    factors = np.array([severity_factors[level] for level in SEVERITY_LEVELS])[severity]
+    expected_loss = exposure * factors
+    difference = np.abs(claim_amount - same_total)
+    tolerance = np.maximum(0.02 * np.maximum(claim_amount, 1.0), difference * 0.5)
+    lower = np.maximum(0.0, np.minimum(claim_amount, same_total) - tolerance)
+    upper = np.maximum(claim_amount, same_total) + tolerance
+
+    # Python's sum of no transactions is the int 0; keep payloads identical.
+    tx_totals = [total if count else 0 for total, count in zip(round2(same_total), same_count.tolist())]
+    paid_totals = [total if count else 0 for total, count in zip(round2(paid_total), paid_count.tolist())]
+    details: list[dict[str, Any]] = []
+    rows = zip(
+        claims,
+        claim_group.tolist(),
+        round2(claim_amount),
+        tx_totals,
+        paid_totals,
+        round2(exposure),
+        severity.tolist(),
+        round2(expected_loss),
+        round2(lower),
+        round2(upper),
+        round2(tolerance),
+    )
+    for claim, group, amount, tx_total, paid, outstanding, code, expected, low, up, buffer in rows:
+        level = SEVERITY_LEVELS[code]
+        details.append(
+            {
+                "claim_id": claim.claim_id,
+                "policy_number": claim.policy_number,
+                "claim_number": claim.claim_number,
+                "claim_type": claim.claim_type,
+                "claim_status": claim.claim_status,
+                "claim_amount": amount if isinstance(claim.claim_amount, float) else round(claim.claim_amount, 2),
+                "currency": claim.currency,
+                "paid_amount": paid,
+                "transaction_total": tx_total,
+                "outstanding_exposure": outstanding,
+                "severity": level,
+                "severity_factor": severity_factors[level],
+                "expected_loss": expected,
+                "evidence_range": {
+                    "lower_bound": low,
+                    "upper_bound": up,
+                    "confidence_buffer": buffer,
+                    "evidence_total": tx_total,
+                    "transaction_ids": [tx.transaction_id for tx in group_transactions[group]],
+                },
+            }
+        )
+    return details
+
+
+def currency_mismatches(
+    claims: Sequence[ClaimRecord],
+    grouped: Mapping[str, Sequence[ClaimTransaction]],
+    *,
+    layout: ClaimLayout | None = None,
+) -> list[list[ClaimTransaction]]:
+    """Per claim, the transactions whose currency differs from the claim's, in order; requires NumPy."""
+    layout = ClaimLayout.build(claims, grouped) if layout is None else layout
+    currencies = max(layout.currency_count, 1)
+    group_sizes = np.bincount(layout.tx_group, minlength=len(layout.group_transactions))
+    same_count = np.bincount(
+        layout.tx_group * currencies + layout.tx_currency, minlength=len(layout.group_transactions) * currencies
+    )[layout.claim_group * currencies + layout.claim_currency]
+    sizes = group_sizes[layout.claim_group]
+    mismatched: list[list[ClaimTransaction]] = [[] for _ in claims]
+    # Only claims with a mismatch are expanded to one row per (claim, transaction).
+    flagged = np.flatnonzero(sizes - same_count)
+    if flagged.size:
+        sizes = sizes[flagged]
+        starts = (np.cumsum(group_sizes) - group_sizes)[layout.claim_group[flagged]]
+        positions = np.repeat(starts - (np.cumsum(sizes) - sizes), sizes) + np.arange(int(sizes.sum()))
+        owners = np.repeat(flagged, sizes)
+        mask = layout.tx_currency[positions] != layout.claim_currency[owners]
+        for owner, position in zip(owners[mask].tolist(), positions[mask].tolist()):
+            mismatched[owner].append(layout.transactions[position])
+    return mismatched
+
+
+def exposure_columns_from_details(exposures: Sequence[Mapping[str, Any]]) -> ExposureColumns:
+    """Summary columns of exposure details, with the rounded values the details carry."""
+    if np is None:
+        raise RuntimeError("NUMPY_UNAVAILABLE")
+    levels: dict[str, int] = {}
+    count = len(exposures)
+    return ExposureColumns(
+        claim_amount=np.fromiter((d.get("claim_amount", 0.0) for d in exposures), np.float64, count),
+        outstanding_exposure=np.fromiter((d.get("outstanding_exposure", 0.0) for d in exposures), np.float64, count),
+        expected_loss=np.fromiter((d.get("expected_loss", 0.0) for d in exposures), np.float64, count),
+        severity=np.fromiter(
+            (levels.setdefault(d.get("severity", "medium"), len(levels)) for d in exposures), np.int64, count
+        ),
+        severity_levels=tuple(levels),
+    )
+
+
+def _sequential_sum(values: Any) -> float:
+    return float(np.cumsum(values)[-1]) if len(values) else 0
+
+
+def summarize_exposure_columns(columns: ExposureColumns, exposures: list[dict[str, Any]]) -> dict[str, Any]:
+    """Vectorized `summarize_claim_portfolio`; `exposures` is passed through as `claims`."""
+    levels = len(columns.severity_levels)
+    claim_counts = np.bincount(columns.severity, minlength=levels).tolist()
+    outstanding = np.bincount(columns.severity, weights=columns.outstanding_exposure, minlength=levels).tolist()
+    expected = np.bincount(columns.severity, weights=columns.expected_loss, minlength=levels).tolist()
+    # Severity levels are numbered in order of first appearance, matching the dict rollup.
+    severity_rollup = {
+        level: {
+            "claims": claim_counts[code],
+            "total_outstanding": round(outstanding[code], 2),
+            "expected_loss": round(expected[code], 2),
+        }
+        for code, level in enumerate(columns.severity_levels)
+    }
+    return {
+        "total_claims": len(exposures),
+        "total_claim_amount": round(_sequential_sum(columns.claim_amount), 2),
+        "total_outstanding_exposure": round(_sequential_sum(columns.outstanding_exposure), 2),
+        "by_severity": severity_rollup,
+        "claims": exposures,
+    }
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    # NumPy's default "linear" method, including its interpolation formula.
+    index = (len(ordered) - 1) * q / 100
+    below = math.floor(index)
+    above = min(below + 1, len(ordered) - 1)
+    a, b, t = ordered[below], ordered[above], index - below
+    return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+
+
+def _histogram(values: Sequence[float], bins: int) -> tuple[list[float], list[int]]:
+    # Equal-width bins over [min, max] like numpy.histogram; the last bin is closed.
+    first, last = min(values), max(values)
+    if first == last:
+        first, last = first - 0.5, last + 0.5
+    step = (last - first) / bins
+    edges = [first + step * index for index in range(bins)] + [last]
+    counts = [0] * bins
+    for value in values:
+        counts[min(bisect_right(edges, value) - 1, bins - 1)] += 1
+    return edges, counts
+
+
+def _distribution(values: Sequence[float], percentiles: Sequence[int], bins: int) -> dict[str, Any]:
+    if not len(values):
+        return {"percentiles": {}, "histogram": {"bin_edges": [], "counts": []}}
+    if np is not None:
+        array = np.asarray(values, dtype=np.float64)
+        points = np.percentile(array, percentiles).tolist()
+        counts, edges = np.histogram(array, bins=bins)
+        counts, edges = counts.tolist(), edges.tolist()
+    else:
+        ordered = sorted(values)
+        points = [_percentile(ordered, q) for q in percentiles]
+        edges, counts = _histogram(ordered, bins)
+    return {
+        "percentiles": {f"p{q}": round(point, 2) for q, point in zip(percentiles, points)},
+        "histogram": {"bin_edges": [round(edge, 2) for edge in edges], "counts": counts},
+    }
+
+
+def exposure_distribution(
+    exposures: Sequence[Mapping[str, Any]],
+    *,
+    percentiles: Sequence[int] = DISTRIBUTION_PERCENTILES,
+    bins: int = DISTRIBUTION_BINS,
+) -> dict[str, Any]:
+    """Portfolio percentiles and histograms of outstanding exposure and expected loss."""
+    return {
+        metric: _distribution([float(d.get(metric, 0.0)) for d in exposures], percentiles, bins)
+        for metric in ("outstanding_exposure", "expected_loss")
+    }
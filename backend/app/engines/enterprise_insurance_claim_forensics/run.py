@@ -12,7 +12,7 @@ from sqlalchemy import select
 
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.core.evidence.service import (
     create_evidence,
@@ -34,6 +34,7 @@ from backend.app.engines.enterprise_insurance_claim_forensics.readiness_scores i
 from backend.app.engines.enterprise_insurance_claim_forensics.remediation import (
     build_remediation_tasks,
 )
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.review.service import ensure_review_item
 from backend.app.engines.enterprise_insurance_claim_forensics.audit_trail import AuditTrail
 from backend.app.engines.enterprise_insurance_claim_forensics.errors import (
@@ -454,6 +455,7 @@ async def _persist_findings(
     return extra_entries
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(*, dataset_version_id: object, started_at: object, parameters: object | None = None) -> dict[str, Any]:
     install_immutability_guards()
     dv_id = _validate_dataset_version_id(dataset_version_id)
@@ -461,10 +463,10 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
     validated_parameters = _validate_parameters(parameters)
     assumptions = MODEL_ASSUMPTIONS + _collect_assumptions(validated_parameters)
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dataset_version = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dataset_version is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         normalized_records = (
@@ -481,7 +483,8 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         if not claims:
             raise ClaimPayloadMissingError("CLAIMS_REQUIRED")
 
-        exposures, portfolio_summary, validation_results, validation_summary = analyze_claim_portfolio(
+        mark_stage("model")
+        exposures, portfolio_summary, validation_results, validation_summary = await analyze_claim_portfolio(
             claims, transactions
         )
 
@@ -511,6 +514,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             readiness_scores=readiness_scores_result.get("claim_scores"),
         )
 
+        mark_stage("persist")
         audit = AuditTrail(db, dataset_version_id=dv_id)
         for claim in claims:
             await audit.log_claim_creation(claim, created_at=started)
@@ -530,6 +534,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
                     analysis_result=exposure_payload,
                     analyzed_at=started,
                 )
+        await audit.flush(created_at=started)
 
         completed = datetime.now(timezone.utc)
         base_entries = audit.get_entries()
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Mapping, Sequence
 
+from backend.app.engines.enterprise_insurance_claim_forensics import columnar
 from backend.app.engines.enterprise_insurance_claim_forensics.claims_management import (
     ClaimRecord,
     ClaimTransaction,
@@ -171,7 +172,10 @@ class CurrencyConsistencyRule(ClaimValidationRule):
                 "message": "No transactions to validate",
             }
 
-        mismatched = [t for t in transactions if t.currency != claim.currency]
+        return self.result(claim, [t for t in transactions if t.currency != claim.currency])
+
+    def result(self, claim: ClaimRecord, mismatched: list[ClaimTransaction]) -> dict[str, Any]:
+        """Rule result for a claim with transactions, given its mismatched transactions."""
         is_valid = len(mismatched) == 0
 
         return {
@@ -238,27 +242,40 @@ class ClaimStatusConsistencyRule(ClaimValidationRule):
         }
 
 
+CURRENCY_CONSISTENCY_RULE = CurrencyConsistencyRule()
+
 # Registry of all validation rules
 VALIDATION_RULES: list[ClaimValidationRule] = [
     ClaimAmountConsistencyRule(),
     ClaimDateConsistencyRule(),
     TransactionDateConsistencyRule(),
-    CurrencyConsistencyRule(),
+    CURRENCY_CONSISTENCY_RULE,
     ClaimStatusConsistencyRule(),
 ]
 
 
 def validate_claim(
-    claim: ClaimRecord, transactions: list[ClaimTransaction]
+    claim: ClaimRecord,
+    transactions: list[ClaimTransaction],
+    *,
+    precomputed: Mapping[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    """Run all validation rules on a claim and its transactions."""
+    """
+    Run all validation rules on a claim and its transactions.
+
+    Rule results in `precomputed` (by rule_id) were produced by a batched pass and
+    are used instead of running those rules again.
+    """
     results = {}
     errors = []
     warnings = []
+    precomputed = precomputed or {}
 
     for rule in VALIDATION_RULES:
         try:
-            result = rule.validate(claim, transactions)
+            result = precomputed.get(rule.rule_id)
+            if result is None:
+                result = rule.validate(claim, transactions)
             results[rule.rule_id] = result
 
             if not result.get("is_valid", True):
@@ -294,7 +311,28 @@ def validate_claim(
     }
 
 
-
-
-
-
+def validate_claims(
+    claims: Sequence[ClaimRecord],
+    grouped: Mapping[str, list[ClaimTransaction]],
+    *,
+    layout: columnar.ClaimLayout | None = None,
+) -> list[dict[str, Any]]:
+    """
+    `validate_claim` for each claim, in order.
+
+    With NumPy installed the currency consistency rule runs once over the whole
+    portfolio (`columnar.currency_mismatches`) instead of once per claim; pass the
+    `layout` already built for these claims to reuse it.
+    """
+    mismatches = (
+        columnar.currency_mismatches(claims, grouped, layout=layout) if columnar.numpy_available() else None
+    )
+    results: list[dict[str, Any]] = []
+    for index, claim in enumerate(claims):
+        transactions = grouped.get(claim.claim_id, [])
+        precomputed = None
+        if mismatches is not None and transactions:
+            rule = CURRENCY_CONSISTENCY_RULE
+            precomputed = {rule.rule_id: rule.result(claim, mismatches[index])}
+        results.append(validate_claim(claim, transactions, precomputed=precomputed))
+    return results
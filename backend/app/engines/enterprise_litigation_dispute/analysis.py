@@ -326,3 +326,101 @@ def legal_consistency_payload(assessment: LegalConsistencyCheck) -> dict[str, An
         "confidence": assessment.confidence,
         "assumptions": assessment.assumptions,
     }
+
+
+ANALYSIS_SECTIONS = ("damage", "liability", "scenario", "legal_consistency")
+
+
+def analyze_dispute(*, dataset_version_id: str, dispute_payload: dict[str, Any], assumptions: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """All four analyses of one dispute as payload dicts, keyed by section."""
+    return {
+        "damage": damage_payload(
+            quantify_damages(dataset_version_id=dataset_version_id, dispute_payload=dispute_payload, assumptions=assumptions)
+        ),
+        "liability": liability_payload(
+            assess_liability(dataset_version_id=dataset_version_id, dispute_payload=dispute_payload, assumptions=assumptions)
+        ),
+        "scenario": scenario_payload(
+            compare_scenarios(dataset_version_id=dataset_version_id, dispute_payload=dispute_payload, assumptions=assumptions)
+        ),
+        "legal_consistency": legal_consistency_payload(
+            evaluate_legal_consistency(dataset_version_id=dataset_version_id, dispute_payload=dispute_payload, assumptions=assumptions)
+        ),
+    }
+
+
+def aggregate_assumptions(results: dict[str, dict[str, Any]]) -> list[dict[str, str]]:
+    aggregated: list[dict[str, str]] = []
+    for key in ANALYSIS_SECTIONS:
+        section = results[key].get("assumptions")
+        if isinstance(section, list):
+            aggregated.extend(section)
+    return aggregated
+
+
+def finding_specs(results: dict[str, dict[str, Any]]) -> list[tuple[str, str, str, str, str, Any, Any, Any, dict[str, Any]]]:
+    """(key, category, metric, title, description, value, status, confidence, details) per finding."""
+    damage_info = results["damage"]
+    liability_info = results["liability"]
+    scenario_info = results["scenario"]
+    consistency_info = results["legal_consistency"]
+    return [
+        (
+            "damage",
+            "legal_damage",
+            "net_damage",
+            "Damage Quantification",
+            "Net legal damages after mitigation.",
+            damage_info["net_damage"],
+            damage_info["severity"],
+            damage_info["confidence"],
+            {
+                "gross_damages": damage_info["gross_damages"],
+                "mitigation": damage_info["mitigation"],
+                "severity_score": damage_info["severity_score"],
+            },
+        ),
+        (
+            "liability",
+            "liability",
+            "responsibility_pct",
+            "Liability Assessment",
+            "Estimated party liability exposure.",
+            liability_info["responsibility_pct"],
+            liability_info["liability_strength"],
+            liability_info["confidence"],
+            {
+                "responsible_party": liability_info["responsible_party"],
+                "evidence_strength": liability_info["evidence_strength"],
+                "indicators": liability_info["indicators"],
+            },
+        ),
+        (
+            "scenario",
+            "scenario_analysis",
+            "best_case_loss",
+            "Scenario Comparison",
+            "Preferred and worst-case exposures.",
+            scenario_info.get("best_case", {}).get("expected_loss") if scenario_info.get("best_case") else 0.0,
+            scenario_info.get("best_case", {}).get("name") if scenario_info.get("best_case") else "n/a",
+            "medium",
+            {
+                "total_probability": scenario_info.get("total_probability"),
+                "best_case": scenario_info.get("best_case"),
+                "worst_case": scenario_info.get("worst_case"),
+            },
+        ),
+        (
+            "legal_consistency",
+            "legal_consistency",
+            "consistent",
+            "Legal Consistency Check",
+            "Checks for conflicting statutes and missing support.",
+            float(1 if consistency_info.get("consistent") else 0),
+            "pass" if consistency_info.get("consistent") else "attention",
+            consistency_info.get("confidence"),
+            {
+                "issues": consistency_info.get("issues"),
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+"""
+Set-based persistence for litigation portfolio runs.
+
+A portfolio run collects the evidence, findings, links and engine finding rows of
+every dispute into a `PersistenceBatch` (all IDs are deterministic, so they are
+known up front). `persist_batch` writes the findings, evidence and links with
+core's `persist_evidence_batch`, which prefetches existing rows per table and
+chunk, verifies their immutability in memory and inserts only the missing rows
+with multi-row statements. Conflicts raise `ImmutableConflictError` before
+anything is inserted; an existing run record and engine finding rows are kept as
+they are.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.service import (
+    DEFAULT_BULK_INSERT_BATCH_SIZE,
+    EvidenceBatch,
+    existing_ids,
+    persist_evidence_batch,
+)
+from backend.app.engines.enterprise_litigation_dispute.errors import ImmutableConflictError
+from backend.app.engines.enterprise_litigation_dispute.models import (
+    EnterpriseLitigationDisputeFinding,
+    EnterpriseLitigationDisputeRun,
+)
+
+
+@dataclass
+class PersistenceBatch(EvidenceBatch):
+    """Rows of one run keyed by primary key, in insertion order."""
+    log_prefix: str = "LITIGATION"
+    conflict_error: type[Exception] = ImmutableConflictError
+    run: dict[str, Any] | None = None
+    engine_findings: dict[str, dict] = field(default_factory=dict)
+
+    def add_engine_finding(self, row: dict) -> None:
+        self.add_row(self.engine_findings, row["finding_id"], row, "FINDING_ID_COLLISION")
+
+
+async def persist_batch(
+    db: AsyncSession,
+    batch: PersistenceBatch,
+    *,
+    batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE,
+) -> None:
+    """
+    Write the rows of `batch` that do not exist yet.
+
+    Round-trips grow with the number of `batch_size` chunks, not with the number
+    of disputes. Rows are flushed, not committed; the caller owns the transaction.
+    """
+    if batch_size < 1:
+        raise ValueError("PERSIST_BATCH_SIZE_INVALID")
+
+    await persist_evidence_batch(db, batch, batch_size=batch_size)
+
+    # Engine findings reference the run.
+    if batch.run is not None and not await existing_ids(
+        db, EnterpriseLitigationDisputeRun.run_id, [batch.run["run_id"]], batch_size=batch_size
+    ):
+        await db.execute(insert(EnterpriseLitigationDisputeRun), [batch.run])
+    found = await existing_ids(
+        db, EnterpriseLitigationDisputeFinding.finding_id, list(batch.engine_findings), batch_size=batch_size
+    )
+    engine_findings = [row for row_id, row in batch.engine_findings.items() if row_id not in found]
+    for start in range(0, len(engine_findings), batch_size):
+        await db.execute(insert(EnterpriseLitigationDisputeFinding), engine_findings[start : start + batch_size])
@@ -0,0 +1,335 @@
+"""
+Portfolio mode: analyze every dispute of a dataset version in one run.
+
+With `parameters.portfolio` set, `run_engine` hands every normalized record that
+carries a `legal_dispute` payload to `run_portfolio` instead of analyzing only
+the first one. Disputes are analyzed in chunks through `core.parallel.map_chunks`
+(in a process pool when `TODISCOPE_ENGINE_PARALLEL_WORKERS` is set), results keep
+record order, and all evidence, findings and links are written with one
+`persist_batch` call.
+
+Per-dispute IDs combine the run ID (a hash of the parameters) with the dispute's
+raw record ID, so reruns are idempotent and runs with different assumptions do
+not collide. `summarize_dispute_portfolio` adds portfolio rollups: exposure
+totals and ranges, and severity, liability and consistency distributions.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.service import deterministic_evidence_id
+from backend.app.core.parallel import chunked, map_chunks
+from backend.app.core.profiling import mark_stage
+from backend.app.engines.enterprise_litigation_dispute.analysis import (
+    ANALYSIS_SECTIONS,
+    aggregate_assumptions,
+    analyze_dispute,
+    finding_specs,
+)
+from backend.app.engines.enterprise_litigation_dispute.constants import ENGINE_ID
+from backend.app.engines.enterprise_litigation_dispute.ids import deterministic_id
+from backend.app.engines.enterprise_litigation_dispute.persistence import PersistenceBatch, persist_batch
+
+
+PARALLEL_CHUNK_SIZE = 500
+SEVERITY_LEVELS = ("low", "medium", "high")
+LIABILITY_LEVELS = ("weak", "moderate", "strong")
+
+
+def _analyze_chunk(
+    chunk: tuple[str, dict[str, Any], Sequence[tuple[str, dict[str, Any]]]],
+) -> list[dict[str, dict[str, Any]]]:
+    dataset_version_id, assumptions, disputes = chunk
+    return [
+        analyze_dispute(dataset_version_id=dataset_version_id, dispute_payload=payload, assumptions=assumptions)
+        for _, payload in disputes
+    ]
+
+
+async def analyze_dispute_portfolio(
+    *,
+    dataset_version_id: str,
+    disputes: Sequence[tuple[str, dict[str, Any]]],
+    assumptions: dict[str, Any],
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> list[dict[str, dict[str, Any]]]:
+    """`analyze_dispute` for each (raw_record_id, dispute_payload), in input order."""
+    chunks = [(dataset_version_id, assumptions, chunk) for chunk in chunked(disputes, chunk_size)]
+    return [result for results in await map_chunks(_analyze_chunk, chunks, workers=workers) for result in results]
+
+
+def _distribution(values: list[str], levels: Sequence[str]) -> dict[str, int]:
+    counts = {level: 0 for level in levels}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def summarize_dispute_portfolio(results: Sequence[dict[str, dict[str, Any]]]) -> dict[str, Any]:
+    """Portfolio rollups over per-dispute analysis results."""
+    damages = [result["damage"] for result in results]
+    scenarios = [result["scenario"] for result in results]
+    consistent = sum(1 for result in results if result["legal_consistency"].get("consistent"))
+    return {
+        "dispute_count": len(results),
+        "damage": {
+            "total_claim_value": round(sum(d["total_claim_value"] for d in damages), 2),
+            "total_gross_damages": round(sum(d["gross_damages"] for d in damages), 2),
+            "total_net_damage": round(sum(d["net_damage"] for d in damages), 2),
+            "max_net_damage": round(max((d["net_damage"] for d in damages), default=0.0), 2),
+            "severity_distribution": _distribution([d["severity"] for d in damages], SEVERITY_LEVELS),
+        },
+        "liability": {
+            "strength_distribution": _distribution(
+                [result["liability"]["liability_strength"] for result in results], LIABILITY_LEVELS
+            ),
+            "undetermined_parties": sum(
+                1 for result in results if result["liability"]["responsible_party"] == "undetermined"
+            ),
+        },
+        "scenario": {
+            # Summing per-dispute best and worst cases bounds the portfolio's expected loss.
+            "exposure_range": {
+                "lower_bound": round(sum((s["best_case"] or {}).get("expected_loss", 0.0) for s in scenarios), 2),
+                "upper_bound": round(sum((s["worst_case"] or {}).get("expected_loss", 0.0) for s in scenarios), 2),
+            },
+            "disputes_without_scenarios": sum(1 for s in scenarios if not s["scenarios"]),
+        },
+        "legal_consistency": {
+            "consistent": consistent,
+            "attention": len(results) - consistent,
+        },
+    }
+
+
+VARIES_PER_DISPUTE = "Varies per dispute; see each dispute's evidence."
+
+
+def _portfolio_assumptions(results: Sequence[dict[str, dict[str, Any]]]) -> list[dict[str, str]]:
+    """
+    One record per assumption ID, holding only text shared by every dispute.
+
+    Assumption texts can carry a dispute's own figures (e.g. its scenario
+    probability sum). A field that differs between disputes is replaced with
+    `VARIES_PER_DISPUTE`; the per-dispute text stays in that dispute's evidence.
+    """
+    assumptions: dict[str, dict[str, str]] = {}
+    for result in results:
+        for record in aggregate_assumptions(result):
+            portfolio_record = assumptions.setdefault(record["id"], dict(record))
+            for field, text in record.items():
+                if portfolio_record.get(field) != text:
+                    portfolio_record[field] = VARIES_PER_DISPUTE
+    return list(assumptions.values())
+
+
+def _evidence_row(
+    *, evidence_id: str, dataset_version_id: str, kind: str, payload: dict[str, Any], created_at: datetime
+) -> dict[str, Any]:
+    return {
+        "evidence_id": evidence_id,
+        "dataset_version_id": dataset_version_id,
+        "engine_id": ENGINE_ID,
+        "kind": kind,
+        "payload": payload,
+        "created_at": created_at,
+    }
+
+
+def _add_dispute(
+    batch: PersistenceBatch,
+    *,
+    run_id: str,
+    raw_record_id: str,
+    results: dict[str, dict[str, Any]],
+    created_at: datetime,
+) -> dict[str, Any]:
+    dv_id = batch.dataset_version_id
+    evidence_ids: dict[str, str] = {}
+    for key in ANALYSIS_SECTIONS:
+        payload = results[key]
+        evidence_ids[key] = deterministic_evidence_id(
+            dataset_version_id=dv_id,
+            engine_id=ENGINE_ID,
+            kind=key,
+            stable_key=f"{run_id}:{raw_record_id}",
+        )
+        batch.add_evidence(
+            _evidence_row(
+                evidence_id=evidence_ids[key],
+                dataset_version_id=dv_id,
+                kind=key,
+                payload={
+                    key: payload,
+                    "source_raw_record_id": raw_record_id,
+                    "assumptions": payload.get("assumptions"),
+                },
+                created_at=created_at,
+            )
+        )
+
+    finding_ids: list[str] = []
+    for key, category, metric, title, description, value, status, confidence, details in finding_specs(results):
+        finding_id = deterministic_id(dv_id, "finding", run_id, raw_record_id, key)
+        finding_payload = {
+            "id": finding_id,
+            "dataset_version_id": dv_id,
+            "raw_record_id": raw_record_id,
+            "title": title,
+            "category": category,
+            "metric": metric,
+            "description": description,
+            "value": value,
+            "threshold": 0.0,
+            "status": status,
+            "confidence": confidence,
+            "details": details,
+        }
+        finding_ids.append(finding_id)
+        batch.add_finding(
+            {
+                "finding_id": finding_id,
+                "dataset_version_id": dv_id,
+                "raw_record_id": raw_record_id,
+                "kind": category,
+                "payload": finding_payload,
+                "created_at": created_at,
+            }
+        )
+        finding_evidence_id = deterministic_evidence_id(
+            dataset_version_id=dv_id,
+            engine_id=ENGINE_ID,
+            kind="finding",
+            stable_key=finding_id,
+        )
+        batch.add_evidence(
+            _evidence_row(
+                evidence_id=finding_evidence_id,
+                dataset_version_id=dv_id,
+                kind="finding",
+                payload={
+                    "source_raw_record_id": raw_record_id,
+                    "finding": finding_payload,
+                    "result_evidence_ids": evidence_ids,
+                },
+                created_at=created_at,
+            )
+        )
+        batch.add_link(
+            {
+                "link_id": deterministic_id(dv_id, "link", finding_id, finding_evidence_id),
+                "finding_id": finding_id,
+                "evidence_id": finding_evidence_id,
+            }
+        )
+        batch.add_engine_finding(
+            {
+                "finding_id": finding_id,
+                "dataset_version_id": dv_id,
+                "run_id": run_id,
+                "category": category,
+                "metric": metric,
+                "status": status,
+                "confidence": confidence,
+                "evidence_ids": evidence_ids,
+                "payload": finding_payload,
+                "created_at": created_at,
+            }
+        )
+
+    return {
+        "raw_record_id": raw_record_id,
+        "net_damage": results["damage"]["net_damage"],
+        "severity": results["damage"]["severity"],
+        "liability_strength": results["liability"]["liability_strength"],
+        "consistent": results["legal_consistency"]["consistent"],
+        "evidence": evidence_ids,
+        "finding_ids": finding_ids,
+    }
+
+
+async def run_portfolio(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    run_id: str,
+    started: datetime,
+    disputes: Sequence[tuple[str, dict[str, Any]]],
+    skipped_raw_record_ids: Sequence[str],
+    assumptions: dict[str, Any],
+    clock: Callable[[], datetime],
+) -> dict[str, Any]:
+    """Analyze and persist all disputes of the dataset version; commits the session."""
+    mark_stage("model")
+    results = await analyze_dispute_portfolio(
+        dataset_version_id=dataset_version_id,
+        disputes=disputes,
+        assumptions=assumptions,
+    )
+    rollup = summarize_dispute_portfolio(results)
+    portfolio_assumptions = _portfolio_assumptions(results)
+
+    mark_stage("persist")
+    batch = PersistenceBatch(dataset_version_id=dataset_version_id)
+    dispute_rows = [
+        _add_dispute(batch, run_id=run_id, raw_record_id=raw_record_id, results=result, created_at=started)
+        for (raw_record_id, _), result in zip(disputes, results)
+    ]
+    summary = {
+        "dataset_version_id": dataset_version_id,
+        "started_at": started.isoformat(),
+        "mode": "portfolio",
+        "portfolio": rollup,
+        "raw_record_ids": [raw_record_id for raw_record_id, _ in disputes],
+        "skipped_raw_record_ids": list(skipped_raw_record_ids),
+        "assumptions": portfolio_assumptions,
+    }
+    summary_evidence_id = deterministic_evidence_id(
+        dataset_version_id=dataset_version_id,
+        engine_id=ENGINE_ID,
+        kind="portfolio_summary",
+        stable_key=run_id,
+    )
+    batch.add_evidence(
+        _evidence_row(
+            evidence_id=summary_evidence_id,
+            dataset_version_id=dataset_version_id,
+            kind="portfolio_summary",
+            payload={"summary": summary},
+            created_at=started,
+        )
+    )
+    evidence_map = {"portfolio_summary": summary_evidence_id}
+    batch.run = {
+        "run_id": run_id,
+        "dataset_version_id": dataset_version_id,
+        "run_start_time": started,
+        "run_end_time": clock(),
+        "status": "completed",
+        "damage_payload": rollup["damage"],
+        "liability_payload": rollup["liability"],
+        "scenario_payload": rollup["scenario"],
+        "legal_consistency_payload": rollup["legal_consistency"],
+        "assumptions": portfolio_assumptions,
+        "summary": summary,
+        "evidence_map": evidence_map,
+    }
+    await persist_batch(db, batch)
+    await db.commit()
+
+    return {
+        "dataset_version_id": dataset_version_id,
+        "started_at": started.isoformat(),
+        "mode": "portfolio",
+        "portfolio": rollup,
+        "disputes": dispute_rows,
+        "skipped_raw_record_ids": list(skipped_raw_record_ids),
+        "assumptions": portfolio_assumptions,
+        "finding_count": len(batch.findings),
+        "evidence": evidence_map,
+        "summary": summary,
+    }
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import hashlib
+import json
 import logging
 from typing import Any
 
@@ -10,7 +12,7 @@ from sqlalchemy import select
 
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
 from backend.app.core.evidence.service import (
     create_evidence,
@@ -19,15 +21,11 @@ from backend.app.core.evidence.service import (
     link_finding_to_evidence,
 )
 from backend.app.core.normalization.models import NormalizedRecord
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.engines.enterprise_litigation_dispute.analysis import (
-    assess_liability,
-    compare_scenarios,
-    damage_payload,
-    evaluate_legal_consistency,
-    legal_consistency_payload,
-    liability_payload,
-    quantify_damages,
-    scenario_payload,
+    aggregate_assumptions,
+    analyze_dispute,
+    finding_specs,
 )
 from backend.app.engines.enterprise_litigation_dispute.models import (
     EnterpriseLitigationDisputeFinding,
@@ -46,6 +44,7 @@ from backend.app.engines.enterprise_litigation_dispute.errors import (
     StartedAtMissingError,
 )
 from backend.app.engines.enterprise_litigation_dispute.ids import deterministic_id
+from backend.app.engines.enterprise_litigation_dispute.portfolio import run_portfolio
 
 logger = logging.getLogger(__name__)
 
@@ -80,9 +79,22 @@ def _validate_parameters(value: object | None) -> dict[str, Any]:
         return {}
     if not isinstance(value, dict):
         raise ParametersInvalidError("PARAMETERS_INVALID_TYPE")
+    if not isinstance(value.get("portfolio", False), bool):
+        raise ParametersInvalidError("PORTFOLIO_INVALID_TYPE")
     return value
 
 
+def _run_id(dataset_version_id: str, parameters: dict[str, Any], assumptions: dict[str, Any]) -> str:
+    # Calculate deterministic run_id from stable inputs (not timestamp)
+    # Same inputs → same run_id, enabling deterministic replay
+    stable_inputs = {
+        "parameters": json.dumps(parameters, sort_keys=True) if parameters else "",
+        "assumptions": json.dumps(assumptions, sort_keys=True) if assumptions else "",
+    }
+    param_hash = hashlib.sha256(json.dumps(stable_inputs, sort_keys=True).encode()).hexdigest()[:16]
+    return deterministic_id(dataset_version_id, "run", param_hash)
+
+
 def _extract_legal_payload(payload: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise LegalPayloadMissingError("LEGAL_PAYLOAD_REQUIRED")
@@ -204,6 +216,7 @@ async def _strict_link(
     return await link_finding_to_evidence(db, link_id=link_id, finding_id=finding_id, evidence_id=evidence_id)
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(*, dataset_version_id: object, started_at: object, parameters: object | None = None) -> dict[str, Any]:
     install_immutability_guards()
     dv_id = _validate_dataset_version_id(dataset_version_id)
@@ -211,63 +224,64 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
     validated_parameters = _validate_parameters(parameters)
     assumptions_map = validated_parameters.get("assumptions") if isinstance(validated_parameters.get("assumptions"), dict) else {}
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         normalized_records = (
             await db.scalars(
                 select(NormalizedRecord)
                 .where(NormalizedRecord.dataset_version_id == dv_id)
-                .order_by(NormalizedRecord.normalized_at.asc())
+                .order_by(NormalizedRecord.normalized_at.asc(), NormalizedRecord.raw_record_id.asc())
             )
         ).all()
         if not normalized_records:
             raise NormalizedRecordMissingError("NORMALIZED_RECORD_REQUIRED")
+        run_id = _run_id(dv_id, validated_parameters, assumptions_map)
+        if validated_parameters.get("portfolio"):
+            disputes: list[tuple[str, dict[str, Any]]] = []
+            skipped: list[str] = []
+            seen: set[str] = set()
+            for record in normalized_records:
+                if record.raw_record_id in seen:
+                    continue
+                seen.add(record.raw_record_id)
+                try:
+                    disputes.append((record.raw_record_id, _extract_legal_payload(record.payload)))
+                except LegalPayloadMissingError:
+                    skipped.append(record.raw_record_id)
+            if not disputes:
+                raise LegalPayloadMissingError("LEGAL_PAYLOAD_REQUIRED")
+            return await run_portfolio(
+                db,
+                dataset_version_id=dv_id,
+                run_id=run_id,
+                started=started,
+                disputes=disputes,
+                skipped_raw_record_ids=skipped,
+                assumptions=assumptions_map,
+                clock=lambda: datetime.now(timezone.utc),
+            )
         normalized_record = normalized_records[0]
         legal_payload = _extract_legal_payload(normalized_record.payload)
         source_raw_id = normalized_record.raw_record_id
 
-        damage_result = quantify_damages(
-            dataset_version_id=dv_id,
-            dispute_payload=legal_payload,
-            assumptions=assumptions_map,
-        )
-        liability_result = assess_liability(
-            dataset_version_id=dv_id,
-            dispute_payload=legal_payload,
-            assumptions=assumptions_map,
-        )
-        scenario_result = compare_scenarios(
-            dataset_version_id=dv_id,
-            dispute_payload=legal_payload,
-            assumptions=assumptions_map,
-        )
-        consistency_result = evaluate_legal_consistency(
+        mark_stage("model")
+        result_payloads = analyze_dispute(
             dataset_version_id=dv_id,
             dispute_payload=legal_payload,
             assumptions=assumptions_map,
         )
+        damage_info = result_payloads["damage"]
+        liability_info = result_payloads["liability"]
+        scenario_info = result_payloads["scenario"]
+        consistency_info = result_payloads["legal_consistency"]
+        aggregated_assumptions = aggregate_assumptions(result_payloads)
 
-        damage_info = damage_payload(damage_result)
-        liability_info = liability_payload(liability_result)
-        scenario_info = scenario_payload(scenario_result)
-        consistency_info = legal_consistency_payload(consistency_result)
-
-        aggregated_assumptions: list[dict[str, str]] = []
-        for section in (damage_info.get("assumptions"), liability_info.get("assumptions"), scenario_info.get("assumptions"), consistency_info.get("assumptions")):
-            if isinstance(section, list):
-                aggregated_assumptions.extend(section)
-
+        mark_stage("persist")
         evidence_ids: dict[str, str] = {}
-        result_payloads = {
-            "damage": damage_info,
-            "liability": liability_info,
-            "scenario": scenario_info,
-            "legal_consistency": consistency_info,
-        }
         for key, payload in result_payloads.items():
             evidence_id = deterministic_evidence_id(
                 dataset_version_id=dv_id,
@@ -322,17 +336,6 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         )
 
         completion_time = datetime.now(timezone.utc)
-        # Calculate deterministic run_id from stable inputs (not timestamp)
-        # Same inputs → same run_id, enabling deterministic replay
-        import hashlib
-        import json
-        
-        stable_inputs = {
-            "parameters": json.dumps(validated_parameters, sort_keys=True) if validated_parameters else "",
-            "assumptions": json.dumps(assumptions_map, sort_keys=True) if assumptions_map else "",
-        }
-        param_hash = hashlib.sha256(json.dumps(stable_inputs, sort_keys=True).encode()).hexdigest()[:16]
-        run_id = deterministic_id(dv_id, "run", param_hash)
         run_record = EnterpriseLitigationDisputeRun(
             run_id=run_id,
             dataset_version_id=dv_id,
@@ -350,68 +353,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         db.add(run_record)
 
         findings: list[dict[str, Any]] = []
-        finding_specs = [
-            (
-                "damage",
-                "legal_damage",
-                "net_damage",
-                "Damage Quantification",
-                "Net legal damages after mitigation.",
-                damage_info["net_damage"],
-                damage_info["severity"],
-                damage_info["confidence"],
-                {
-                    "gross_damages": damage_info["gross_damages"],
-                    "mitigation": damage_info["mitigation"],
-                    "severity_score": damage_info["severity_score"],
-                },
-            ),
-            (
-                "liability",
-                "liability",
-                "responsibility_pct",
-                "Liability Assessment",
-                "Estimated party liability exposure.",
-                liability_info["responsibility_pct"],
-                liability_info["liability_strength"],
-                liability_info["confidence"],
-                {
-                    "responsible_party": liability_info["responsible_party"],
-                    "evidence_strength": liability_info["evidence_strength"],
-                    "indicators": liability_info["indicators"],
-                },
-            ),
-            (
-                "scenario",
-                "scenario_analysis",
-                "best_case_loss",
-                "Scenario Comparison",
-                "Preferred and worst-case exposures.",
-                scenario_info.get("best_case", {}).get("expected_loss") if scenario_info.get("best_case") else 0.0,
-                scenario_info.get("best_case", {}).get("name") if scenario_info.get("best_case") else "n/a",
-                "medium",
-                {
-                    "total_probability": scenario_info.get("total_probability"),
-                    "best_case": scenario_info.get("best_case"),
-                    "worst_case": scenario_info.get("worst_case"),
-                },
-            ),
-            (
-                "legal_consistency",
-                "legal_consistency",
-                "consistent",
-                "Legal Consistency Check",
-                "Checks for conflicting statutes and missing support.",
-                float(1 if consistency_info.get("consistent") else 0),
-                "pass" if consistency_info.get("consistent") else "attention",
-                consistency_info.get("confidence"),
-                {
-                    "issues": consistency_info.get("issues"),
-                },
-            ),
-        ]
-
-        for key, category, metric, title, description, value, status, confidence, details in finding_specs:
+        for key, category, metric, title, description, value, status, confidence, details in finding_specs(result_payloads):
             finding_id = deterministic_id(dv_id, "finding", key)
             finding_payload = {
                 "id": finding_id,
@@ -6,10 +6,11 @@ import uuid
 
 from sqlalchemy import select
 
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.uuidv7 import uuid7
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.engines.erp_integration_readiness.engine import ENGINE_ID, ENGINE_VERSION
 from backend.app.engines.erp_integration_readiness.errors import (
     DatasetVersionInvalidError,
@@ -166,6 +167,7 @@ def _parse_started_at(started_at: object) -> datetime:
     return parsed
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: str | None,
@@ -191,10 +193,10 @@ async def run_engine(
         optional_inputs=validated_optional_inputs,
     )
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == validated_dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, validated_dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         run_id = str(uuid7())
@@ -212,6 +214,7 @@ async def run_engine(
         db.add(run)
 
         # Get infrastructure config from parameters (optional)
+        mark_stage("model")
         infrastructure_config = validated_parameters.get("infrastructure_config", {})
         erp_system_id = validated_erp_config.get("system_id", "unknown")
 
@@ -271,6 +274,7 @@ async def run_engine(
             ),
         }
 
+        mark_stage("persist")
         # Persist findings
         await persist_readiness_findings(
             db,
@@ -6,12 +6,13 @@ FF-1 engines must not persist artifacts. Artifact usage begins in FF-2.
 from __future__ import annotations
 
 from fastapi import APIRouter
-from fastapi import HTTPException
+from fastapi import Header, HTTPException, Query, Response
 
 from backend.app.core.dataset.errors import ChecksumMismatchError, ChecksumMissingError
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.engine_registry.registry import REGISTRY
 from backend.app.core.engine_registry.spec import EngineSpec
+from backend.app.core.json_stream import StreamingJSONResponse
 from backend.app.core.lifecycle.enforcement import (
     LifecycleViolationError,
     verify_calculate_complete,
@@ -19,6 +20,11 @@ from backend.app.core.lifecycle.enforcement import (
     verify_normalize_complete,
     record_calculation_completion,
 )
+from backend.app.core.reporting.materialization import (
+    materialize_report,
+    report_kind_with_parameters,
+    report_response,
+)
 
 
 ENGINE_ID = "engine_financial_forensics"
@@ -84,7 +90,8 @@ async def run_engine_endpoint(payload: dict) -> dict:
         if isinstance(result, dict):
             result.setdefault("dataset_version_id", validated_dv_id)
             result.setdefault("run_id", run_id)
-            return result
+            # Findings and per-record conversions can be very large; encode in chunks.
+            return StreamingJSONResponse(result)
         return {"dataset_version_id": validated_dv_id, "run_id": run_id, "result": result}
     except DatasetVersionInvalidError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -129,11 +136,13 @@ async def normalize_endpoint(payload: dict) -> dict:
     return {"dataset_version_id": validated, "canonical_created": created}
 
 
-@router.post("/report")
-async def report_endpoint(payload: dict) -> dict:
-    dataset_version_id = payload.get("dataset_version_id")
-    run_id = payload.get("run_id")
-    parameters = payload.get("parameters", {})
+async def _materialized_report(
+    *,
+    dataset_version_id: object,
+    run_id: object,
+    parameters: dict,
+    if_none_match: str | None,
+) -> Response:
     from backend.app.engines.financial_forensics.run import _validate_dataset_version_id
     from backend.app.engines.financial_forensics.report.assembler import assemble_report
     from backend.app.engines.financial_forensics.failures import (
@@ -145,6 +154,7 @@ async def report_endpoint(payload: dict) -> dict:
     validated = _validate_dataset_version_id(dataset_version_id)
     if not isinstance(run_id, str) or not run_id.strip():
         raise HTTPException(status_code=400, detail="RUN_ID_REQUIRED")
+    run_id = run_id.strip()
 
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
@@ -152,16 +162,29 @@ async def report_endpoint(payload: dict) -> dict:
             await verify_calculate_complete(
                 db,
                 dataset_version_id=validated,
-                run_id=run_id.strip(),
+                run_id=run_id,
                 engine_id=ENGINE_ID,
                 actor_id=f"engine:{ENGINE_ID}",
             )
-            return await assemble_report(
+
+            async def _render() -> dict:
+                return await assemble_report(
+                    db,
+                    dataset_version_id=validated,
+                    run_id=run_id,
+                    parameters=parameters,
+                )
+
+            report = await materialize_report(
                 db,
+                run_id=run_id,
+                report_kind=report_kind_with_parameters(f"{ENGINE_ID}:report", parameters),
                 dataset_version_id=validated,
-                run_id=run_id.strip(),
-                parameters=parameters or {},
+                engine_id=ENGINE_ID,
+                render=_render,
+                if_none_match=if_none_match,
             )
+            return report_response(report)
         except MissingArtifactError as exc:
             raise HTTPException(status_code=404, detail=str(exc))
         except InconsistentReferenceError as exc:
@@ -172,6 +195,66 @@ async def report_endpoint(payload: dict) -> dict:
             raise HTTPException(status_code=409, detail=exc.detail) from exc
 
 
+@router.post("/report")
+async def report_endpoint(payload: dict) -> Response:
+    return await _materialized_report(
+        dataset_version_id=payload.get("dataset_version_id"),
+        run_id=payload.get("run_id"),
+        parameters=payload.get("parameters", {}) or {},
+        if_none_match=None,
+    )
+
+
+@router.get("/report")
+async def get_report_endpoint(
+    dataset_version_id: str,
+    run_id: str,
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Cacheable form of POST /report (default parameters); honours If-None-Match."""
+    return await _materialized_report(
+        dataset_version_id=dataset_version_id,
+        run_id=run_id,
+        parameters={},
+        if_none_match=if_none_match,
+    )
+
+
+@router.get("/report/findings")
+async def report_findings_page_endpoint(
+    dataset_version_id: str,
+    run_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+) -> Response:
+    """Page through the report's findings table without assembling the full report."""
+    from backend.app.engines.financial_forensics.run import _validate_dataset_version_id
+    from backend.app.engines.financial_forensics.report.assembler import assemble_findings_page
+    from backend.app.engines.financial_forensics.failures import InconsistentReferenceError, MissingArtifactError
+
+    validated = _validate_dataset_version_id(dataset_version_id)
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        try:
+            await verify_calculate_complete(
+                db,
+                dataset_version_id=validated,
+                run_id=run_id.strip(),
+                engine_id=ENGINE_ID,
+                actor_id=f"engine:{ENGINE_ID}",
+            )
+            page = await assemble_findings_page(
+                db, dataset_version_id=validated, run_id=run_id.strip(), offset=offset, limit=limit
+            )
+        except MissingArtifactError as exc:
+            raise HTTPException(status_code=404, detail=str(exc))
+        except InconsistentReferenceError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+        except LifecycleViolationError as exc:
+            raise HTTPException(status_code=409, detail=exc.detail) from exc
+    return StreamingJSONResponse(page)
+
+
 def register_engine() -> None:
     if REGISTRY.get(ENGINE_ID) is not None:
         return
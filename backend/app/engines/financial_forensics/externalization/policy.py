@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+from backend.app.core.reporting.redaction import CompiledFieldPolicy
+
 
 class ReportSection(str, Enum):
     """Report section identifiers."""
@@ -162,3 +165,16 @@ def validate_externalization_policy(policy: ExternalizationPolicy) -> None:
             f"Externalization policy incomplete: missing sections: {missing}"
         )
 
+
+@lru_cache(maxsize=None)
+def compile_policy(policy: ExternalizationPolicy) -> CompiledFieldPolicy:
+    """
+    Compile a policy into the field matcher used for single-pass redaction.
+
+    Compiled once per policy instance (policies are frozen and hashable).
+    """
+    return CompiledFieldPolicy(
+        redacted_fields=policy.redacted_fields,
+        anonymized_fields=policy.anonymized_fields,
+    )
+
@@ -7,15 +7,17 @@ No transformation of numbers, only omission/redaction.
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+import re
+from typing import Any, Iterator
 
+from backend.app.core.reporting.redaction import Redactor
 from backend.app.engines.financial_forensics.externalization.policy import (
     DEFAULT_POLICY,
     ExternalizationPolicy,
     ReportSection,
     SharingLevel,
+    compile_policy,
     get_sharing_level,
-    should_anonymize_field,
     should_redact_field,
 )
 from backend.app.engines.financial_forensics.leakage.semantic_guards import (
@@ -57,6 +59,22 @@ def create_internal_view(report: dict[str, Any]) -> dict[str, Any]:
     return report.copy()
 
 
+def external_view_redactor(
+    policy: ExternalizationPolicy = DEFAULT_POLICY,
+    anonymization_salt: str = "",
+) -> Redactor:
+    """
+    Build a single-use redactor for one external view.
+
+    Anonymized references are memoized on the redactor, so each distinct identifier
+    is hashed once per view regardless of how often it appears in the report.
+    """
+    return compile_policy(policy).redactor(
+        anonymize=lambda value: anonymize_id(value, salt=anonymization_salt),
+        sanitize_text=_sanitize_text,
+    )
+
+
 def create_external_view(
     report: dict[str, Any],
     policy: ExternalizationPolicy = DEFAULT_POLICY,
@@ -65,7 +83,9 @@ def create_external_view(
     """
     Create external view of report (policy-filtered, redacted).
     
-    No transformation of numbers, only omission/redaction.
+    No transformation of numbers, only omission/redaction. Redaction, anonymization,
+    text sanitization and field validation happen in one traversal; data the policy
+    forbids that cannot be omitted raises ValueError.
     
     Args:
         report: Full report data
@@ -75,7 +95,23 @@ def create_external_view(
     Returns:
         External view (filtered, redacted, anonymized)
     """
-    external_view = {}
+    redactor = external_view_redactor(policy, anonymization_salt)
+    return {
+        key: redactor.redact(value) if needs_redaction else value
+        for key, value, needs_redaction in _external_entries(report, policy=policy)
+    }
+
+
+def _external_entries(
+    report: dict[str, Any],
+    *,
+    policy: ExternalizationPolicy,
+) -> Iterator[tuple[str, Any, bool]]:
+    """
+    Yield the top-level (key, value, needs_redaction) entries of the external view.
+
+    Section filtering happens here; section bodies are left for the redactor.
+    """
     omitted_internal_sections: list[str] = []
     
     # Filter sections by sharing level
@@ -87,22 +123,16 @@ def create_external_view(
             # Unknown section - exclude from external view (conservative)
             continue
         
-        sharing_level = get_sharing_level(section, policy)
-        
-        if sharing_level == SharingLevel.EXTERNAL:
-            # Include section, but redact/anonymize fields
-            external_view[section_key] = _redact_section(
-                section_data,
-                policy=policy,
-                anonymization_salt=anonymization_salt,
-            )
+        if get_sharing_level(section, policy) == SharingLevel.EXTERNAL:
+            yield section_key, section_data, True
         else:
             omitted_internal_sections.append(section_key)
 
     if omitted_internal_sections:
-        external_view["__omitted_internal_sections__"] = sorted(omitted_internal_sections)
-    
-    return external_view
+        yield "__omitted_internal_sections__", sorted(omitted_internal_sections), False
+
+
+_SECTION_MAP = {section.value: section for section in ReportSection}
 
 
 def _identify_section(section_key: str) -> ReportSection | None:
@@ -115,83 +145,21 @@ def _identify_section(section_key: str) -> ReportSection | None:
     Returns:
         ReportSection if identified, None otherwise
     """
-    section_key_lower = section_key.lower()
-    
-    # Map common section names to ReportSection enum
-    section_map = {
-        "findings_overview": ReportSection.FINDINGS_OVERVIEW,
-        "exposure_estimates": ReportSection.EXPOSURE_ESTIMATES,
-        "control_signals": ReportSection.CONTROL_SIGNALS,
-        "limitations_uncertainty": ReportSection.LIMITATIONS_UNCERTAINTY,
-        "assumptions": ReportSection.ASSUMPTIONS,
-        "evidence_index": ReportSection.EVIDENCE_INDEX,
-        "internal_notes": ReportSection.INTERNAL_NOTES,
-        "counterparty_details": ReportSection.COUNTERPARTY_DETAILS,
-        "source_system_ids": ReportSection.SOURCE_SYSTEM_IDS,
-        "run_parameters": ReportSection.RUN_PARAMETERS,
-    }
-    
-    return section_map.get(section_key_lower)
+    return _SECTION_MAP.get(section_key.lower())
 
 
-def _redact_section(
-    section_data: Any,
-    policy: ExternalizationPolicy,
-    anonymization_salt: str,
-) -> Any:
-    """
-    Redact and anonymize section data for external view.
-    
-    Args:
-        section_data: Section data (dict, list, or primitive)
-        policy: Externalization policy
-        anonymization_salt: Salt for anonymization
-    
-    Returns:
-        Redacted/anonymized section data
-    """
-    if isinstance(section_data, dict):
-        redacted = {}
-        for key, value in section_data.items():
-            if should_redact_field(key, policy):
-                # Omit redacted fields
-                continue
-            elif should_anonymize_field(key, policy):
-                # Anonymize field value
-                if isinstance(value, str):
-                    redacted[key] = anonymize_id(value, salt=anonymization_salt)
-                elif isinstance(value, list):
-                    redacted[key] = [
-                        anonymize_id(item, salt=anonymization_salt) if isinstance(item, str) else item
-                        for item in value
-                    ]
-                else:
-                    # Non-string anonymizable field - omit to be safe
-                    continue
-            else:
-                # Recursively redact nested structures
-                redacted[key] = _redact_section(value, policy=policy, anonymization_salt=anonymization_salt)
-        return redacted
-    elif isinstance(section_data, list):
-        return [
-            _redact_section(item, policy=policy, anonymization_salt=anonymization_salt)
-            for item in section_data
-        ]
-    else:
-        # Primitive value - return as-is (no transformation of numbers).
-        if isinstance(section_data, str):
-            return _sanitize_text(section_data)
-        return section_data
+# One alternation over all forbidden words/phrases; substring semantics as before.
+_FORBIDDEN_TEXT_RE = re.compile(
+    "|".join(
+        re.escape(term.lower())
+        for term in sorted({*FORBIDDEN_FRAUD_WORDS, *FORBIDDEN_DECISION_PHRASES}, key=len, reverse=True)
+    )
+)
 
 
 def _sanitize_text(text: str) -> str:
-    lowered = text.lower()
-    for word in FORBIDDEN_FRAUD_WORDS:
-        if word in lowered:
-            return "[redacted]"
-    for phrase in FORBIDDEN_DECISION_PHRASES:
-        if phrase.lower() in lowered:
-            return "[redacted]"
+    if _FORBIDDEN_TEXT_RE.search(text.lower()):
+        return "[redacted]"
     return text
 
 
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.core.evidence.reader import EvidenceReader
 from backend.app.engines.financial_forensics.failures import MissingArtifactError, InconsistentReferenceError, RuntimeLimitError
 from backend.app.engines.financial_forensics.models.findings import FinancialForensicsFinding
 from backend.app.engines.financial_forensics.models.leakage import FinancialForensicsLeakageItem
@@ -20,6 +20,23 @@ from backend.app.engines.financial_forensics.report.sections import (
 from backend.app.engines.financial_forensics.runtime_limits import limits_from_parameters
 
 
+def _finding_row(f: FinancialForensicsFinding, li: FinancialForensicsLeakageItem) -> dict:
+    return {
+        "finding_id": f.finding_id,
+        "rule_id": f.rule_id,
+        "rule_version": f.rule_version,
+        "framework_version": f.framework_version,
+        "confidence": f.confidence,
+        "finding_type": f.finding_type,
+        "matched_record_ids": list(f.matched_record_ids),
+        "unmatched_amount": f.unmatched_amount,
+        "typology": li.typology,
+        "exposure_abs": str(li.exposure_abs),
+        "exposure_signed": str(li.exposure_signed),
+        "primary_evidence_item_id": f.primary_evidence_item_id,
+    }
+
+
 async def assemble_report(
     db: AsyncSession,
     *,
@@ -58,13 +75,8 @@ async def assemble_report(
 
     # Evidence index: collect primary evidence ids from findings.
     evidence_ids = sorted({f.primary_evidence_item_id for f in findings})
-    evidences = (
-        await db.execute(
-            select(EvidenceRecord)
-            .where(EvidenceRecord.evidence_id.in_(evidence_ids))
-            .order_by(EvidenceRecord.evidence_id.asc())
-        )
-    ).scalars().all()
+    evidence_refs = await EvidenceReader.for_session(db).evidence(evidence_ids)
+    evidences = [evidence_refs[e] for e in evidence_ids if e in evidence_refs]
     if len(evidences) != len(evidence_ids):
         raise MissingArtifactError("MISSING_EVIDENCE_FOR_RUN")
 
@@ -81,26 +93,8 @@ async def assemble_report(
         for t in sorted(buckets.keys())
     ]
 
-    findings_rows = []
     leakage_by_finding = {li.finding_id: li for li in leakage_items}
-    for f in findings:
-        li = leakage_by_finding[f.finding_id]
-        findings_rows.append(
-            {
-                "finding_id": f.finding_id,
-                "rule_id": f.rule_id,
-                "rule_version": f.rule_version,
-                "framework_version": f.framework_version,
-                "confidence": f.confidence,
-                "finding_type": f.finding_type,
-                "matched_record_ids": list(f.matched_record_ids),
-                "unmatched_amount": f.unmatched_amount,
-                "typology": li.typology,
-                "exposure_abs": str(li.exposure_abs),
-                "exposure_signed": str(li.exposure_signed),
-                "primary_evidence_item_id": f.primary_evidence_item_id,
-            }
-        )
+    findings_rows = [_finding_row(f, leakage_by_finding[f.finding_id]) for f in findings]
 
     evidence_index = [
         {"evidence_id": e.evidence_id, "kind": e.kind, "engine_id": e.engine_id, "created_at": e.created_at.isoformat()}
@@ -123,3 +117,65 @@ async def assemble_report(
         ],
     }
 
+
+async def assemble_findings_page(
+    db: AsyncSession,
+    *,
+    dataset_version_id: str,
+    run_id: str,
+    offset: int,
+    limit: int,
+) -> dict:
+    """
+    Return one page of the report's findings table, in report order.
+
+    Only the requested findings and their leakage items are loaded, so large runs can
+    be browsed without assembling the full report.
+    """
+    if offset < 0 or limit < 1:
+        raise InconsistentReferenceError("PAGE_BOUNDS_INVALID")
+
+    run = await db.scalar(select(FinancialForensicsRun).where(FinancialForensicsRun.run_id == run_id))
+    if run is None:
+        raise MissingArtifactError("RUN_NOT_FOUND")
+    if run.dataset_version_id != dataset_version_id:
+        raise InconsistentReferenceError("RUN_DATASET_MISMATCH")
+
+    total = await db.scalar(
+        select(func.count()).select_from(FinancialForensicsFinding).where(FinancialForensicsFinding.run_id == run_id)
+    )
+    findings = (
+        await db.execute(
+            select(FinancialForensicsFinding)
+            .where(FinancialForensicsFinding.run_id == run_id)
+            .order_by(FinancialForensicsFinding.rule_id.asc(), FinancialForensicsFinding.finding_id.asc())
+            .offset(offset)
+            .limit(limit)
+        )
+    ).scalars().all()
+
+    leakage_by_finding: dict[str, FinancialForensicsLeakageItem] = {}
+    if findings:
+        leakage_items = (
+            await db.execute(
+                select(FinancialForensicsLeakageItem).where(
+                    FinancialForensicsLeakageItem.run_id == run_id,
+                    FinancialForensicsLeakageItem.finding_id.in_([f.finding_id for f in findings]),
+                )
+            )
+        ).scalars().all()
+        leakage_by_finding = {li.finding_id: li for li in leakage_items}
+        if len(leakage_by_finding) != len(findings):
+            raise MissingArtifactError("MISSING_LEAKAGE_ITEMS_FOR_RUN")
+
+    total = int(total or 0)
+    next_offset = offset + len(findings)
+    return {
+        "run_id": run_id,
+        "dataset_version_id": dataset_version_id,
+        "items": [_finding_row(f, leakage_by_finding[f.finding_id]) for f in findings],
+        "offset": offset,
+        "limit": limit,
+        "total": total,
+        "next_offset": next_offset if next_offset < total else None,
+    }
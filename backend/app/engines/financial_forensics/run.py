@@ -8,7 +8,7 @@ from sqlalchemy import select
 
 from backend.app.core.artifacts.fx_service import FxArtifactError, load_fx_artifact_for_dataset
 from backend.app.core.db import get_sessionmaker
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.engine_registry.kill_switch import is_engine_enabled
 from backend.app.engines.financial_forensics.engine import ENGINE_ID, ENGINE_VERSION
 from backend.app.engines.financial_forensics.failures import RuntimeLimitError
@@ -18,6 +18,7 @@ from backend.app.engines.financial_forensics.models import FinancialForensicsRun
 from backend.app.engines.financial_forensics.models.findings import FinancialForensicsFinding
 from backend.app.engines.financial_forensics.models.leakage import FinancialForensicsLeakageItem
 from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.engines.financial_forensics.matching.framework import (
     CanonicalInput,
     ConvertedAmounts,
@@ -238,6 +239,7 @@ def _build_evidence_schema_v1(
     )
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(
     *,
     dataset_version_id: str | None,
@@ -278,11 +280,11 @@ async def run_engine(
     if not isinstance(fx_artifact_id, str) or not fx_artifact_id.strip():
         raise FxArtifactMissingError("FX_ARTIFACT_ID_EMPTY")
     
+    mark_stage("load")
     # Guard 3: DatasetVersion existence check
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == validated_dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, validated_dv_id):
             raise DatasetVersionNotFoundError(
                 f"DATASET_VERSION_NOT_FOUND: dataset_version_id '{validated_dv_id}' does not exist. "
                 "Create via ingestion API first."
@@ -329,6 +331,7 @@ async def run_engine(
         if len(canonical) > limits.max_canonical_records:
             raise RuntimeLimitError("RUNTIME_LIMIT_EXCEEDED: max_canonical_records")
 
+        mark_stage("normalize")
         rates: dict[str, str] = fx_payload["rates"]
         base_currency: str = fx_payload["base_currency"]
         conversions: list[dict] = []
@@ -389,6 +392,7 @@ async def run_engine(
             parameters=rule_params,
         )
 
+        mark_stage("model")
         rules = [
             ExactInvoicePaymentRule(),
             ExactInvoiceCreditNoteRule(),
@@ -502,6 +506,7 @@ async def run_engine(
         if len(findings_out) > limits.max_findings:
             raise RuntimeLimitError("RUNTIME_LIMIT_EXCEEDED: max_findings")
 
+        mark_stage("persist")
         # Persist FF-4 leakage artifacts (typology + exposure) derived from findings + evidence payloads.
         for f in findings_out:
             evidence_payload = (await db.execute(select(EvidenceRecord.payload).where(EvidenceRecord.evidence_id == f["primary_evidence_item_id"]))).scalar_one()
@@ -3,17 +3,20 @@ from __future__ import annotations
 from typing import Iterable, Sequence
 
 from backend.app.engines.regulatory_readiness.controls import ControlDefinition
+from backend.app.engines.regulatory_readiness.matching import CatalogMatchIndex, compile_catalog_index
 
 
 class ControlCatalog:
     def __init__(self, *, initial_controls: Iterable[ControlDefinition] | None = None):
         self._controls: dict[str, ControlDefinition] = {}
+        self._index: CatalogMatchIndex | None = None
         if initial_controls is not None:
             for control in initial_controls:
                 self.register(control)
 
     def register(self, control: ControlDefinition) -> None:
         self._controls[control.control_id] = control
+        self._index = None
 
     def load_from_payloads(self, payloads: Iterable[dict] | None) -> None:
         if not payloads:
@@ -30,6 +33,17 @@ class ControlCatalog:
     def list_controls(self) -> Sequence[ControlDefinition]:
         return tuple(self._controls.values())
 
+    @property
+    def version(self) -> str:
+        """Content fingerprint of the registered controls; changes whenever a control does."""
+        return self.match_index().version
+
+    def match_index(self) -> CatalogMatchIndex:
+        """Compiled framework matching index for the registered controls (cached across catalogs)."""
+        if self._index is None:
+            self._index = compile_catalog_index(self.list_controls())
+        return self._index
+
     def find(self, control_id: str) -> ControlDefinition | None:
         return self._controls.get(control_id)
 
@@ -16,6 +16,7 @@ class RegulatoryFramework:
     explicit_controls: Tuple[str, ...] = field(default_factory=tuple)
 
     def matches_control(self, control: ControlDefinition) -> bool:
+        """Single-pair rule; `matching.CatalogMatchIndex` applies it to a whole catalog at once."""
         if self.framework_id in control.frameworks:
             return True
         if control.control_id in self.explicit_controls:
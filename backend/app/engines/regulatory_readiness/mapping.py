@@ -5,6 +5,7 @@ from typing import Sequence
 
 from backend.app.engines.regulatory_readiness.controls import ControlDefinition, ControlStatus
 from backend.app.engines.regulatory_readiness.frameworks import RegulatoryFramework
+from backend.app.engines.regulatory_readiness.matching import CatalogMatchIndex, compile_catalog_index
 
 
 @dataclass(frozen=True)
@@ -38,18 +39,24 @@ def _score_from_status(status: ControlStatus) -> float:
 
 
 def map_controls_to_frameworks(
-    controls: Sequence[ControlDefinition],
+    controls: Sequence[ControlDefinition] | CatalogMatchIndex,
     frameworks: Sequence[RegulatoryFramework],
     *,
     evaluations: dict[str, ControlStatus] | None = None,
 ) -> Sequence[ComplianceMapping]:
+    """
+    Map each control to the frameworks it matches, in control then framework order.
+
+    `controls` is either the control definitions or an index already compiled from
+    them (e.g. `ControlCatalog.match_index()`); the index's controls are the ones mapped.
+    """
     eval_map = evaluations or {}
+    index = controls if isinstance(controls, CatalogMatchIndex) else compile_catalog_index(controls)
+    matched_frameworks = index.frameworks_by_control(frameworks)
     mappings: list[ComplianceMapping] = []
-    for control in controls:
+    for control, control_frameworks in zip(index.controls, matched_frameworks):
         control_status = eval_map.get(control.control_id, control.status)
-        for framework in frameworks:
-            if not framework.matches_control(control):
-                continue
+        for framework in control_frameworks:
             alignment_score = _score_from_status(control_status)
             notes = "Control explicitly scoped to framework."
             if framework.framework_id not in control.frameworks:
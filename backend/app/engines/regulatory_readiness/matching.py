@@ -0,0 +1,133 @@
+"""
+Precompiled control/framework matching for a control catalog.
+
+`RegulatoryFramework.matches_control` is a per-pair check; mapping a catalog with
+thousands of controls against every framework repeats the same tag scans for each
+pair. `CatalogMatchIndex` compiles the catalog once into bitsets (Python ints, bit
+N = Nth control in catalog order):
+
+- control_id -> controls with that ID
+- tag -> controls carrying the tag
+- framework_id -> controls that list the framework explicitly
+
+The controls matching a framework are then the union of its declared framework
+bits, its explicit controls and the tag bitsets of its domains, which is the same
+rule as `matches_control`. Per-framework results are memoized on the index.
+
+Indexes are kept in a small process-wide LRU cache keyed by the control
+definitions themselves (frozen, so equal catalogs hash alike), so runs over the
+same catalog reuse the compiled index. The catalog version, a fingerprint of the
+definitions, is computed once when an index is compiled.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
+import json
+import threading
+from types import MappingProxyType
+from typing import Iterator, Mapping, Sequence
+
+from backend.app.engines.regulatory_readiness.controls import ControlDefinition
+from backend.app.engines.regulatory_readiness.frameworks import RegulatoryFramework
+
+
+INDEX_CACHE_SIZE = 8
+
+
+def catalog_version(controls: Sequence[ControlDefinition]) -> str:
+    """Fingerprint of the control definitions, in catalog order."""
+    digest = hashlib.sha256()
+    for control in controls:
+        digest.update(json.dumps(control.as_dict(), sort_keys=True).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+@dataclass(frozen=True)
+class CatalogMatchIndex:
+    version: str
+    controls: tuple[ControlDefinition, ...]
+    control_bits: Mapping[str, int]
+    tag_bits: Mapping[str, int]
+    framework_bits: Mapping[str, int]
+    _framework_cache: dict[RegulatoryFramework, int] = field(default_factory=dict, compare=False, repr=False)
+
+    def matching_bits(self, framework: RegulatoryFramework) -> int:
+        cached = self._framework_cache.get(framework)
+        if cached is not None:
+            return cached
+        bits = self.framework_bits.get(framework.framework_id, 0)
+        for control_id in framework.explicit_controls:
+            bits |= self.control_bits.get(control_id, 0)
+        for domain in framework.domains:
+            bits |= self.tag_bits.get(domain, 0)
+        self._framework_cache[framework] = bits
+        return bits
+
+    def matching_controls(self, framework: RegulatoryFramework) -> tuple[ControlDefinition, ...]:
+        """Controls matching the framework, in catalog order."""
+        return tuple(self.controls[position] for position in _iter_bits(self.matching_bits(framework)))
+
+    def frameworks_by_control(
+        self, frameworks: Sequence[RegulatoryFramework]
+    ) -> tuple[tuple[RegulatoryFramework, ...], ...]:
+        """For each control position, the matching frameworks in `frameworks` order."""
+        matched: list[list[RegulatoryFramework]] = [[] for _ in self.controls]
+        for framework in frameworks:
+            for position in _iter_bits(self.matching_bits(framework)):
+                matched[position].append(framework)
+        return tuple(tuple(items) for items in matched)
+
+
+def _compile(controls: tuple[ControlDefinition, ...]) -> CatalogMatchIndex:
+    control_bits: dict[str, int] = {}
+    tag_bits: dict[str, int] = {}
+    framework_bits: dict[str, int] = {}
+    for position, control in enumerate(controls):
+        bit = 1 << position
+        control_bits[control.control_id] = control_bits.get(control.control_id, 0) | bit
+        for tag in control.tags:
+            tag_bits[tag] = tag_bits.get(tag, 0) | bit
+        for framework_id in control.frameworks:
+            framework_bits[framework_id] = framework_bits.get(framework_id, 0) | bit
+    return CatalogMatchIndex(
+        version=catalog_version(controls),
+        controls=controls,
+        control_bits=MappingProxyType(control_bits),
+        tag_bits=MappingProxyType(tag_bits),
+        framework_bits=MappingProxyType(framework_bits),
+    )
+
+
+_CACHE: OrderedDict[tuple[ControlDefinition, ...], CatalogMatchIndex] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def compile_catalog_index(controls: Sequence[ControlDefinition]) -> CatalogMatchIndex:
+    """Return the compiled index for `controls`, reusing a cached one for the same definitions."""
+    controls = tuple(controls)
+    with _CACHE_LOCK:
+        index = _CACHE.get(controls)
+        if index is not None:
+            _CACHE.move_to_end(controls)
+            return index
+    index = _compile(controls)
+    with _CACHE_LOCK:
+        _CACHE[controls] = index
+        while len(_CACHE) > INDEX_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return index
+
+
+def clear_index_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
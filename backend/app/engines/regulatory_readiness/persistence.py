@@ -0,0 +1,80 @@
+"""
+Set-based persistence for regulatory readiness runs.
+
+A run collects every control record, gap, remediation task, finding, evidence
+record and link it wants to write into a `PersistenceBatch` (all IDs are
+deterministic, so they are known up front). `persist_batch` then writes the
+findings, evidence and links with core's `persist_evidence_batch` (one prefetch
+per table, immutability verified in memory, multi-row inserts) and inserts the
+missing engine rows the same way. The number of round-trips no longer grows with
+the number of controls.
+
+Existing control records, gaps and tasks are kept as they are (first write wins),
+as before. Conflicts raise `ImmutableConflictError` before anything is inserted,
+including a batch that receives two different rows under one ID.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.evidence.service import EvidenceBatch, existing_ids, persist_evidence_batch
+from backend.app.engines.regulatory_readiness.errors import ImmutableConflictError
+from backend.app.engines.regulatory_readiness.models import (
+    RegulatoryControl,
+    RegulatoryGap,
+    RegulatoryRemediationTask,
+)
+
+DEFAULT_PERSIST_BATCH_SIZE = 500
+
+
+@dataclass
+class PersistenceBatch(EvidenceBatch):
+    """Rows of one run keyed by primary key, in insertion order."""
+    log_prefix: str = "REGULATORY"
+    conflict_error: type[Exception] = ImmutableConflictError
+    controls: dict[str, dict] = field(default_factory=dict)
+    gaps: dict[str, dict] = field(default_factory=dict)
+    tasks: dict[str, dict] = field(default_factory=dict)
+
+    def add_control(self, row: dict) -> None:
+        self.add_row(self.controls, row["control_record_id"], row, "CONTROL_ID_COLLISION")
+
+    def add_gap(self, row: dict) -> None:
+        self.add_row(self.gaps, row["gap_id"], row, "GAP_ID_COLLISION")
+
+    def add_task(self, row: dict) -> None:
+        self.add_row(self.tasks, row["task_id"], row, "TASK_ID_COLLISION")
+
+
+async def persist_batch(
+    db: AsyncSession,
+    batch: PersistenceBatch,
+    *,
+    batch_size: int = DEFAULT_PERSIST_BATCH_SIZE,
+) -> None:
+    """
+    Write the rows of `batch` that do not exist yet.
+
+    Issues one prefetch query per table (per `batch_size` IDs) and one multi-row
+    insert per table. Nothing is inserted if an existing row conflicts. Rows are
+    flushed, not committed; the caller owns the transaction.
+    """
+    if batch_size < 1:
+        raise ValueError("PERSIST_BATCH_SIZE_INVALID")
+
+    await persist_evidence_batch(db, batch, batch_size=batch_size)
+
+    # Parents before children: tasks reference gaps.
+    for model, column, rows in (
+        (RegulatoryControl, RegulatoryControl.control_record_id, batch.controls),
+        (RegulatoryGap, RegulatoryGap.gap_id, batch.gaps),
+        (RegulatoryRemediationTask, RegulatoryRemediationTask.task_id, batch.tasks),
+    ):
+        found = await existing_ids(db, column, list(rows), batch_size=batch_size)
+        new_rows = [row for row_id, row in rows.items() if row_id not in found]
+        for start in range(0, len(new_rows), batch_size):
+            await db.execute(insert(model), new_rows[start : start + batch_size])
@@ -1,23 +1,15 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-import logging
 from typing import Iterable
 
-from sqlalchemy import select
-
 from backend.app.core.db import get_sessionmaker
 from backend.app.core.dataset.immutability import install_immutability_guards
-from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.existence import dataset_version_exists
 from backend.app.core.dataset.service import load_raw_records
+from backend.app.core.profiling import mark_stage, profiled_run
 from backend.app.core.workflows.service import resolve_strict_mode
-from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
-from backend.app.core.evidence.service import (
-    create_evidence,
-    create_finding,
-    deterministic_evidence_id,
-    link_finding_to_evidence,
-)
+from backend.app.core.evidence.service import deterministic_evidence_id
 from backend.app.engines.regulatory_readiness.catalog import ControlCatalog
 from backend.app.engines.regulatory_readiness.checks import ControlEvaluation, evaluate_controls
 from backend.app.engines.regulatory_readiness.controls import (
@@ -36,7 +28,6 @@ from backend.app.engines.regulatory_readiness.errors import (
     DatasetVersionInvalidError,
     DatasetVersionMissingError,
     DatasetVersionNotFoundError,
-    ImmutableConflictError,
     RawRecordsMissingError,
     StartedAtInvalidError,
     StartedAtMissingError,
@@ -51,13 +42,7 @@ from backend.app.engines.regulatory_readiness.mapping import (
     ComplianceMapping,
     map_controls_to_frameworks,
 )
-from backend.app.engines.regulatory_readiness.models import (
-    RegulatoryControl,
-    RegulatoryGap,
-    RegulatoryRemediationTask,
-)
-
-logger = logging.getLogger(__name__)
+from backend.app.engines.regulatory_readiness.persistence import PersistenceBatch, persist_batch
 
 
 def _parse_started_at(value: object) -> datetime:
@@ -149,50 +134,41 @@ def _readiness_score_for_status(status: ControlStatus) -> float:
     }.get(status, 0.5)
 
 
-async def _persist_control_record(
-    db,
+def _control_row(
     *,
     dataset_version_id: str,
     control_record_id: str,
     control: ControlDefinition,
     evaluation: ControlEvaluation,
     created_at: datetime,
-) -> RegulatoryControl:
-    existing = await db.scalar(
-        select(RegulatoryControl).where(RegulatoryControl.control_record_id == control_record_id)
-    )
-    if existing is not None:
-        return existing
-    record = RegulatoryControl(
-        control_record_id=control_record_id,
-        dataset_version_id=dataset_version_id,
-        control_id=control.control_id,
-        title=control.title,
-        description=control.description,
-        category=control.category.value,
-        risk_type=control.risk_type.value,
-        control_status=evaluation.status.value,
-        ownership=list(control.ownership),
-        frameworks=list(control.frameworks),
-        evaluation=evaluation.as_dict(),
-        created_at=created_at,
-    )
-    db.add(record)
-    return record
+) -> dict:
+    return {
+        "control_record_id": control_record_id,
+        "dataset_version_id": dataset_version_id,
+        "control_id": control.control_id,
+        "title": control.title,
+        "description": control.description,
+        "category": control.category.value,
+        "risk_type": control.risk_type.value,
+        "control_status": evaluation.status.value,
+        "ownership": list(control.ownership),
+        "frameworks": list(control.frameworks),
+        "evaluation": evaluation.as_dict(),
+        "created_at": created_at,
+    }
 
 
-async def _persist_gap_and_task(
-    db,
+def _add_gap_and_task(
+    batch: PersistenceBatch,
     *,
-    dataset_version_id: str,
     control: ControlDefinition,
     control_record_id: str,
     evaluation: ControlEvaluation,
     mapping: ComplianceMapping,
     created_at: datetime,
 ) -> tuple[dict, dict]:
+    dataset_version_id = batch.dataset_version_id
     gap_id = deterministic_id(dataset_version_id, "gap", control.control_id, mapping.framework_id)
-    existing_gap = await db.scalar(select(RegulatoryGap).where(RegulatoryGap.gap_id == gap_id))
     severity = _severity_for_status(evaluation.status)
     gap_payload = {
         "gap_id": gap_id,
@@ -204,25 +180,22 @@ async def _persist_gap_and_task(
         "notes": mapping.notes,
         "status": evaluation.status.value,
     }
-    if existing_gap is None:
-        gap = RegulatoryGap(
-            gap_id=gap_id,
-            dataset_version_id=dataset_version_id,
-            control_record_id=control_record_id,
-            control_id=control.control_id,
-            framework_id=mapping.framework_id,
-            framework_name=mapping.framework_name,
-            severity=severity,
-            alignment_score=mapping.alignment_score,
-            notes=mapping.notes,
-            status=evaluation.status.value,
-            created_at=created_at,
-        )
-        db.add(gap)
-    task_id = deterministic_id(dataset_version_id, "task", gap_id)
-    existing_task = await db.scalar(
-        select(RegulatoryRemediationTask).where(RegulatoryRemediationTask.task_id == task_id)
+    batch.add_gap(
+        {
+            "gap_id": gap_id,
+            "dataset_version_id": dataset_version_id,
+            "control_record_id": control_record_id,
+            "control_id": control.control_id,
+            "framework_id": mapping.framework_id,
+            "framework_name": mapping.framework_name,
+            "severity": severity,
+            "alignment_score": mapping.alignment_score,
+            "notes": mapping.notes,
+            "status": evaluation.status.value,
+            "created_at": created_at,
+        }
     )
+    task_id = deterministic_id(dataset_version_id, "task", gap_id)
     owner = control.ownership[0] if control.ownership else "regulatory_team"
     task_payload = {
         "task_id": task_id,
@@ -234,126 +207,19 @@ async def _persist_gap_and_task(
         "owner": owner,
         "status": "open",
     }
-    if existing_task is None:
-        task = RegulatoryRemediationTask(
-            task_id=task_id,
-            dataset_version_id=dataset_version_id,
-            gap_id=gap_id,
-            control_id=control.control_id,
-            description=task_payload["description"],
-            owner=owner,
-            status="open",
-            created_at=created_at,
-        )
-        db.add(task)
-    return gap_payload, task_payload
-
-
-async def _strict_create_evidence(
-    db,
-    *,
-    evidence_id: str,
-    dataset_version_id: str,
-    engine_id: str,
-    kind: str,
-    payload: dict,
-    created_at: datetime,
-) -> EvidenceRecord:
-    existing = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == evidence_id))
-    if existing is not None:
-        if existing.dataset_version_id != dataset_version_id or existing.engine_id != engine_id or existing.kind != kind:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT evidence_id_collision evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("EVIDENCE_ID_COLLISION")
-        existing_created_at = existing.created_at
-        if existing_created_at.tzinfo is None:
-            existing_created_at = existing_created_at.replace(tzinfo=timezone.utc)
-        created_at_norm = created_at if created_at.tzinfo is not None else created_at.replace(tzinfo=timezone.utc)
-        if existing_created_at != created_at_norm:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT evidence_created_at_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_CREATED_AT_MISMATCH")
-        if existing.payload != payload:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT evidence_payload_mismatch evidence_id=%s dataset_version_id=%s",
-                evidence_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_EVIDENCE_MISMATCH")
-        return existing
-    return await create_evidence(
-        db,
-        evidence_id=evidence_id,
-        dataset_version_id=dataset_version_id,
-        engine_id=engine_id,
-        kind=kind,
-        payload=payload,
-        created_at=created_at,
-    )
-
-
-async def _strict_create_finding(
-    db,
-    *,
-    finding_id: str,
-    dataset_version_id: str,
-    raw_record_id: str,
-    kind: str,
-    payload: dict,
-    created_at: datetime,
-) -> FindingRecord:
-    existing = await db.scalar(select(FindingRecord).where(FindingRecord.finding_id == finding_id))
-    if existing is not None:
-        if existing.dataset_version_id != dataset_version_id or existing.raw_record_id != raw_record_id or existing.kind != kind:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT finding_id_collision finding_id=%s dataset_version_id=%s",
-                finding_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("FINDING_ID_COLLISION")
-        if existing.payload != payload:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT finding_payload_mismatch finding_id=%s dataset_version_id=%s",
-                finding_id,
-                dataset_version_id,
-            )
-            raise ImmutableConflictError("IMMUTABLE_FINDING_MISMATCH")
-        return existing
-    return await create_finding(
-        db,
-        finding_id=finding_id,
-        dataset_version_id=dataset_version_id,
-        raw_record_id=raw_record_id,
-        kind=kind,
-        payload=payload,
-        created_at=created_at,
+    batch.add_task(
+        {
+            "task_id": task_id,
+            "dataset_version_id": dataset_version_id,
+            "gap_id": gap_id,
+            "control_id": control.control_id,
+            "description": task_payload["description"],
+            "owner": owner,
+            "status": "open",
+            "created_at": created_at,
+        }
     )
-
-
-async def _strict_link(
-    db,
-    *,
-    link_id: str,
-    finding_id: str,
-    evidence_id: str,
-) -> FindingEvidenceLink:
-    existing = await db.scalar(select(FindingEvidenceLink).where(FindingEvidenceLink.link_id == link_id))
-    if existing is not None:
-        if existing.finding_id != finding_id or existing.evidence_id != evidence_id:
-            logger.warning(
-                "REGULATORY_IMMUTABLE_CONFLICT link_mismatch link_id=%s dataset_version_id=%s",
-                link_id,
-                "unknown",
-            )
-            raise ImmutableConflictError("IMMUTABLE_LINK_MISMATCH")
-        return existing
-    return await link_finding_to_evidence(db, link_id=link_id, finding_id=finding_id, evidence_id=evidence_id)
+    return gap_payload, task_payload
 
 
 def _group_mappings_by_control(mappings: Iterable[ComplianceMapping]) -> dict[str, list[ComplianceMapping]]:
@@ -363,16 +229,17 @@ def _group_mappings_by_control(mappings: Iterable[ComplianceMapping]) -> dict[st
     return grouped
 
 
+@profiled_run(ENGINE_ID)
 async def run_engine(*, dataset_version_id: object, started_at: object, parameters: dict | None = None) -> dict:
     install_immutability_guards()
     dv_id = _validate_dataset_version_id(dataset_version_id)
     started = _parse_started_at(started_at)
     params = parameters if isinstance(parameters, dict) else {}
 
+    mark_stage("load")
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as db:
-        dv = await db.scalar(select(DatasetVersion).where(DatasetVersion.id == dv_id))
-        if dv is None:
+        if not await dataset_version_exists(db, dv_id):
             raise DatasetVersionNotFoundError("DATASET_VERSION_NOT_FOUND")
 
         strict_mode_override = params.get("strict_mode") if isinstance(params.get("strict_mode"), bool) else None
@@ -392,6 +259,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         if not regulatory_payload:
             warnings.append("REGULATORY_PAYLOAD_MISSING")
 
+        mark_stage("model")
         catalog = ControlCatalog()
         control_payloads = regulatory_payload.get("controls")
         if isinstance(control_payloads, dict):
@@ -414,6 +282,7 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
         evaluation_map = {evaluation.control_id: evaluation.status for evaluation in evaluations}
         readiness_scores = [_readiness_score_for_status(evaluation.status) for evaluation in evaluations]
         readiness_score = sum(readiness_scores) / len(readiness_scores) if readiness_scores else 0.0
+        batch = PersistenceBatch(dataset_version_id=dv_id)
         control_record_ids: dict[str, str] = {}
         for control in controls:
             control_record_id = deterministic_id(dv_id, "control", control.control_id)
@@ -421,16 +290,17 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             evaluation = evaluation_by_control.get(control.control_id)
             if evaluation is None:
                 continue
-            await _persist_control_record(
-                db,
-                dataset_version_id=dv_id,
-                control_record_id=control_record_id,
-                control=control,
-                evaluation=evaluation,
-                created_at=started,
+            batch.add_control(
+                _control_row(
+                    dataset_version_id=dv_id,
+                    control_record_id=control_record_id,
+                    control=control,
+                    evaluation=evaluation,
+                    created_at=started,
+                )
             )
         compliance_mappings = map_controls_to_frameworks(
-            controls,
+            catalog.match_index(),
             framework_catalog.list_frameworks(),
             evaluations=evaluation_map,
         )
@@ -463,9 +333,8 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             control_mapping = [mapping.as_dict() for mapping in control_mapping_items]
             control_record_id = control_record_ids.get(control.control_id)
             for mapping in control_mapping_items:
-                gap_payload, task_payload = await _persist_gap_and_task(
-                    db,
-                    dataset_version_id=dv_id,
+                gap_payload, task_payload = _add_gap_and_task(
+                    batch,
                     control=control,
                     control_record_id=control_record_id or deterministic_id(
                         dv_id,
@@ -488,14 +357,15 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
                 "data_flow": regulatory_payload.get("data_flow"),
             }
             finding_id = deterministic_id(dv_id, "finding", control.control_id)
-            await _strict_create_finding(
-                db,
-                finding_id=finding_id,
-                dataset_version_id=dv_id,
-                raw_record_id=primary_raw.raw_record_id,
-                kind=FINDING_KIND,
-                payload=finding_payload,
-                created_at=started,
+            batch.add_finding(
+                {
+                    "finding_id": finding_id,
+                    "dataset_version_id": dv_id,
+                    "raw_record_id": primary_raw.raw_record_id,
+                    "kind": FINDING_KIND,
+                    "payload": finding_payload,
+                    "created_at": started,
+                }
             )
             evidence_id = deterministic_evidence_id(
                 dataset_version_id=dv_id,
@@ -503,22 +373,23 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
                 kind=CONTROL_EVIDENCE_KIND,
                 stable_key=control.control_id,
             )
-            await _strict_create_evidence(
-                db,
-                evidence_id=evidence_id,
-                dataset_version_id=dv_id,
-                engine_id=ENGINE_ID,
-                kind=CONTROL_EVIDENCE_KIND,
-                payload={
-                    "control": control.as_dict(),
-                    "evaluation": evaluation.as_dict(),
-                    "framework_mappings": control_mapping,
-                    "source_raw_record_id": primary_raw.raw_record_id,
-                },
-                created_at=started,
+            batch.add_evidence(
+                {
+                    "evidence_id": evidence_id,
+                    "dataset_version_id": dv_id,
+                    "engine_id": ENGINE_ID,
+                    "kind": CONTROL_EVIDENCE_KIND,
+                    "payload": {
+                        "control": control.as_dict(),
+                        "evaluation": evaluation.as_dict(),
+                        "framework_mappings": control_mapping,
+                        "source_raw_record_id": primary_raw.raw_record_id,
+                    },
+                    "created_at": started,
+                }
             )
             link_id = deterministic_id(dv_id, "link", finding_id, evidence_id)
-            await _strict_link(db, link_id=link_id, finding_id=finding_id, evidence_id=evidence_id)
+            batch.add_link({"link_id": link_id, "finding_id": finding_id, "evidence_id": evidence_id})
             findings.append(
                 {
                     "finding_id": finding_id,
@@ -562,15 +433,18 @@ async def run_engine(*, dataset_version_id: object, started_at: object, paramete
             kind=SYSTEM_EVIDENCE_KIND,
             stable_key="compliance_snapshot",
         )
-        await _strict_create_evidence(
-            db,
-            evidence_id=compliance_evidence_id,
-            dataset_version_id=dv_id,
-            engine_id=ENGINE_ID,
-            kind=SYSTEM_EVIDENCE_KIND,
-            payload=compliance_snapshot_payload,
-            created_at=started,
+        batch.add_evidence(
+            {
+                "evidence_id": compliance_evidence_id,
+                "dataset_version_id": dv_id,
+                "engine_id": ENGINE_ID,
+                "kind": SYSTEM_EVIDENCE_KIND,
+                "payload": compliance_snapshot_payload,
+                "created_at": started,
+            }
         )
+        mark_stage("persist")
+        await persist_batch(db, batch)
 
         await db.commit()
 
@@ -11,11 +11,17 @@ from backend.app.core.normalization.api import router as normalization_router
 from backend.app.core.workflows.api import router as workflows_router
 from backend.app.core.artifacts.api import router as artifacts_router
 from backend.app.core.artifacts.fx_api import router as fx_artifacts_router
+from backend.app.core.artifacts.emission_factor_api import router as emission_factor_artifacts_router
 from backend.app.core.ocr.api import router as ocr_router
 from backend.app.core.normalization.api import router as normalization_router
 from backend.app.core.audit.api import router as audit_router
+from backend.app.core.audit.sink import start_audit_sink, stop_audit_sink
 from backend.app.core.engine_registry.mount import mount_enabled_engine_routers
 from backend.app.core.metrics import metrics_middleware, router as metrics_router
+from backend.app.core.parallel import shutdown_pool
+from backend.app.core.query_metrics import router as query_metrics_router
+from backend.app.core.profiling import profiling_middleware
+from backend.app.core.profiling.api import router as profiling_router
 from backend.app.core.dataset.immutability import install_immutability_guards
 from backend.app.core.config import get_settings
 from backend.app.core.db import get_engine
@@ -44,6 +50,7 @@ def create_app() -> FastAPI:
         max_age=86400,
     )
     install_immutability_guards()
+    app.middleware("http")(profiling_middleware())
     app.middleware("http")(metrics_middleware())
     app.include_router(health_router)
     app.include_router(ingest_router)
@@ -53,10 +60,13 @@ def create_app() -> FastAPI:
     app.include_router(workflows_router)
     app.include_router(artifacts_router)
     app.include_router(fx_artifacts_router)
+    app.include_router(emission_factor_artifacts_router)
     app.include_router(ocr_router)
     app.include_router(normalization_router)
     app.include_router(audit_router)
     app.include_router(metrics_router)
+    app.include_router(query_metrics_router)
+    app.include_router(profiling_router)
     register_all_engines()
     mount_enabled_engine_routers(app)
 
@@ -66,6 +76,20 @@ def create_app() -> FastAPI:
         if settings.database_url and settings.database_url.startswith("sqlite"):
             await ensure_sqlite_schema(get_engine())
 
+    @app.on_event("startup")
+    async def _start_audit_sink() -> None:
+        settings = get_settings()
+        if settings.audit_write_behind and settings.database_url:
+            await start_audit_sink()
+
+    @app.on_event("shutdown")
+    async def _stop_audit_sink() -> None:
+        await stop_audit_sink()
+
+    @app.on_event("shutdown")
+    async def _stop_parallel_pool() -> None:
+        shutdown_pool()
+
     return app
 
 
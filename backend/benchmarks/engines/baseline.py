@@ -0,0 +1,76 @@
+"""
+Baseline comparison for benchmark results.
+
+A baseline is simply a previous `bench_engines.py` output file. Results are matched
+on (engine, size, phase). Latency is flagged when it is both relatively slower
+than the tolerance and slower by more than a small absolute floor, so
+millisecond-level jitter on fast phases does not fail a run. Query counts are
+deterministic for a given input, so any increase is flagged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float | None:
+        return self.current / self.baseline if self.baseline else None
+
+    def to_payload(self) -> dict[str, Any]:
+        ratio = self.ratio
+        return {
+            "key": self.key,
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "current": self.current,
+            "ratio": round(ratio, 4) if ratio is not None else None,
+        }
+
+
+def result_key(result: dict[str, Any]) -> str:
+    return f"{result['engine']}/{result['size']}/{result['phase']}"
+
+
+def load_baseline(path: str) -> list[dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    results = payload.get("results") if isinstance(payload, dict) else payload
+    if not isinstance(results, list):
+        raise ValueError(f"BASELINE_INVALID: {path} has no results list")
+    return results
+
+
+def compare_to_baseline(
+    current: Iterable[dict[str, Any]],
+    baseline: Iterable[dict[str, Any]],
+    *,
+    latency_tolerance: float = 0.25,
+    min_latency_delta_ms: float = 5.0,
+) -> list[Regression]:
+    """Return the regressions of `current` against `baseline`; keys missing from either side are ignored."""
+    previous = {result_key(result): result for result in baseline}
+    regressions: list[Regression] = []
+    for result in current:
+        key = result_key(result)
+        before = previous.get(key)
+        if before is None:
+            continue
+        old_ms, new_ms = float(before["latency_ms"]), float(result["latency_ms"])
+        if new_ms > old_ms * (1 + latency_tolerance) and new_ms - old_ms > min_latency_delta_ms:
+            regressions.append(Regression(key=key, metric="latency_ms", baseline=old_ms, current=new_ms))
+        old_queries, new_queries = before.get("queries"), result.get("queries")
+        if isinstance(old_queries, int) and isinstance(new_queries, int) and new_queries > old_queries:
+            regressions.append(
+                Regression(key=key, metric="queries", baseline=float(old_queries), current=float(new_queries))
+            )
+    return regressions
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+from httpx import ASGITransport, AsyncClient
+
+from backend.benchmarks.engines.baseline import compare_to_baseline, load_baseline
+from backend.benchmarks.engines.scenarios import SCENARIOS, EngineScenario, ScenarioContext, scenarios_by_name
+
+
+@dataclass(frozen=True)
+class PhaseSample:
+    seconds: float
+    queries: int
+    db_seconds: float
+    rows: int
+    peak_alloc_kb: int
+
+
+@dataclass(frozen=True)
+class PhaseResult:
+    engine: str
+    engine_id: str
+    size: int
+    phase: str
+    items: int
+    repeat: int
+    latency_ms: float
+    latency_ms_min: float
+    latency_ms_max: float
+    throughput_per_s: float
+    queries: int
+    db_ms: float
+    rows: int
+    peak_alloc_kb: int
+
+
+def _parse_sizes(value: str) -> list[int]:
+    sizes = [int(item) for item in (part.strip() for part in value.split(",")) if item]
+    if not sizes or any(size <= 0 for size in sizes):
+        raise ValueError("Sizes must be a comma-delimited list of positive integers.")
+    return sizes
+
+
+async def _timed(
+    samples: dict[str, list[PhaseSample]],
+    scenario: EngineScenario,
+    phase: str,
+    fn: Callable[[], Awaitable[Any]],
+) -> Any:
+    from backend.app.core.query_metrics import track_queries
+
+    # Peak Python allocations of this phase alone; process RSS only ever grows across phases.
+    tracemalloc.reset_peak()
+    with track_queries("benchmark", f"{scenario.name}:{phase}") as stats:
+        start = time.perf_counter()
+        result = await fn()
+        seconds = time.perf_counter() - start
+    samples.setdefault(phase, []).append(
+        PhaseSample(
+            seconds=seconds,
+            queries=stats.query_count,
+            db_seconds=stats.db_seconds,
+            rows=stats.rows,
+            peak_alloc_kb=tracemalloc.get_traced_memory()[1] // 1024,
+        )
+    )
+    return result
+
+
+async def _ingest(records: list[dict]) -> str:
+    from backend.app.core.db import get_sessionmaker
+    from backend.app.core.ingestion.service import ingest_records
+
+    async with get_sessionmaker()() as db:
+        dataset_version_id, _, _, _ = await ingest_records(db, records=records, normalize=True)
+    return dataset_version_id
+
+
+async def _run_flow(
+    client: AsyncClient, scenario: EngineScenario, size: int, samples: dict[str, list[PhaseSample]]
+) -> int:
+    """Ingest, prepare, run and report once on a fresh dataset version; returns the ingested record count."""
+    records = scenario.records(size)
+    dataset_version_id = await _timed(samples, scenario, "ingest", lambda: _ingest(records))
+    ctx = ScenarioContext(dataset_version_id=dataset_version_id, size=size)
+    if scenario.prepare is not None:
+        await _timed(samples, scenario, "prepare", lambda: scenario.prepare(client, ctx))
+    await _timed(samples, scenario, "run", lambda: scenario.run(client, ctx))
+    if scenario.report is not None:
+        await _timed(samples, scenario, "report", lambda: scenario.report(client, ctx))
+    return len(records)
+
+
+def _aggregate(scenario: EngineScenario, size: int, items: dict[str, int], samples: dict[str, list[PhaseSample]]) -> list[PhaseResult]:
+    results: list[PhaseResult] = []
+    for phase, phase_samples in samples.items():
+        latencies = [sample.seconds for sample in phase_samples]
+        median_seconds = statistics.median(latencies)
+        results.append(
+            PhaseResult(
+                engine=scenario.name,
+                engine_id=scenario.engine_id,
+                size=size,
+                phase=phase,
+                items=items[phase],
+                repeat=len(phase_samples),
+                latency_ms=round(median_seconds * 1000, 3),
+                latency_ms_min=round(min(latencies) * 1000, 3),
+                latency_ms_max=round(max(latencies) * 1000, 3),
+                throughput_per_s=round(items[phase] / median_seconds, 3) if median_seconds > 0 else 0.0,
+                queries=max(sample.queries for sample in phase_samples),
+                db_ms=round(statistics.median(sample.db_seconds for sample in phase_samples) * 1000, 3),
+                rows=max(sample.rows for sample in phase_samples),
+                peak_alloc_kb=max(sample.peak_alloc_kb for sample in phase_samples),
+            )
+        )
+    return results
+
+
+def _configure_environment(*, database_url: str, scenarios: list[EngineScenario]) -> None:
+    os.environ["TODISCOPE_DATABASE_URL"] = database_url
+    os.environ["TODISCOPE_ENABLED_ENGINES"] = ",".join(scenario.engine_id for scenario in scenarios)
+    os.environ.setdefault("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+
+
+async def run_suite(
+    *,
+    scenarios: list[EngineScenario],
+    sizes: list[int],
+    repeat: int,
+    database_url: str,
+) -> tuple[list[PhaseResult], list[dict[str, Any]]]:
+    """Run every scenario at every size; returns (results, errors)."""
+    _configure_environment(database_url=database_url, scenarios=scenarios)
+
+    from backend.app.core.db import get_engine
+    from backend.app.core.db_bootstrap import ensure_sqlite_schema
+    from backend.app.main import create_app
+
+    # Tables declared outside `models` modules are not picked up by the bootstrap import sweep.
+    from backend.app.engines.financial_forensics import normalization as _ff_normalization  # noqa: F401
+
+    # create_all only adds missing tables, so this is also safe on a local Postgres.
+    await ensure_sqlite_schema(get_engine())
+    app = create_app()
+
+    results: list[PhaseResult] = []
+    errors: list[dict[str, Any]] = []
+    tracemalloc.start()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        for scenario in scenarios:
+            for size in sizes:
+                samples: dict[str, list[PhaseSample]] = {}
+                try:
+                    for _ in range(repeat):
+                        ingested = await _run_flow(client, scenario, size, samples)
+                except Exception as exc:  # noqa: BLE001 - report and continue with the next scenario
+                    errors.append(
+                        {
+                            "engine": scenario.name,
+                            "size": size,
+                            "error": f"{type(exc).__name__}: {exc}",
+                            "traceback": traceback.format_exc(limit=5),
+                        }
+                    )
+                    continue
+                items = {"ingest": ingested, "prepare": size, "run": size, "report": size}
+                results.extend(_aggregate(scenario, size, items, samples))
+    tracemalloc.stop()
+    await get_engine().dispose()
+    return results, errors
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ingestion, run and report paths across all engines.")
+    parser.add_argument("--engines", default="", help=f"Comma-delimited scenario names (default: all). Available: {', '.join(s.name for s in SCENARIOS)}")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-delimited input sizes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Full flows per engine and size (fresh dataset version each).")
+    parser.add_argument(
+        "--database-url",
+        default="",
+        help="Async SQLAlchemy URL, e.g. postgresql+asyncpg://localhost/todiscope_bench (default: temporary SQLite file).",
+    )
+    parser.add_argument("--baseline", default="", help="Previous output JSON to compare against.")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="Allowed relative latency increase.")
+    parser.add_argument("--min-latency-delta-ms", type=float, default=5.0, help="Ignore latency increases below this.")
+    parser.add_argument("--output", default="", help="Optional path to write JSON output.")
+    args = parser.parse_args()
+
+    available = scenarios_by_name()
+    names = [name.strip() for name in args.engines.split(",") if name.strip()] or list(available)
+    unknown = sorted(set(names) - set(available))
+    if unknown:
+        parser.error(f"Unknown engines: {', '.join(unknown)}")
+    sizes = _parse_sizes(args.sizes)
+
+    database_url = args.database_url
+    if not database_url:
+        tmp = tempfile.NamedTemporaryFile(prefix="todiscope-bench-", suffix=".db", delete=False)
+        tmp.close()
+        database_url = f"sqlite+aiosqlite:///{tmp.name}"
+
+    results, errors = await run_suite(
+        scenarios=[available[name] for name in names],
+        sizes=sizes,
+        repeat=max(1, args.repeat),
+        database_url=database_url,
+    )
+    payload: dict[str, Any] = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database_url.split(":", 1)[0],
+            "sizes": sizes,
+            "repeat": max(1, args.repeat),
+        },
+        "results": [asdict(result) for result in results],
+        "errors": errors,
+    }
+    regressions = []
+    if args.baseline:
+        regressions = compare_to_baseline(
+            payload["results"],
+            load_baseline(args.baseline),
+            latency_tolerance=args.latency_tolerance,
+            min_latency_delta_ms=args.min_latency_delta_ms,
+        )
+        payload["baseline"] = {"path": args.baseline, "regressions": [r.to_payload() for r in regressions]}
+
+    serialized = json.dumps(payload, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(serialized)
+    else:
+        print(serialized)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.key} {regression.metric}: {regression.baseline:g} -> {regression.current:g}",
+            file=sys.stderr,
+        )
+    for error in errors:
+        print(f"ERROR {error['engine']} size={error['size']}: {error['error']}", file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,345 @@
+"""
+Deterministic synthetic inputs for the cross-engine benchmark suite.
+
+Every generator takes a `size` (the number of domain items the engine has to work
+through: invoices/payments, BOQ lines, claims, controls, ...) and an optional
+`seed`, and returns raw ingestion records. The same (size, seed) always yields the
+same records, so latency and query counts are comparable across runs.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import hashlib
+import random
+from typing import Any
+
+
+BASE_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CURRENCIES = ("USD", "EUR", "GBP")
+
+
+def _iso(days: int) -> str:
+    return (BASE_DATE + timedelta(days=days)).isoformat()
+
+
+def _record(source_record_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {"source_system": "benchmark", "source_record_id": source_record_id, **payload}
+
+
+def financial_forensics_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """`size` invoices, each settled by one or two payments (some exact, some partial)."""
+    rng = random.Random(seed)
+    records: list[dict[str, Any]] = []
+    for i in range(size):
+        counterparty = f"cp-{i % max(1, size // 10)}"
+        amount = rng.randint(100, 50_000)
+        reference = f"doc-{i}"
+        records.append(
+            _record(
+                f"inv-{i}",
+                {
+                    "record_type": "invoice",
+                    "posted_at": _iso(i % 300),
+                    "counterparty_id": counterparty,
+                    "amount_original": f"{amount}.00",
+                    "currency_original": "USD",
+                    "direction": "debit",
+                    "reference_ids": [reference],
+                },
+            )
+        )
+        parts = [amount] if i % 3 else [amount // 2, amount - amount // 2 - (i % 7)]
+        for j, part in enumerate(parts):
+            records.append(
+                _record(
+                    f"pay-{i}-{j}",
+                    {
+                        "record_type": "payment",
+                        "posted_at": _iso(i % 300 + 5 + j),
+                        "counterparty_id": counterparty,
+                        "amount_original": f"{part}.00",
+                        "currency_original": "USD",
+                        "direction": "credit",
+                        "reference_ids": [reference],
+                    },
+                )
+            )
+    return records
+
+
+def construction_cost_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """One BOQ record and one actuals record with `size` lines each (a few unmatched)."""
+    rng = random.Random(seed)
+    categories = ("labor", "materials", "equipment", "subcontract")
+    boq_lines = []
+    actual_lines = []
+    for i in range(size):
+        planned = rng.randint(1_000, 250_000)
+        category = categories[i % len(categories)]
+        boq_lines.append({"id": f"b{i}", "item": f"ITEM-{i}", "total": str(planned), "category": category})
+        if i % 17 == 0:
+            continue  # unmatched BOQ line
+        variance = rng.uniform(-0.15, 0.25)
+        actual_lines.append(
+            {"id": f"a{i}", "item": f"ITEM-{i}", "total": f"{planned * (1 + variance):.2f}", "category": category}
+        )
+    return [_record("boq", {"lines": boq_lines}), _record("actual", {"lines": actual_lines})]
+
+
+def csrd_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """`size` reporting-entity records with emissions, energy and governance data."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        revenue = rng.randint(10_000_000, 500_000_000)
+        renewable = round(rng.uniform(5, 80), 2)
+        records.append(
+            _record(
+                f"entity-{i}",
+                {
+                    "esg": {
+                        "emissions": {
+                            "scope1": rng.randint(100, 20_000),
+                            "scope2": rng.randint(100, 40_000),
+                            "scope3": rng.randint(1_000, 200_000),
+                        },
+                        "energy_consumption": {"renewable": renewable, "non_renewable": round(100 - renewable, 2)},
+                        "governance": {"board_diversity": round(rng.uniform(0.1, 0.5), 2), "esg_committee": i % 2 == 0},
+                    },
+                    "financial": {
+                        "revenue": revenue,
+                        "operating_costs": revenue * 0.8,
+                        "profit": revenue * 0.2,
+                        "assets": revenue * 5,
+                    },
+                },
+            )
+        )
+    return records
+
+
+def capital_debt_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """One balance-sheet record carrying `size` debt instruments."""
+    rng = random.Random(seed)
+    instruments = []
+    for i in range(size):
+        instruments.append(
+            {
+                "id": f"loan-{i}",
+                "principal": rng.randint(50_000, 2_000_000),
+                "annual_interest_rate": round(rng.uniform(0.02, 0.12), 4),
+                "amortization": "amortizing" if i % 3 else "bullet",
+                "payment_frequency_months": (1, 3, 6)[i % 3],
+                "term_months": 12 * (1 + i % 10),
+            }
+        )
+    total_debt = sum(item["principal"] for item in instruments)
+    return [
+        _record(
+            "balance-sheet",
+            {
+                "financial": {
+                    "analysis_date": "2025-01-01",
+                    "balance_sheet": {
+                        "cash_and_equivalents": total_debt * 0.2,
+                        "current_assets": total_debt * 0.9,
+                        "current_liabilities": total_debt * 0.6,
+                        "total_equity": total_debt * 1.1,
+                    },
+                    "income_statement": {"ebitda": total_debt * 0.3, "operating_expenses": total_debt * 0.5},
+                    "debt": {"total_debt": total_debt, "undrawn_credit_lines": total_debt * 0.1, "instruments": instruments},
+                    "capex_plan_12m": total_debt * 0.05,
+                }
+            },
+        )
+    ]
+
+
+def deal_readiness_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """`size` generic data-room index records (the run itself scales with optional inputs)."""
+    return [_record(f"dataroom-{i}", {"document": f"doc-{i}", "section": f"s{i % 12}"}) for i in range(size)]
+
+
+def deal_readiness_optional_inputs(size: int) -> dict[str, dict[str, str]]:
+    """`size` optional prerequisites pointing at artifacts that do not exist (each yields a finding)."""
+    return {
+        f"input_{i:05d}": {"artifact_key": f"benchmarks/missing/{i}.json", "sha256": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(size)
+    }
+
+
+def distressed_asset_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """One debt record with `size` instruments and `size // 4` distressed assets."""
+    rng = random.Random(seed)
+    instruments = []
+    for i in range(size):
+        base = rng.randint(50_000, 2_000_000)
+        instruments.append(
+            {
+                "principal": base,
+                "interest_rate_pct": round(3.5 + (i % 7) * 0.25, 2),
+                "collateral_value": round(base * rng.uniform(0.3, 0.9), 2),
+                "currency": CURRENCIES[i % len(CURRENCIES)],
+            }
+        )
+    assets = [
+        {"name": f"asset-{i}", "value": rng.randint(10_000, 500_000), "recovery_rate_pct": 30 + (i % 5) * 5}
+        for i in range(max(1, size // 4))
+    ]
+    total = sum(item["principal"] for item in instruments)
+    return [
+        _record(
+            "debt-book",
+            {
+                "financial": {
+                    "debt": {"instruments": instruments, "interest_rate_pct": 4.5},
+                    "assets": {"total": total * 2},
+                },
+                "distressed_assets": assets,
+                "currency": "USD",
+            },
+        )
+    ]
+
+
+def insurance_claim_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """`size` claims, one per record, each with one to four transactions."""
+    rng = random.Random(seed)
+    claim_types = ("property", "liability", "auto", "health")
+    records = []
+    for i in range(size):
+        amount = float(rng.randint(1_000, 250_000))
+        transactions = []
+        remaining = amount
+        for j in range(1 + i % 4):
+            paid = round(remaining if j == i % 4 else remaining * rng.uniform(0.2, 0.6), 2)
+            remaining = round(remaining - paid, 2)
+            transactions.append(
+                {
+                    "transaction_id": f"tx-{i}-{j}",
+                    "transaction_type": "payment" if j % 3 else "reserve",
+                    "transaction_date": _iso(30 + i % 200 + j * 7),
+                    "amount": paid,
+                    "currency": "USD",
+                    "description": f"Transaction {j}",
+                }
+            )
+        records.append(
+            _record(
+                f"claim-{i}",
+                {
+                    "insurance_claim": {
+                        "claim_id": f"claim-{i}",
+                        "policy_number": f"POL-{i % max(1, size // 5):05d}",
+                        "claim_number": f"CLM-{i:06d}",
+                        "claim_type": claim_types[i % len(claim_types)],
+                        "claim_status": "open" if i % 5 else "closed",
+                        "reported_date": _iso(20 + i % 200),
+                        "incident_date": _iso(i % 200),
+                        "claim_amount": amount,
+                        "currency": "USD",
+                        "claimant_name": f"Claimant {i}",
+                        "claimant_type": "individual" if i % 2 else "business",
+                        "description": "Synthetic benchmark claim",
+                        "transactions": transactions,
+                    }
+                },
+            )
+        )
+    return records
+
+
+def litigation_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """One dispute with `size` claims, liable parties and scenarios."""
+    rng = random.Random(seed)
+    parties = max(1, size // 10)
+    return [
+        _record(
+            "dispute",
+            {
+                "legal_dispute": {
+                    "claims": [{"amount": rng.randint(10_000, 1_000_000)} for _ in range(size)],
+                    "damages": {"compensatory": 800_000, "punitive": 200_000, "mitigation": 100_000},
+                    "liability": {
+                        "parties": [
+                            {"party": f"Party {i}", "percent": round(100 / parties, 4), "evidence_strength": 0.5 + (i % 5) / 10}
+                            for i in range(parties)
+                        ],
+                        "admissions": [f"Admission {i}" for i in range(size % 7)],
+                    },
+                    "scenarios": [
+                        {
+                            "name": f"Scenario {i}",
+                            "probability": round(1 / size, 6),
+                            "expected_damages": rng.randint(100_000, 2_000_000),
+                            "liability_multiplier": 1.0 + (i % 5) / 10,
+                        }
+                        for i in range(size)
+                    ],
+                    "legal_consistency": {"conflicts": [], "missing_support": []},
+                }
+            },
+        )
+    ]
+
+
+def regulatory_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """One control inventory with `size` controls spread across frameworks."""
+    frameworks = ("iso27001", "internal_controls", "sox", "gdpr")
+    statuses = ("implemented", "partially_implemented", "not_implemented")
+    controls = [
+        {
+            "id": f"ctrl-{i:05d}",
+            "title": f"Control {i}",
+            "description": f"Synthetic control {i}.",
+            "category": ("data_governance", "access", "change_management")[i % 3],
+            "risk_type": "compliance",
+            "ownership": [f"team_{i % 6}"],
+            "status": statuses[i % len(statuses)],
+            "frameworks": [frameworks[i % len(frameworks)]],
+        }
+        for i in range(size)
+    ]
+    hints = {control["id"]: control["status"] for control in controls[::5]}
+    return [
+        _record(
+            "controls",
+            {"regulatory": {"controls": controls, "control_status_hints": hints, "data_flow": {"source": "erp_system"}}},
+        )
+    ]
+
+
+def audit_control_catalog(size: int) -> dict[str, Any]:
+    """A single framework with `size` controls, each requiring one or two evidence types."""
+    controls = [{"control_id": f"ctrl_{i:05d}", "control_name": f"Control {i}", "critical": i % 4 == 0} for i in range(size)]
+    required = {
+        control["control_id"]: [f"evidence_type_{i % 8}"] + ([f"evidence_type_{(i + 3) % 8}"] if i % 2 else [])
+        for i, control in enumerate(controls)
+    }
+    return {
+        "frameworks": {
+            "benchmark_framework": {
+                "metadata": {"name": "Benchmark Framework", "version": "v1"},
+                "controls": controls,
+                "required_evidence_types": required,
+            }
+        }
+    }
+
+
+def generic_records(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """`size` flat ERP-style records with a few duplicates and missing fields."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        payload: dict[str, Any] = {
+            "customer_id": f"cust-{i % max(1, size - size // 20)}",
+            "amount": round(rng.uniform(1, 10_000), 2),
+            "currency": CURRENCIES[i % len(CURRENCIES)],
+            "posted_at": _iso(i % 365),
+        }
+        if i % 11 == 0:
+            payload.pop("currency")
+        records.append(_record(f"row-{i}", payload))
+    return records
@@ -0,0 +1,16 @@
+-- Migration: Composite indexes for audit log keyset pagination
+-- Description: Supports GET /api/v3/audit/logs ordered by (created_at, audit_log_id)
+--              with the common dataset_version_id / action_type filters, so deep
+--              pages and filtered listings are index range scans instead of sorts.
+--
+-- CONCURRENTLY avoids blocking audit writes; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_created_at_id
+    ON audit_log (created_at, audit_log_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_log_dataset_action_created
+    ON audit_log (dataset_version_id, action_type, created_at, audit_log_id);
+
+-- Rollback:
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_dataset_action_created;
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_audit_log_created_at_id;
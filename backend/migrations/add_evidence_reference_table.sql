@@ -0,0 +1,27 @@
+-- Migration: Indexed references extracted from evidence and finding payloads
+-- Description: Side table written by create_evidence/create_finding so lookups such as
+--              "evidence referencing control X" or "findings from rule Y" are index
+--              range scans instead of payload scans. See core/evidence/references.py.
+--
+-- evidence_records.payload is JSON (not JSONB), so a GIN index on the payload would
+-- need an expression index on payload::jsonb and Postgres-only queries; the side table
+-- keeps the same queries working on SQLite.
+--
+-- After applying, index existing rows per dataset version with
+-- backend.app.core.evidence.references.backfill_references (safe to re-run).
+
+CREATE TABLE IF NOT EXISTS evidence_reference (
+    subject_type VARCHAR NOT NULL,
+    subject_id VARCHAR NOT NULL,
+    ref_type VARCHAR NOT NULL,
+    ref_value VARCHAR NOT NULL,
+    dataset_version_id VARCHAR NOT NULL REFERENCES dataset_version (id),
+    PRIMARY KEY (subject_type, subject_id, ref_type, ref_value)
+);
+
+CREATE INDEX IF NOT EXISTS ix_evidence_reference_lookup
+    ON evidence_reference (dataset_version_id, ref_type, ref_value, subject_type);
+
+-- Rollback:
+-- DROP INDEX IF EXISTS ix_evidence_reference_lookup;
+-- DROP TABLE IF EXISTS evidence_reference;
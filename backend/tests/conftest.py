@@ -5,9 +5,13 @@ import pytest
 import pytest_asyncio
 
 from backend.app.core.artifacts.store import reset_artifact_store_for_tests
+from backend.app.core.audit.sink import reset_audit_sink_for_tests
+from backend.app.core.dataset.existence import reset_dataset_version_cache_for_tests
 from backend.app.core.db import get_engine, reset_db_state_for_tests
 from backend.app.core.engine_registry.registry import REGISTRY
 from backend.app.core.governance import models as _governance  # noqa: F401
+from backend.app.core.lifecycle.status import reset_lifecycle_status_cache_for_tests
+from backend.app.core.query_metrics import reset_query_metrics_for_tests
 from backend.db.models.base import Base
 from sqlalchemy import create_engine
 
@@ -25,6 +29,10 @@ def _reset_globals_and_env() -> None:
 
     reset_artifact_store_for_tests()
     reset_db_state_for_tests()
+    reset_lifecycle_status_cache_for_tests()
+    reset_audit_sink_for_tests()
+    reset_dataset_version_cache_for_tests()
+    reset_query_metrics_for_tests()
     REGISTRY.reset_for_tests()
 
 
@@ -36,11 +44,15 @@ async def sqlite_db() -> None:
     os.environ["TODISCOPE_DATABASE_URL"] = db_url
     sync_engine = create_engine(f"sqlite:///{tmp.name}")
     from backend.app.core.artifacts import fx_models as _fx  # noqa: F401
+    from backend.app.core.artifacts import emission_factor_models as _emission_factors  # noqa: F401
     from backend.app.core.evidence import models as _evidence  # noqa: F401
     from backend.app.core.review import models as _review  # noqa: F401
     from backend.app.core.dataset import raw_models as _raw  # noqa: F401
     from backend.app.core.normalization import models as _norm_core  # noqa: F401
     from backend.app.core.governance import models as _governance  # noqa: F401
+    from backend.app.core.lifecycle import models as _lifecycle  # noqa: F401
+    from backend.app.core.reporting import models as _reporting  # noqa: F401
+    from backend.app.core.profiling import models as _profiling  # noqa: F401
     from backend.app.engines.financial_forensics import models as _  # noqa: F401
     from backend.app.engines.enterprise_deal_transaction_readiness import models as _engine5  # noqa: F401
     from backend.app.engines.financial_forensics import normalization as _norm  # noqa: F401
@@ -49,6 +61,7 @@ async def sqlite_db() -> None:
     from backend.app.engines.data_migration_readiness import models as _data_migration_models  # noqa: F401
     from backend.app.engines.enterprise_litigation_dispute import models as _litigation_models  # noqa: F401
     from backend.app.engines.regulatory_readiness import models as _regulatory_models  # noqa: F401
+    from backend.app.engines.audit_readiness import models as _audit_readiness_models  # noqa: F401
     from backend.app.engines.enterprise_insurance_claim_forensics import models as _insurance_claim_models  # noqa: F401
     Base.metadata.create_all(sync_engine)
     sync_engine.dispose()
@@ -0,0 +1,156 @@
+"""
+Test the persisted control-evidence index.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.evidence.models import EvidenceReference
+from backend.app.core.evidence.service import create_evidence
+from backend.app.engines.audit_readiness import evidence_index as evidence_index_module
+from backend.app.engines.audit_readiness.errors import ImmutableConflictError
+from backend.app.engines.audit_readiness.evidence_index import (
+    extract_control_ids,
+    load_control_evidence_index,
+    refresh_control_evidence_index,
+)
+from backend.app.engines.audit_readiness.evidence_integration import map_evidence_to_controls
+from backend.app.engines.audit_readiness.models.evidence_index import AuditReadinessEvidenceIndexEntry
+
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def _evidence(db, dv_id: str, evidence_id: str, kind: str, payload: dict) -> None:
+    await create_evidence(
+        db,
+        evidence_id=evidence_id,
+        dataset_version_id=dv_id,
+        engine_id="engine_audit_readiness",
+        kind=kind,
+        payload=payload,
+        created_at=CREATED_AT,
+    )
+
+
+def test_extract_control_ids_adds_control_kind_convention() -> None:
+    assert extract_control_ids("evidence", ["c2", "c1", "c1"]) == ["c1", "c2"]
+    assert extract_control_ids("control_access_001", []) == ["access_001"]
+    assert extract_control_ids("control_access_001", ["access_001"]) == ["access_001"]
+    assert extract_control_ids("control_gap", []) == []
+
+
+@pytest.mark.anyio
+async def test_index_is_persisted_and_refreshed_incrementally(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await _evidence(db, dv.id, "ev-b", "control_evidence", {"control_ids": ["ctrl_001", "ctrl_002"]})
+        await _evidence(db, dv.id, "ev-a", "control_evidence", {"control_id": "ctrl_001"})
+        await _evidence(db, dv.id, "ev-c", "regulatory_check", {"framework_id": "f1"})
+        await db.commit()
+
+    async with sessionmaker() as db:
+        index = await load_control_evidence_index(db, dv.id, batch_size=2)
+        await db.commit()
+    assert index.evidence_for("ctrl_001") == ("ev-a", "ev-b")
+    assert index.evidence_for("ctrl_002") == ("ev-b",)
+    assert index.evidence_for("missing") == ()
+
+    async with sessionmaker() as db:
+        # Every scanned record has an entry, including the one without control references.
+        entries = await db.scalar(
+            select(func.count()).select_from(AuditReadinessEvidenceIndexEntry)
+            .where(AuditReadinessEvidenceIndexEntry.dataset_version_id == dv.id)
+        )
+        assert entries == 3
+        assert await refresh_control_evidence_index(db, dv.id) == 0
+
+        await _evidence(db, dv.id, "ev-d", "control_ctrl_002", {})
+        await db.commit()
+
+    async with sessionmaker() as db:
+        assert await refresh_control_evidence_index(db, dv.id) == 1
+        evidence_map = await map_evidence_to_controls(db, dv.id, {})
+    assert evidence_map == {"ctrl_001": ["ev-a", "ev-b"], "ctrl_002": ["ev-b", "ev-d"]}
+
+
+@pytest.mark.anyio
+async def test_evidence_without_reference_rows_is_indexed_from_payload(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await _evidence(db, dv.id, "ev-legacy", "evidence", {"control": {"control_id": "ctrl_001"}})
+        await _evidence(db, dv.id, "ev-new", "evidence", {"control_id": "ctrl_002"})
+        await _evidence(db, dv.id, "ev-none", "evidence", {"note": "no controls"})
+        # Evidence written before core extracted references has no reference rows.
+        await db.execute(delete(EvidenceReference).where(EvidenceReference.subject_id == "ev-legacy"))
+        await db.commit()
+
+    async with sessionmaker() as db:
+        assert await refresh_control_evidence_index(db, dv.id, batch_size=1) == 3
+        await db.commit()
+        stored = dict(
+            (
+                await db.execute(
+                    select(AuditReadinessEvidenceIndexEntry.evidence_id, AuditReadinessEvidenceIndexEntry.control_ids)
+                    .where(AuditReadinessEvidenceIndexEntry.dataset_version_id == dv.id)
+                )
+            ).all()
+        )
+    assert stored == {"ev-legacy": ["ctrl_001"], "ev-new": ["ctrl_002"], "ev-none": []}
+
+
+def _index_concurrently(monkeypatch: pytest.MonkeyPatch, dv_id: str, evidence_id: str, control_ids: list[str]) -> None:
+    """Insert an entry for `evidence_id` after the refresh has scanned, as a concurrent run would."""
+    backfill = evidence_index_module.backfill_references
+
+    async def backfill_then_index(db, **kwargs):
+        db.add(
+            AuditReadinessEvidenceIndexEntry(
+                dataset_version_id=dv_id, evidence_id=evidence_id, control_ids=control_ids
+            )
+        )
+        await db.flush()
+        return await backfill(db, **kwargs)
+
+    monkeypatch.setattr(evidence_index_module, "backfill_references", backfill_then_index)
+
+
+@pytest.mark.anyio
+async def test_concurrently_indexed_entries_are_verified_and_the_rest_inserted(
+    sqlite_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await _evidence(db, dv.id, "ev-a", "evidence", {"control_id": "ctrl_001"})
+        await _evidence(db, dv.id, "ev-b", "evidence", {"control_id": "ctrl_002"})
+        await db.commit()
+
+    _index_concurrently(monkeypatch, dv.id, "ev-a", ["ctrl_001"])
+    async with sessionmaker() as db:
+        assert await refresh_control_evidence_index(db, dv.id) == 1
+        await db.commit()
+        index = await load_control_evidence_index(db, dv.id, refresh=False)
+    assert index.evidence_for("ctrl_001") == ("ev-a",)
+    assert index.evidence_for("ctrl_002") == ("ev-b",)
+
+
+@pytest.mark.anyio
+async def test_conflicting_concurrent_entry_raises(sqlite_db: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await _evidence(db, dv.id, "ev-a", "evidence", {"control_id": "ctrl_001"})
+        await db.commit()
+
+    _index_concurrently(monkeypatch, dv.id, "ev-a", ["ctrl_999"])
+    async with sessionmaker() as db:
+        with pytest.raises(ImmutableConflictError, match="IMMUTABLE_EVIDENCE_INDEX_MISMATCH"):
+            await refresh_control_evidence_index(db, dv.id)
@@ -80,9 +80,11 @@ async def test_end_to_end_regulatory_readiness_evaluation(sqlite_db: None) -> No
         regulatory_result = result["regulatory_results"][0]
         assert regulatory_result["framework_id"] == "framework_1"
         assert "check_status" in regulatory_result
+        assert regulatory_result["check_status"] != "error"
         assert "risk_level" in regulatory_result
         assert "controls_assessed" in regulatory_result
         assert regulatory_result["controls_assessed"] == 2
+        assert len(regulatory_result["control_gaps"]) == 2
 
         # Verify database records
         async with get_sessionmaker()() as db:
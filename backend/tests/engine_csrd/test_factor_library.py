@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.core.artifacts.emission_factor_service import create_emission_factor_artifact
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.engines.csrd import group_emissions
+from backend.app.engines.csrd.emissions import calculate_emissions
+from backend.app.engines.csrd.errors import EmissionFactorArtifactInvalidError
+from backend.app.engines.csrd.factor_library import FactorResolver, build_factor_index, clear_factor_index_cache
+from backend.app.engines.csrd.group_emissions import GroupEntity, calculate_group_emissions
+from backend.app.engines.csrd.run import run_engine
+
+
+def _row(activity: str, effective_date: str, value: str, **key: str) -> dict:
+    row = {"activity": activity, "country": None, "region": None, "fuel_type": None}
+    row.update(key)
+    return {**row, "effective_date": effective_date, "kgco2e_per_unit": value}
+
+
+TABLE = {
+    "name": "test factors",
+    "factors": [
+        _row("electricity_kwh", "2000-01-01", "0.5"),
+        _row("electricity_kwh", "2022-01-01", "0.4", country="DE"),
+        _row("electricity_kwh", "2024-01-01", "0.3", country="DE"),
+        _row("electricity_kwh", "2024-01-01", "0.1", country="DE", region="NORTH"),
+        _row("fuel_liters", "2000-01-01", "2.5"),
+        _row("fuel_liters", "2000-01-01", "2.7", fuel_type="diesel"),
+    ],
+}
+
+
+def _resolver() -> FactorResolver:
+    return FactorResolver(build_factor_index(checksum="c" * 64, payload=TABLE))
+
+
+def _site_esg(index: int) -> dict:
+    return {
+        "country": "DE" if index % 2 else "FR",
+        "grid_region": "north" if index % 4 == 1 else None,
+        "reporting_year": 2023 + index % 2,
+        "activity": {
+            "scope1": {"fuel_liters": 1000.0 * (index + 1), "fuel_type": "diesel" if index % 3 == 0 else "petrol"},
+            "scope2": {"electricity_kwh": 5000.0 + index},
+            "scope3": {"total_tco2e": 1.5},
+        },
+    }
+
+
+def test_resolver_bisects_dates_and_falls_back_to_broader_keys() -> None:
+    clear_factor_index_cache()
+    resolver = _resolver()
+    resolve = resolver.resolve
+    on = date(2025, 6, 30)
+    assert resolve("electricity_kwh", country="DE", on=date(2023, 12, 31)).kgco2e_per_unit == 0.4
+    assert resolve("electricity_kwh", country="de", on=date(2024, 1, 1)).kgco2e_per_unit == 0.3
+    assert resolve("electricity_kwh", country="DE", region="north", on=date(2024, 6, 1)).kgco2e_per_unit == 0.1
+    # The region series starts in 2024; earlier dates fall back to the country series.
+    assert resolve("electricity_kwh", country="DE", region="north", on=date(2023, 6, 1)).kgco2e_per_unit == 0.4
+    assert resolve("electricity_kwh", country="FR", on=on).kgco2e_per_unit == 0.5
+    assert resolve("fuel_liters", country="DE", fuel_type="Diesel", on=on).kgco2e_per_unit == 2.7
+    assert resolve("fuel_liters", country="DE", fuel_type="petrol", on=on).kgco2e_per_unit == 2.5
+    assert resolve("electricity_kwh", on=date(1999, 1, 1)) is None
+    assert resolve("heat_kwh", country="DE", on=on) is None
+    # Without a reporting date nothing is resolved, so results never depend on the run date.
+    assert resolve("electricity_kwh", country="DE") is None
+
+    for _ in range(1000):
+        resolve("electricity_kwh", country="DE", on=date(2023, 12, 31))
+    # Spelling variants of one key share a memo entry.
+    resolve("Electricity_KWh", country="de", on=date(2023, 12, 31))
+    resolve("fuel_liters", country="de", fuel_type="DIESEL", on=on)
+    summary = resolver.summary()
+    assert summary["lookups"] == 1011
+    assert summary["distinct_lookups"] == 9
+    assert len(summary["resolved_factors"]) == 6
+    assert build_factor_index(checksum="c" * 64, payload={}) is resolver.index
+
+
+def test_single_record_emissions_use_library_factors() -> None:
+    esg = _site_esg(1)
+    result = calculate_emissions(dataset_version_id="dv", esg=esg, parameters={}, factor_resolver=_resolver())
+    assert result.totals_tco2e["scope1"] == 2000.0 * 2.5 / 1000.0
+    assert result.totals_tco2e["scope2"] == 5001.0 * 0.1 / 1000.0
+    assert [a["id"] for a in result.assumptions] == ["assumption_units", "assumption_factor_library"]
+
+    explicit = {**esg, "activity": {**esg["activity"], "scope2": {"electricity_kwh": 10.0, "emission_factor_kgco2e_per_kwh": 1.0}}}
+    result = calculate_emissions(dataset_version_id="dv", esg=explicit, parameters={}, factor_resolver=_resolver())
+    assert result.totals_tco2e["scope2"] == 10.0 / 1000.0
+    assert "assumption_default_factors" in {a["id"] for a in result.assumptions}
+
+    undated = {key: value for key, value in esg.items() if key != "reporting_year"}
+    result = calculate_emissions(dataset_version_id="dv", esg=undated, parameters={}, factor_resolver=_resolver())
+    assert [a["id"] for a in result.assumptions] == ["assumption_units", "assumption_default_factors"]
+
+
+def test_group_rows_carry_library_keys_on_both_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    records = [
+        GroupEntity(raw_record_id=f"raw-{i}", entity_id=f"sub-{i % 3}", esg=_site_esg(i), financial={"revenue": 1e6})
+        for i in range(40)
+    ]
+    vectorized = calculate_group_emissions(records=records, parameters={}, factor_resolver=_resolver())
+    monkeypatch.setattr(group_emissions, "np", None)
+    fallback = calculate_group_emissions(records=records, parameters={}, factor_resolver=_resolver())
+    assert fallback == vectorized
+
+    for record in records[:4]:
+        single = calculate_emissions(dataset_version_id="dv", esg=record.esg, parameters={}, factor_resolver=_resolver())
+        rows = [row for row in vectorized.rows if row["raw_record_id"] == record.raw_record_id]
+        assert [row["tco2e"] for row in rows] == [single.totals_tco2e[scope] for scope in ("scope1", "scope2", "scope3")]
+    north = next(row for row in vectorized.rows if row["raw_record_id"] == "raw-1" and row["scope"] == "scope2")
+    assert north["factor_library_key"]["region"] == "NORTH" and north["factor_kgco2e_per_unit"] == 0.1
+    assert "factor_library_key" not in vectorized.rows[2]
+    assert vectorized.factor_library["checksum"] == "c" * 64
+    assert {a["id"] for a in vectorized.consolidated.assumptions} == {"assumption_units", "assumption_factor_library"}
+
+
+@pytest.mark.anyio
+async def test_run_resolves_factors_from_artifact(sqlite_db: None) -> None:
+    dv_id = "dv-csrd-factor-library"
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id=dv_id))
+        for index in range(6):
+            db.add(
+                RawRecord(
+                    raw_record_id=f"{dv_id}-raw-{index}",
+                    dataset_version_id=dv_id,
+                    source_system="test",
+                    source_record_id=f"site-{index}",
+                    payload={"entity_id": f"sub-{index % 2}", "esg": _site_esg(index), "financial": {"revenue": 1e6}},
+                    legacy_no_checksum=True,
+                    ingested_at=created_at,
+                )
+            )
+        await db.commit()
+        artifact = await create_emission_factor_artifact(
+            db, dataset_version_id=dv_id, name=TABLE["name"], factors=TABLE["factors"], created_at=created_at
+        )
+
+    parameters = {
+        "group_reporting": True,
+        "strict_mode": False,
+        "emission_factor_artifact_id": artifact.emission_factor_artifact_id,
+    }
+    result = await run_engine(dataset_version_id=dv_id, started_at="2025-01-01T00:00:00Z", parameters=parameters)
+    async with get_sessionmaker()() as db:
+        group_evidence = await db.scalar(
+            select(EvidenceRecord).where(
+                EvidenceRecord.evidence_id == result["group_emissions"]["group_emissions_evidence_id"]
+            )
+        )
+        entity_evidence = await db.scalar(
+            select(EvidenceRecord).where(EvidenceRecord.evidence_id == result["group_emissions"]["entities"][1]["evidence_id"])
+        )
+    assert group_evidence.payload["factor_library"]["checksum"] == artifact.checksum
+    assert all("factor_library_key" in row for row in entity_evidence.payload["activity_rows"] if row["scope"] != "scope3")
+    assert "assumption_factor_library" in {a["id"] for a in result["assumptions"]}
+
+    with pytest.raises(EmissionFactorArtifactInvalidError, match="EMISSION_FACTOR_ARTIFACT_NOT_FOUND"):
+        await run_engine(
+            dataset_version_id=dv_id,
+            started_at="2025-01-01T00:00:00Z",
+            parameters={**parameters, "emission_factor_artifact_id": "missing"},
+        )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.engines.csrd import group_emissions
+from backend.app.engines.csrd.emissions import calculate_emissions
+from backend.app.engines.csrd.errors import ImmutableConflictError
+from backend.app.engines.csrd.group_emissions import (
+    GroupEntity,
+    calculate_group_emissions,
+    compile_factor_set,
+    factor_set_from_parameters,
+)
+from backend.app.engines.csrd.run import run_engine
+
+
+def _site(index: int) -> dict:
+    if index % 3 == 0:
+        esg = {"emissions": {"scope1": 10.5 * index, "scope2": 3.25, "scope3": 100.0 + index}}
+    else:
+        scope1 = {"fuel_liters": 1234.5 * index}
+        if index % 5 == 0:
+            scope1["emission_factor_kgco2e_per_liter"] = 2.31
+        esg = {
+            "activity": {
+                "scope1": scope1,
+                "scope2": {"electricity_kwh": 98765.4 + index},
+                "scope3": {"total_tco2e": 12.5 * index},
+            }
+        }
+    return {"entity_id": f"sub-{index % 4}", "esg": esg, "financial": {"revenue": 1_000_000.0 * (index + 1)}}
+
+
+def _entities(count: int) -> list[GroupEntity]:
+    return [
+        GroupEntity(raw_record_id=f"raw-{index}", entity_id=payload["entity_id"], esg=payload["esg"], financial=payload["financial"])
+        for index, payload in ((index, _site(index)) for index in range(count))
+    ]
+
+
+def test_entity_totals_match_single_record_calculation() -> None:
+    entities = _entities(30)
+    result = calculate_group_emissions(records=entities, parameters={})
+
+    expected: dict[str, dict[str, float]] = {}
+    for entity in entities:
+        single = calculate_emissions(dataset_version_id="dv", esg=entity.esg, parameters={}).totals_tco2e
+        totals = expected.setdefault(entity.entity_id, {"scope1": 0.0, "scope2": 0.0, "scope3": 0.0})
+        for scope, value in single.items():
+            totals[scope] += value
+    assert {e["entity_id"]: e["totals_tco2e"] for e in result.entities} == expected
+    assert [e["entity_id"] for e in result.entities] == ["sub-0", "sub-1", "sub-2", "sub-3"]
+    assert result.entities[0]["source_raw_record_ids"] == [f"raw-{i}" for i in range(0, 30, 4)]
+    assert result.consolidated.totals_tco2e["scope2"] == pytest.approx(
+        sum(e["totals_tco2e"]["scope2"] for e in result.entities)
+    )
+    assert {a["id"] for a in result.consolidated.assumptions} == {"assumption_units", "assumption_default_factors"}
+    assert len(result.rows) == 90
+
+
+def test_numpy_and_python_paths_are_identical(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    entities = _entities(50)
+    parameters = {"carbon_price_eur_per_tco2e": 80, "emissions_impact_threshold_tco2e": 200}
+    vectorized = calculate_group_emissions(records=entities, parameters=parameters)
+    monkeypatch.setattr(group_emissions, "np", None)
+    fallback = calculate_group_emissions(records=entities, parameters=parameters)
+    assert fallback == vectorized
+
+
+def test_factor_sets_are_cached_by_content() -> None:
+    first = compile_factor_set({"fuel_liters": 2.5, "electricity_kwh": 0.3})
+    second = compile_factor_set({"electricity_kwh": 0.3, "fuel_liters": 2.5})
+    assert first is second
+    assert factor_set_from_parameters({}).version != first.version
+
+    custom = factor_set_from_parameters({"emission_factors": {"fuel_liters": 2.5, "electricity_kwh": 0.3}})
+    assert custom is first
+    result = calculate_group_emissions(records=_entities(3)[1:2], parameters={}, factor_set=custom)
+    assert result.rows[0]["factor_kgco2e_per_unit"] == 2.5
+    assert result.rows[0]["tco2e"] == 1234.5 * 2.5 / 1000.0
+    assert result.rows[2]["factor_kgco2e_per_unit"] is None
+    assert "assumption_group_factor_set" in {a["id"] for a in result.consolidated.assumptions}
+
+
+@pytest.mark.anyio
+async def test_group_reporting_run_persists_traceable_entity_evidence(sqlite_db: None) -> None:
+    dv_id = "dv-csrd-group"
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id=dv_id))
+        for index in range(8):
+            db.add(
+                RawRecord(
+                    raw_record_id=f"{dv_id}-raw-{index}",
+                    dataset_version_id=dv_id,
+                    source_system="test",
+                    source_record_id=f"site-{index}",
+                    payload=_site(index),
+                    legacy_no_checksum=True,
+                    ingested_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                )
+            )
+        await db.commit()
+
+    parameters = {"group_reporting": True, "strict_mode": False}
+    result = await run_engine(dataset_version_id=dv_id, started_at="2025-01-01T00:00:00Z", parameters=parameters)
+    group = result["group_emissions"]
+    assert group["entity_count"] == 4
+    assert result["total_emissions_tco2e"] == pytest.approx(sum(e["total_emissions_tco2e"] for e in group["entities"]))
+
+    async with get_sessionmaker()() as db:
+        entity_evidence = await db.scalar(
+            select(EvidenceRecord).where(EvidenceRecord.evidence_id == group["entities"][1]["evidence_id"])
+        )
+        group_evidence = await db.scalar(
+            select(EvidenceRecord).where(EvidenceRecord.evidence_id == group["group_emissions_evidence_id"])
+        )
+        evidence_count = await db.scalar(select(func.count()).select_from(EvidenceRecord))
+    assert entity_evidence.kind == "entity_emissions"
+    assert entity_evidence.payload["source_raw_record_ids"] == [f"{dv_id}-raw-1", f"{dv_id}-raw-5"]
+    assert {row["raw_record_id"] for row in entity_evidence.payload["activity_rows"]} == {f"{dv_id}-raw-1", f"{dv_id}-raw-5"}
+    assert group_evidence.payload["entity_evidence_ids"]["sub-1"] == entity_evidence.evidence_id
+
+    rerun = await run_engine(dataset_version_id=dv_id, started_at="2025-01-01T00:00:00Z", parameters=parameters)
+    assert rerun["group_emissions"] == group
+    async with get_sessionmaker()() as db:
+        assert await db.scalar(select(func.count()).select_from(EvidenceRecord)) == evidence_count
+        await db.execute(
+            update(EvidenceRecord)
+            .where(EvidenceRecord.evidence_id == entity_evidence.evidence_id)
+            .values(payload={"tampered": True})
+        )
+        await db.commit()
+
+    with pytest.raises(ImmutableConflictError, match="IMMUTABLE_EVIDENCE_MISMATCH"):
+        await run_engine(dataset_version_id=dv_id, started_at="2025-01-01T00:00:00Z", parameters=parameters)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.core.reporting.materialization import MaterializedReportContent
+from backend.app.engines.enterprise_deal_transaction_readiness import engine
+from backend.app.engines.enterprise_deal_transaction_readiness.externalization.views import (
+    anonymize_id,
+    create_external_view,
+    validate_external_view,
+)
+
+
+def _report() -> dict:
+    return {
+        "engine_id": "engine5",
+        "engine_version": "v1",
+        "dataset_version_id": "dv-1",
+        "run_id": "run-1",
+        "sections": [
+            {
+                "section_id": "readiness_findings",
+                "findings": [
+                    {
+                        "finding_id": f"f-{i % 7}",
+                        "evidence_ids": ["e-1", "e-2"],
+                        "evidence_id": "e-1",
+                        "artifact_key": "internal/key",
+                        "sha256": "abc",
+                        "amount": i,
+                    }
+                    for i in range(1500)
+                ],
+            },
+            {"section_id": "internal_notes", "note": "internal"},
+            {"section_id": "unknown_section", "x": 1},
+        ],
+    }
+
+
+def test_external_view_single_pass_redacts_and_anonymizes() -> None:
+    view = create_external_view(_report(), anonymization_salt="s")
+
+    assert [s["section_id"] for s in view["sections"]] == ["readiness_findings"]
+    assert view["__omitted_internal_sections__"] == ["internal_notes"]
+    assert "run_id" not in view
+    assert view["dataset_version_id"] == anonymize_id("dv-1", salt="s")
+    first = view["sections"][0]["findings"][0]
+    assert first == {
+        "finding_id": anonymize_id("f-0", salt="s"),
+        "evidence_ids": ["e-1", "e-2"],
+        "evidence_id": anonymize_id("e-1", salt="s"),
+        "amount": 0,
+    }
+    validate_external_view(view)
+
+
+def test_external_view_rejects_unstrippable_redacted_fields() -> None:
+    report = {"evidence_index": {"evidence_id": [{"artifact_key": "internal/key"}]}}
+    with pytest.raises(ValueError, match="redacted field"):
+        create_external_view(report)
+
+
+@pytest.mark.anyio
+async def test_report_endpoint_rejects_unsafe_external_view_before_responding(
+    sqlite_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TODISCOPE_ENABLED_ENGINES", engine.ENGINE_ID)
+    report = {"evidence_index": {"evidence_id": [{"artifact_key": "internal/key"}]}}
+
+    async def _complete(*args, **kwargs) -> None:
+        return None
+
+    async def _materialize(*args, **kwargs) -> MaterializedReportContent:
+        return MaterializedReportContent(report_id="r", etag='"e"', content=json.dumps(report).encode(), rendered=False)
+
+    monkeypatch.setattr(engine, "verify_calculate_complete", _complete)
+    monkeypatch.setattr(engine, "materialize_report", _materialize)
+    payload = {
+        "dataset_version_id": str(uuid.UUID(int=(0x7 << 76) | (0x8 << 60))),
+        "run_id": "run-1",
+        "view_type": "external",
+    }
+
+    with pytest.raises(HTTPException) as exc_info:
+        await engine.report_endpoint(payload)
+    assert exc_info.value.status_code == 500
+    assert "redacted field" in exc_info.value.detail
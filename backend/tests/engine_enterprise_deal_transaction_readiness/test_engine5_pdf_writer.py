@@ -0,0 +1,63 @@
+import re
+
+import pytest
+
+from backend.app.core.artifacts.store import artifact_key_from_uri, get_artifact_store
+from backend.app.engines.enterprise_deal_transaction_readiness.externalization.exporter import export_report_pdf
+from backend.app.engines.enterprise_deal_transaction_readiness.pdf import BOTTOM_MARGIN, render_simple_text_pdf
+
+
+def _check_xref(pdf: bytes) -> int:
+    startxref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf).group(1))
+    assert pdf[startxref:].startswith(b"xref\n")
+    size = int(re.search(rb"/Size (\d+)", pdf).group(1))
+    entries = pdf[startxref:].split(b"\n")[3 : 3 + size - 1]
+    for number, entry in enumerate(entries, start=1):
+        offset = int(entry[:10])
+        assert pdf[offset:].startswith(f"{number} 0 obj\n".encode())
+    return int(re.search(rb"/Type /Pages /Kids \[[^\]]*\] /Count (\d+)", pdf).group(1))
+
+
+def test_pdf_paginates_all_lines_deterministically() -> None:
+    lines = [f"line {i} ({'x' * (i % 7)})" for i in range(500)]
+    pdf = render_simple_text_pdf(title="Report", lines=lines)
+    assert pdf == render_simple_text_pdf(title="Report", lines=lines)
+    assert _check_xref(pdf) == 11  # 501 lines at 49 per page
+    assert b"(line 499 \\(xx\\)) Tj" in pdf
+
+    single = render_simple_text_pdf(title="Report", lines=[])
+    assert _check_xref(single) == 1
+
+
+def test_every_text_line_is_inside_the_media_box() -> None:
+    pdf = render_simple_text_pdf(title="Report", lines=[f"line {i}" for i in range(120)])
+    width, height = (int(v) for v in re.search(rb"/MediaBox \[0 0 (\d+) (\d+)\]", pdf).groups())
+    for stream in re.findall(rb"stream\n(.*?)\nendstream", pdf, re.S):
+        x = y = 0
+        for dx, dy in re.findall(rb"(-?\d+) (-?\d+) Td", stream):
+            x, y = x + int(dx), y + int(dy)
+            assert 0 <= x < width
+            assert BOTTOM_MARGIN <= y < height
+
+
+@pytest.mark.anyio
+async def test_export_report_pdf_streams_to_artifact_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+    findings = [
+        {"finding_id": f"f{i}", "severity": "high", "kind": "gap", "evidence_id": f"e{i}", "title": "Missing input"}
+        for i in range(200)
+    ]
+    view = {
+        "engine_id": "engine_enterprise_deal_transaction_readiness",
+        "dataset_version_id": "dv",
+        "result_set_id": "rs",
+        "sections": [{"section_id": "readiness_findings", "finding_count": 200, "findings": findings}],
+    }
+    first = await export_report_pdf(dataset_version_id="dv", result_set_id="rs", view_type="internal", report_view=view)
+    again = await export_report_pdf(dataset_version_id="dv", result_set_id="rs", view_type="internal", report_view=view)
+    assert first == again
+
+    stored = await get_artifact_store().get_bytes(key=artifact_key_from_uri(first["uri"]))
+    assert len(stored) == first["size_bytes"]
+    assert _check_xref(stored) > 1
+    assert b"(- f199 severity=high kind=gap evidence_id=e199) Tj" in stored
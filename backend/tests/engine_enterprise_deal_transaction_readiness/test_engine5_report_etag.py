@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.engines.enterprise_deal_transaction_readiness import engine
+from backend.app.engines.enterprise_deal_transaction_readiness.report import assembler
+from backend.app.main import create_app
+
+
+REPORT_URL = "/api/v3/engines/enterprise-deal-transaction-readiness/report"
+
+
+@pytest.mark.anyio
+async def test_report_answers_matching_if_none_match_with_304(
+    sqlite_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+    monkeypatch.setenv("TODISCOPE_ENABLED_ENGINES", engine.ENGINE_ID)
+    renders = 0
+
+    async def _complete(*args, **kwargs) -> None:
+        return None
+
+    async def _assemble(db, *, dataset_version_id: str, run_id: str) -> dict:
+        nonlocal renders
+        renders += 1
+        return {"dataset_version_id": dataset_version_id, "run_id": run_id, "sections": []}
+
+    monkeypatch.setattr(engine, "verify_calculate_complete", _complete)
+    monkeypatch.setattr(assembler, "assemble_report", _assemble)
+    async with get_sessionmaker()() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await db.commit()
+    params = {"dataset_version_id": dv.id, "run_id": "run-1"}
+
+    async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test") as ac:
+        first = await ac.post(REPORT_URL, json=params)
+        etag = first.headers["etag"]
+        cached = await ac.get(REPORT_URL, params=params, headers={"If-None-Match": etag})
+        stale = await ac.get(REPORT_URL, params=params, headers={"If-None-Match": '"other"'})
+        external = await ac.post(REPORT_URL, json={**params, "view_type": "external", "anonymization_salt": "s"})
+
+    assert first.status_code == 200 and first.json()["run_id"] == "run-1"
+    assert cached.status_code == 304 and cached.content == b""
+    assert stale.status_code == 200 and stale.headers["etag"] == etag
+    assert stale.json() == first.json()
+    assert external.status_code == 200
+    assert renders == 1
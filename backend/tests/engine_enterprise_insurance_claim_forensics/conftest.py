@@ -0,0 +1,60 @@
+"""Shared fixtures for the insurance claim forensics engine tests."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import pytest
+
+from backend.app.engines.enterprise_insurance_claim_forensics.claims_management import (
+    ClaimRecord,
+    ClaimTransaction,
+)
+
+
+STATUSES = ("open", "closed", "settled", "pending", "approved")
+
+
+def _portfolio(count: int) -> tuple[list[ClaimRecord], list[ClaimTransaction]]:
+    reported = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    claims: list[ClaimRecord] = []
+    transactions: list[ClaimTransaction] = []
+    for index in range(count):
+        claim_id = f"claim-{index:04d}"
+        claims.append(
+            ClaimRecord(
+                claim_id=claim_id,
+                dataset_version_id="dv-parallel",
+                policy_number=f"POL-{index % 17}",
+                claim_number=f"CLM-{index:04d}",
+                claim_type="property",
+                claim_status=STATUSES[index % len(STATUSES)],
+                reported_date=reported,
+                incident_date=reported - timedelta(days=index % 5 - 2),
+                claim_amount=1000.0 + index * 37.5,
+                currency="USD",
+                claimant_name="Claimant",
+                claimant_type="individual",
+                description="",
+                metadata={"region": "north"} if index % 4 == 0 else {},
+            )
+        )
+        for tx_index in range(index % 4):
+            transactions.append(
+                ClaimTransaction(
+                    transaction_id=f"{claim_id}-tx-{tx_index}",
+                    claim_id=claim_id,
+                    dataset_version_id="dv-parallel",
+                    transaction_type=("payment", "reserve", "settlement")[tx_index % 3],
+                    transaction_date=reported + timedelta(days=tx_index * 10),
+                    amount=250.0 * (tx_index + 1),
+                    currency="EUR" if index % 9 == 0 else "USD",
+                    description="",
+                )
+            )
+    return claims, transactions
+
+
+@pytest.fixture
+def claim_portfolio() -> Callable[[int], tuple[list[ClaimRecord], list[ClaimTransaction]]]:
+    """Builder for a deterministic portfolio of `count` claims with mixed statuses and currencies."""
+    return _portfolio
@@ -0,0 +1,109 @@
+"""Tests for buffered, bulk-persisted audit trail entries."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import math
+
+import pytest
+from sqlalchemy import func, select, update
+
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.evidence.models import EvidenceRecord
+from backend.app.core.query_metrics import track_queries
+from backend.app.engines.enterprise_insurance_claim_forensics.audit_trail import AuditTrail
+from backend.app.engines.enterprise_insurance_claim_forensics.errors import ImmutableConflictError
+
+
+LOGGED_AT = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+async def _log_portfolio(audit: AuditTrail, portfolio: tuple[list, list]) -> list[str]:
+    claims, transactions = portfolio
+    evidence_ids = [await audit.log_claim_creation(claim, created_at=LOGGED_AT) for claim in claims]
+    for transaction in transactions:
+        evidence_ids.append(await audit.log_transaction(transaction, created_at=transaction.transaction_date))
+    for claim in claims:
+        evidence_ids.append(await audit.log_validation_result(claim.claim_id, {"is_valid": True}, validated_at=LOGGED_AT))
+    return evidence_ids
+
+
+async def _flushed_run(dataset_version_id: str, portfolio: tuple[list, list]) -> tuple[list[str], str | None, int]:
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id=dataset_version_id))
+        await db.commit()
+        audit = AuditTrail(db, dataset_version_id=dataset_version_id)
+        evidence_ids = await _log_portfolio(audit, portfolio)
+        with track_queries("test", "audit_flush") as stats:
+            batch_id = await audit.flush(created_at=LOGGED_AT, batch_size=50)
+        await db.commit()
+    return evidence_ids, batch_id, stats.query_count
+
+
+@pytest.mark.anyio
+async def test_entries_are_written_on_flush_with_batch_summary(sqlite_db: None, claim_portfolio) -> None:
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id="dv-audit-buffer"))
+        await db.commit()
+        audit = AuditTrail(db, dataset_version_id="dv-audit-buffer")
+        evidence_ids = await _log_portfolio(audit, claim_portfolio(5))
+        assert await db.scalar(select(func.count()).select_from(EvidenceRecord)) == 0
+
+        batch_id = await audit.flush(created_at=LOGGED_AT)
+        await db.commit()
+        assert await audit.flush(created_at=LOGGED_AT) is None
+
+        stored = set((await db.scalars(select(EvidenceRecord.evidence_id).where(EvidenceRecord.kind == "audit_trail"))).all())
+        batch = await db.scalar(select(EvidenceRecord).where(EvidenceRecord.evidence_id == batch_id))
+    assert stored == set(evidence_ids)
+    assert batch.kind == "audit_trail_batch"
+    assert batch.payload["details"]["evidence_ids"] == evidence_ids
+    assert batch.payload["details"]["action_counts"] == {"claim_creation": 5, "transaction": 6, "validation": 5}
+    assert audit.get_summary()["batch_evidence_ids"] == [batch_id]
+    assert [entry["evidence_id"] for entry in audit.get_entries()] == evidence_ids
+
+
+@pytest.mark.anyio
+async def test_flush_is_idempotent_and_deterministic(sqlite_db: None, claim_portfolio) -> None:
+    first_ids, first_batch, _ = await _flushed_run("dv-audit-rerun", claim_portfolio(8))
+    async with get_sessionmaker()() as db:
+        audit = AuditTrail(db, dataset_version_id="dv-audit-rerun")
+        second_ids = await _log_portfolio(audit, claim_portfolio(8))
+        second_batch = await audit.flush(created_at=LOGGED_AT)
+        await db.commit()
+        total = await db.scalar(select(func.count()).select_from(EvidenceRecord))
+    assert second_ids == first_ids
+    assert second_batch == first_batch
+    assert total == len(first_ids) + 1
+
+
+@pytest.mark.anyio
+async def test_conflicts_are_detected_in_buffer_and_on_flush(sqlite_db: None, claim_portfolio) -> None:
+    claims, _ = claim_portfolio(1)
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id="dv-audit-conflict"))
+        await db.commit()
+        audit = AuditTrail(db, dataset_version_id="dv-audit-conflict")
+        await audit.log_claim_creation(claims[0], created_at=LOGGED_AT)
+        await audit.log_claim_creation(claims[0], created_at=LOGGED_AT)
+        with pytest.raises(ImmutableConflictError, match="IMMUTABLE_EVIDENCE_CREATED_AT_MISMATCH"):
+            await audit.log_claim_creation(claims[0], created_at=datetime(2024, 3, 1, tzinfo=timezone.utc))
+        await audit.flush(created_at=LOGGED_AT)
+        await db.execute(update(EvidenceRecord).where(EvidenceRecord.kind == "audit_trail").values(payload={"tampered": True}))
+        await db.commit()
+
+        rerun = AuditTrail(db, dataset_version_id="dv-audit-conflict")
+        await rerun.log_claim_creation(claims[0], created_at=LOGGED_AT)
+        with pytest.raises(ImmutableConflictError, match="IMMUTABLE_EVIDENCE_MISMATCH"):
+            await rerun.flush(created_at=LOGGED_AT)
+
+
+@pytest.mark.anyio
+async def test_flush_round_trips_grow_with_batches_not_entries(sqlite_db: None, claim_portfolio) -> None:
+    _, _, small = await _flushed_run("dv-audit-small", claim_portfolio(2))
+    large_ids, _, large = await _flushed_run("dv-audit-large", claim_portfolio(40))
+    # One prefetch, one evidence insert and at most one reference insert per 50 rows.
+    chunks = math.ceil((len(large_ids) + 1) / 50)
+    assert 0 < small <= 3
+    assert large <= 3 * chunks < len(large_ids) // 4
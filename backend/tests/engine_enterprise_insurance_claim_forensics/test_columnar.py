@@ -0,0 +1,124 @@
+"""Tests for columnar exposure modeling and portfolio aggregation."""
+
+from dataclasses import replace
+import json
+
+import pytest
+
+from backend.app.engines.enterprise_insurance_claim_forensics import analysis, columnar, validation
+from backend.app.engines.enterprise_insurance_claim_forensics.validation import validate_claim, validate_claims
+
+
+np = pytest.importorskip("numpy")
+
+
+def _serial_exposures(claims, transactions):
+    grouped = analysis.group_transactions_by_claim(transactions)
+    return [analysis.model_loss_exposure(claim, grouped.get(claim.claim_id, [])) for claim in claims]
+
+
+def test_columnar_exposures_are_identical_to_per_claim_model(claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(120)
+    # A duplicated claim_id shares its transactions, as in the per-claim path.
+    claims = claims + claims[:3]
+    grouped = analysis.group_transactions_by_claim(transactions)
+    expected = _serial_exposures(claims, transactions)
+    assert json.dumps(analysis.model_portfolio_exposures(claims, grouped)) == json.dumps(expected)
+
+
+def test_columnar_summary_matches_dict_rollup(claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(90)
+    exposures = _serial_exposures(claims, transactions)
+    summary = analysis.summarize_portfolio_exposures(exposures)
+    distribution = summary.pop("exposure_distribution")
+    assert json.dumps(summary) == json.dumps(analysis.summarize_claim_portfolio(exposures))
+    assert list(distribution) == ["outstanding_exposure", "expected_loss"]
+    assert sum(distribution["expected_loss"]["histogram"]["counts"]) == len(exposures)
+
+
+def test_distribution_fallback_matches_numpy(monkeypatch: pytest.MonkeyPatch, claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(75)
+    exposures = _serial_exposures(claims, transactions)
+    with_numpy = columnar.exposure_distribution(exposures)
+    monkeypatch.setattr(columnar, "np", None)
+    assert columnar.exposure_distribution(exposures) == with_numpy
+    assert analysis.model_portfolio_exposures(claims, analysis.group_transactions_by_claim(transactions)) == exposures
+    assert columnar.exposure_distribution([]) == {
+        metric: {"percentiles": {}, "histogram": {"bin_edges": [], "counts": []}}
+        for metric in ("outstanding_exposure", "expected_loss")
+    }
+
+
+def test_exposure_totals_stay_within_summation_tolerance(claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(2)
+    claims = claims[1:]
+    # The array path adds left to right; Python 3.12+ `sum` compensates and gives 1e16 + 2.
+    template = transactions[0]
+    transactions = [
+        replace(template, transaction_id=f"tx-{index}", amount=amount, currency=claims[0].currency)
+        for index, amount in enumerate((1e16, 1.0, 1.0))
+    ]
+    grouped = analysis.group_transactions_by_claim(transactions)
+    exposures = analysis.model_portfolio_exposures(claims, grouped)
+    serial = _serial_exposures(claims, transactions)
+    assert exposures[0]["transaction_total"] == 1e16
+    assert exposures[0]["transaction_total"] == pytest.approx(serial[0]["transaction_total"])
+    totals = [{"claim_amount": amount, "outstanding_exposure": amount} for amount in (1e16, 1.0, 1.0)]
+    summary = columnar.summarize_exposure_columns(columnar.exposure_columns_from_details(totals), totals)
+    serial_summary = analysis.summarize_claim_portfolio(totals)
+    assert summary["total_claim_amount"] == 1e16
+    assert summary["total_claim_amount"] == pytest.approx(serial_summary["total_claim_amount"])
+
+
+def test_portfolio_analysis_builds_one_layout(monkeypatch: pytest.MonkeyPatch, claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(40)
+    build = columnar.ClaimLayout.build
+    builds = []
+
+    def _recording_build(*args):
+        builds.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(columnar.ClaimLayout, "build", _recording_build)
+    exposures, results = analysis._model_and_validate(claims, analysis.group_transactions_by_claim(transactions))
+    assert len(builds) == 1
+    assert exposures == _serial_exposures(claims, transactions)
+    assert len(results) == len(claims)
+
+
+def test_batched_validation_matches_per_claim_rules(monkeypatch: pytest.MonkeyPatch, claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(80)
+    # Mixed currencies inside one claim, and a duplicated claim_id with another currency.
+    transactions = transactions + [replace(transactions[-1], transaction_id="tx-gbp", currency="GBP")]
+    claims = claims + [replace(claims[5], currency="EUR")]
+    grouped = analysis.group_transactions_by_claim(transactions)
+    expected = [validate_claim(claim, grouped.get(claim.claim_id, [])) for claim in claims]
+    mismatches = columnar.currency_mismatches(claims, grouped)
+    assert sum(map(bool, mismatches)) > 2
+    assert [tx.transaction_id for tx in mismatches[-1]] == [tx.transaction_id for tx in grouped[claims[5].claim_id]]
+
+    per_claim = validation.CurrencyConsistencyRule.validate
+    calls = []
+
+    def _recording_validate(rule, claim, claim_transactions):
+        calls.append(claim_transactions)
+        return per_claim(rule, claim, claim_transactions)
+
+    monkeypatch.setattr(validation.CurrencyConsistencyRule, "validate", _recording_validate)
+    assert json.dumps(validate_claims(claims, grouped), default=str) == json.dumps(expected, default=str)
+    # Only claims without transactions still go through the per-claim rule.
+    assert calls and not any(calls)
+    monkeypatch.undo()
+    monkeypatch.setattr(columnar, "np", None)
+    assert validate_claims(claims, grouped) == expected
+
+
+def test_round2_matches_python_round_on_halves() -> None:
+    values = np.concatenate(
+        [
+            (np.arange(0, 20000) + 0.5) / 100,
+            np.array([0.125, 1.005, 2.675, -0.001, 0.0, 1e17, float("inf")]),
+            np.random.default_rng(7).uniform(-1e7, 1e7, 20000),
+        ]
+    )
+    assert json.dumps(columnar.round2(values)) == json.dumps([round(value, 2) for value in values.tolist()])
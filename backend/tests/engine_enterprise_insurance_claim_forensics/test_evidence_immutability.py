@@ -191,6 +191,7 @@ async def test_audit_trail_uses_strict_evidence_creation(sqlite_db: None) -> Non
         
         # Log claim creation (uses strict evidence creation)
         evidence_id = await audit.log_claim_creation(claim, created_at=created_at)
+        await audit.flush(created_at=created_at)
         await db.commit()
         
         # Verify evidence was created
@@ -0,0 +1,90 @@
+"""Tests for chunked parallel claim portfolio analysis."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from backend.app.core import parallel
+from backend.app.core.config import _parse_parallel_workers
+from backend.app.engines.enterprise_insurance_claim_forensics.analysis import analyze_claim_portfolio
+
+
+@pytest.mark.anyio
+async def test_parallel_analysis_matches_serial(claim_portfolio) -> None:
+    claims, transactions = claim_portfolio(60)
+    serial = await analyze_claim_portfolio(claims, transactions, workers=1)
+    try:
+        chunked = await analyze_claim_portfolio(claims, transactions, workers=2, chunk_size=7)
+    finally:
+        parallel.shutdown_pool()
+    assert chunked == serial
+    assert list(chunked[2]) == [claim.claim_id for claim in claims]
+
+
+@pytest.mark.anyio
+async def test_concurrent_runs_share_one_pool() -> None:
+    try:
+        first, second = await asyncio.gather(
+            parallel.map_chunks(sum, parallel.chunked(list(range(10)), 2), workers=2),
+            parallel.map_chunks(sum, parallel.chunked(list(range(9)), 3), workers=3),
+        )
+        pool = parallel._POOL
+        assert await parallel.map_chunks(sum, [[1], [2]], workers=4) == [1, 2]
+        assert parallel._POOL is pool
+    finally:
+        parallel.shutdown_pool()
+    assert first == [1, 5, 9, 13, 17]
+    assert second == [3, 12, 21]
+    assert parallel._POOL is None
+
+
+def _thread_name(chunk: list[int]) -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.anyio
+async def test_map_chunks_falls_back_to_a_thread_when_pool_breaks(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _broken_pool(workers: int):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(parallel, "_pool", _broken_pool)
+    assert await parallel.map_chunks(sum, parallel.chunked([1, 2, 3, 4, 5], 2), workers=4) == [3, 7, 5]
+    names = await parallel.map_chunks(_thread_name, [[1], [2]], workers=2)
+    assert threading.current_thread().name not in names
+
+
+def _slow_sum(chunk: list[int]) -> int:
+    time.sleep(0.2)
+    return sum(chunk)
+
+
+@pytest.mark.anyio
+async def test_map_chunks_does_not_block_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(parallel, "_pool", lambda workers: executor)
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.ensure_future(_tick())
+    try:
+        assert await parallel.map_chunks(_slow_sum, [[1, 2], [3]], workers=2) == [3, 3]
+    finally:
+        ticker.cancel()
+        executor.shutdown()
+    assert ticks > 5
+
+
+def test_parallel_workers_setting() -> None:
+    assert _parse_parallel_workers("") == 0
+    assert _parse_parallel_workers(" 4 ") == 4
+    assert _parse_parallel_workers("auto") >= 1
+    with pytest.raises(ValueError):
+        _parse_parallel_workers("-1")
@@ -0,0 +1,169 @@
+"""Tests for portfolio mode of the litigation/dispute engine."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.evidence.models import EvidenceRecord, FindingEvidenceLink, FindingRecord
+from backend.app.core.normalization.models import NormalizedRecord
+from backend.app.core.query_metrics import track_queries
+from backend.app.engines.enterprise_litigation_dispute.analysis import analyze_dispute
+from backend.app.engines.enterprise_litigation_dispute.errors import ParametersInvalidError
+from backend.app.engines.enterprise_litigation_dispute.models import (
+    EnterpriseLitigationDisputeFinding,
+    EnterpriseLitigationDisputeRun,
+)
+from backend.app.engines.enterprise_litigation_dispute.portfolio import (
+    VARIES_PER_DISPUTE,
+    analyze_dispute_portfolio,
+    summarize_dispute_portfolio,
+)
+from backend.app.engines.enterprise_litigation_dispute.run import run_engine
+
+
+STARTED_AT = "2024-01-01T00:00:00Z"
+
+
+def _dispute(index: int) -> dict:
+    return {
+        "claims": [{"amount": 100_000 * (index + 1)}],
+        "damages": {"compensatory": 300_000 * (index % 5), "punitive": 50_000, "mitigation": 20_000},
+        "liability": {"parties": [{"party": f"Party {index % 3}", "percent": 60, "evidence_strength": (index % 10) / 10}]},
+        "scenarios": [
+            {"name": "settle", "probability": 0.6, "expected_damages": 100_000 + index},
+            {"name": "trial", "probability": 0.4, "expected_damages": 900_000 + index},
+        ]
+        if index % 4
+        else [],
+        "legal_consistency": {"conflicts": ["overlap"] if index % 3 == 0 else [], "missing_support": []},
+    }
+
+
+async def _seed(dataset_version_id: str, count: int, *, without_payload: int = 0) -> None:
+    normalized_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id=dataset_version_id))
+        for index in range(count + without_payload):
+            raw_id = f"{dataset_version_id}-raw-{index:04d}"
+            payload = {"legal_dispute": _dispute(index)} if index < count else {"other": True}
+            db.add(
+                RawRecord(
+                    raw_record_id=raw_id,
+                    dataset_version_id=dataset_version_id,
+                    source_system="litigation",
+                    source_record_id=f"LIT{index}",
+                    payload=payload,
+                    legacy_no_checksum=True,
+                    ingested_at=normalized_at,
+                )
+            )
+            db.add(
+                NormalizedRecord(
+                    normalized_record_id=f"{dataset_version_id}-norm-{index:04d}",
+                    dataset_version_id=dataset_version_id,
+                    raw_record_id=raw_id,
+                    payload=payload,
+                    normalized_at=normalized_at,
+                )
+            )
+        await db.commit()
+
+
+async def _count(db, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.anyio
+async def test_portfolio_run_analyzes_every_dispute(sqlite_db: None) -> None:
+    dv_id = "dv-lit-portfolio"
+    await _seed(dv_id, 6, without_payload=1)
+    result = await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={"portfolio": True})
+
+    assert result["mode"] == "portfolio"
+    assert [row["raw_record_id"] for row in result["disputes"]] == [f"{dv_id}-raw-{i:04d}" for i in range(6)]
+    assert result["skipped_raw_record_ids"] == [f"{dv_id}-raw-0006"]
+    assert result["finding_count"] == 24
+    portfolio = result["portfolio"]
+    assert portfolio["dispute_count"] == 6
+    assert sum(portfolio["damage"]["severity_distribution"].values()) == 6
+    assert portfolio["legal_consistency"] == {"consistent": 4, "attention": 2}
+    scenario_range = portfolio["scenario"]["exposure_range"]
+    assert 0 < scenario_range["lower_bound"] < scenario_range["upper_bound"]
+    assert portfolio["scenario"]["disputes_without_scenarios"] == 2
+
+    async with get_sessionmaker()() as db:
+        run_record = await db.scalar(select(EnterpriseLitigationDisputeRun))
+        assert run_record.summary["portfolio"] == portfolio
+        assert await _count(db, EnterpriseLitigationDisputeFinding) == 24
+        assert await _count(db, FindingRecord) == 24
+        assert await _count(db, FindingEvidenceLink) == 24
+        # Four analysis and four finding evidence records per dispute, plus the portfolio summary.
+        assert await _count(db, EvidenceRecord) == 6 * 8 + 1
+        raw_ids = set((await db.scalars(select(FindingRecord.raw_record_id))).all())
+    assert raw_ids == {row["raw_record_id"] for row in result["disputes"]}
+
+
+@pytest.mark.anyio
+async def test_portfolio_rerun_is_idempotent(sqlite_db: None) -> None:
+    dv_id = "dv-lit-rerun"
+    await _seed(dv_id, 3)
+    first = await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={"portfolio": True})
+    second = await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={"portfolio": True})
+    assert second["disputes"] == first["disputes"]
+    assert second["portfolio"] == first["portfolio"]
+    async with get_sessionmaker()() as db:
+        assert await _count(db, EvidenceRecord) == 3 * 8 + 1
+        assert await _count(db, EnterpriseLitigationDisputeRun) == 1
+
+
+@pytest.mark.anyio
+async def test_portfolio_query_count_does_not_grow_with_disputes(sqlite_db: None) -> None:
+    counts = []
+    for dv_id, size in (("dv-lit-small", 3), ("dv-lit-large", 40)):
+        await _seed(dv_id, size)
+        with track_queries("test", "litigation_portfolio") as stats:
+            await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={"portfolio": True})
+        counts.append(stats.query_count)
+    assert counts[0] > 0
+    assert counts[1] == counts[0]
+
+
+@pytest.mark.anyio
+async def test_portfolio_parameter_must_be_boolean() -> None:
+    with pytest.raises(ParametersInvalidError, match="PORTFOLIO_INVALID_TYPE"):
+        await run_engine(dataset_version_id="dv", started_at=STARTED_AT, parameters={"portfolio": "yes"})
+
+
+@pytest.mark.anyio
+async def test_chunked_analysis_matches_per_dispute_analysis() -> None:
+    disputes = [(f"raw-{index}", _dispute(index)) for index in range(25)]
+    results = await analyze_dispute_portfolio(
+        dataset_version_id="dv", disputes=disputes, assumptions={}, workers=1, chunk_size=4
+    )
+    assert results == [
+        analyze_dispute(dataset_version_id="dv", dispute_payload=payload, assumptions={}) for _, payload in disputes
+    ]
+    rollup = summarize_dispute_portfolio(results)
+    assert rollup["dispute_count"] == 25
+    assert rollup["damage"]["total_net_damage"] == round(sum(r["damage"]["net_damage"] for r in results), 2)
+    assert summarize_dispute_portfolio([])["damage"]["max_net_damage"] == 0.0
+
+
+@pytest.mark.anyio
+async def test_portfolio_assumptions_do_not_carry_one_disputes_figures(sqlite_db: None) -> None:
+    await _seed("dv-lit-assumptions", 4)
+    result = await run_engine(
+        dataset_version_id="dv-lit-assumptions", started_at=STARTED_AT, parameters={"portfolio": True}
+    )
+    assumptions = {record["id"]: record for record in result["assumptions"]}
+    # Dispute 0 has no scenarios (probability sum 0); the others sum to 1.
+    probabilities = assumptions["assumption_scenario_probabilities"]
+    assert probabilities["source"] == VARIES_PER_DISPUTE
+    assert probabilities["description"].startswith("Scenario probabilities")
+    # Text derived only from run parameters is the same for every dispute and is kept.
+    assert assumptions["assumption_liability_multipliers"]["source"].startswith("parameters.assumptions.scenario")
+    assert result["summary"]["assumptions"] == result["assumptions"]
@@ -0,0 +1,173 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.engines.financial_forensics import engine
+from backend.app.engines.financial_forensics.failures import InconsistentReferenceError, MissingArtifactError
+from backend.app.engines.financial_forensics.models.findings import FinancialForensicsFinding
+from backend.app.engines.financial_forensics.models.leakage import FinancialForensicsLeakageItem
+from backend.app.engines.financial_forensics.models.runs import FinancialForensicsRun
+from backend.app.engines.financial_forensics.report.assembler import assemble_findings_page
+from backend.app.main import create_app
+
+
+FINDINGS = 5
+CREATED_AT = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+async def _seed_run(db, *, findings: int = FINDINGS) -> tuple[str, str]:
+    dv = await create_dataset_version_via_ingestion(db)
+    run_id = f"run-{dv.id}"
+    db.add(
+        FinancialForensicsRun(
+            run_id=run_id,
+            dataset_version_id=dv.id,
+            fx_artifact_id="fx-1",
+            started_at=CREATED_AT,
+            status="completed",
+            parameters={},
+            engine_version="v1",
+        )
+    )
+    await db.flush()
+    for index in range(findings):
+        # Two rules, so report order (rule_id, finding_id) differs from insertion order.
+        finding_id = f"f-{index}"
+        db.add(
+            FinancialForensicsFinding(
+                finding_id=finding_id,
+                run_id=run_id,
+                dataset_version_id=dv.id,
+                rule_id="rule-b" if index % 2 == 0 else "rule-a",
+                rule_version="1",
+                framework_version="financial_forensics_v1",
+                finding_type="partial_match",
+                confidence="partial",
+                matched_record_ids=[f"inv-{index}", f"pay-{index}"],
+                unmatched_amount="0.50",
+                fx_artifact_id="fx-1",
+                primary_evidence_item_id=f"ev-{index}",
+                evidence_ids=[],
+                created_at=CREATED_AT,
+            )
+        )
+        await db.flush()
+        db.add(
+            FinancialForensicsLeakageItem(
+                leakage_item_id=f"li-{index}",
+                run_id=run_id,
+                finding_id=finding_id,
+                dataset_version_id=dv.id,
+                typology="underpayment",
+                exposure_abs=Decimal("0.50"),
+                exposure_signed=Decimal("-0.50"),
+                created_at=CREATED_AT,
+            )
+        )
+    await db.commit()
+    return dv.id, run_id
+
+
+@pytest.fixture
+def client_app(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+    monkeypatch.setenv("TODISCOPE_ENABLED_ENGINES", engine.ENGINE_ID)
+
+    async def _complete(*args, **kwargs) -> None:
+        return None
+
+    monkeypatch.setattr(engine, "verify_calculate_complete", _complete)
+    return create_app()
+
+
+async def _page(ac: AsyncClient, dv_id: str, run_id: str, **params):
+    return await ac.get(
+        "/api/v3/engines/financial-forensics/report/findings",
+        params={"dataset_version_id": dv_id, "run_id": run_id, **params},
+    )
+
+
+@pytest.mark.anyio
+async def test_findings_pages_follow_the_cursor_to_the_full_table(sqlite_db: None, client_app) -> None:
+    async with get_sessionmaker()() as db:
+        dv_id, run_id = await _seed_run(db)
+
+    pages = []
+    async with AsyncClient(transport=ASGITransport(app=client_app), base_url="http://test") as ac:
+        rows = (await _page(ac, dv_id, run_id)).json()["items"]
+        offset = 0
+        while offset is not None:
+            res = await _page(ac, dv_id, run_id, offset=offset, limit=2)
+            assert res.status_code == 200
+            page = res.json()
+            assert (page["offset"], page["limit"], page["total"]) == (offset, 2, FINDINGS)
+            pages.append(page)
+            offset = page["next_offset"]
+
+    assert [len(page["items"]) for page in pages] == [2, 2, 1]
+    assert [page["next_offset"] for page in pages] == [2, 4, None]
+    assert [item for page in pages for item in page["items"]] == rows
+    # Report order: rule_id, then finding_id.
+    assert [row["finding_id"] for row in rows] == ["f-1", "f-3", "f-0", "f-2", "f-4"]
+    assert rows[0]["typology"] == "underpayment" and rows[0]["exposure_abs"] == "0.500000000000"
+
+
+@pytest.mark.anyio
+async def test_findings_page_boundaries(sqlite_db: None, client_app) -> None:
+    async with get_sessionmaker()() as db:
+        dv_id, run_id = await _seed_run(db)
+
+    async with AsyncClient(transport=ASGITransport(app=client_app), base_url="http://test") as ac:
+        exact = (await _page(ac, dv_id, run_id, offset=0, limit=FINDINGS)).json()
+        last = (await _page(ac, dv_id, run_id, offset=FINDINGS - 1, limit=FINDINGS)).json()
+        past_end = await _page(ac, dv_id, run_id, offset=FINDINGS, limit=2)
+        zero_limit = await _page(ac, dv_id, run_id, limit=0)
+        over_limit = await _page(ac, dv_id, run_id, limit=5001)
+        negative_offset = await _page(ac, dv_id, run_id, offset=-1)
+        unknown_run = await _page(ac, dv_id, "missing-run")
+
+    # A page that ends exactly at the last finding has no next cursor.
+    assert len(exact["items"]) == FINDINGS and exact["next_offset"] is None
+    assert len(last["items"]) == 1 and last["next_offset"] is None
+    assert past_end.status_code == 200
+    assert past_end.json()["items"] == [] and past_end.json()["next_offset"] is None
+    assert past_end.json()["total"] == FINDINGS
+    assert {zero_limit.status_code, over_limit.status_code, negative_offset.status_code} == {422}
+    assert unknown_run.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_run_without_findings_has_one_empty_page(sqlite_db: None, client_app) -> None:
+    async with get_sessionmaker()() as db:
+        dv_id, run_id = await _seed_run(db, findings=0)
+
+    async with AsyncClient(transport=ASGITransport(app=client_app), base_url="http://test") as ac:
+        res = await _page(ac, dv_id, run_id)
+    assert res.status_code == 200
+    assert res.json() == {
+        "run_id": run_id,
+        "dataset_version_id": dv_id,
+        "items": [],
+        "offset": 0,
+        "limit": 500,
+        "total": 0,
+        "next_offset": None,
+    }
+
+
+@pytest.mark.anyio
+async def test_assemble_findings_page_rejects_bad_bounds_and_references(sqlite_db: None) -> None:
+    async with get_sessionmaker()() as db:
+        dv_id, run_id = await _seed_run(db)
+        with pytest.raises(InconsistentReferenceError, match="PAGE_BOUNDS_INVALID"):
+            await assemble_findings_page(db, dataset_version_id=dv_id, run_id=run_id, offset=-1, limit=10)
+        with pytest.raises(InconsistentReferenceError, match="PAGE_BOUNDS_INVALID"):
+            await assemble_findings_page(db, dataset_version_id=dv_id, run_id=run_id, offset=0, limit=0)
+        with pytest.raises(MissingArtifactError, match="RUN_NOT_FOUND"):
+            await assemble_findings_page(db, dataset_version_id=dv_id, run_id="missing-run", offset=0, limit=10)
+        with pytest.raises(InconsistentReferenceError, match="RUN_DATASET_MISMATCH"):
+            await assemble_findings_page(db, dataset_version_id="other-dv", run_id=run_id, offset=0, limit=10)
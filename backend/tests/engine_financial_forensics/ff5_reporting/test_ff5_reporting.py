@@ -70,8 +70,15 @@ async def test_report_assembly_deterministic(sqlite_db: None) -> None:
 
         r1 = await ac.post("/api/v3/engines/financial-forensics/report", json={"dataset_version_id": dv_id, "run_id": run_id})
         r2 = await ac.post("/api/v3/engines/financial-forensics/report", json={"dataset_version_id": dv_id, "run_id": run_id})
+        cached = await ac.get(
+            "/api/v3/engines/financial-forensics/report",
+            params={"dataset_version_id": dv_id, "run_id": run_id},
+            headers={"If-None-Match": r1.headers["etag"]},
+        )
     assert r1.status_code == 200 and r2.status_code == 200
     assert r1.json() == r2.json()
+    assert r1.headers["etag"] == r2.headers["etag"]
+    assert cached.status_code == 304
 
 
 @pytest.mark.anyio
@@ -0,0 +1,92 @@
+"""Tests for the compiled control/framework matching index."""
+
+from __future__ import annotations
+
+from backend.app.engines.regulatory_readiness import matching
+from backend.app.engines.regulatory_readiness.catalog import ControlCatalog
+from backend.app.engines.regulatory_readiness.controls import ControlDefinition
+from backend.app.engines.regulatory_readiness.frameworks import RegulatoryFramework, build_default_frameworks
+from backend.app.engines.regulatory_readiness.mapping import map_controls_to_frameworks
+from backend.app.engines.regulatory_readiness.matching import clear_index_cache, compile_catalog_index
+
+
+CATEGORIES = ("data_governance", "operations", "risk_management", "third_party", "compliance_monitoring")
+
+
+def _catalog(count: int) -> ControlCatalog:
+    catalog = ControlCatalog()
+    catalog.load_from_payloads(
+        [
+            {
+                "id": f"ctrl-{index:04d}",
+                "category": CATEGORIES[index % len(CATEGORIES)],
+                "status": "partial" if index % 3 else "implemented",
+                "frameworks": ["iso27001"] if index % 7 == 0 else [],
+                "tags": ["custom"] if index % 11 == 0 else [],
+            }
+            for index in range(count)
+        ]
+    )
+    return catalog
+
+
+def _frameworks() -> tuple[RegulatoryFramework, ...]:
+    return build_default_frameworks() + (
+        RegulatoryFramework(
+            framework_id="explicit",
+            name="Explicit",
+            description="",
+            domains=("custom",),
+            explicit_controls=("ctrl-0005", "missing"),
+        ),
+    )
+
+
+def test_index_matches_pairwise_rule() -> None:
+    catalog = _catalog(200)
+    index = catalog.match_index()
+    for framework in _frameworks():
+        expected = tuple(c for c in catalog.list_controls() if framework.matches_control(c))
+        assert index.matching_controls(framework) == expected
+
+
+def test_mapping_order_and_content_unchanged() -> None:
+    catalog = _catalog(50)
+    controls = catalog.list_controls()
+    frameworks = _frameworks()
+    expected = [
+        (control.control_id, framework.framework_id)
+        for control in controls
+        for framework in frameworks
+        if framework.matches_control(control)
+    ]
+    mappings = map_controls_to_frameworks(catalog.match_index(), frameworks)
+    assert [(m.control_id, m.framework_id) for m in mappings] == expected
+    assert map_controls_to_frameworks(controls, frameworks) == mappings
+
+
+def test_index_is_cached_per_catalog_version() -> None:
+    clear_index_cache()
+    first = _catalog(20)
+    second = _catalog(20)
+    assert first.version == second.version
+    assert first.match_index() is second.match_index()
+
+    second.register(
+        ControlDefinition.from_payload({"id": "ctrl-0001", "category": "third_party", "status": "implemented"})
+    )
+    assert second.version != first.version
+    assert second.match_index() is not first.match_index()
+    assert compile_catalog_index(first.list_controls()) is first.match_index()
+
+
+def test_catalog_version_is_computed_once_per_compiled_index(monkeypatch) -> None:
+    clear_index_cache()
+    calls = []
+    fingerprint = matching.catalog_version
+    monkeypatch.setattr(matching, "catalog_version", lambda controls: calls.append(1) or fingerprint(controls))
+    for _ in range(3):
+        catalog = _catalog(20)
+        map_controls_to_frameworks(catalog.match_index(), _frameworks())
+        assert catalog.version == catalog.match_index().version
+    assert len(calls) == 1
@@ -0,0 +1,128 @@
+"""Tests for set-based persistence of regulatory readiness runs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.evidence.models import EvidenceReference, FindingEvidenceLink, FindingRecord
+from backend.app.core.query_metrics import track_queries
+from backend.app.engines.regulatory_readiness.errors import ImmutableConflictError
+from backend.app.engines.regulatory_readiness.models import (
+    RegulatoryControl,
+    RegulatoryGap,
+    RegulatoryRemediationTask,
+)
+from backend.app.engines.regulatory_readiness.persistence import PersistenceBatch
+from backend.app.engines.regulatory_readiness.run import run_engine
+
+
+STARTED_AT = "2024-01-01T00:00:00Z"
+
+
+def _controls(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"ctrl-{index:03d}",
+            "title": f"Control {index}",
+            "category": "risk_management",
+            "risk_type": "operational",
+            "ownership": ["risk_team"],
+            "status": "not_implemented" if index % 2 else "partial",
+            "frameworks": ["internal_controls"],
+        }
+        for index in range(count)
+    ]
+
+
+async def _seed(dataset_version_id: str, controls: list[dict]) -> str:
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id=dataset_version_id))
+        db.add(
+            RawRecord(
+                raw_record_id=f"raw-{dataset_version_id}",
+                dataset_version_id=dataset_version_id,
+                source_system="test",
+                source_record_id="raw-1",
+                payload={"regulatory": {"controls": controls}},
+                legacy_no_checksum=True,
+                ingested_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+        await db.commit()
+    return dataset_version_id
+
+
+async def _count(db, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+async def _counted_run(dataset_version_id: str) -> int:
+    with track_queries("test", "regulatory_run") as stats:
+        await run_engine(dataset_version_id=dataset_version_id, started_at=STARTED_AT, parameters={})
+    return stats.query_count
+
+
+@pytest.mark.anyio
+async def test_rerun_is_idempotent(sqlite_db: None) -> None:
+    dv_id = await _seed("dv-rerun", _controls(4))
+    first = await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={})
+    async with get_sessionmaker()() as db:
+        counts = [
+            await _count(db, model)
+            for model in (RegulatoryControl, RegulatoryGap, RegulatoryRemediationTask, FindingEvidenceLink)
+        ]
+        references = await _count(db, EvidenceReference)
+    # risk_management controls map to two frameworks: one gap and task per mapping.
+    assert counts == [4, 8, 8, 4]
+    assert references > 0
+
+    second = await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={})
+    assert second == first
+    async with get_sessionmaker()() as db:
+        assert [
+            await _count(db, model)
+            for model in (RegulatoryControl, RegulatoryGap, RegulatoryRemediationTask, FindingEvidenceLink)
+        ] == counts
+        assert await _count(db, EvidenceReference) == references
+
+
+@pytest.mark.anyio
+def test_batch_rejects_conflicting_duplicate_ids() -> None:
+    batch = PersistenceBatch(dataset_version_id="dv")
+    batch.add_link({"link_id": "l-1", "finding_id": "f-1", "evidence_id": "e-1"})
+    batch.add_link({"link_id": "l-1", "finding_id": "f-1", "evidence_id": "e-1"})
+    assert list(batch.links) == ["l-1"]
+
+    with pytest.raises(ImmutableConflictError, match="IMMUTABLE_LINK_MISMATCH"):
+        batch.add_link({"link_id": "l-1", "finding_id": "f-1", "evidence_id": "e-2"})
+    assert batch.links["l-1"]["evidence_id"] == "e-1"
+
+
+@pytest.mark.anyio
+async def test_conflicting_finding_aborts_before_inserting(sqlite_db: None) -> None:
+    dv_id = await _seed("dv-conflict", _controls(2))
+    await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={})
+    async with get_sessionmaker()() as db:
+        await db.execute(update(FindingRecord).values(payload={"tampered": True}))
+        await db.execute(RegulatoryRemediationTask.__table__.delete())
+        await db.execute(RegulatoryGap.__table__.delete())
+        await db.commit()
+
+    with pytest.raises(ImmutableConflictError, match="IMMUTABLE_FINDING_MISMATCH"):
+        await run_engine(dataset_version_id=dv_id, started_at=STARTED_AT, parameters={})
+    async with get_sessionmaker()() as db:
+        assert await _count(db, RegulatoryGap) == 0
+
+
+@pytest.mark.anyio
+async def test_query_count_does_not_grow_with_controls(sqlite_db: None) -> None:
+    small = await _counted_run(await _seed("dv-small", _controls(3)))
+    large = await _counted_run(await _seed("dv-large", _controls(60)))
+    assert small > 0
+    assert large == small
@@ -1,8 +1,12 @@
+import hashlib
+import io
 import os
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from backend.app.core.artifacts.externalization_service import ArtifactImmutableWriteError, put_file_immutable
+from backend.app.core.artifacts.store import get_artifact_store, reset_artifact_store_for_tests
 from backend.app.main import create_app
 
 
@@ -16,3 +20,48 @@ async def test_artifact_store_put_get_roundtrip() -> None:
         get = await ac.get("/api/v3/artifacts/get-test")
         assert get.status_code == 200
         assert get.json()["data"] == "hello"
+
+
+class _ChunkOnlyFile(io.BytesIO):
+    """Rejects unbounded reads, so a whole-file read fails the test."""
+
+    def read(self, size: int | None = -1) -> bytes:
+        assert size is not None and size > 0
+        return super().read(size)
+
+
+@pytest.mark.anyio
+async def test_file_uploads_and_immutable_checks_stream_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    os.environ["TODISCOPE_ARTIFACT_STORE_KIND"] = "memory"
+    reset_artifact_store_for_tests()
+    store = get_artifact_store()
+    data = bytes(range(256)) * 10_000
+    sha = hashlib.sha256(data).hexdigest()
+
+    stored = await put_file_immutable(
+        key="t/file.bin", fileobj=_ChunkOnlyFile(data), sha256=sha, size_bytes=len(data), content_type="x"
+    )
+    assert (stored.sha256, stored.size_bytes) == (sha, len(data))
+    assert await store.get_bytes(key="t/file.bin") == data
+
+    async def _no_whole_reads(**_: object) -> bytes:
+        raise AssertionError("existing object read whole")
+
+    chunks: list[int] = []
+
+    async def _iter_bytes(*, key: str, chunk_size: int = 64 * 1024):
+        payload = store._data[key][0]
+        for start in range(0, len(payload), chunk_size):
+            chunks.append(start)
+            yield payload[start : start + chunk_size]
+
+    monkeypatch.setattr(store, "get_bytes", _no_whole_reads)
+    monkeypatch.setattr(store, "iter_bytes", _iter_bytes)
+    again = await put_file_immutable(
+        key="t/file.bin", fileobj=_ChunkOnlyFile(data), sha256=sha, size_bytes=len(data), content_type="x"
+    )
+    assert again.sha256 == sha and len(chunks) > 1
+    with pytest.raises(ArtifactImmutableWriteError):
+        await put_file_immutable(
+            key="t/file.bin", fileobj=_ChunkOnlyFile(b"other"), sha256="0" * 64, size_bytes=5, content_type="x"
+        )
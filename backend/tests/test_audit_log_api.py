@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core.audit.service import log_action
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.main import create_app
+
+
+async def _seed_logs(n: int) -> str:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with get_sessionmaker()() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        for i in range(n):
+            await log_action(
+                db,
+                actor_id="tester",
+                actor_type="system",
+                action_type="maintenance",
+                dataset_version_id=dv.id,
+                reason=f"entry {i}",
+                # Pairs of identical timestamps exercise the audit_log_id tie-breaker.
+                timestamp=base + timedelta(seconds=i // 2),
+            )
+        await db.commit()
+    return dv.id
+
+
+@pytest.mark.anyio
+async def test_keyset_pagination_walks_all_logs_once(sqlite_db: None) -> None:
+    dv_id = await _seed_logs(25)
+    app = create_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        seen: list[str] = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"dataset_version_id": dv_id, "limit": 10, "count": "none"}
+            if cursor:
+                params["cursor"] = cursor
+            res = await ac.get("/api/v3/audit/logs", params=params)
+            assert res.status_code == 200
+            body = res.json()
+            assert body["total"] is None
+            seen.extend(log["audit_log_id"] for log in body["logs"])
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len(seen) == len(set(seen)) == 25
+
+        first = await ac.get("/api/v3/audit/logs", params={"dataset_version_id": dv_id, "limit": 5})
+        assert first.json()["total"] == 25
+
+        bad = await ac.get("/api/v3/audit/logs", params={"cursor": "not-a-cursor"})
+        assert bad.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_streaming_export_formats(sqlite_db: None) -> None:
+    dv_id = await _seed_logs(7)
+    app = create_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        csv_res = await ac.get("/api/v3/audit/logs/export", params={"dataset_version_id": dv_id})
+        assert csv_res.status_code == 200
+        assert len(csv_res.text.strip().splitlines()) == 8
+
+        nd_res = await ac.get(
+            "/api/v3/audit/logs/export", params={"dataset_version_id": dv_id, "format": "ndjson"}
+        )
+        lines = [json.loads(line) for line in nd_res.text.splitlines()]
+        assert len(lines) == 7
+        assert lines[0]["created_at"] >= lines[-1]["created_at"]
+
+        json_res = await ac.get(
+            "/api/v3/audit/logs/export", params={"dataset_version_id": dv_id, "format": "json"}
+        )
+        body = json_res.json()
+        assert body["total"] == 7 and len(body["logs"]) == 7
+
+
+def test_estimated_count_explain_renders_filters_or_falls_back() -> None:
+    from sqlalchemy import bindparam, select
+    from sqlalchemy.dialects import postgresql
+
+    from backend.app.core.audit.api import _explain_sql, _filters
+    from backend.app.core.audit.models import AuditLog
+
+    clauses = _filters(actor_id="o'brien", start_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    explain = _explain_sql(select(AuditLog.audit_log_id).where(*clauses), postgresql.dialect())
+    assert explain.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "'o''brien'" in explain and "'2024-01-01 00:00:00+00:00'" in explain
+
+    # A bind value the dialect cannot render as a literal means an exact COUNT(*) instead.
+    unrenderable = select(AuditLog.audit_log_id).where(AuditLog.actor_id == bindparam("actor", object()))
+    assert _explain_sql(unrenderable, postgresql.dialect()) is None
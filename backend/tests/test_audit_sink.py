@@ -0,0 +1,139 @@
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.core.audit.models import AuditLog
+from backend.app.core.audit.service import log_action
+from backend.app.core.audit import sink as sink_module
+from backend.app.core.audit.sink import MAX_RETRIES, start_audit_sink, stop_audit_sink
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+
+
+async def _count(**filters: object) -> int:
+    async with get_sessionmaker()() as db:
+        stmt = select(func.count()).select_from(AuditLog)
+        for key, value in filters.items():
+            stmt = stmt.where(getattr(AuditLog, key) == value)
+        return int(await db.scalar(stmt) or 0)
+
+
+def _entry_row(entry: AuditLog) -> dict:
+    return {column.key: getattr(entry, column.key) for column in AuditLog.__mapper__.column_attrs}
+
+
+@pytest.mark.anyio
+async def test_write_behind_batches_entries_until_flush(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+
+    sink = await start_audit_sink(batch_size=50, flush_interval=60)
+    async with sessionmaker() as db:
+        for i in range(20):
+            await log_action(
+                db,
+                actor_id="tester",
+                actor_type="system",
+                action_type="maintenance",
+                dataset_version_id=dv.id,
+                reason=f"entry {i}",
+            )
+        # Nothing was added to the caller's session.
+        assert not db.new
+    assert sink.pending == 20
+    assert await _count() == 0
+
+    assert await sink.flush() == 20
+    assert await _count(dataset_version_id=dv.id) == 20
+    await stop_audit_sink()
+
+
+@pytest.mark.anyio
+async def test_durable_actions_bypass_the_queue(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+
+    sink = await start_audit_sink(batch_size=10, flush_interval=60)
+    async with sessionmaker() as db:
+        await log_action(db, actor_id="t", actor_type="system", action_type="integrity", dataset_version_id=dv.id)
+        await log_action(
+            db, actor_id="t", actor_type="system", action_type="maintenance", dataset_version_id=dv.id, durable=True
+        )
+        await db.commit()
+    assert sink.pending == 0
+    assert await _count(dataset_version_id=dv.id) == 2
+    await stop_audit_sink()
+
+
+@pytest.mark.anyio
+async def test_unknown_dataset_reference_raises_before_enqueue(sqlite_db: None) -> None:
+    sink = await start_audit_sink(batch_size=10, flush_interval=60)
+    async with get_sessionmaker()() as db:
+        with pytest.raises(ValueError, match="missing-dv"):
+            await log_action(
+                db, actor_id="t", actor_type="system", action_type="maintenance", dataset_version_id="missing-dv"
+            )
+    assert sink.pending == 0
+    await stop_audit_sink()
+
+
+@pytest.mark.anyio
+async def test_reference_invisible_to_sink_is_kept_without_foreign_key(sqlite_db: None) -> None:
+    sink = await start_audit_sink(batch_size=10, flush_interval=60)
+    async with get_sessionmaker()() as db:
+        entry = await log_action(db, actor_id="t", actor_type="system", action_type="maintenance")
+    # A dataset version the caller saw in its own, later rolled back, transaction.
+    sink.try_enqueue({**_entry_row(entry), "audit_log_id": "unresolved", "dataset_version_id": "missing-dv"})
+    assert await sink.flush() == 1
+    assert sink.pending == 1
+
+    await stop_audit_sink()
+    async with get_sessionmaker()() as db:
+        row = await db.scalar(select(AuditLog).where(AuditLog.audit_log_id == "unresolved"))
+    assert row is not None
+    assert row.dataset_version_id is None
+    assert row.context["unresolved_dataset_version_id"] == "missing-dv"
+
+
+@pytest.mark.anyio
+async def test_failed_batch_write_is_requeued_not_lost(sqlite_db: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    sink = await start_audit_sink(batch_size=10, flush_interval=60)
+    async with get_sessionmaker()() as db:
+        entries = [await log_action(db, actor_id="t", actor_type="system", action_type="maintenance") for _ in range(3)]
+    real_insert = sink_module.insert
+    failures = 0
+
+    def _failing_insert(model):
+        nonlocal failures
+        failures += 1
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(sink_module, "insert", _failing_insert)
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await sink.flush()
+    assert sink.pending == 3
+    assert await _count() == 0
+
+    monkeypatch.setattr(sink_module, "insert", real_insert)
+    assert await sink.flush() == 3
+    assert await _count() == 3
+
+    # Entries are only dropped once the retry limit is spent.
+    sink.try_enqueue({**_entry_row(entries[0]), "audit_log_id": "never-written"})
+    monkeypatch.setattr(sink_module, "insert", _failing_insert)
+    for _ in range(MAX_RETRIES + 1):
+        with pytest.raises(RuntimeError):
+            await sink.flush()
+    assert sink.pending == 0
+    assert failures == MAX_RETRIES + 2
+    await stop_audit_sink()
+
+
+def test_write_behind_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    from backend.app.core.config import get_settings
+
+    monkeypatch.delenv("TODISCOPE_AUDIT_WRITE_BEHIND", raising=False)
+    assert get_settings().audit_write_behind is False
+    monkeypatch.setenv("TODISCOPE_AUDIT_WRITE_BEHIND", "1")
+    assert get_settings().audit_write_behind is True
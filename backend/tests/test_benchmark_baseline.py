@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from backend.benchmarks.engines import generators
+from backend.benchmarks.engines.baseline import compare_to_baseline
+from backend.benchmarks.engines.scenarios import SCENARIOS, BenchmarkStepError, _check
+
+
+def _result(phase: str, latency_ms: float, queries: int) -> dict:
+    return {"engine": "csrd", "size": 100, "phase": phase, "latency_ms": latency_ms, "queries": queries}
+
+
+def test_compare_to_baseline_flags_latency_and_query_growth() -> None:
+    baseline = [_result("run", 100.0, 40), _result("report", 2.0, 4), _result("ingest", 50.0, 15)]
+    current = [
+        _result("run", 130.0, 41),  # +30% and +30 ms, one extra query
+        _result("report", 4.0, 4),  # doubled but under the absolute floor
+        _result("ingest", 60.0, 15),  # within tolerance
+        _result("prepare", 500.0, 99),  # not in the baseline
+    ]
+
+    regressions = compare_to_baseline(current, baseline)
+
+    assert [(r.key, r.metric) for r in regressions] == [("csrd/100/run", "latency_ms"), ("csrd/100/run", "queries")]
+    assert regressions[0].to_payload()["ratio"] == 1.3
+
+
+def test_generators_are_deterministic_and_scenarios_unique() -> None:
+    assert generators.insurance_claim_records(20) == generators.insurance_claim_records(20)
+    assert generators.insurance_claim_records(20, seed=1) != generators.insurance_claim_records(20)
+    assert len(generators.financial_forensics_records(9)) == 9 + 9 + 3
+    assert len({scenario.name for scenario in SCENARIOS}) == len(SCENARIOS)
+
+
+def test_step_fails_on_errored_check_in_successful_response() -> None:
+    ok = httpx.Response(200, json={"regulatory_results": [{"check_status": "non_compliant"}]})
+    assert _check(ok, "POST /run") == {"regulatory_results": [{"check_status": "non_compliant"}]}
+
+    errored = httpx.Response(200, json={"regulatory_results": [{"framework_id": "f", "check_status": "error"}]})
+    with pytest.raises(BenchmarkStepError, match="check_status=error"):
+        _check(errored, "POST /run")
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import event
+
+from backend.app.core.dataset.existence import (
+    dataset_version_exists,
+    existing_dataset_versions,
+    reset_dataset_version_cache_for_tests,
+)
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_engine, get_sessionmaker
+
+
+def _capture_selects():
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *_args) -> None:  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements, _capture
+
+
+@pytest.mark.anyio
+async def test_created_version_is_known_without_query(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+
+    statements, capture = _capture_selects()
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        async with sessionmaker() as db:
+            for _ in range(5):
+                assert await dataset_version_exists(db, dv.id)
+            assert await existing_dataset_versions(db, {dv.id}) == {dv.id}
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    assert statements == []
+
+
+@pytest.mark.anyio
+async def test_lookups_fall_back_to_database_and_cache_misses(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+    reset_dataset_version_cache_for_tests()
+
+    statements, capture = _capture_selects()
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        async with sessionmaker() as db:
+            assert await dataset_version_exists(db, dv.id)
+            assert await dataset_version_exists(db, dv.id)
+            assert not await dataset_version_exists(db, "missing")
+            assert not await dataset_version_exists(db, "missing")
+            assert not await dataset_version_exists(db, "")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    assert len(statements) == 2
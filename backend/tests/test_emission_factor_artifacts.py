@@ -0,0 +1,71 @@
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.main import create_app
+
+
+FACTORS = [
+    {"activity": "electricity_kwh", "country": "de", "effective_date": "2024-01-01", "kgco2e_per_unit": "0.38"},
+    {"activity": "electricity_kwh", "country": "DE", "year": 2023, "kgco2e_per_unit": 0.42},
+    {"activity": "fuel_liters", "fuel_type": "Diesel", "effective_date": "2020-01-01", "kgco2e_per_unit": "2.68"},
+]
+
+
+def _request(dv_id: str, factors: list) -> dict:
+    return {
+        "dataset_version_id": dv_id,
+        "name": "Grid and fuel factors 2024",
+        "factors": factors,
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }
+
+
+@pytest.mark.anyio
+async def test_emission_factor_artifact_create_and_load_canonical(sqlite_db: None) -> None:
+    os.environ["TODISCOPE_ARTIFACT_STORE_KIND"] = "memory"
+    app = create_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        dv_id = (await ac.post("/api/v3/ingest")).json()["dataset_version_id"]
+        created = await ac.post("/api/v3/emission-factor-artifacts", json=_request(dv_id, FACTORS))
+        assert created.status_code == 200
+        assert created.json()["factor_count"] == 3
+
+        loaded = await ac.get(f"/api/v3/emission-factor-artifacts/{created.json()['emission_factor_artifact_id']}")
+        assert loaded.status_code == 200
+        assert loaded.json()["checksum"] == created.json()["checksum"]
+        rows = loaded.json()["payload"]["factors"]
+        assert [(r["activity"], r["country"], r["effective_date"]) for r in rows] == [
+            ("electricity_kwh", "DE", "2023-01-01"),
+            ("electricity_kwh", "DE", "2024-01-01"),
+            ("fuel_liters", None, "2020-01-01"),
+        ]
+        assert rows[2]["fuel_type"] == "diesel"
+        assert rows[0]["kgco2e_per_unit"] == "0.42"
+
+        # Content-addressed: the same table in another row order is the same artifact.
+        again = await ac.post("/api/v3/emission-factor-artifacts", json=_request(dv_id, list(reversed(FACTORS))))
+        assert again.json()["emission_factor_artifact_id"] == created.json()["emission_factor_artifact_id"]
+
+
+@pytest.mark.anyio
+async def test_emission_factor_artifact_rejects_invalid_tables(sqlite_db: None) -> None:
+    os.environ["TODISCOPE_ARTIFACT_STORE_KIND"] = "memory"
+    app = create_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        dv_id = (await ac.post("/api/v3/ingest")).json()["dataset_version_id"]
+        cases = {
+            "FACTOR_KEY_DUPLICATE": FACTORS + [dict(FACTORS[0], kgco2e_per_unit="0.40")],
+            "FACTOR_REGION_REQUIRES_COUNTRY": [dict(FACTORS[2], region="north")],
+            "FACTOR_VALUE_NEGATIVE": [dict(FACTORS[0], kgco2e_per_unit="-1")],
+            "FACTOR_EFFECTIVE_DATE_INVALID": [dict(FACTORS[0], effective_date="2024-13-01")],
+            "FACTORS_REQUIRED": [],
+        }
+        for code, factors in cases.items():
+            response = await ac.post("/api/v3/emission-factor-artifacts", json=_request(dv_id, factors))
+            assert response.status_code == 400
+            assert response.json()["detail"] == code
+
+        missing = await ac.get("/api/v3/emission-factor-artifacts/does-not-exist")
+        assert missing.status_code == 404
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import pstats
+import tempfile
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.profiling import (
+    PROFILE_CAPTURE_HEADER,
+    PROFILE_REQUEST_HEADER,
+    engine_stage,
+    mark_stage,
+    profiled_run,
+    profiling_middleware,
+)
+from backend.app.core.profiling.api import router as profiles_router
+from backend.app.core.profiling.stages import _CURRENT_RUN
+
+
+captured_timings: list[list[dict]] = []
+
+
+@profiled_run("engine_profiling_test")
+async def _run_engine(*, dataset_version_id: str, fail: bool = False) -> dict:
+    mark_stage("load")
+    async with get_sessionmaker()() as db:
+        await db.execute(text("SELECT 1"))
+        mark_stage("model")
+        sum(i * i for i in range(1000))
+        mark_stage("persist")
+        await db.execute(text("SELECT 2"))
+        await db.execute(text("SELECT 3"))
+        with engine_stage("report"):
+            pass
+    captured_timings.append([t.to_payload() for t in _CURRENT_RUN.get().timings])
+    if fail:
+        raise RuntimeError("boom")
+    return {"run_id": "run-1", "dataset_version_id": dataset_version_id}
+
+
+@profiled_run("engine_profiling_test")
+async def _run_engine_positional(dataset_version_id: str, started_at: str) -> dict:
+    return {"run_id": f"run-{started_at}", "dataset_version_id": dataset_version_id}
+
+
+def test_mark_stage_outside_run_is_noop() -> None:
+    mark_stage("load")
+    with pytest.raises(ValueError, match="ENGINE_STAGE_ENGINE_ID_REQUIRED"):
+        with engine_stage("load"):
+            pass
+
+
+@pytest.mark.anyio
+async def test_profiled_run_records_stage_timings_and_queries(sqlite_db) -> None:
+    captured_timings.clear()
+    result = await _run_engine(dataset_version_id="dv-1")
+    assert result["run_id"] == "run-1"
+    assert _CURRENT_RUN.get() is None
+
+    # Timings are inspected before profiled_run closes the last stage.
+    stages = captured_timings[0]
+    assert [s["stage"] for s in stages] == ["load", "model", "report"]
+    by_stage = {s["stage"]: s for s in stages}
+    assert by_stage["load"]["query_count"] == 1
+    assert by_stage["model"]["query_count"] == 0
+
+
+@pytest.mark.anyio
+async def test_requested_capture_is_stored_and_listed(sqlite_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+
+    app = FastAPI()
+    app.middleware("http")(profiling_middleware())
+    app.include_router(profiles_router)
+
+    @app.post("/run")
+    async def run(fail: bool = False) -> dict:
+        try:
+            return await _run_engine(dataset_version_id="dv-1", fail=fail)
+        except RuntimeError:
+            return {"failed": True}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        plain = await ac.post("/run")
+        assert PROFILE_CAPTURE_HEADER not in plain.headers
+
+        res = await ac.post("/run", headers={PROFILE_REQUEST_HEADER: "1"})
+        assert res.status_code == 200
+        capture_id = res.headers[PROFILE_CAPTURE_HEADER]
+
+        failed = await ac.post("/run", params={"fail": "true"}, headers={PROFILE_REQUEST_HEADER: "1"})
+        failed_id = failed.headers[PROFILE_CAPTURE_HEADER]
+
+        listing = await ac.get("/api/v3/admin/profiles", params={"run_id": "run-1"})
+        assert listing.status_code == 200
+        items = listing.json()["items"]
+        assert [item["capture_id"] for item in items] == [capture_id]
+        item = items[0]
+        assert item["engine_id"] == "engine_profiling_test"
+        assert item["dataset_version_id"] == "dv-1"
+        assert item["status"] == "completed"
+        assert item["artifacts"] == ["cprofile.pstats", "cprofile.txt", "summary.json", "tracemalloc.txt"]
+        # Stages are recorded as they close; "report" is nested in "persist".
+        stages = {s["stage"]: s for s in item["summary"]["stages"]}
+        assert [s["stage"] for s in item["summary"]["stages"]] == ["load", "model", "report", "persist"]
+        assert stages["persist"]["query_count"] == 2
+
+        by_dv = await ac.get("/api/v3/admin/profiles", params={"dataset_version_id": "dv-1"})
+        statuses = {i["capture_id"]: i["status"] for i in by_dv.json()["items"]}
+        assert statuses == {capture_id: "completed", failed_id: "failed"}
+
+        report = await ac.get(f"/api/v3/admin/profiles/{capture_id}/cprofile.txt")
+        assert report.status_code == 200
+        assert "_run_engine" in report.text
+
+        raw = await ac.get(f"/api/v3/admin/profiles/{capture_id}/cprofile.pstats")
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "run.pstats")
+            with open(path, "wb") as fh:
+                fh.write(raw.content)
+            assert pstats.Stats(path).total_calls > 0
+
+        missing = await ac.get(f"/api/v3/admin/profiles/{capture_id}/nope.txt")
+        assert missing.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_capture_reads_a_positional_dataset_version_id(sqlite_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+
+    app = FastAPI()
+    app.middleware("http")(profiling_middleware())
+    app.include_router(profiles_router)
+
+    @app.post("/run")
+    async def run() -> dict:
+        return await _run_engine_positional("dv-positional", "t0")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        res = await ac.post("/run", headers={PROFILE_REQUEST_HEADER: "1"})
+        capture_id = res.headers[PROFILE_CAPTURE_HEADER]
+        listing = await ac.get("/api/v3/admin/profiles", params={"dataset_version_id": "dv-positional"})
+    assert [item["capture_id"] for item in listing.json()["items"]] == [capture_id]
@@ -15,6 +15,7 @@ import uuid
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 
 from backend.app.core.dataset.service import create_dataset_version_via_ingestion
 from backend.app.core.db import get_sessionmaker
@@ -24,6 +25,8 @@ from backend.app.core.evidence.aggregation import (
     MissingEvidenceError,
     aggregate_evidence_by_engine,
     aggregate_evidence_by_kind,
+    count_evidence_by_engine,
+    count_evidence_by_kind,
     get_evidence_by_dataset_version,
     get_evidence_by_ids,
     get_evidence_for_findings,
@@ -643,7 +646,42 @@ async def test_get_evidence_summary(sqlite_db: None) -> None:
         assert summary_empty["latest_evidence"] is None
 
 
-
-
-
-
+@pytest.mark.anyio
+async def test_count_evidence_and_payload_free_grouping(sqlite_db: None) -> None:
+    """Test SQL-side counts and grouping without loading payloads."""
+    now = datetime.now(timezone.utc)
+    
+    async with get_sessionmaker()() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        
+        for i, (kind, engine_id) in enumerate([
+            ("kind_a", "engine_1"),
+            ("kind_b", "engine_1"),
+            ("kind_a", "engine_2"),
+        ]):
+            await create_evidence(
+                db,
+                evidence_id=deterministic_evidence_id(
+                    dataset_version_id=dv.id,
+                    engine_id=engine_id,
+                    kind=kind,
+                    stable_key=f"key{i}",
+                ),
+                dataset_version_id=dv.id,
+                engine_id=engine_id,
+                kind=kind,
+                payload={"data": f"value{i}"},
+                created_at=now,
+            )
+        
+        await db.commit()
+    
+    async with get_sessionmaker()() as db:
+        assert await count_evidence_by_kind(db, dataset_version_id=dv.id) == {"kind_a": 2, "kind_b": 1}
+        assert await count_evidence_by_kind(db, dataset_version_id=dv.id, engine_id="engine_2") == {"kind_a": 1}
+        assert await count_evidence_by_engine(db, dataset_version_id=dv.id) == {"engine_1": 2, "engine_2": 1}
+        
+        grouped = await aggregate_evidence_by_engine(db, dataset_version_id=dv.id, include_payload=False)
+        assert len(grouped["engine_1"]) == 2
+        with pytest.raises(InvalidRequestError):
+            _ = grouped["engine_1"][0].payload
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.evidence import EvidenceBatch, EvidenceRecord, EvidenceReference, persist_evidence_batch
+
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _Conflict(RuntimeError):
+    pass
+
+
+def _batch(dv_id: str) -> EvidenceBatch:
+    return EvidenceBatch(dataset_version_id=dv_id, log_prefix="TEST", conflict_error=_Conflict)
+
+
+def _evidence(dv_id: str, evidence_id: str, payload: dict) -> dict:
+    return {
+        "evidence_id": evidence_id,
+        "dataset_version_id": dv_id,
+        "engine_id": "engine_test",
+        "kind": "test",
+        "payload": payload,
+        "created_at": CREATED_AT,
+    }
+
+
+def test_batch_ignores_true_duplicates_and_rejects_conflicting_ones() -> None:
+    batch = _batch("dv")
+    batch.add_evidence(_evidence("dv", "e-1", {"values": (1, 2)}))
+    # Same row in stored form: tuples come back from JSON columns as lists.
+    batch.add_evidence(_evidence("dv", "e-1", {"values": [1, 2]}))
+    assert list(batch.evidence) == ["e-1"]
+
+    with pytest.raises(_Conflict, match="IMMUTABLE_EVIDENCE_MISMATCH"):
+        batch.add_evidence(_evidence("dv", "e-1", {"values": [2, 1]}))
+    rows: dict[str, dict] = {}
+    batch.add_row(rows, "g-1", {"gap_id": "g-1", "status": "open"}, "GAP_ID_COLLISION")
+    with pytest.raises(_Conflict, match="GAP_ID_COLLISION"):
+        batch.add_row(rows, "g-1", {"gap_id": "g-1", "status": "closed"}, "GAP_ID_COLLISION")
+
+
+@pytest.mark.anyio
+async def test_persist_evidence_batch_inserts_missing_rows_and_verifies_existing(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        first = _batch(dv.id)
+        first.add_evidence(_evidence(dv.id, "e-1", {"control_ids": ("c1",)}))
+        await persist_evidence_batch(db, first, batch_size=1)
+        await db.commit()
+
+    async with sessionmaker() as db:
+        again = _batch(dv.id)
+        again.add_evidence(_evidence(dv.id, "e-1", {"control_ids": ["c1"]}))
+        again.add_evidence(_evidence(dv.id, "e-2", {"control_ids": ["c2"]}))
+        await persist_evidence_batch(db, again, batch_size=1)
+        await db.commit()
+        assert await db.scalar(select(func.count()).select_from(EvidenceRecord)) == 2
+        assert await db.scalar(select(func.count()).select_from(EvidenceReference)) == 2
+
+        await db.execute(update(EvidenceRecord).where(EvidenceRecord.evidence_id == "e-1").values(payload={}))
+        conflicting = _batch(dv.id)
+        conflicting.add_evidence(_evidence(dv.id, "e-3", {}))
+        conflicting.add_evidence(_evidence(dv.id, "e-1", {"control_ids": ["c1"]}))
+        with pytest.raises(_Conflict, match="IMMUTABLE_EVIDENCE_MISMATCH"):
+            await persist_evidence_batch(db, conflicting)
+        assert await db.scalar(select(func.count()).select_from(EvidenceRecord)) == 2
+
+        with pytest.raises(ValueError, match="BULK_INSERT_BATCH_SIZE_INVALID"):
+            await persist_evidence_batch(db, again, batch_size=0)
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_engine, get_sessionmaker
+from backend.app.core.evidence.reader import EvidenceReader
+from backend.app.core.evidence.service import create_evidence, create_finding, link_finding_to_evidence
+
+
+async def _seed(n: int) -> tuple[str, list[str], str]:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with get_sessionmaker()() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        db.add(
+            RawRecord(
+                raw_record_id="rr-1",
+                dataset_version_id=dv.id,
+                source_system="test",
+                source_record_id="1",
+                payload={},
+                ingested_at=now,
+            )
+        )
+        evidence_ids = [f"ev-{i:03d}" for i in range(n)]
+        for i, evidence_id in enumerate(evidence_ids):
+            await create_evidence(
+                db,
+                evidence_id=evidence_id,
+                dataset_version_id=dv.id,
+                engine_id="engine_a",
+                kind="kind_a" if i % 2 else "kind_b",
+                payload={"i": i},
+                created_at=now,
+            )
+        await create_finding(
+            db,
+            finding_id="f-1",
+            dataset_version_id=dv.id,
+            raw_record_id="rr-1",
+            kind="finding_kind",
+            payload={"big": "x" * 100},
+            created_at=now,
+        )
+        for evidence_id in evidence_ids[:3]:
+            await link_finding_to_evidence(db, link_id=f"l-{evidence_id}", finding_id="f-1", evidence_id=evidence_id)
+        await db.commit()
+    return dv.id, evidence_ids, "f-1"
+
+
+@pytest.mark.anyio
+async def test_reader_projects_metadata_and_batches_payloads(sqlite_db: None) -> None:
+    dv_id, evidence_ids, finding_id = await _seed(10)
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *_args) -> None:  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _capture)
+    try:
+        async with get_sessionmaker()() as db:
+            reader = EvidenceReader.for_session(db)
+            assert EvidenceReader.for_session(db) is reader
+
+            refs = await reader.evidence_for_dataset_version(dv_id)
+            assert [r.evidence_id for r in refs] == evidence_ids
+            assert "payload" not in statements[-1]
+
+            # Identity map: a second lookup of known IDs issues no query.
+            count = len(statements)
+            assert set(await reader.evidence(evidence_ids[:4] + ["missing"])) == set(evidence_ids[:4])
+            assert len(statements) == count + 1  # only "missing" was looked up
+
+            count = len(statements)
+            payloads = [await reader.evidence_payload(r.evidence_id) for r in refs]
+            assert payloads == [{"i": i} for i in range(10)]
+            assert len(statements) == count + 1
+
+            links = await reader.evidence_ids_by_finding([finding_id, "no-links"])
+            assert links == {finding_id: evidence_ids[:3], "no-links": []}
+            finding = (await reader.findings([finding_id]))[finding_id]
+            assert finding.kind == "finding_kind"
+            assert (await reader.finding_payload(finding_id))["big"] == "x" * 100
+
+            with pytest.raises(KeyError):
+                await reader.evidence_payload("missing")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _capture)
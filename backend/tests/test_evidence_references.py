@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.core.dataset.raw_models import RawRecord
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.evidence import (
+    REF_CONTROL,
+    REF_RULE,
+    REF_SOURCE_RECORD,
+    SUBJECT_EVIDENCE,
+    SUBJECT_FINDING,
+    EvidenceRecord,
+    EvidenceReference,
+    backfill_references,
+    create_evidence,
+    create_finding,
+    extract_references,
+)
+
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def _references(db, *, ref_type: str, subject_type: str = SUBJECT_EVIDENCE) -> list[tuple[str, str]]:
+    rows = await db.execute(
+        select(EvidenceReference.ref_value, EvidenceReference.subject_id)
+        .where(EvidenceReference.ref_type == ref_type)
+        .where(EvidenceReference.subject_type == subject_type)
+        .order_by(EvidenceReference.ref_value, EvidenceReference.subject_id)
+    )
+    return [tuple(row) for row in rows.all()]
+
+
+def test_extract_references_reads_declared_paths() -> None:
+    payload = {
+        "control_ids": ["c2", "c1", 7, ""],
+        "control": {"control_id": "c3"},
+        "rule_identity": {"rule_id": "exact_match"},
+        "source_raw_record_id": "raw-1",
+        "controls": [{"control_id": "ignored"}],
+        "notes": "control_id",
+    }
+    assert extract_references(payload) == [
+        (REF_CONTROL, "c1"),
+        (REF_CONTROL, "c2"),
+        (REF_CONTROL, "c3"),
+        (REF_RULE, "exact_match"),
+        (REF_SOURCE_RECORD, "raw-1"),
+    ]
+    assert extract_references(None) == []
+    assert extract_references({"control": "c1"}) == []
+
+
+@pytest.mark.anyio
+async def test_references_are_written_with_evidence_and_findings(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        db.add(
+            RawRecord(
+                raw_record_id="raw-1",
+                dataset_version_id=dv.id,
+                source_system="test",
+                source_record_id="r1",
+                payload={},
+                legacy_no_checksum=True,
+                ingested_at=CREATED_AT,
+            )
+        )
+        for evidence_id, payload in (
+            ("ev-1", {"control_ids": ["c1", "c2"]}),
+            ("ev-2", {"control_id": "c1", "rule_id": "r1"}),
+            ("ev-3", {"text": "no references"}),
+        ):
+            await create_evidence(
+                db,
+                evidence_id=evidence_id,
+                dataset_version_id=dv.id,
+                engine_id="engine_test",
+                kind="test",
+                payload=payload,
+                created_at=CREATED_AT,
+            )
+        await create_finding(
+            db,
+            finding_id="f-1",
+            dataset_version_id=dv.id,
+            raw_record_id="raw-1",
+            kind="test",
+            payload={"rule_id": "r1"},
+            created_at=CREATED_AT,
+        )
+        await db.commit()
+
+    async with sessionmaker() as db:
+        assert await _references(db, ref_type=REF_CONTROL) == [("c1", "ev-1"), ("c1", "ev-2"), ("c2", "ev-1")]
+        assert await _references(db, ref_type=REF_RULE, subject_type=SUBJECT_FINDING) == [("r1", "f-1")]
+        # Everything written through the service is already indexed.
+        assert await backfill_references(db, evidence_ids=["ev-1", "ev-2", "ev-3"]) == 0
+
+
+@pytest.mark.anyio
+async def test_backfill_indexes_rows_written_without_references(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        db.add(
+            EvidenceRecord(
+                evidence_id="legacy",
+                dataset_version_id=dv.id,
+                engine_id="engine_test",
+                kind="test",
+                payload={"controls": ["c1"], "source_record_id": "s1"},
+                created_at=CREATED_AT,
+            )
+        )
+        await db.commit()
+
+    async with sessionmaker() as db:
+        assert await _references(db, ref_type=REF_CONTROL) == []
+        assert await backfill_references(db, evidence_ids=["legacy", "missing"], batch_size=1) == 2
+        assert await backfill_references(db, evidence_ids=["legacy"]) == 0
+        await db.commit()
+        assert await _references(db, ref_type=REF_CONTROL) == [("c1", "legacy")]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core import metrics
+from backend.app.core.metrics import (
+    OVERFLOW_LABEL,
+    UNMATCHED_ROUTE,
+    _BoundedLabelValues,
+    metrics_middleware,
+    register_engine_routes,
+)
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _app() -> FastAPI:
+    router = APIRouter(prefix="/api/v3/engines/metrics-test")
+
+    @router.post("/runs/{run_id}")
+    async def _run(run_id: str) -> dict:
+        return {"run_id": run_id}
+
+    @router.get("/stream")
+    async def _stream() -> StreamingResponse:
+        async def body():
+            yield b"x" * 10
+            yield b"y" * 5
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    app = FastAPI()
+    app.middleware("http")(metrics_middleware())
+    app.include_router(router)
+    register_engine_routes("metrics_test_engine", router)
+    return app
+
+
+@pytest.mark.anyio
+async def test_http_metrics_use_route_templates_and_engine_label() -> None:
+    template = "/api/v3/engines/metrics-test/runs/{run_id}"
+    labels = {"method": "POST", "path": template, "status": "200", "engine_id": "metrics_test_engine"}
+    before = _sample("todiscope_http_requests_total", labels)
+
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as ac:
+        for run_id in ("a", "b", "c"):
+            res = await ac.post(f"/api/v3/engines/metrics-test/runs/{run_id}", content=b"{}")
+            assert res.status_code == 200
+        assert (await ac.get("/api/v3/engines/metrics-test/stream")).text == "x" * 10 + "y" * 5
+        assert (await ac.get("/no/such/path/123")).status_code == 404
+
+    assert _sample("todiscope_http_requests_total", labels) == before + 3
+    assert _sample(
+        "todiscope_http_requests_total",
+        {"method": "POST", "path": "/api/v3/engines/metrics-test/runs/a", "status": "200", "engine_id": "metrics_test_engine"},
+    ) == 0
+    assert _sample(
+        "todiscope_http_requests_total",
+        {"method": "GET", "path": UNMATCHED_ROUTE, "status": "404", "engine_id": ""},
+    ) >= 1
+    stream_labels = {"method": "GET", "path": "/api/v3/engines/metrics-test/stream", "engine_id": "metrics_test_engine"}
+    assert _sample("todiscope_http_response_size_bytes_sum", stream_labels) >= 15
+    size_labels = {"method": "POST", "path": template, "engine_id": "metrics_test_engine"}
+    assert _sample("todiscope_http_request_size_bytes_count", size_labels) >= 3
+    assert _sample("todiscope_http_requests_in_flight", {"method": "POST"}) == 0
+
+
+@pytest.mark.anyio
+async def test_streamed_request_is_in_flight_until_its_body_ends() -> None:
+    router = APIRouter(prefix="/api/v3/engines/metrics-slow")
+    seen_in_flight: list[float] = []
+
+    @router.get("/stream")
+    async def _stream() -> StreamingResponse:
+        async def body():
+            yield b"first"
+            # call_next has returned by now; the request is still being served.
+            seen_in_flight.append(_sample("todiscope_http_requests_in_flight", {"method": "GET"}))
+            await asyncio.sleep(0.05)
+            yield b"last"
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    app = FastAPI()
+    app.middleware("http")(metrics_middleware())
+    app.include_router(router)
+    register_engine_routes("metrics_slow_engine", router)
+    labels = {"method": "GET", "path": "/api/v3/engines/metrics-slow/stream", "engine_id": "metrics_slow_engine"}
+    in_flight_before = _sample("todiscope_http_requests_in_flight", {"method": "GET"})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        assert (await ac.get("/api/v3/engines/metrics-slow/stream")).text == "firstlast"
+
+    assert seen_in_flight == [in_flight_before + 1]
+    assert _sample("todiscope_http_requests_in_flight", {"method": "GET"}) == in_flight_before
+    assert _sample("todiscope_http_request_duration_seconds_count", labels) == 1
+    assert _sample("todiscope_http_request_duration_seconds_sum", labels) >= 0.05
+
+
+def test_bounded_label_values_overflow() -> None:
+    bound = _BoundedLabelValues(2)
+    assert bound("/a") == "/a"
+    assert bound("/b") == "/b"
+    assert bound("/c") == OVERFLOW_LABEL
+    assert bound("/a") == "/a"
+    assert metrics.MAX_ROUTE_LABELS > 0
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import ASGITransport, AsyncClient
+
+from backend.app.core import json_stream
+from backend.app.core.json_stream import StreamingJSONResponse, iter_json_chunks
+
+
+def _document() -> dict:
+    return {
+        "run_id": "r1",
+        "findings": [{"id": i, "amount": Decimal("1.50"), "note": "é"} for i in range(1200)],
+        "sections": {"summary": {"count": 1200, "at": datetime(2026, 1, 1, tzinfo=timezone.utc)}},
+        "empty": [],
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_chunks_concatenate_to_fastapi_equivalent_json(use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_stream, "orjson", None)
+    doc = _document()
+    chunks = list(iter_json_chunks(doc, batch_items=100, chunk_bytes=4096))
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == jsonable_encoder(doc)
+
+
+@pytest.mark.anyio
+async def test_streaming_response_body() -> None:
+    app = FastAPI()
+
+    @app.get("/doc")
+    async def _doc() -> StreamingJSONResponse:
+        return StreamingJSONResponse(_document())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        res = await ac.get("/doc")
+    assert res.headers["content-type"] == "application/json"
+    assert res.json() == jsonable_encoder(_document())
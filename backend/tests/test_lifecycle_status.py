@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import event
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_engine, get_sessionmaker
+from backend.app.core.lifecycle.enforcement import (
+    enforce_run_prerequisites,
+    record_import_completion,
+    record_normalize_completion,
+)
+from backend.app.core.lifecycle.status import (
+    DATASET_SCOPE,
+    get_lifecycle_status,
+    reset_lifecycle_status_cache_for_tests,
+)
+from backend.app.core.workflows.state_machine import transition_workflow_state
+
+
+@pytest.mark.anyio
+async def test_record_completion_materializes_status(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await record_import_completion(db, dataset_version_id=dv.id)
+        await record_normalize_completion(db, dataset_version_id=dv.id)
+
+    reset_lifecycle_status_cache_for_tests()
+    async with sessionmaker() as db:
+        status = await get_lifecycle_status(db, dataset_version_id=dv.id)
+        assert status is not None
+        assert status.engine_id == DATASET_SCOPE
+        assert status.import_completed and status.normalize_completed
+        assert not status.calculate_completed
+
+
+@pytest.mark.anyio
+async def test_run_prerequisites_use_single_lookup(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await record_import_completion(db, dataset_version_id=dv.id)
+        await record_normalize_completion(db, dataset_version_id=dv.id)
+
+    reset_lifecycle_status_cache_for_tests()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *_args) -> None:  # noqa: ANN001
+        statements.append(statement)
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _capture)
+    try:
+        async with sessionmaker() as db:
+            await enforce_run_prerequisites(db, dataset_version_id=dv.id, engine_id="engine_x", actor_id="t")
+            await enforce_run_prerequisites(db, dataset_version_id=dv.id, engine_id="engine_x", actor_id="t")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _capture)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "lifecycle_status" in selects[0]
+
+
+@pytest.mark.anyio
+async def test_lifecycle_workflow_transition_updates_status(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        await transition_workflow_state(
+            db,
+            dataset_version_id=dv.id,
+            subject_type="lifecycle",
+            subject_id="calculate:engine_x",
+            to_state="review",
+            actor_id="reviewer",
+        )
+        status = await get_lifecycle_status(db, dataset_version_id=dv.id, engine_id="engine_x")
+        assert status is not None and not status.calculate_completed
+        assert await get_lifecycle_status(db, dataset_version_id=dv.id) is None
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.normalization.warning_store import (
+    WarningAggregator,
+    WarningStoreError,
+    load_warning_page,
+    persist_warning_artifact,
+)
+from backend.app.core.normalization.warnings import (
+    create_fuzzy_match_warning,
+    create_missing_value_warning,
+)
+
+
+def _fill(aggregator: WarningAggregator, n: int) -> None:
+    for i in range(n):
+        if i % 3 == 0:
+            aggregator.add(create_fuzzy_match_warning(f"raw-{i}", "amt", "amt", "amount", 0.9))
+        else:
+            aggregator.add(create_missing_value_warning(f"raw-{i}", "source_system"))
+
+
+def test_aggregator_counts_by_code_and_severity_with_capped_sample() -> None:
+    agg = WarningAggregator(sample_limit=5)
+    _fill(agg, 30)
+
+    summary = agg.summary()
+    assert summary.total == 30
+    assert summary.counts == {"FUZZY_MATCH": {"info": 10}, "MISSING_VALUE": {"warning": 20}}
+    assert summary.by_severity == {"info": 10, "warning": 20}
+    assert len(summary.sample) == 5
+    assert summary.truncated is True
+    assert "sample" not in summary.to_dict(include_sample=False)
+
+
+def test_aggregator_stream_is_deterministic() -> None:
+    a = WarningAggregator()
+    b = WarningAggregator()
+    _fill(a, 50)
+    _fill(b, 50)
+    assert a.compressed_ndjson() == b.compressed_ndjson()
+
+
+@pytest.mark.anyio
+async def test_persist_and_page_through_warning_artifact(sqlite_db: None) -> None:
+    sessionmaker = get_sessionmaker()
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    async with sessionmaker() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        agg = WarningAggregator(sample_limit=2)
+        _fill(agg, 25)
+        row = await persist_warning_artifact(db, dataset_version_id=dv.id, aggregator=agg, created_at=now)
+        again = await persist_warning_artifact(db, dataset_version_id=dv.id, aggregator=agg, created_at=now)
+        await db.commit()
+        assert again.warning_artifact_id == row.warning_artifact_id
+        assert row.warning_count == 25
+
+    async with sessionmaker() as db:
+        first = await load_warning_page(db, warning_artifact_id=row.warning_artifact_id, limit=10)
+        assert [w["raw_record_id"] for w in first["items"]] == [f"raw-{i}" for i in range(10)]
+        assert first["next_offset"] == 10
+
+        last = await load_warning_page(db, warning_artifact_id=row.warning_artifact_id, offset=20, limit=10)
+        assert len(last["items"]) == 5
+        assert last["next_offset"] is None
+
+        fuzzy = await load_warning_page(
+            db, warning_artifact_id=row.warning_artifact_id, code="FUZZY_MATCH", limit=100
+        )
+        assert len(fuzzy["items"]) == 9
+
+        with pytest.raises(WarningStoreError, match="WARNING_ARTIFACT_NOT_FOUND"):
+            await load_warning_page(db, warning_artifact_id="missing")
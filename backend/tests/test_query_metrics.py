@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from backend.app.core import query_metrics
+from backend.app.core.dataset.models import DatasetVersion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.query_metrics import (
+    fingerprint_statement,
+    parameters_shape,
+    recent_slow_queries,
+    reset_query_metrics_for_tests,
+    router,
+    track_queries,
+)
+
+
+def test_fingerprint_collapses_literals_and_in_lists() -> None:
+    a = fingerprint_statement("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'x'  AND n > 10")
+    b = fingerprint_statement("SELECT *\n FROM t WHERE id IN (?, ?) AND name = 'it''s' AND n > 7")
+    assert a == b == "SELECT * FROM t WHERE id IN (?...) AND name = ? AND n > ?"
+    assert fingerprint_statement("SELECT x::text FROM t2 WHERE y = :y_1") == "SELECT x::text FROM t2 WHERE y = ?"
+
+
+def test_parameters_shape_hides_values() -> None:
+    assert parameters_shape({"a": 1, "b": "secret"}) == {"a": "int", "b": "str"}
+    assert parameters_shape([(1, "x"), (2, "y")], executemany=True) == {"batch": 2, "row": ["int", "str"]}
+
+
+@pytest.mark.anyio
+async def test_track_queries_counts_nested_scopes(sqlite_db) -> None:
+    async with get_sessionmaker()() as db:
+        with track_queries("http", "/outer") as outer:
+            await db.execute(text("SELECT 1"))
+            with track_queries("stage", "engine:persist") as inner:
+                await db.execute(text("SELECT 2"))
+                await db.execute(text("SELECT 3"))
+        await db.execute(text("SELECT 4"))
+
+    assert outer.query_count == 3
+    assert inner.query_count == 2
+    assert outer.db_seconds >= inner.db_seconds > 0
+
+
+@pytest.mark.anyio
+async def test_slow_queries_are_captured_with_plan(sqlite_db, monkeypatch) -> None:
+    monkeypatch.setenv("TODISCOPE_SLOW_QUERY_THRESHOLD_MS", "0")
+    monkeypatch.setenv("TODISCOPE_SLOW_QUERY_EXPLAIN", "1")
+    monkeypatch.setenv("TODISCOPE_SLOW_QUERY_LOG_SIZE", "3")
+    reset_query_metrics_for_tests()
+
+    async with get_sessionmaker()() as db:
+        with track_queries("stage", "engine:load"):
+            for i in range(5):
+                await db.execute(text("SELECT :v AS v"), {"v": i})
+
+    entries = recent_slow_queries()
+    assert len(entries) == 3
+    newest = entries[0]
+    assert newest.fingerprint == "SELECT ? AS v"
+    assert newest.parameters_shape in ({"v": "int"}, ["int"])
+    assert newest.scopes == ("stage:engine:load",)
+    assert newest.explain_error is None and newest.explain
+
+    app = FastAPI()
+    app.include_router(router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        res = await ac.get("/api/v3/admin/slow-queries", params={"limit": 2})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["threshold_ms"] == 0
+    assert body["capacity"] == 3
+    assert len(body["items"]) == 2
+    assert body["items"][0]["fingerprint"] == "SELECT ? AS v"
+
+
+@pytest.mark.anyio
+async def test_failing_explain_leaves_the_callers_transaction_intact(sqlite_db, monkeypatch) -> None:
+    monkeypatch.setenv("TODISCOPE_SLOW_QUERY_THRESHOLD_MS", "0")
+    monkeypatch.setenv("TODISCOPE_SLOW_QUERY_EXPLAIN", "1")
+    monkeypatch.setitem(query_metrics._EXPLAIN_PREFIXES, "sqlite", "EXPLAIN NOT VALID SQL ")
+    reset_query_metrics_for_tests()
+
+    async with get_sessionmaker()() as db:
+        db.add(DatasetVersion(id="dv-explain"))
+        await db.flush()
+        assert await db.scalar(text("SELECT count(*) FROM dataset_version")) == 1
+        await db.commit()
+    async with get_sessionmaker()() as db:
+        assert await db.get(DatasetVersion, "dv-explain") is not None
+
+    counted = next(entry for entry in recent_slow_queries() if entry.fingerprint.startswith("SELECT count"))
+    assert counted.explain is None and counted.explain_error
+
+    # Dialects without an EXPLAIN form are skipped, not reported as errors.
+    monkeypatch.delitem(query_metrics._EXPLAIN_PREFIXES, "sqlite")
+    reset_query_metrics_for_tests()
+    async with get_sessionmaker()() as db:
+        await db.execute(text("SELECT 1"))
+    assert all(entry.explain is None and entry.explain_error is None for entry in recent_slow_queries())
@@ -0,0 +1,45 @@
+import pytest
+
+from backend.app.core.dataset.service import create_dataset_version_via_ingestion
+from backend.app.core.db import get_sessionmaker
+from backend.app.core.reporting.materialization import (
+    canonical_report_bytes,
+    materialize_report,
+    report_kind_with_parameters,
+    report_response,
+)
+
+
+@pytest.mark.anyio
+async def test_report_rendered_once_and_revalidated_by_etag(sqlite_db: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TODISCOPE_ARTIFACT_STORE_KIND", "memory")
+    renders = 0
+
+    async def _render() -> dict:
+        nonlocal renders
+        renders += 1
+        return {"b": [1, 2], "a": "report"}
+
+    async with get_sessionmaker()() as db:
+        dv = await create_dataset_version_via_ingestion(db)
+        kwargs = dict(run_id="run-1", report_kind="engine_x:report", dataset_version_id=dv.id, engine_id="engine_x")
+
+        first = await materialize_report(db, render=_render, **kwargs)
+        second = await materialize_report(db, render=_render, **kwargs)
+        assert renders == 1
+        assert first.rendered and not second.rendered
+        assert first.content == second.content == canonical_report_bytes({"a": "report", "b": [1, 2]})
+        assert first.etag == second.etag and first.etag.startswith('"')
+
+        revalidated = await materialize_report(db, render=_render, if_none_match=f"W/{first.etag}", **kwargs)
+        assert revalidated.not_modified
+        assert report_response(revalidated).status_code == 304
+
+        response = report_response(second)
+        assert response.status_code == 200
+        assert response.headers["etag"] == first.etag
+
+        other = await materialize_report(
+            db, render=_render, **{**kwargs, "report_kind": report_kind_with_parameters("engine_x:report", {"k": 1})}
+        )
+        assert other.rendered and renders == 2
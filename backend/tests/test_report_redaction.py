@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.app.core.reporting.redaction import ANONYMIZE, REDACT, CompiledFieldPolicy
+
+
+def _policy() -> CompiledFieldPolicy:
+    return CompiledFieldPolicy(redacted_fields={"secret", "both"}, anonymized_fields={"item_id", "both"})
+
+
+def test_compiled_policy_redaction_takes_precedence() -> None:
+    policy = _policy()
+    assert policy.action("secret") == REDACT
+    assert policy.action("both") == REDACT
+    assert policy.action("item_id") == ANONYMIZE
+    assert policy.action("amount") is None
+
+
+def test_redactor_single_pass_and_memoized_anonymization() -> None:
+    calls: list[str] = []
+
+    def anonymize(value: str) -> str:
+        calls.append(value)
+        return f"REF-{value[::-1]}"
+
+    redactor = _policy().redactor(anonymize=anonymize, sanitize_text=str.upper)
+    report = {
+        "rows": [{"item_id": "a1", "secret": "x", "amount": 10, "note": "ok"} for _ in range(50)],
+        "refs": {"item_id": ["a1", "b2", 7], "count": 3},
+        "nested": {"item_id": {"not": "a string"}},
+    }
+
+    out = redactor.redact(report)
+
+    assert out["rows"][0] == {"item_id": "REF-1a", "amount": 10, "note": "OK"}
+    assert out["refs"] == {"item_id": ["REF-1a", "REF-2b", 7], "count": 3}
+    # Non-string anonymizable values are omitted.
+    assert out["nested"] == {}
+    # Each distinct identifier is hashed once per redactor.
+    assert calls == ["a1", "b2"]
+
+
+def test_redactor_rejects_redacted_fields_it_cannot_strip() -> None:
+    redactor = _policy().redactor(anonymize=lambda v: v)
+    with pytest.raises(ValueError, match=r"redacted field: item_id\[0\]\.secret"):
+        redactor.redact({"section": {"item_id": [{"secret": "x"}]}})
+
+
+def test_redactor_compares_actions_by_value() -> None:
+    # Actions loaded from configuration are equal to, not identical with, the module constants.
+    policy = CompiledFieldPolicy(redacted_fields=(), anonymized_fields=())
+    policy._actions.update({"secret": "".join(["re", "dact"]), "item_id": "".join(["anon", "ymize"])})
+    redactor = policy.redactor(anonymize=lambda v: f"R{v}")
+
+    assert redactor.redact({"secret": 1, "item_id": "a", "x": [{"secret": 2}]}) == {"item_id": "Ra", "x": [{}]}
+    with pytest.raises(ValueError, match="redacted field"):
+        redactor.redact({"item_id": [{"secret": 3}]})